@@ -0,0 +1,163 @@
+"""Persistent on-disk cache of calibrated benchmark rounds.
+
+Auto-calibrating the number of rounds for a benchmark variation (see
+:meth:`~simplebench.runners.SimpleRunner.calibrate_rounds`) searches upwards from a single
+round in 10x steps, which adds noticeable start-up time to large suites. The
+:class:`CalibrationCache` remembers the calibrated rounds and the per-call time measured
+with them so that later sessions can start from the cached value and only verify it.
+
+Entries are keyed by benchmark id, variation marks, timer and
+:func:`~simplebench.utils.machine_fingerprint`, and are stored as JSON in the session's
+output path. Benchmarks with transient ids (which change from run to run) are never cached,
+and entries older than :data:`~simplebench.defaults.DEFAULT_CALIBRATION_CACHE_TTL` are
+ignored and pruned from the file when it is next written.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from . import defaults
+from .exceptions import SimpleBenchTypeError, _CalibrationCacheErrorTag
+from .utils import machine_fingerprint
+from .validators import validate_positive_float, validate_positive_int
+
+
+class CalibrationEntry(NamedTuple):
+    """A cached rounds calibration.
+
+    :ivar rounds: The calibrated number of rounds.
+    :vartype rounds: int
+    :ivar per_call_ns: The per-call time of the action measured with ``rounds`` rounds, in timer units.
+    :vartype per_call_ns: float
+    :ivar stored_at: When the calibration was stored, in seconds since the epoch.
+    :vartype stored_at: float
+    """
+    rounds: int
+    per_call_ns: float
+    stored_at: float = 0.0
+
+    @property
+    def stale(self) -> bool:
+        """Whether the calibration is older than :data:`~simplebench.defaults.DEFAULT_CALIBRATION_CACHE_TTL`."""
+        return not 0.0 <= time.time() - self.stored_at <= defaults.DEFAULT_CALIBRATION_CACHE_TTL
+
+
+class CalibrationCache:
+    """A JSON file backed cache of calibrated rounds.
+
+    The file is re-read before every write and replaced atomically, so entries written
+    by other processes sharing the file (such as parallel workers) are preserved.
+
+    :param path: The path of the cache file. It is created when the first entry is stored.
+    :raises SimpleBenchTypeError: If ``path`` is not a :class:`~pathlib.Path`.
+    """
+    def __init__(self, path: Path) -> None:
+        if not isinstance(path, Path):
+            raise SimpleBenchTypeError(
+                f'path must be a Path instance - cannot be a {type(path)}',
+                tag=_CalibrationCacheErrorTag.INVALID_PATH_ARG_TYPE)
+        self._path: Path = path
+        self._entries: dict[str, CalibrationEntry] | None = None
+        """The cached entries - loaded from the file on first use."""
+
+    @property
+    def path(self) -> Path:
+        """The path of the cache file."""
+        return self._path
+
+    @staticmethod
+    def cacheable(benchmark_id: str) -> bool:
+        """Return whether the calibrations of a benchmark can be cached.
+
+        Transient benchmark ids (see :data:`~simplebench.defaults.TRANSIENT_BENCHMARK_ID_PREFIX`)
+        are derived from object ids, so an entry stored for one could never be found again.
+
+        :param benchmark_id: The benchmark id of the case.
+        :return: True unless the benchmark id is transient.
+        """
+        return not benchmark_id.startswith(defaults.TRANSIENT_BENCHMARK_ID_PREFIX)
+
+    @staticmethod
+    def key(*, benchmark_id: str, variation_marks: dict[str, Any], timer: Callable[[], int | float]) -> str:
+        """Return the cache key for a benchmark variation.
+
+        :param benchmark_id: The benchmark id of the case.
+        :param variation_marks: The variation marks of the kwargs variation.
+        :param timer: The timer function used for the benchmark.
+        :return: The cache key.
+        """
+        timer_name = (f"{getattr(timer, '__module__', None) or ''}."
+                      f"{getattr(timer, '__qualname__', None) or repr(timer)}")
+        marks = json.dumps(variation_marks, sort_keys=True, default=repr)
+        return f'{benchmark_id}|{marks}|{timer_name}|{machine_fingerprint()}'
+
+    def _read(self) -> dict[str, CalibrationEntry]:
+        """Read the entries from the cache file, ignoring a missing or unreadable file.
+
+        Stale entries and entries for transient benchmark ids are left out.
+
+        :return: The entries in the file.
+        """
+        try:
+            with self._path.open('r', encoding='utf-8') as cache_file:
+                raw = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        entries: dict[str, CalibrationEntry] = {}
+        if isinstance(raw, dict):
+            for key, value in raw.items():
+                try:
+                    entry = CalibrationEntry(int(value['rounds']), float(value['per_call_ns']),
+                                             float(value.get('stored_at', 0.0)))
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    continue
+                if not entry.stale and self.cacheable(key.partition('|')[0]):
+                    entries[key] = entry
+        return entries
+
+    def get(self, key: str) -> CalibrationEntry | None:
+        """Return the cached calibration for a key.
+
+        :param key: The cache key (see :meth:`key`).
+        :return: The cached calibration, or None if there is none.
+        """
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries.get(key)
+
+    def store(self, key: str, *, rounds: int, per_call_ns: float) -> None:
+        """Store a calibration and write the cache file.
+
+        The file is rewritten without its stale entries. Failures to write the file are
+        ignored: the cache is an optimization only.
+
+        :param key: The cache key (see :meth:`key`).
+        :param rounds: The calibrated number of rounds.
+        :param per_call_ns: The per-call time of the action measured with ``rounds`` rounds.
+        :raises SimpleBenchTypeError: If ``rounds`` is not an int or ``per_call_ns`` is not a number.
+        :raises SimpleBenchValueError: If ``rounds`` or ``per_call_ns`` is not positive.
+        """
+        entry = CalibrationEntry(
+            validate_positive_int(rounds, 'rounds',
+                                  _CalibrationCacheErrorTag.STORE_INVALID_ROUNDS_TYPE,
+                                  _CalibrationCacheErrorTag.STORE_INVALID_ROUNDS_VALUE),
+            validate_positive_float(per_call_ns, 'per_call_ns',
+                                    _CalibrationCacheErrorTag.STORE_INVALID_PER_CALL_NS_TYPE,
+                                    _CalibrationCacheErrorTag.STORE_INVALID_PER_CALL_NS_VALUE),
+            time.time())
+        entries = self._read()
+        entries[key] = entry
+        self._entries = entries
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=self._path.name, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                json.dump({key: entry._asdict() for key, entry in entries.items()}, tmp_file, indent=2)
+            os.replace(tmp_name, self._path)
+        except OSError:
+            pass
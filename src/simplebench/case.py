@@ -3,14 +3,18 @@ from __future__ import annotations
 
 import inspect
 import itertools
+import math
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from copy import copy
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, get_type_hints
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Sequence, get_type_hints
 
 import simplebench.defaults as defaults
 
 from .doc_utils import format_docstring
-from .enums import Color
+from .enums import Color, GCPolicy, MemoryStrategy, PrecisionStatistic, WarmupStrategy
 from .exceptions import (
     SimpleBenchAttributeError,
     SimpleBenchBenchmarkError,
@@ -19,6 +23,8 @@ from .exceptions import (
     SimpleBenchValueError,
     _CaseErrorTag,
 )
+from .interleave import run_interleaved
+from .isolation import run_isolated
 from .protocols import ActionRunner
 from .reporters.protocols import ReporterCallback
 from .reporters.reporter.options import ReporterOptions
@@ -26,11 +32,15 @@ from .reporters.validators.validators import validate_reporter_callback
 from .results import Results
 from .runners import SimpleRunner
 from .tasks import ProgressTracker
+from .utils import CPUPinning, available_cpus, cpu_pinning, pin_to_cpu, spread_over_cores
 from .validators import (
+    validate_float_range,
+    validate_int_range,
     validate_non_blank_string,
     validate_non_negative_int,
     validate_positive_float,
     validate_positive_int,
+    validate_sequence_of_type,
     validate_string,
     validate_type,
 )
@@ -84,7 +94,62 @@ def generate_benchmark_id(obj: object | None, action: Callable[..., Any]) -> str
         return benchmark_id
     except (AttributeError, TypeError):  # More specific exception handling
         # Fallback to transient ID for built-ins, interactively defined functions, etc.
-        return f'transient-{id(obj)}'
+        return f'{defaults.TRANSIENT_BENCHMARK_ID_PREFIX}{id(obj)}'
+
+
+_WORKER_CASE: Case | None = None
+"""The Case being run by a parallel worker process (set by the pool initializer)."""
+_WORKER_SESSION: Session | None = None
+"""The worker-local copy of the Session for a parallel worker process."""
+_WORKER_SLOT: int = 0
+"""The worker slot number claimed by a parallel worker process."""
+_WORKER_CPU: int | None = None
+"""The CPU a parallel worker process is pinned to, or None if it is not pinned."""
+
+
+def _parallel_worker_init(case: Case, session: Session | None, slots: Any) -> None:
+    """Initialize a worker process for running kwargs variations in parallel.
+
+    The worker claims a (slot, cpu) pair from the shared ``slots`` queue and pins itself to
+    that CPU where the platform supports it. Progress display is disabled on the worker's
+    copy of the session so that only the parent process writes to the console.
+
+    :param case: The Case whose variations the worker will run.
+    :param session: The parent process's Session, or None.
+    :param slots: A multiprocessing queue of ``(slot, cpu)`` tuples.
+    """
+    global _WORKER_CASE, _WORKER_SESSION, _WORKER_SLOT, _WORKER_CPU  # pylint: disable=global-statement
+    _WORKER_CASE = case
+    if session is not None:
+        session.show_progress = False
+    _WORKER_SESSION = session
+    _WORKER_SLOT, cpu = slots.get()
+    _WORKER_CPU = pin_to_cpu(cpu)
+
+
+def _parallel_worker_run(
+        index: int, kwargs: dict[str, Any]) -> tuple[int, int, Results | None, str | None, str]:
+    """Run one kwargs variation of the worker's Case.
+
+    Exceptions are returned as text rather than raised because tagged exceptions
+    do not survive the trip back through the process pool.
+
+    :param index: The position of the variation in the case's expanded kwargs variations.
+    :param kwargs: The keyword arguments for the variation.
+    :return: A tuple of (index, worker slot, results, error kind, error message). The error kind is
+        None on success, ``'timeout'`` for timeouts and ``'error'`` for any other exception.
+    """
+    if _WORKER_CASE is None:  # pragma: no cover
+        return index, _WORKER_SLOT, None, 'error', 'worker process was not initialized'
+    try:
+        bench = _WORKER_CASE._create_runner(  # pylint: disable=protected-access
+            kwargs=kwargs, session=_WORKER_SESSION)
+        results = _WORKER_CASE.action(bench, **kwargs)
+    except SimpleBenchTimeoutError as e:
+        return index, _WORKER_SLOT, None, 'timeout', str(e)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return index, _WORKER_SLOT, None, 'error', f'{e}, {type(e)}'
+    return index, _WORKER_SLOT, results, None, ''
 
 
 class Case:
@@ -102,6 +167,8 @@ class Case:
     using the default SimpleRunner:
     - The benchmark will perform `warmup_iterations` iterations before starting the timing
         and measurement phase. This is done to allow for any setup or caching effects to stabilize.
+        With the :attr:`WarmupStrategy.AUTO` `warmup_strategy` it instead runs warmup iterations
+        until the iteration times reach a steady state.
         This is separate from the main benchmark iterations and does not count towards the
         `iterations` count or the `min_time`/`max_time` limits.
     - The benchmark will run for at least `min_time` wall clock seconds, but will stop on
@@ -135,6 +202,9 @@ class Case:
 
     The unrolled loop means that setup and teardown functions (if any) are called only once per iteration,
     not once per round. All rounds in the same iteration share the same setup/teardown context.
+    Actions that mutate their input can instead pass an ``input_factory`` to
+    :meth:`SimpleRunner.run() <simplebench.runners.SimpleRunner.run>`: every round then gets a
+    fresh input, generated in batches outside of the timed region.
 
     It is recommended to leave `rounds` to its default of ``None``. A setting of ``None`` enables
     auto-calibration of rounds based on the expected execution time of the action and the
@@ -173,13 +243,25 @@ class Case:
 
     '''
     __slots__ = ('_group', '_title', '_description', '_action',
-                 '_iterations', '_warmup_iterations', '_min_time', '_max_time',
+                 '_iterations', '_warmup_iterations', '_warmup_strategy', '_min_time', '_max_time',
                  '_variation_cols', '_kwargs_variations', '_runner',
                  '_callback', '_results', '_options', '_rounds',
-                 '_benchmark_id', '_git_info', '_timeout', '_timer')
+                 '_benchmark_id', '_git_info', '_timeout', '_timer', '_jobs', '_interleave',
+                 '_memory_strategy', '_memory_samples', '_latency_samples', '_latency_sample_rate',
+                 '_allocation_sites', '_allocation_frames', '_native_memory',
+                 '_target_precision', '_precision_statistic', '_confidence_level',
+                 '_subtract_baseline', '_gc_policy', '_cpu_affinity', '_priority', '_pinning')
 
     @format_docstring(DEFAULT_TIMEOUT_GRACE_PERIOD=defaults.DEFAULT_TIMEOUT_GRACE_PERIOD,
-                      DEFAULT_TIMER=defaults.DEFAULT_TIMER.__name__,)
+                      DEFAULT_TIMER=defaults.DEFAULT_TIMER.__name__,
+                      DEFAULT_JOBS=defaults.DEFAULT_JOBS,
+                      DEFAULT_MEMORY_SAMPLES=defaults.DEFAULT_MEMORY_SAMPLES,
+                      DEFAULT_ALLOCATION_FRAMES=defaults.DEFAULT_ALLOCATION_FRAMES,
+                      DEFAULT_TAIL_PERCENTILES=', '.join(f'{p:g}' for p in defaults.DEFAULT_TAIL_PERCENTILES),
+                      DEFAULT_QUANTIZATION_RATIO=f'{defaults.DEFAULT_QUANTIZATION_RATIO:g}',
+                      DEFAULT_CONFIDENCE_LEVEL=defaults.DEFAULT_CONFIDENCE_LEVEL,
+                      DEFAULT_WARMUP_WINDOW=defaults.DEFAULT_WARMUP_WINDOW,
+                      DEFAULT_MAX_WARMUP_ITERATIONS=defaults.DEFAULT_MAX_WARMUP_ITERATIONS)
     def __init__(self, *,
                  benchmark_id: Optional[str] = None,
                  git_info: Optional[GitInfo] = None,
@@ -189,6 +271,7 @@ class Case:
                  description: Optional[str] = None,
                  iterations: int = defaults.DEFAULT_ITERATIONS,
                  warmup_iterations: int = defaults.DEFAULT_WARMUP_ITERATIONS,
+                 warmup_strategy: WarmupStrategy = WarmupStrategy.FIXED,
                  rounds: int | None = None,
                  timer: Callable[[], int] | None = None,
                  min_time: float = defaults.DEFAULT_MIN_TIME,
@@ -198,7 +281,23 @@ class Case:
                  kwargs_variations: Optional[dict[str, list[Any]]] = None,
                  runner: Optional[type[SimpleRunner]] = None,
                  callback: Optional[ReporterCallback] = None,
-                 options: Optional[Iterable[ReporterOptions]] = None) -> None:
+                 options: Optional[Iterable[ReporterOptions]] = None,
+                 jobs: int | None = None,
+                 interleave: bool = False,
+                 memory_strategy: MemoryStrategy = MemoryStrategy.EVERY_ITERATION,
+                 memory_samples: int = defaults.DEFAULT_MEMORY_SAMPLES,
+                 latency_samples: int | None = None,
+                 latency_sample_rate: float = 1.0,
+                 allocation_sites: int | None = None,
+                 allocation_frames: int = defaults.DEFAULT_ALLOCATION_FRAMES,
+                 native_memory: bool = False,
+                 target_precision: float | None = None,
+                 precision_statistic: PrecisionStatistic = PrecisionStatistic.MEAN,
+                 confidence_level: float = defaults.DEFAULT_CONFIDENCE_LEVEL,
+                 subtract_baseline: bool = False,
+                 gc_policy: GCPolicy = GCPolicy.ENABLED,
+                 cpu_affinity: Sequence[int] | None = None,
+                 priority: int | None = None) -> None:
         """The only REQUIRED parameter is `action`.
 
         :param benchmark_id: An optional unique identifier for the benchmark case.
@@ -234,6 +333,17 @@ class Case:
             '(no description)' if no docstring is available. Cannot be blank.
         :param iterations: The minimum number of iterations to run for the benchmark.
         :param warmup_iterations: The number of warmup iterations to run before the benchmark.
+        :param warmup_strategy: How the number of warmup iterations is decided.
+
+            :attr:`WarmupStrategy.FIXED` (the default) runs ``warmup_iterations`` warmup iterations.
+            :attr:`WarmupStrategy.AUTO` runs warmup iterations until the medians of two consecutive
+            windows of {DEFAULT_WARMUP_WINDOW} iteration times no longer differ by more than their noise
+            (see :func:`~simplebench.stats.steady_state_start`), for at most {DEFAULT_MAX_WARMUP_ITERATIONS}
+            iterations or half of ``max_time``, and ignores ``warmup_iterations``. Whatever the strategy,
+            the per-round times of the warmup iterations are kept as the WARMUP section. With
+            :attr:`WarmupStrategy.AUTO`, a single call of the action (with its setup and teardown)
+            is also timed before anything else, and its time in seconds is recorded in
+            :attr:`Results.extra_info` under ``'first_call_elapsed'`` (None with a fixed warmup).
         :param rounds: The number of rounds to run for the benchmark.
 
             Rounds are multiple runs of calls to the action within an iteration to mitigate timer
@@ -312,6 +422,120 @@ class Case:
             specific reporters. Reporters are responsible for extracting applicable ReporterOptions
             from the list of options themselves.
             If None, an empty list is used.
+        :param jobs: The number of worker processes used to run the kwargs variations of the case.
+
+            If None, the ``jobs`` setting of the Session (if any) is used, falling back to
+            {DEFAULT_JOBS}. When greater than 1, variations are dispatched to a pool of worker
+            processes, each pinned to its own CPU where the platform supports it. Results are
+            always stored in the same order as :attr:`expanded_kwargs_variations`. Parallel
+            execution requires the ``fork`` start method; on platforms without it the
+            variations are run serially.
+        :param interleave: Whether to run the kwargs variations of the case interleaved.
+
+            If True, all the variations are started at once in the current process and take
+            turns, one iteration at a time, in round-robin order reshuffled at random for every
+            round (see :mod:`simplebench.interleave`). Slow drifts of the environment such as
+            thermal throttling are then spread evenly over the variations instead of landing on
+            the ones run last. Each variation still gets its own Results. Interleaved variations
+            are never run in parallel or isolated, whatever the ``jobs`` and isolation settings.
+            Defaults to False.
+        :param memory_strategy: When the memory usage of the action is measured.
+
+            Memory is measured with ``tracemalloc`` in an extra, untimed call of the action
+            (with its own setup and teardown). :attr:`MemoryStrategy.EVERY_ITERATION` (the default)
+            does this after every iteration, :attr:`MemoryStrategy.EVERY_NTH` after every
+            ``memory_samples``-th measured iteration, :attr:`MemoryStrategy.AFTER_TIMING` in
+            ``memory_samples`` dedicated calls after timing has finished and
+            :attr:`MemoryStrategy.OFF` not at all. The MEMORY and PEAK_MEMORY sections are
+            computed from whichever samples were taken, and left out of the reports when
+            memory was not measured.
+        :param memory_samples: The N for :attr:`MemoryStrategy.EVERY_NTH` or the number of samples
+            for :attr:`MemoryStrategy.AFTER_TIMING`. Must be a positive integer.
+            Defaults to {DEFAULT_MEMORY_SAMPLES}.
+        :param latency_samples: The number of individually timed calls of the action used to
+            measure its per-call latency distribution.
+
+            Each iteration times `rounds` calls as one aggregate, so the TIMING percentiles
+            describe per-round means and hide the tail latency of single calls. If set, after
+            timing has finished each variation times this many calls one by one into a
+            preallocated buffer, subtracts the timer overhead from every sample and records
+            them in the LATENCY section. The {DEFAULT_TAIL_PERCENTILES} percentiles are recorded in
+            :attr:`Results.extra_info` under ``'tail_latencies'``, and those below
+            {DEFAULT_QUANTIZATION_RATIO} times the timer precision (too short for the timer to
+            resolve reliably) are listed under ``'quantized_tail_latencies'``. If None (the default), no
+            per-call latencies are measured. Ignored by :class:`~simplebench.runners.LoadRunner`,
+            which always records the latency of every call.
+        :param latency_sample_rate: The fraction of calls that are timed when measuring per-call
+            latencies, between 0.0 exclusive and 1.0.
+
+            With a rate below 1.0, the timed calls are picked at random among back to back
+            calls of the action, the others running untimed, so `latency_samples` samples cover
+            about `latency_samples / latency_sample_rate` calls. Defaults to 1.0 (every call is timed).
+        :param allocation_sites: The number of allocation sites reported for each variation.
+
+            If set, after timing has finished each variation makes one more untimed call of the
+            action between two ``tracemalloc`` snapshots and the sites that allocated the most
+            memory still held when the call returned are stored in
+            :attr:`Results.allocation_sites`, largest first. They are shown by the
+            ``--allocations`` and ``--allocations-json`` reports. If None (the default), allocation
+            sites are not measured.
+        :param allocation_frames: The number of frames recorded for each allocation when measuring
+            allocation sites. With more than one frame, allocations from the same line reached
+            through different callers are reported as separate sites. Defaults to {DEFAULT_ALLOCATION_FRAMES}.
+        :param native_memory: Whether to measure the native memory of the process around every iteration.
+
+            :mod:`tracemalloc` only sees allocations made through Python's allocators, so memory
+            allocated by C extensions, :mod:`mmap` and arena growth is missing from the MEMORY and
+            PEAK_MEMORY sections. If True, the resident, unique and proportional set sizes of the
+            process are read from ``/proc/self`` before and after each timed iteration (outside the
+            timed region) and their changes are reported in the RSS, USS and PSS sections. The
+            resident set size high-water mark is reset before each iteration and reported in the
+            PEAK_RSS section; as it is shared with :func:`resource.getrusage`, MAX_RSS then also
+            becomes the peak of each iteration. Reading the sizes costs tens of microseconds per
+            iteration. On platforms without ``/proc/self/smaps_rollup`` (Linux 4.14 or later) the
+            sections are all zeros. Defaults to False.
+        :param target_precision: The target relative precision of the per-round time, as a fraction
+            (e.g. 0.01 for ±1%).
+
+            If None (the default), each variation runs for at least `min_time` and `iterations`.
+            If set, `min_time` is ignored: each variation stops once it has run at least
+            `iterations` iterations and the confidence interval half-width of the
+            `precision_statistic` has dropped below `target_precision` times the statistic,
+            or when `max_time` is reached. The achieved precision is always recorded in
+            :attr:`Results.extra_info` under ``'precision'``.
+        :param precision_statistic: Whether precision is judged on the mean or the median
+            per-round time. Defaults to :attr:`PrecisionStatistic.MEAN`.
+        :param confidence_level: The confidence level of the precision confidence interval,
+            between 0.0 and 1.0 exclusive. Defaults to {DEFAULT_CONFIDENCE_LEVEL}.
+        :param subtract_baseline: Whether to subtract the baseline from the reported timings.
+
+            Before timing, each variation times a no-op action with the same signature and
+            argument binding, using the same rounds and timer. The median per-round time of this
+            baseline (the cost of the call sequence and timer reads themselves) is always recorded
+            in :attr:`Results.extra_info` under ``'baseline_per_round'``. If True, it is also
+            subtracted from the per-round timings in the TIMING and OPS sections. Defaults to False.
+        :param gc_policy: How the garbage collector is handled while the action is timed.
+
+            :attr:`GCPolicy.ENABLED` (the default) leaves it enabled,
+            :attr:`GCPolicy.DISABLE_DURING_TIMING` disables it for the duration of each timed
+            iteration and :attr:`GCPolicy.COLLECT_BEFORE_ITERATION` runs a full collection
+            before every iteration. Whatever the policy, the collections that happen during
+            each timed iteration are reported in the GC section and the share of the timed
+            time spent in them is recorded in :attr:`Results.extra_info` under ``'gc_time_fraction'``.
+        :param cpu_affinity: The CPUs the case is run on.
+
+            If None, the ``cpu_affinity`` setting of the Session (if any) is used, falling back to
+            leaving the affinity unchanged. The process is restricted to these CPUs with
+            :func:`os.sched_setaffinity` while the case runs, and parallel or isolated workers
+            are pinned round-robin over them, one physical core at a time before SMT siblings.
+            The effective CPUs, niceness and number of observed CPU migrations of each variation
+            are recorded in :attr:`Results.extra_info`.
+        :param priority: The niceness the case is run with, from -20 (highest priority) to 19.
+
+            If None, the ``priority`` setting of the Session (if any) is used, falling back to
+            leaving the niceness unchanged. It is set with :func:`os.setpriority` while the case
+            runs. Raising the priority usually requires elevated privileges; if it cannot be set
+            the case runs with the niceness it has.
         :raises SimpleBenchTypeError: If any parameter is of incorrect type.
         :raises SimpleBenchValueError: If any parameter has an invalid value.
         """
@@ -342,6 +566,8 @@ class Case:
                         warmup_iterations, "warmup_iterations",
                         _CaseErrorTag.INVALID_WARMUP_ITERATIONS_TYPE,
                         _CaseErrorTag.INVALID_WARMUP_ITERATIONS_VALUE)
+        self._warmup_strategy: WarmupStrategy = validate_type(
+            warmup_strategy, WarmupStrategy, 'warmup_strategy', _CaseErrorTag.INVALID_WARMUP_STRATEGY_TYPE)
         self._rounds: int | None = None
         if rounds is not None:
             self._rounds = validate_positive_int(
@@ -396,12 +622,135 @@ class Case:
         self._runner = Case.validate_runner(runner)
         self._callback = validate_reporter_callback(callback, allow_none=True)
         self._options = Case.validate_options(options)
+        self._init_execution(jobs=jobs, interleave=interleave, cpu_affinity=cpu_affinity, priority=priority)
+        self._init_measurements(memory_strategy=memory_strategy, memory_samples=memory_samples,
+                                latency_samples=latency_samples, latency_sample_rate=latency_sample_rate,
+                                allocation_sites=allocation_sites, allocation_frames=allocation_frames,
+                                native_memory=native_memory)
+        self._init_precision(target_precision=target_precision, precision_statistic=precision_statistic,
+                             confidence_level=confidence_level)
+        self._subtract_baseline: bool = validate_type(
+            subtract_baseline, bool, 'subtract_baseline', _CaseErrorTag.INVALID_SUBTRACT_BASELINE_TYPE)
+        self._gc_policy: GCPolicy = validate_type(
+            gc_policy, GCPolicy, 'gc_policy', _CaseErrorTag.INVALID_GC_POLICY_TYPE)
+        self._pinning: CPUPinning | None = None
         self._results: list[Results] = []  # No validation needed here
-        self.validate_time_range(self._min_time, self._max_time)
+        if self._target_precision is None:  # min_time is not used when stopping on precision
+            self.validate_time_range(self._min_time, self._max_time)
         self._git_info: GitInfo | None = get_git_info() if git_info is None else validate_type(
             git_info, GitInfo, 'git_info', _CaseErrorTag.INVALID_GIT_INFO_ARG_TYPE
         )
 
+    def _init_execution(self, *,
+                        jobs: int | None,
+                        interleave: bool,
+                        cpu_affinity: Sequence[int] | None,
+                        priority: int | None) -> None:
+        """Validate and set how the kwargs variations of the case are executed (see :meth:`__init__`).
+
+        :param jobs: The number of worker processes, or None to use the session setting.
+        :param interleave: Whether the kwargs variations are run interleaved.
+        :param cpu_affinity: The CPUs the case is run on, or None to use the session setting.
+        :param priority: The niceness the case is run with, or None to use the session setting.
+        :raises SimpleBenchTypeError: If any parameter is of incorrect type.
+        :raises SimpleBenchValueError: If any parameter has an invalid value.
+        """
+        self._jobs: int | None = None
+        if jobs is not None:
+            self._jobs = validate_positive_int(
+                        jobs, "jobs",
+                        _CaseErrorTag.INVALID_JOBS_TYPE,
+                        _CaseErrorTag.INVALID_JOBS_VALUE)
+        self._interleave: bool = validate_type(
+            interleave, bool, 'interleave', _CaseErrorTag.INVALID_INTERLEAVE_TYPE)
+        self._cpu_affinity: tuple[int, ...] | None = None
+        if cpu_affinity is not None:
+            self._cpu_affinity = Case.validate_cpu_affinity(cpu_affinity)
+        self._priority: int | None = None
+        if priority is not None:
+            self._priority = validate_int_range(
+                        priority, "priority",
+                        _CaseErrorTag.INVALID_PRIORITY_TYPE,
+                        _CaseErrorTag.INVALID_PRIORITY_VALUE,
+                        min_value=-20, max_value=19)
+
+    def _init_measurements(self, *,
+                           memory_strategy: MemoryStrategy,
+                           memory_samples: int,
+                           latency_samples: int | None,
+                           latency_sample_rate: float,
+                           allocation_sites: int | None,
+                           allocation_frames: int,
+                           native_memory: bool) -> None:
+        """Validate and set the memory, latency and allocation measurements of the case (see :meth:`__init__`).
+
+        :param memory_strategy: When the memory usage of the action is measured.
+        :param memory_samples: The number of memory samples.
+        :param latency_samples: The number of per-call latency samples, or None to skip them.
+        :param latency_sample_rate: The fraction of calls timed when measuring per-call latencies.
+        :param allocation_sites: The number of allocation sites reported, or None to skip them.
+        :param allocation_frames: The number of frames recorded for each allocation.
+        :param native_memory: Whether the native memory of the process is measured.
+        :raises SimpleBenchTypeError: If any parameter is of incorrect type.
+        :raises SimpleBenchValueError: If any parameter has an invalid value.
+        """
+        self._memory_strategy: MemoryStrategy = validate_type(
+            memory_strategy, MemoryStrategy, 'memory_strategy', _CaseErrorTag.INVALID_MEMORY_STRATEGY_TYPE)
+        self._memory_samples: int = validate_positive_int(
+                        memory_samples, "memory_samples",
+                        _CaseErrorTag.INVALID_MEMORY_SAMPLES_TYPE,
+                        _CaseErrorTag.INVALID_MEMORY_SAMPLES_VALUE)
+        self._latency_samples: int | None = None
+        if latency_samples is not None:
+            self._latency_samples = validate_positive_int(
+                        latency_samples, "latency_samples",
+                        _CaseErrorTag.INVALID_LATENCY_SAMPLES_TYPE,
+                        _CaseErrorTag.INVALID_LATENCY_SAMPLES_VALUE)
+        self._latency_sample_rate: float = validate_float_range(
+                        latency_sample_rate, "latency_sample_rate",
+                        _CaseErrorTag.INVALID_LATENCY_SAMPLE_RATE_TYPE,
+                        _CaseErrorTag.INVALID_LATENCY_SAMPLE_RATE_VALUE,
+                        min_value=math.nextafter(0.0, 1.0), max_value=1.0)
+        self._allocation_sites: int | None = None
+        if allocation_sites is not None:
+            self._allocation_sites = validate_positive_int(
+                        allocation_sites, "allocation_sites",
+                        _CaseErrorTag.INVALID_ALLOCATION_SITES_TYPE,
+                        _CaseErrorTag.INVALID_ALLOCATION_SITES_VALUE)
+        self._allocation_frames: int = validate_positive_int(
+                        allocation_frames, "allocation_frames",
+                        _CaseErrorTag.INVALID_ALLOCATION_FRAMES_TYPE,
+                        _CaseErrorTag.INVALID_ALLOCATION_FRAMES_VALUE)
+        self._native_memory: bool = validate_type(
+            native_memory, bool, 'native_memory', _CaseErrorTag.INVALID_NATIVE_MEMORY_TYPE)
+
+    def _init_precision(self, *,
+                        target_precision: float | None,
+                        precision_statistic: PrecisionStatistic,
+                        confidence_level: float) -> None:
+        """Validate and set the precision-based stopping rule of the case (see :meth:`__init__`).
+
+        :param target_precision: The target relative confidence interval half-width, or None.
+        :param precision_statistic: Whether precision is judged on the mean or the median.
+        :param confidence_level: The confidence level of the precision confidence interval.
+        :raises SimpleBenchTypeError: If any parameter is of incorrect type.
+        :raises SimpleBenchValueError: If any parameter has an invalid value.
+        """
+        self._target_precision: float | None = None
+        if target_precision is not None:
+            self._target_precision = validate_positive_float(
+                        target_precision, "target_precision",
+                        _CaseErrorTag.INVALID_TARGET_PRECISION_TYPE,
+                        _CaseErrorTag.INVALID_TARGET_PRECISION_VALUE)
+        self._precision_statistic: PrecisionStatistic = validate_type(
+            precision_statistic, PrecisionStatistic, 'precision_statistic',
+            _CaseErrorTag.INVALID_PRECISION_STATISTIC_TYPE)
+        self._confidence_level: float = validate_float_range(
+                        confidence_level, "confidence_level",
+                        _CaseErrorTag.INVALID_CONFIDENCE_LEVEL_TYPE,
+                        _CaseErrorTag.INVALID_CONFIDENCE_LEVEL_VALUE,
+                        min_value=math.nextafter(0.0, 1.0), max_value=math.nextafter(1.0, 0.0))
+
     @staticmethod
     def validate_time_range(min_time: float, max_time: float) -> None:
         """Validate that min_time < max_time for the case.
@@ -472,9 +821,10 @@ class Case:
         # Use the resolved type hint if available, otherwise use the annotation from signature
         actual_annotation = type_hints.get('_bench', bench_param.annotation)
 
-        if actual_annotation != SimpleRunner:
+        # Runner subclasses such as LoadRunner are accepted so that their own run() options type check
+        if not (isinstance(actual_annotation, type) and issubclass(actual_annotation, SimpleRunner)):
             raise SimpleBenchTypeError(
-                f'Invalid action: {action}. "_bench" parameter must be of type SimpleRunner.',
+                f'Invalid action: {action}. "_bench" parameter must be of type SimpleRunner or a subclass.',
                 tag=_CaseErrorTag.INVALID_ACTION_BENCH_PARAMETER_WRONG_TYPE
                 )
 
@@ -609,6 +959,27 @@ class Case:
             validated_dict[key] = stripped_value
         return validated_dict
 
+    @staticmethod
+    def validate_cpu_affinity(value: Sequence[int]) -> tuple[int, ...]:
+        """Validate the CPUs to run the case on.
+
+        :param value: The CPU numbers to validate.
+        :return: The sorted, de-duplicated CPU numbers.
+        :rtype: tuple[int, ...]
+        :raises SimpleBenchTypeError: If the value is not a sequence of ints.
+        :raises SimpleBenchValueError: If the sequence is empty or a CPU number is negative.
+        """
+        cpus = validate_sequence_of_type(
+            value, int, 'cpu_affinity',
+            _CaseErrorTag.INVALID_CPU_AFFINITY_TYPE,
+            _CaseErrorTag.INVALID_CPU_AFFINITY_VALUE,
+            allow_empty=False)
+        if any(cpu < 0 for cpu in cpus):
+            raise SimpleBenchValueError(
+                f'Invalid cpu_affinity: {value}. CPU numbers cannot be negative.',
+                tag=_CaseErrorTag.INVALID_CPU_AFFINITY_VALUE)
+        return tuple(sorted(set(cpus)))
+
     @staticmethod
     def validate_runner(value: type[SimpleRunner] | None) -> type[SimpleRunner] | None:
         """Validate the runner class.
@@ -756,6 +1127,11 @@ class Case:
         """The number of warmup iterations to run before the benchmark."""
         return self._warmup_iterations
 
+    @property
+    def warmup_strategy(self) -> WarmupStrategy:
+        """How the number of warmup iterations is decided."""
+        return self._warmup_strategy
+
     @property
     def rounds(self) -> int | None:
         """The number of rounds to run for the benchmark for each iteration.
@@ -790,6 +1166,107 @@ class Case:
         """The timeout for the benchmark in seconds."""
         return self._timeout
 
+    @property
+    def jobs(self) -> int | None:
+        """The number of worker processes used to run the kwargs variations of the case.
+
+        If None, the ``jobs`` setting of the Session running the case is used.
+        """
+        return self._jobs
+
+    @property
+    def interleave(self) -> bool:
+        """Whether the kwargs variations of the case are run interleaved, one iteration at a time."""
+        return self._interleave
+
+    @property
+    def memory_strategy(self) -> MemoryStrategy:
+        """When the memory usage of the action is measured."""
+        return self._memory_strategy
+
+    @property
+    def memory_samples(self) -> int:
+        """The N for :attr:`MemoryStrategy.EVERY_NTH` or the number of samples
+        for :attr:`MemoryStrategy.AFTER_TIMING`."""
+        return self._memory_samples
+
+    @property
+    def latency_samples(self) -> int | None:
+        """The number of individually timed calls used to measure the per-call latency
+        distribution, or None if it is not measured."""
+        return self._latency_samples
+
+    @property
+    def latency_sample_rate(self) -> float:
+        """The fraction of calls that are timed when measuring per-call latencies."""
+        return self._latency_sample_rate
+
+    @property
+    def allocation_sites(self) -> int | None:
+        """The number of allocation sites reported for each variation, or None if they are
+        not measured."""
+        return self._allocation_sites
+
+    @property
+    def allocation_frames(self) -> int:
+        """The number of frames recorded for each allocation when measuring allocation sites."""
+        return self._allocation_frames
+
+    @property
+    def native_memory(self) -> bool:
+        """Whether the native memory (RSS, USS, PSS and peak RSS) of the process is measured
+        around every iteration."""
+        return self._native_memory
+
+    @property
+    def target_precision(self) -> float | None:
+        """The target relative precision of the per-round time, or None to stop on
+        `min_time` and `iterations`."""
+        return self._target_precision
+
+    @property
+    def precision_statistic(self) -> PrecisionStatistic:
+        """Whether precision is judged on the mean or the median per-round time."""
+        return self._precision_statistic
+
+    @property
+    def confidence_level(self) -> float:
+        """The confidence level of the precision confidence interval."""
+        return self._confidence_level
+
+    @property
+    def subtract_baseline(self) -> bool:
+        """Whether the measured baseline of an empty action is subtracted from the TIMING
+        and OPS sections."""
+        return self._subtract_baseline
+
+    @property
+    def gc_policy(self) -> GCPolicy:
+        """How the garbage collector is handled while the action is timed."""
+        return self._gc_policy
+
+    @property
+    def cpu_affinity(self) -> tuple[int, ...] | None:
+        """The CPUs the case is run on.
+
+        If None, the ``cpu_affinity`` setting of the Session running the case is used.
+        """
+        return self._cpu_affinity
+
+    @property
+    def priority(self) -> int | None:
+        """The niceness the case is run with.
+
+        If None, the ``priority`` setting of the Session running the case is used.
+        """
+        return self._priority
+
+    @property
+    def pinning(self) -> CPUPinning | None:
+        """The effective CPU pinning and niceness of the last run of the case, or None if
+        it has not been run."""
+        return self._pinning
+
     @property
     def variation_cols(self) -> dict[str, str]:
         """Keyword arguments to be used for columns to denote kwarg variations.
@@ -946,6 +1423,86 @@ class Case:
         If passed, the session's tasks will be used to display progress,
         control verbosity, and pass CLI arguments to the benchmark runner.
 
+        If the effective number of :attr:`jobs` is greater than 1 and there is more than
+        one variation, the variations are run in parallel worker processes (see :meth:`_run_parallel`).
+
+        If the session is in isolated mode, each variation is run in its own fresh child
+        process forked from a pre-warmed fork server (see :mod:`simplebench.isolation`).
+
+        If :attr:`interleave` is True, the variations are run interleaved with each other in
+        the current process instead (see :mod:`simplebench.interleave`).
+
+        While the case runs, the process is restricted to the effective :attr:`cpu_affinity`
+        and runs with the effective :attr:`priority` (see :func:`~simplebench.utils.cpu_pinning`).
+        The previous affinity and niceness are restored afterwards and the pinning the case
+        ran with is kept in :attr:`pinning`.
+
+        :param session: The session to use for the benchmark case.
+        :raises SimpleBenchTimeoutError: If a timeout occurs during the benchmark action.
+        :raises SimpleBenchBenchmarkError: If an error occurs during the benchmark action.
+        """
+        with self.pinned(session):
+            self._run_variations(session)
+
+    @contextmanager
+    def pinned(self, session: Optional[Session] = None) -> Iterator[CPUPinning]:
+        """Restrict the current thread to the effective :attr:`cpu_affinity` and :attr:`priority` of the case.
+
+        The case's own settings take priority over those of the session. The pinning is kept
+        in :attr:`pinning` and the previous affinity and niceness are restored on exit.
+
+        If the session is in isolated mode, the niceness is only applied to the child processes
+        running the variations (see :func:`~simplebench.isolation.run_isolated`), so that a
+        lower priority never has to be raised back in the current process.
+
+        :param session: The session running the case, if any.
+        :return: A context manager yielding the effective pinning.
+        :raises SimpleBenchRuntimeError: If the previous niceness could not be restored on exit.
+        """
+        cpus: tuple[int, ...] | None = self._cpu_affinity
+        if cpus is None and session is not None:
+            cpus = session.cpu_affinity
+        priority: int | None = self._priority
+        if priority is None and session is not None:
+            priority = session.priority
+        isolated: bool = session is not None and session.isolated
+        with cpu_pinning(cpus, None if isolated else priority) as pinning:
+            if isolated and priority is not None:
+                pinning = pinning._replace(priority=priority)
+            self._pinning = pinning
+            yield pinning
+
+    @staticmethod
+    def run_interleaved(cases: Sequence[Case], session: Optional[Session] = None) -> None:
+        """Run the kwargs variations of several cases interleaved with each other.
+
+        All the variations of all the cases take turns, one iteration at a time, in
+        round-robin order reshuffled at random for every round (see :mod:`simplebench.interleave`).
+        Each variation runs with the CPU affinity and priority of its own case and the results
+        of each case are stored in its :attr:`results` in :attr:`expanded_kwargs_variations` order.
+
+        :param cases: The cases to run.
+        :param session: The session running the cases, if any.
+        :raises SimpleBenchTimeoutError: If a timeout occurs during a benchmark action.
+        :raises SimpleBenchBenchmarkError: If an error occurs during a benchmark action.
+        """
+        runs: list[tuple[Case, dict[str, Any]]] = [
+            (case, kwargs) for case in cases for kwargs in case.expanded_kwargs_variations]
+        progress_tracker = ProgressTracker(
+            session=session,
+            task_name='Case:run',
+            progress_max=len(runs),
+            description='Running interleaved variations',
+            color=Color.CYAN)
+        progress_tracker.reset()
+        results = run_interleaved(runs, session=session, progress_tracker=progress_tracker)
+        progress_tracker.stop()
+        for (case, _), result in zip(runs, results):
+            case._results.append(result)  # pylint: disable=protected-access
+
+    def _run_variations(self, session: Optional[Session]) -> None:
+        """Run the kwargs variations of the case serially, in parallel, isolated or interleaved (see :meth:`run`).
+
         :param session: The session to use for the benchmark case.
         :raises SimpleBenchTimeoutError: If a timeout occurs during the benchmark action.
         :raises SimpleBenchBenchmarkError: If an error occurs during the benchmark action.
@@ -959,16 +1516,28 @@ class Case:
             color=Color.CYAN)
         progress_tracker.reset()
 
+        if self._interleave:
+            self._results.extend(run_interleaved(
+                [(self, kwargs) for kwargs in all_variations], session=session, progress_tracker=progress_tracker))
+            progress_tracker.stop()
+            return
+
+        jobs = min(self._effective_jobs(session), len(all_variations))
+        if session is not None and session.isolated:
+            self._results.extend(run_isolated(self, all_variations=all_variations, session=session,
+                                              jobs=jobs, progress_tracker=progress_tracker))
+            progress_tracker.stop()
+            return
+
+        if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            self._run_parallel(all_variations=all_variations, session=session,
+                               jobs=jobs, progress_tracker=progress_tracker)
+            progress_tracker.stop()
+            return
+
         kwargs: dict[str, Any]
         for variations_counter, kwargs in enumerate(all_variations):
-            bench: SimpleRunner
-            if self.runner is not None and issubclass(self.runner, SimpleRunner):
-                runner: type[SimpleRunner] = self.runner
-                bench = runner(case=self, session=session, kwargs=kwargs)
-            elif session and session.default_runner is not None:
-                bench = session.default_runner(case=self, session=session, kwargs=kwargs)
-            else:
-                bench = SimpleRunner(case=self, session=session, kwargs=kwargs)
+            bench: SimpleRunner = self._create_runner(kwargs=kwargs, session=session)
             try:
                 results: Results = self.action(bench, **kwargs)
             except SimpleBenchTimeoutError as e:
@@ -991,6 +1560,117 @@ class Case:
                 refresh=True)
         progress_tracker.stop()
 
+    def _effective_jobs(self, session: Optional[Session]) -> int:
+        """The number of worker processes to use when running the case.
+
+        The case's own :attr:`jobs` setting takes priority, then the session's, then
+        :data:`~simplebench.defaults.DEFAULT_JOBS`.
+
+        :param session: The session running the case, if any.
+        :return: The number of worker processes to use.
+        """
+        if self._jobs is not None:
+            return self._jobs
+        if session is not None:
+            return session.jobs
+        return defaults.DEFAULT_JOBS
+
+    def _create_runner(self, *, kwargs: dict[str, Any], session: Optional[Session]) -> SimpleRunner:
+        """Create the runner instance for one kwargs variation of the case.
+
+        The case's :attr:`runner` takes priority, then the session's default runner,
+        then :class:`~.runners.SimpleRunner`.
+
+        :param kwargs: The keyword arguments for the variation.
+        :param session: The session running the case, if any.
+        :return: The runner instance to pass to the action.
+        """
+        if self.runner is not None and issubclass(self.runner, SimpleRunner):
+            runner: type[SimpleRunner] = self.runner
+            return runner(case=self, session=session, kwargs=kwargs)
+        if session and session.default_runner is not None:
+            return session.default_runner(case=self, session=session, kwargs=kwargs)
+        return SimpleRunner(case=self, session=session, kwargs=kwargs)
+
+    def _run_parallel(self, *,
+                      all_variations: list[dict[str, Any]],
+                      session: Optional[Session],
+                      jobs: int,
+                      progress_tracker: ProgressTracker) -> None:
+        """Run the kwargs variations of the case in a pool of worker processes.
+
+        Worker processes are forked from the current process, so the action does not need
+        to be picklable, and each worker pins itself to its own CPU (round-robin over the
+        CPUs available to this process, one physical core at a time before SMT siblings)
+        where :func:`os.sched_setaffinity` is supported.
+
+        Results are stored in the same order as ``all_variations`` regardless of the order
+        in which the workers complete them. The ``Case:run`` progress bar tracks overall
+        completion and each worker gets its own ``Case:worker:<n>`` progress bar.
+
+        :param all_variations: The expanded kwargs variations to run.
+        :param session: The session running the case, if any.
+        :param jobs: The number of worker processes to use.
+        :param progress_tracker: The ``Case:run`` progress tracker.
+        :raises SimpleBenchTimeoutError: If a timeout occurs during the benchmark action.
+        :raises SimpleBenchBenchmarkError: If an error occurs during the benchmark action.
+        """
+        mp_context = multiprocessing.get_context('fork')
+        cpus: list[int | None] = list(spread_over_cores(available_cpus())) or [None]
+        slots = mp_context.Queue()
+        for slot in range(jobs):
+            slots.put((slot, cpus[slot % len(cpus)]))
+
+        worker_trackers: list[ProgressTracker] = []
+        for slot in range(jobs):
+            worker_tracker = ProgressTracker(
+                session=session,
+                task_name=f'Case:worker:{slot}',
+                progress_max=len(all_variations),
+                description=f'Worker {slot + 1}/{jobs} waiting',
+                color=Color.BLUE)
+            worker_tracker.reset()
+            worker_trackers.append(worker_tracker)
+        worker_completed: list[int] = [0] * jobs
+
+        ordered_results: list[Results | None] = [None] * len(all_variations)
+        completed: int = 0
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context,
+                                 initializer=_parallel_worker_init,
+                                 initargs=(self, session, slots)) as executor:
+            futures: list[Future] = [
+                executor.submit(_parallel_worker_run, index, kwargs)
+                for index, kwargs in enumerate(all_variations)]
+            for future in as_completed(futures):
+                index, slot, results, error_kind, error_message = future.result()
+                kwargs = all_variations[index]
+                if error_kind is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    if error_kind == 'timeout':
+                        raise SimpleBenchTimeoutError(
+                            f'Timeout occurred running benchmark action {str(self.action)} for case '
+                            f'"{self.title}" with kwargs {kwargs}: {error_message}',
+                            tag=_CaseErrorTag.BENCHMARK_ACTION_TIMEOUT_OCCURRED)
+                    raise SimpleBenchBenchmarkError(
+                        f'Error occurred running benchmark action {str(self.action)} for case '
+                        f'"{self.title}" with kwargs {kwargs}: {error_message}',
+                        tag=_CaseErrorTag.BENCHMARK_ACTION_RAISED_EXCEPTION)
+                ordered_results[index] = results
+                completed += 1
+                worker_completed[slot] += 1
+                worker_trackers[slot].update(
+                    description=f'Worker {slot + 1}/{jobs} finished {kwargs}',
+                    completed=worker_completed[slot],
+                    refresh=True)
+                progress_tracker.update(
+                    description=(
+                        f'Running case {self.title} ({completed}/{len(all_variations)}, {jobs} workers)'),
+                    completed=completed,
+                    refresh=True)
+        for worker_tracker in worker_trackers:
+            worker_tracker.stop()
+        self._results.extend(result for result in ordered_results if result is not None)
+
     def as_dict(self, full_data: bool = False) -> dict[str, Any]:
         """Returns the benchmark case and results as a JSON serializable dict.
 
@@ -30,6 +30,8 @@ from .exceptions import (
     _CLIErrorTag,
 )
 from .session import Session
+from .timers import reprofile_timers
+from .utils import parse_cpu_list
 
 if TYPE_CHECKING:
     from .case import Case
@@ -54,9 +56,76 @@ def _create_parser() -> ArgumentParser:
         help='Run specific benchmarks selected by group name or "all" for all benchmarks (default: all)')
     parser.add_argument('--output_path', default='.benchmarks', metavar='<path>', type=pathlib.Path,
                         help='Output destination directory (default: .benchmarks)')
+    parser.add_argument('--jobs', default=1, metavar='<N>', type=int,
+                        help=('Number of worker processes used to run the variations of each benchmark '
+                              'in parallel, each pinned to its own CPU (default: 1)'))
+    parser.add_argument('--cpu-affinity', default=None, metavar='<cpus>',
+                        help=('Run the benchmarks on the given CPUs, as a CPU list such as 0-3,6 '
+                              '(default: leave the CPU affinity unchanged)'))
+    parser.add_argument('--priority', default=None, metavar='<niceness>', type=int,
+                        help=('Run the benchmarks with the given niceness, from -20 (highest priority) to 19; '
+                              'raising the priority usually requires elevated privileges '
+                              '(default: leave the niceness unchanged)'))
+    parser.add_argument('--isolated', action='store_true',
+                        help=('Run each benchmark variation in a fresh process forked from a '
+                              'pre-warmed fork server'))
+    parser.add_argument('--interleave', action='store_true',
+                        help=('Run the variations of all selected benchmarks interleaved, one iteration '
+                              'at a time in randomized round-robin order, to spread environmental drift '
+                              'evenly over them'))
+    parser.add_argument('--calibration-cache', action='store_true',
+                        help=('Reuse and store auto-calibrated rounds in a calibration cache '
+                              'in the output path'))
+    parser.add_argument('--reprofile-timers', action='store_true',
+                        help='Measure the timer precision and overhead again instead of using the cached profiles')
     return parser
 
 
+def _configure_execution_from_args(session: Session, args: Namespace) -> None:
+    """Configure how the Session runs its benchmarks from the parsed command-line arguments.
+
+    Sets the number of worker processes, isolated and interleaved execution, and the
+    CPU affinity and priority of the Session.
+
+    :param session: The Session instance to configure.
+    :param args: The parsed command-line arguments.
+    :raises SimpleBenchUsageError:
+        If --jobs is not a positive integer, if --cpu-affinity is not a valid CPU list
+        or if --priority is out of range
+    """
+    if args.jobs < 1:
+        raise SimpleBenchUsageError(
+            f'--jobs must be a positive integer, got {args.jobs}',
+            tag=_CLIErrorTag.INVALID_JOBS_VALUE)
+    session.jobs = args.jobs
+    session.isolated = args.isolated
+    session.interleave = args.interleave
+    if args.cpu_affinity is not None:
+        try:
+            session.cpu_affinity = parse_cpu_list(args.cpu_affinity)
+        except ValueError as exc:
+            raise SimpleBenchUsageError(
+                f'--cpu-affinity must be a CPU list such as 0-3,6, got {args.cpu_affinity!r}',
+                tag=_CLIErrorTag.INVALID_CPU_AFFINITY_VALUE) from exc
+    if args.priority is not None:
+        if not -20 <= args.priority <= 19:
+            raise SimpleBenchUsageError(
+                f'--priority must be an integer from -20 to 19, got {args.priority}',
+                tag=_CLIErrorTag.INVALID_PRIORITY_VALUE)
+        session.priority = args.priority
+
+
+def _configure_calibration_from_args(session: Session, args: Namespace) -> None:
+    """Configure the calibration cache and timer profiles from the parsed command-line arguments.
+
+    :param session: The Session instance to configure.
+    :param args: The parsed command-line arguments.
+    """
+    session.use_calibration_cache = args.calibration_cache
+    if args.reprofile_timers:
+        reprofile_timers()
+
+
 def _configure_session_from_args(
         session: Session,
         cases: Sequence[Case],
@@ -67,8 +136,9 @@ def _configure_session_from_args(
     :param cases: The available benchmark Case instances.
     :param args: The parsed command-line arguments.
     :raises SimpleBenchUsageError:
-        If no benchmarks match the specified --run options or if no
-        reporters are selected via command-line flags
+        If no benchmarks match the specified --run options, if --jobs is not a positive
+        integer, if --cpu-affinity is not a valid CPU list, if --priority is out of range,
+        or if no reporters are selected via command-line flags
     """
     if args is None:
         args = Namespace()
@@ -98,6 +168,9 @@ def _configure_session_from_args(
 
     session.show_progress = args.progress
 
+    _configure_execution_from_args(session, args)
+    _configure_calibration_from_args(session, args)
+
     report_keys: list[str] = session.report_keys()
     if len(report_keys) == 0:
         error_msg = 'Please specify at least one reporter via command-line flags'
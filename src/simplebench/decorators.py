@@ -1,15 +1,17 @@
 """Decorators for simplifying benchmark case creation."""
 from __future__ import annotations
 
+import inspect
 from typing import Any, Callable, ParamSpec, TypeVar
 
 import simplebench.defaults as defaults
 
 from .case import Case, generate_benchmark_id
 from .doc_utils import format_docstring
+from .enums import GCPolicy, MemoryStrategy, PrecisionStatistic, WarmupStrategy
 from .exceptions import SimpleBenchTypeError, SimpleBenchValueError, _DecoratorsErrorTag
 from .reporters.reporter.options import ReporterOptions
-from .runners import SimpleRunner
+from .runners import AsyncRunner, SimpleRunner
 from .validators import (
     validate_non_blank_string,
     validate_non_negative_int,
@@ -35,6 +37,7 @@ def benchmark(
         description: str | None = None,
         iterations: int = defaults.DEFAULT_ITERATIONS,
         warmup_iterations: int = defaults.DEFAULT_WARMUP_ITERATIONS,
+        warmup_strategy: WarmupStrategy = WarmupStrategy.FIXED,
         rounds: int | None = None,
         timer: Callable[[], int] | None = None,
         min_time: float = defaults.DEFAULT_MIN_TIME,
@@ -44,7 +47,20 @@ def benchmark(
         kwargs_variations: dict[str, list[Any]] | None = None,
         options: list[ReporterOptions] | None = None,
         n: int | float = 1,
-        use_field_for_n: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        use_field_for_n: str | None = None,
+        memory_strategy: MemoryStrategy = MemoryStrategy.EVERY_ITERATION,
+        memory_samples: int = defaults.DEFAULT_MEMORY_SAMPLES,
+        latency_samples: int | None = None,
+        latency_sample_rate: float = 1.0,
+        allocation_sites: int | None = None,
+        allocation_frames: int = defaults.DEFAULT_ALLOCATION_FRAMES,
+        native_memory: bool = False,
+        target_precision: float | None = None,
+        precision_statistic: PrecisionStatistic = PrecisionStatistic.MEAN,
+        confidence_level: float = defaults.DEFAULT_CONFIDENCE_LEVEL,
+        subtract_baseline: bool = False,
+        gc_policy: GCPolicy = GCPolicy.ENABLED,
+        interleave: bool = False) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """A decorator to register a function as a benchmark case.
 
     This module uses a global registry to store benchmark cases created via the
@@ -73,6 +89,10 @@ def benchmark(
     n is included to allow n-weighting the complexity of the benchmark case when using
     runners that support it.
 
+    If the decorated function is a coroutine function (``async def``), the case uses the
+    :class:`~simplebench.runners.AsyncRunner` so that the function is awaited inside a single
+    event loop rather than being wrapped in :func:`asyncio.run` for every call.
+
     A minimal example:
 
     .. code-block:: python
@@ -110,6 +130,8 @@ def benchmark(
         Cannot be blank.
     :param iterations: The minimum number of iterations to run for the benchmark.
     :param warmup_iterations: The number of warmup iterations to run before the benchmark.
+    :param warmup_strategy: Whether to run ``warmup_iterations`` warmup iterations or to warm up
+        until the iteration times reach a steady state. See :class:`Case`.
     :param rounds: The number of rounds to run for the benchmark.
 
             Rounds are multiple runs of calls to the action within an iteration to mitigate timer
@@ -157,6 +179,28 @@ def benchmark(
     :param timer: The timer function to use for the benchmark. If None, the default timer is used.
         The timer function should be a callable that returns a float or int representing the current
         time.
+    :param memory_strategy: When the memory usage of the function is measured. See :class:`Case`.
+    :param memory_samples: The N for :attr:`MemoryStrategy.EVERY_NTH` or the number of samples
+        for :attr:`MemoryStrategy.AFTER_TIMING`.
+    :param latency_samples: If set, the number of calls of the function timed one by one after
+        timing to measure its per-call tail latency. See :class:`Case`.
+    :param latency_sample_rate: The fraction of calls timed when measuring per-call latencies.
+    :param allocation_sites: If set, the number of allocation sites of the function reported for
+        each variation, measured from ``tracemalloc`` snapshots after timing. See :class:`Case`.
+    :param allocation_frames: The number of frames recorded for each allocation when measuring
+        allocation sites.
+    :param native_memory: Whether to measure the native memory (RSS, USS, PSS and peak RSS) of the
+        process around every iteration. See :class:`Case`.
+    :param target_precision: If set, stop each variation once the relative confidence interval
+        half-width of the per-round time drops below this fraction (bounded by `max_time`)
+        instead of running for `min_time`. See :class:`Case`.
+    :param precision_statistic: Whether precision is judged on the mean or the median per-round time.
+    :param confidence_level: The confidence level of the precision confidence interval.
+    :param subtract_baseline: Whether to subtract the measured cost of calling an empty action
+        from the TIMING and OPS sections. See :class:`Case`.
+    :param gc_policy: How the garbage collector is handled while the function is timed. See :class:`Case`.
+    :param interleave: Whether to run the kwargs variations interleaved, one iteration at a time,
+        to spread environmental drift evenly over them. See :class:`Case`.
     :return: A decorator that registers the function for benchmarking and returns it unmodified.
     :rtype: Callable[[Callable[P, R]], Callable[P, R]]
     :raises SimpleBenchTypeError: If any argument is of an incorrect type.
@@ -173,17 +217,7 @@ def benchmark(
 
     # we can't fully validate title and description yet if they are None
     # because they will be inferred later from the function being decorated
-    if title is not None:
-        title = validate_non_blank_string(
-            title, 'title',
-            _DecoratorsErrorTag.BENCHMARK_TITLE_TYPE,
-            _DecoratorsErrorTag.BENCHMARK_TITLE_VALUE)
-
-    if description is not None:
-        description = validate_non_blank_string(
-            description, 'description',
-            _DecoratorsErrorTag.BENCHMARK_DESCRIPTION_TYPE,
-            _DecoratorsErrorTag.BENCHMARK_DESCRIPTION_VALUE)
+    title, description = _validate_title_and_description(title, description)
 
     iterations = validate_positive_int(
         iterations, 'iterations',
@@ -236,22 +270,7 @@ def benchmark(
                                                   kwargs_variations=kwargs_variations)
     options = Case.validate_options(options)
 
-    if not isinstance(use_field_for_n, str) and use_field_for_n is not None:
-        raise SimpleBenchTypeError("The 'use_field_for_n' parameter to the @benchmark decorator "
-                                   "must be a string if passed.",
-                                   tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_TYPE)
-
-    if (isinstance(use_field_for_n, str) and isinstance(kwargs_variations, dict)):
-        if use_field_for_n not in kwargs_variations:
-            raise SimpleBenchValueError(
-                "The 'use_field_for_n' parameter to the @benchmark decorator must "
-                f"match one of the kwargs_variations keys: {list(kwargs_variations.keys())}",
-                tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_KWARGS_VARIATIONS)
-        if not all(isinstance(v, int) and v > 0 for v in kwargs_variations[use_field_for_n]):
-            raise SimpleBenchValueError(
-                f"The values for the '{use_field_for_n}' entry in 'kwargs_variations' "
-                "must all be positive integers when used with 'use_field_for_n'.",
-                tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_INVALID_VALUE)
+    _validate_use_field_for_n(use_field_for_n, kwargs_variations)
 
     git_info = get_git_info()
 
@@ -274,24 +293,20 @@ def benchmark(
                     tag=_DecoratorsErrorTag.BENCHMARK_N_FOR_RUN_INVALID_VALUE)
             return _bench.run(action=func, n=n_for_run, kwargs=kwargs)
 
-        final_benchmark_id = benchmark_id
-        if final_benchmark_id is None:
-            final_benchmark_id = generate_benchmark_id(obj=func, action=func)
+        # Report the user's module so that isolated mode preloads it in the fork server.
+        case_action_wrapper.__module__ = func.__module__
 
         final_benchmark_id = validate_non_blank_string(
-            final_benchmark_id, 'benchmark_id',
+            generate_benchmark_id(obj=func, action=func) if benchmark_id is None else benchmark_id,
+            'benchmark_id',
             _DecoratorsErrorTag.BENCHMARK_ID_TYPE,
             _DecoratorsErrorTag.BENCHMARK_ID_VALUE)
 
         # Create the Case instance, using sensible defaults from the function.
-        if title is None:
-            inferred_title = func.__name__
-        else:
-            inferred_title = title
-        if description is None:
-            inferred_description = '(no description)'if func.__doc__ is None else func.__doc__
-        else:
-            inferred_description = description
+        inferred_title = func.__name__ if title is None else title
+        inferred_description = description
+        if inferred_description is None:
+            inferred_description = '(no description)' if func.__doc__ is None else func.__doc__
 
         case = Case(
             group=group,
@@ -302,6 +317,7 @@ def benchmark(
             description=inferred_description,
             iterations=iterations,
             warmup_iterations=warmup_iterations,
+            warmup_strategy=warmup_strategy,
             rounds=rounds,
             timer=timer,
             min_time=min_time,
@@ -310,6 +326,20 @@ def benchmark(
             variation_cols=variation_cols,
             kwargs_variations=kwargs_variations,
             options=options,
+            runner=AsyncRunner if inspect.iscoroutinefunction(func) else None,
+            memory_strategy=memory_strategy,
+            memory_samples=memory_samples,
+            latency_samples=latency_samples,
+            latency_sample_rate=latency_sample_rate,
+            allocation_sites=allocation_sites,
+            allocation_frames=allocation_frames,
+            native_memory=native_memory,
+            target_precision=target_precision,
+            precision_statistic=precision_statistic,
+            confidence_level=confidence_level,
+            subtract_baseline=subtract_baseline,
+            gc_policy=gc_policy,
+            interleave=interleave,
         )
 
         # Add the created case to the global registry.
@@ -340,6 +370,56 @@ def clear_registered_cases() -> None:
     _DECORATOR_CASES.clear()
 
 
+def _validate_title_and_description(title: str | None, description: str | None) -> tuple[str | None, str | None]:
+    """Validate the title and description parameters of the benchmark decorator if they are set.
+
+    :param title: The title of the benchmark case, or None to infer it from the function.
+    :param description: The description of the benchmark case, or None to infer it from the function.
+    :return: The validated title and description.
+    :raises SimpleBenchTypeError: If the title or description is not a string or None.
+    :raises SimpleBenchValueError: If the title or description is blank.
+    """
+    if title is not None:
+        title = validate_non_blank_string(
+            title, 'title',
+            _DecoratorsErrorTag.BENCHMARK_TITLE_TYPE,
+            _DecoratorsErrorTag.BENCHMARK_TITLE_VALUE)
+
+    if description is not None:
+        description = validate_non_blank_string(
+            description, 'description',
+            _DecoratorsErrorTag.BENCHMARK_DESCRIPTION_TYPE,
+            _DecoratorsErrorTag.BENCHMARK_DESCRIPTION_VALUE)
+    return title, description
+
+
+def _validate_use_field_for_n(use_field_for_n: str | None, kwargs_variations: dict[str, list[Any]]) -> None:
+    """Validate the use_field_for_n parameter of the benchmark decorator against its kwargs_variations.
+
+    :param use_field_for_n: The kwargs_variations field to use for 'n', or None.
+    :param kwargs_variations: The validated kwargs_variations of the benchmark.
+    :raises SimpleBenchTypeError: If use_field_for_n is not a string or None.
+    :raises SimpleBenchValueError: If use_field_for_n is not a kwargs_variations key or its
+        values are not all positive integers.
+    """
+    if not isinstance(use_field_for_n, str) and use_field_for_n is not None:
+        raise SimpleBenchTypeError("The 'use_field_for_n' parameter to the @benchmark decorator "
+                                   "must be a string if passed.",
+                                   tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_TYPE)
+
+    if (isinstance(use_field_for_n, str) and isinstance(kwargs_variations, dict)):
+        if use_field_for_n not in kwargs_variations:
+            raise SimpleBenchValueError(
+                "The 'use_field_for_n' parameter to the @benchmark decorator must "
+                f"match one of the kwargs_variations keys: {list(kwargs_variations.keys())}",
+                tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_KWARGS_VARIATIONS)
+        if not all(isinstance(v, int) and v > 0 for v in kwargs_variations[use_field_for_n]):
+            raise SimpleBenchValueError(
+                f"The values for the '{use_field_for_n}' entry in 'kwargs_variations' "
+                "must all be positive integers when used with 'use_field_for_n'.",
+                tag=_DecoratorsErrorTag.BENCHMARK_USE_FIELD_FOR_N_INVALID_VALUE)
+
+
 def validate_timer(
         timer: Callable[[], int] | None,
         param_name: str,
@@ -17,6 +17,104 @@ DEFAULT_ITERATIONS: int = 20
 DEFAULT_WARMUP_ITERATIONS: int = 10
 """Default number of warmup iterations before benchmarking."""
 
+DEFAULT_MAX_WARMUP_ITERATIONS: int = 1000
+"""Maximum number of warmup iterations run while waiting for a steady state (automatic warmup)."""
+
+DEFAULT_WARMUP_WINDOW: int = 5
+"""Number of iterations in each of the two consecutive windows compared to detect a steady state."""
+
+DEFAULT_WARMUP_TOLERANCE: float = 0.02
+"""Relative difference between window medians that is always accepted as a steady state."""
+
+DEFAULT_MEMORY_SAMPLES: int = 10
+"""Default memory sampling parameter (every Nth iteration, or number of samples after timing)."""
+
+DEFAULT_ALLOCATION_FRAMES: int = 1
+"""Default number of frames recorded per allocation when attributing allocations to their sites."""
+
+DEFAULT_CONFIDENCE_LEVEL: float = 0.95
+"""Default confidence level for the confidence intervals used to judge measurement precision."""
+
+DEFAULT_MEDIAN_PRECISION_GROWTH: float = 0.05
+"""Relative growth of the sample between re-evaluations of the median confidence interval while
+running to a target precision (the mean is tracked incrementally after every iteration)."""
+
+DEFAULT_TRIM_PROPORTION: float = 0.1
+"""Default proportion of the data points cut from each end for the trimmed mean."""
+
+DEFAULT_BOOTSTRAP_RESAMPLES: int = 2000
+"""Default number of bootstrap resamples used to compute confidence intervals."""
+
+DEFAULT_BOOTSTRAP_SEED: int | None = 0
+"""Default seed of the bootstrap resampling (a fixed seed makes reported intervals reproducible)."""
+
+DEFAULT_BOOTSTRAP_PERCENTILES: tuple[float, ...] = (5.0, 95.0)
+"""Default percentiles whose bootstrap confidence intervals are computed (besides the mean and median)."""
+
+DEFAULT_HISTOGRAM_SIGNIFICANT_FIGURES: int = 3
+"""Default number of significant decimal digits to which latency histograms resolve recorded values."""
+
+DEFAULT_HISTOGRAM_LOWEST_TRACKABLE: int = 1
+"""Default lowest value (in timer units) a latency histogram can tell apart from zero."""
+
+DEFAULT_HISTOGRAM_HIGHEST_TRACKABLE: int = 3_600_000_000_000
+"""Default highest value (in timer units, one hour in nanoseconds) a latency histogram can record."""
+
+DEFAULT_TAIL_PERCENTILES: tuple[float, ...] = (99.0, 99.9, 99.99)
+"""Percentiles of the per-call latency samples reported as the tail latencies of a benchmark."""
+
+DEFAULT_QUANTIZATION_RATIO: float = 10.0
+"""Multiple of the timer precision below which a per-call latency is flagged as dominated by timer quantization."""
+
+DEFAULT_MAX_ITERATION_TIME_FRACTION: float = 0.02
+"""Largest fraction of ``max_time`` a single iteration may take when calibrating its rounds, including
+untimed work such as generating the inputs of batched benchmarks."""
+
+DEFAULT_CALIBRATION_CACHE_FILENAME: str = '_calibration_cache.json'
+"""Name of the calibrated rounds cache file in the session output path."""
+
+DEFAULT_CALIBRATION_CACHE_TTL: float = 30 * 24 * 60 * 60.0
+"""Time after which a cached rounds calibration is discarded as stale (in seconds)."""
+
+TRANSIENT_BENCHMARK_ID_PREFIX: str = 'transient-'
+"""Prefix of the benchmark ids generated for actions without a stable identity. They differ between runs."""
+
+DEFAULT_CALIBRATION_DRIFT_THRESHOLD: float = 0.5
+"""Relative change in per-call time beyond which a cached rounds calibration is discarded."""
+
+DEFAULT_CALIBRATION_VERIFY_SAMPLES: int = 3
+"""Number of timed iterations used to verify a cached rounds calibration (the fastest is used)."""
+
+DEFAULT_TIMER_PROFILE_TTL: float = 7 * 24 * 60 * 60.0
+"""Time after which persisted timer precision and overhead profiles are measured again (in seconds)."""
+
+DEFAULT_TIMER_PROFILE_CACHE_ENV: str = 'SIMPLEBENCH_CACHE_DIR'
+"""Environment variable that overrides the directory holding the persisted timer profiles."""
+
+DEFAULT_BASELINE_ITERATIONS: int = 10
+"""Number of timed iterations of an empty action used to measure the call overhead baseline."""
+
+DEFAULT_SCALING_REFERENCE_ITERATIONS: int = 5
+"""Number of single-threaded iterations timed as the reference for the scaling efficiency of threaded runs."""
+
+DEFAULT_LOAD_RATE: float = 100.0
+"""Default offered rate of an open-loop load run, in calls per second."""
+
+DEFAULT_LOAD_WINDOW_CALLS: int = 100
+"""Number of consecutive calls of an open-loop load run grouped into one iteration for the achieved throughput."""
+
+DEFAULT_LOAD_SPIN_THRESHOLD: float = 0.001
+"""Time (in seconds) before the next scheduled call of a load run below which the runner spins instead of sleeping."""
+
+DEFAULT_SATURATION_TOLERANCE: float = 0.05
+"""Relative shortfall of the achieved rate below the offered rate at which a load run is considered saturated."""
+
+DEFAULT_JOBS: int = 1
+"""Default number of worker processes used to run the kwargs variations of a case (1 = serial)."""
+
+DEFAULT_FORKSERVER_PRELOAD: tuple[str, ...] = ('simplebench', 'numpy')
+"""Modules imported by the fork server before it forks isolated benchmark processes."""
+
 DEFAULT_TIMER = time.perf_counter_ns
 """Default timer function for benchmarking."""
 
@@ -26,6 +124,9 @@ DEFAULT_MIN_TIME: float = 5.0
 DEFAULT_MAX_TIME: float = 20.0
 """Default maximum time for a benchmark run (in seconds)."""
 
+DEFAULT_ITERATION_TABLE_CAPACITY: int = 64
+"""Default number of rows allocated up front by an IterationTable (the columns double in size as needed)."""
+
 DEFAULT_INTERVAL_SCALE: float = 1e-9
 """Default scaling factor for time intervals (nanoseconds -> seconds)."""
 
@@ -53,5 +154,14 @@ DEFAULT_MEMORY_UNIT: str = 'bytes'
 BASE_MEMORY_UNIT: str = 'bytes'
 """Base unit for memory usage."""
 
+DEFAULT_GC_COLLECTIONS_SCALE: float = 1.0
+"""Default scaling factor for garbage collection counts (1.0 -> 1.0)."""
+
+DEFAULT_GC_COLLECTIONS_UNIT: str = 'collections'
+"""Default unit for garbage collection counts."""
+
+BASE_GC_COLLECTIONS_UNIT: str = 'collections'
+"""Base unit for garbage collection counts."""
+
 DEFAULT_SIGNIFICANT_FIGURES: int = 3
 """Default number of significant figures for output values (3 significant figures)."""
@@ -4,32 +4,53 @@ Enumarations used throughout SimpleBench.
 
 Provides
 --------
+- :class:`ArrivalProcess`
+- :class:`BindingStrategy`
 - :class:`Color`
 - :class:`ExitCode`
 - :class:`FlagType`
 - :class:`Format`
+- :class:`GCPolicy`
+- :class:`MemoryStrategy`
+- :class:`OutlierMethod`
+- :class:`PrecisionStatistic`
 - :class:`Section`
 - :class:`Target`
 - :class:`Verbosity`
+- :class:`WarmupStrategy`
 - :func:`enum_docstrings`
 
 """
+from .arrival_process import ArrivalProcess
+from .binding_strategy import BindingStrategy
 from .color import Color
 from .decorators import enum_docstrings
 from .exit_code import ExitCode
 from .flag_type import FlagType
 from .format import Format
+from .gc_policy import GCPolicy
+from .memory_strategy import MemoryStrategy
+from .outlier_method import OutlierMethod
+from .precision_statistic import PrecisionStatistic
 from .section import Section
 from .target import Target
 from .verbosity import Verbosity
+from .warmup_strategy import WarmupStrategy
 
 __all__ = [
+    'ArrivalProcess',
+    'BindingStrategy',
     'Color',
     'ExitCode',
     'FlagType',
     'Format',
+    'GCPolicy',
+    'MemoryStrategy',
+    'OutlierMethod',
+    'PrecisionStatistic',
     'Section',
     'Target',
     'Verbosity',
+    'WarmupStrategy',
     'enum_docstrings',
 ]
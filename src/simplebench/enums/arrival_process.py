@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Arrival process enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class ArrivalProcess(str, Enum):
+    """Arrival processes for the calls issued by an open-loop load run.
+
+    Defined ArrivalProcesses are:
+      - CONSTANT: Calls are issued at fixed intervals of ``1 / rate``.
+      - POISSON: Calls are issued with exponentially distributed intervals averaging ``1 / rate``.
+    """
+    CONSTANT = 'constant'
+    """Issue calls at fixed intervals (a constant arrival rate)."""
+    POISSON = 'poisson'
+    """Issue calls with exponentially distributed intervals (random arrivals, as from many independent clients)."""
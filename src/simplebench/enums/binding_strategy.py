@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Argument binding strategy enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class BindingStrategy(str, Enum):
+    """How the generated timer functions pass the keyword arguments to the benchmark action.
+
+    The runner chooses the cheapest strategy the action's signature allows. Keyword
+    argument unpacking and binding can dominate the timing of nanosecond-scale actions,
+    so the strategy used is recorded in the results to keep measurements comparable.
+
+    Defined BindingStrategies are:
+      - NO_ARGS: The action is called without arguments.
+      - POSITIONAL: The arguments are unpacked into locals and passed positionally.
+      - KEYWORDS: The arguments are passed as ``**kwargs``.
+    """
+    NO_ARGS = 'no-args'
+    """There are no keyword arguments, so the action is called without arguments."""
+    POSITIONAL = 'positional'
+    """The keyword arguments are unpacked into local variables before timing starts and passed positionally."""
+    KEYWORDS = 'keywords'
+    """The keyword arguments are passed with ``**kwargs`` on every call."""
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Garbage collector policy enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class GCPolicy(str, Enum):
+    """Policies for how the cyclic garbage collector is handled while a benchmark runs.
+
+    Whatever the policy, the collections that happen during each timed iteration and the
+    time spent in them are recorded (see :attr:`~simplebench.enums.Section.GC`).
+
+    Defined GCPolicies are:
+      - ENABLED: Leave the garbage collector enabled.
+      - DISABLE_DURING_TIMING: Disable the garbage collector during the timed regions.
+      - COLLECT_BEFORE_ITERATION: Run a full collection before every iteration.
+    """
+    ENABLED = 'enabled'
+    """Leave the garbage collector enabled. Collections are charged to the iterations they happen in."""
+    DISABLE_DURING_TIMING = 'disable-during-timing'
+    """Disable the garbage collector during each timed iteration and re-enable it afterwards."""
+    COLLECT_BEFORE_ITERATION = 'collect-before-iteration'
+    """Run a full, untimed collection before every iteration so each starts from a clean heap."""
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""Memory measurement strategy enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class MemoryStrategy(str, Enum):
+    """Strategies for when the memory usage of a benchmark action is measured.
+
+    Memory is measured with :mod:`tracemalloc` in a separate, untimed call of the
+    action so that tracing does not distort the timing measurements.
+
+    Defined MemoryStrategies are:
+      - EVERY_ITERATION: Measure memory after every iteration.
+      - EVERY_NTH: Measure memory after every Nth measured iteration.
+      - AFTER_TIMING: Measure memory in a fixed number of dedicated samples after timing.
+      - OFF: Do not measure memory.
+    """
+    EVERY_ITERATION = 'every-iteration'
+    """Measure memory with an extra call of the action after every iteration (including warmups)."""
+    EVERY_NTH = 'every-nth'
+    """Measure memory with an extra call of the action after every Nth measured iteration."""
+    AFTER_TIMING = 'after-timing'
+    """Measure memory in a fixed number of dedicated calls of the action after timing has finished."""
+    OFF = 'off'
+    """Do not measure memory. The memory sections are left out of the reports."""
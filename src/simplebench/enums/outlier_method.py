@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""Outlier detection method enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class OutlierMethod(str, Enum):
+    """Methods for classifying benchmark samples as mild or severe outliers.
+
+    Defined OutlierMethods are:
+      - TUKEY: Tukey's fences on the interquartile range.
+      - MAD: Modified z-scores based on the median absolute deviation.
+    """
+    TUKEY = 'tukey'
+    """Samples beyond 1.5 (mild) or 3 (severe) interquartile ranges outside the quartiles."""
+    MAD = 'mad'
+    """Samples more than 3.5 (mild) or 7 (severe) robust standard deviations from the median,
+    estimated from the median absolute deviation."""
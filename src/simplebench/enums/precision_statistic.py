@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Precision statistic enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class PrecisionStatistic(str, Enum):
+    """The statistic whose confidence interval is used to judge measurement precision.
+
+    Defined PrecisionStatistics are:
+      - MEAN: Student's t confidence interval of the mean.
+      - MEDIAN: Distribution-free (order statistic) confidence interval of the median.
+    """
+    MEAN = 'mean'
+    """Use the Student's t confidence interval of the mean."""
+    MEDIAN = 'median'
+    """Use the distribution-free (order statistic) confidence interval of the median."""
@@ -16,18 +16,63 @@ class Section(str, Enum):
     Defined Sections are:
       - OPS: Operations per second section.
       - TIMING: Time per round section.
+      - CPU_TIME: CPU time per round section.
       - MEMORY: Memory usage section.
       - PEAK_MEMORY: Peak memory usage section.
+      - GC: Garbage collections section.
+      - MINOR_PAGE_FAULTS: Minor page faults section.
+      - MAJOR_PAGE_FAULTS: Major page faults section.
+      - VOLUNTARY_CONTEXT_SWITCHES: Voluntary context switches section.
+      - INVOLUNTARY_CONTEXT_SWITCHES: Involuntary context switches section.
+      - BLOCK_IO: Block I/O operations section.
+      - MAX_RSS: Maximum resident set size section.
+      - RSS: Resident set size change section.
+      - USS: Unique set size change section.
+      - PSS: Proportional set size change section.
+      - PEAK_RSS: Peak resident set size section.
+      - WARMUP: Time per round of the warmup iterations section.
+      - LATENCY: Per call latency histogram section.
+      - ALLOCATIONS: Allocation sites section.
       - NULL: No section. This is used when a reporter does not specify a section.
     """
     OPS = 'operations per second'
     """Operations per second section."""
     TIMING = 'per round timings'
     """Time per round section."""
+    CPU_TIME = 'per round cpu timings'
+    """CPU time per round section."""
     MEMORY = 'memory usage'
     """Memory usage section."""
     PEAK_MEMORY = 'peak memory usage'
     """Peak memory usage section."""
+    GC = 'gc collections'
+    """Garbage collections per iteration section."""
+    MINOR_PAGE_FAULTS = 'minor page faults'
+    """Minor (no I/O) page faults per iteration section."""
+    MAJOR_PAGE_FAULTS = 'major page faults'
+    """Major (I/O) page faults per iteration section."""
+    VOLUNTARY_CONTEXT_SWITCHES = 'voluntary context switches'
+    """Voluntary context switches per iteration section."""
+    INVOLUNTARY_CONTEXT_SWITCHES = 'involuntary context switches'
+    """Involuntary context switches per iteration section."""
+    BLOCK_IO = 'block i/o operations'
+    """Block input and output operations per iteration section."""
+    MAX_RSS = 'max rss'
+    """Maximum resident set size of the process after each iteration section."""
+    RSS = 'rss change'
+    """Change in the native resident set size of the process over each iteration section."""
+    USS = 'uss change'
+    """Change in the native unique (private) set size of the process over each iteration section."""
+    PSS = 'pss change'
+    """Change in the native proportional set size of the process over each iteration section."""
+    PEAK_RSS = 'peak rss'
+    """Peak native resident set size of the process during each iteration section."""
+    WARMUP = 'warmup timings'
+    """Time per round of the warmup iterations (the warmup curve) section."""
+    LATENCY = 'per call latencies'
+    """Per call latency section, summarized from a latency histogram."""
+    ALLOCATIONS = 'allocation sites'
+    """Allocation sites section, listing where the memory of a call was allocated."""
     NULL = 'null section'
     """No section. This is used when a reporter does not specify a section."""
 
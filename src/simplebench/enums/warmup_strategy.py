@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Warmup strategy enums for SimpleBench."""
+
+from enum import Enum
+
+from .decorators import enum_docstrings
+
+
+@enum_docstrings
+class WarmupStrategy(str, Enum):
+    """Strategies for deciding how many warmup iterations run before measuring starts.
+
+    Whatever the strategy, the per-round times of the warmup iterations are kept as the
+    warmup curve (see :attr:`~simplebench.enums.Section.WARMUP`).
+
+    Defined WarmupStrategies are:
+      - FIXED: Run a fixed number of warmup iterations.
+      - AUTO: Run warmup iterations until the iteration times reach a steady state.
+    """
+    FIXED = 'fixed'
+    """Run the case's ``warmup_iterations`` warmup iterations."""
+    AUTO = 'auto'
+    """Run warmup iterations until no level shift is detected between consecutive windows of iteration times."""
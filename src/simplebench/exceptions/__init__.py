@@ -7,10 +7,14 @@ from textwrap import dedent
 from typing import Any, Generic, TypeVar
 
 from .base import ErrorTag
+from .calibration_cache import _CalibrationCacheErrorTag
 from .case import _CaseErrorTag
 from .cli import _CLIErrorTag
 from .decorators import _DecoratorsErrorTag
+from .interleave import _InterleaveErrorTag
+from .isolation import _IsolationErrorTag
 from .iteration import _IterationErrorTag
+from .iteration_table import _IterationTableErrorTag
 from .results import _ResultsErrorTag
 from .runners import _RunnersErrorTag
 from .session import _SessionErrorTag
@@ -29,10 +33,14 @@ __all__ = [
     "SimpleBenchArgumentError",
     "SimpleBenchImportError",
     "ErrorTag",
+    "_CalibrationCacheErrorTag",
     "_CaseErrorTag",
     "_CLIErrorTag",
     "_DecoratorsErrorTag",
+    "_InterleaveErrorTag",
+    "_IsolationErrorTag",
     "_IterationErrorTag",
+    "_IterationTableErrorTag",
     "_RichProgressTasksErrorTag",
     "_RichTaskErrorTag",
     "_ResultsErrorTag",
@@ -0,0 +1,18 @@
+"""ErrorTags for simplebench.calibration_cache related exceptions in SimpleBench."""
+from ..enums import enum_docstrings
+from .base import ErrorTag
+
+
+@enum_docstrings
+class _CalibrationCacheErrorTag(ErrorTag):
+    """ErrorTags for calibration cache related exceptions."""
+    INVALID_PATH_ARG_TYPE = "INVALID_PATH_ARG_TYPE"
+    """Something other than a Path was passed as the path argument to the CalibrationCache() constructor"""
+    STORE_INVALID_ROUNDS_TYPE = "STORE_INVALID_ROUNDS_TYPE"
+    """Something other than an int was passed as the rounds argument to CalibrationCache.store()"""
+    STORE_INVALID_ROUNDS_VALUE = "STORE_INVALID_ROUNDS_VALUE"
+    """A rounds value less than 1 was passed to CalibrationCache.store()"""
+    STORE_INVALID_PER_CALL_NS_TYPE = "STORE_INVALID_PER_CALL_NS_TYPE"
+    """Something other than a number was passed as the per_call_ns argument to CalibrationCache.store()"""
+    STORE_INVALID_PER_CALL_NS_VALUE = "STORE_INVALID_PER_CALL_NS_VALUE"
+    """A per_call_ns value less than or equal to zero was passed to CalibrationCache.store()"""
@@ -224,3 +224,58 @@ class _CaseErrorTag(ErrorTag):
     """Invalid rounds argument value passed to the Case() constructor"""
     BENCHMARK_ACTION_TIMEOUT_OCCURRED = "BENCHMARK_ACTION_TIMEOUT_OCCURRED"
     """A timeout occurred while running the benchmark action."""
+    INVALID_JOBS_TYPE = "INVALID_JOBS_TYPE"
+    """Invalid jobs argument type passed to the Case() constructor"""
+    INVALID_JOBS_VALUE = "INVALID_JOBS_VALUE"
+    """Invalid jobs argument value passed to the Case() constructor"""
+    INVALID_MEMORY_STRATEGY_TYPE = "INVALID_MEMORY_STRATEGY_TYPE"
+    """Something other than a MemoryStrategy was passed as the memory_strategy argument to the Case() constructor"""
+    INVALID_MEMORY_SAMPLES_TYPE = "INVALID_MEMORY_SAMPLES_TYPE"
+    """Invalid memory_samples argument type passed to the Case() constructor"""
+    INVALID_MEMORY_SAMPLES_VALUE = "INVALID_MEMORY_SAMPLES_VALUE"
+    """Invalid memory_samples argument value passed to the Case() constructor"""
+    INVALID_LATENCY_SAMPLES_TYPE = "INVALID_LATENCY_SAMPLES_TYPE"
+    """Invalid latency_samples argument type passed to the Case() constructor"""
+    INVALID_LATENCY_SAMPLES_VALUE = "INVALID_LATENCY_SAMPLES_VALUE"
+    """Invalid latency_samples argument value passed to the Case() constructor (must be a positive int)"""
+    INVALID_LATENCY_SAMPLE_RATE_TYPE = "INVALID_LATENCY_SAMPLE_RATE_TYPE"
+    """Invalid latency_sample_rate argument type passed to the Case() constructor"""
+    INVALID_LATENCY_SAMPLE_RATE_VALUE = "INVALID_LATENCY_SAMPLE_RATE_VALUE"
+    """Invalid latency_sample_rate argument value passed to the Case() constructor (must be > 0.0 and <= 1.0)"""
+    INVALID_ALLOCATION_SITES_TYPE = "INVALID_ALLOCATION_SITES_TYPE"
+    """Invalid allocation_sites argument type passed to the Case() constructor"""
+    INVALID_ALLOCATION_SITES_VALUE = "INVALID_ALLOCATION_SITES_VALUE"
+    """Invalid allocation_sites argument value passed to the Case() constructor (must be a positive int)"""
+    INVALID_ALLOCATION_FRAMES_TYPE = "INVALID_ALLOCATION_FRAMES_TYPE"
+    """Invalid allocation_frames argument type passed to the Case() constructor"""
+    INVALID_ALLOCATION_FRAMES_VALUE = "INVALID_ALLOCATION_FRAMES_VALUE"
+    """Invalid allocation_frames argument value passed to the Case() constructor (must be a positive int)"""
+    INVALID_NATIVE_MEMORY_TYPE = "INVALID_NATIVE_MEMORY_TYPE"
+    """Something other than a bool was passed as the native_memory argument to the Case() constructor"""
+    INVALID_TARGET_PRECISION_TYPE = "INVALID_TARGET_PRECISION_TYPE"
+    """Invalid target_precision argument type passed to the Case() constructor"""
+    INVALID_TARGET_PRECISION_VALUE = "INVALID_TARGET_PRECISION_VALUE"
+    """Invalid target_precision argument value passed to the Case() constructor"""
+    INVALID_PRECISION_STATISTIC_TYPE = "INVALID_PRECISION_STATISTIC_TYPE"
+    """Something other than a PrecisionStatistic was passed as the precision_statistic argument
+    to the Case() constructor"""
+    INVALID_CONFIDENCE_LEVEL_TYPE = "INVALID_CONFIDENCE_LEVEL_TYPE"
+    """Invalid confidence_level argument type passed to the Case() constructor"""
+    INVALID_CONFIDENCE_LEVEL_VALUE = "INVALID_CONFIDENCE_LEVEL_VALUE"
+    """Invalid confidence_level argument value passed to the Case() constructor (must be between 0 and 1)"""
+    INVALID_SUBTRACT_BASELINE_TYPE = "INVALID_SUBTRACT_BASELINE_TYPE"
+    """Something other than a bool was passed as the subtract_baseline argument to the Case() constructor"""
+    INVALID_GC_POLICY_TYPE = "INVALID_GC_POLICY_TYPE"
+    """Something other than a GCPolicy was passed as the gc_policy argument to the Case() constructor"""
+    INVALID_CPU_AFFINITY_TYPE = "INVALID_CPU_AFFINITY_TYPE"
+    """Something other than a sequence of ints was passed as the cpu_affinity argument to the Case() constructor"""
+    INVALID_CPU_AFFINITY_VALUE = "INVALID_CPU_AFFINITY_VALUE"
+    """An empty sequence or a negative CPU number was passed as the cpu_affinity argument to the Case() constructor"""
+    INVALID_PRIORITY_TYPE = "INVALID_PRIORITY_TYPE"
+    """Invalid priority argument type passed to the Case() constructor"""
+    INVALID_PRIORITY_VALUE = "INVALID_PRIORITY_VALUE"
+    """Invalid priority argument value passed to the Case() constructor (must be between -20 and 19)"""
+    INVALID_WARMUP_STRATEGY_TYPE = "INVALID_WARMUP_STRATEGY_TYPE"
+    """Something other than a WarmupStrategy was passed as the warmup_strategy argument to the Case() constructor"""
+    INVALID_INTERLEAVE_TYPE = "INVALID_INTERLEAVE_TYPE"
+    """Something other than a bool was passed as the interleave argument to the Case() constructor"""
@@ -16,3 +16,9 @@ class _CLIErrorTag(ErrorTag):
     """No matching benchmark cases were found for the specified --run options."""
     NO_REPORTERS_SPECIFIED = "NO_REPORTERS_SPECIFIED"
     """No reporters were specified for output generation."""
+    INVALID_JOBS_VALUE = "INVALID_JOBS_VALUE"
+    """The --jobs option must be a positive integer."""
+    INVALID_CPU_AFFINITY_VALUE = "INVALID_CPU_AFFINITY_VALUE"
+    """The --cpu-affinity option must be a CPU list such as 0-3,6."""
+    INVALID_PRIORITY_VALUE = "INVALID_PRIORITY_VALUE"
+    """The --priority option must be an integer from -20 to 19."""
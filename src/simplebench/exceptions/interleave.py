@@ -0,0 +1,16 @@
+"""ErrorTags for simplebench.interleave related exceptions in SimpleBench."""
+from ..enums import enum_docstrings
+from .base import ErrorTag
+
+
+@enum_docstrings
+class _InterleaveErrorTag(ErrorTag):
+    """ErrorTags for interleaved execution related exceptions."""
+    INVALID_PARTICIPANTS_ARG_TYPE = "INVALID_PARTICIPANTS_ARG_TYPE"
+    """Invalid participants argument type passed to the InterleavedScheduler() constructor"""
+    INVALID_PARTICIPANTS_ARG_VALUE = "INVALID_PARTICIPANTS_ARG_VALUE"
+    """Invalid participants argument value passed to the InterleavedScheduler() constructor (must be positive)"""
+    INVALID_PARTICIPANT = "INVALID_PARTICIPANT"
+    """A participant number outside the range of the scheduler's participants was passed"""
+    CANCELLED = "CANCELLED"
+    """The interleaved run was cancelled because another variation failed"""
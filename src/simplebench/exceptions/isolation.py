@@ -0,0 +1,16 @@
+"""ErrorTags for simplebench.isolation related exceptions in SimpleBench."""
+from ..enums import enum_docstrings
+from .base import ErrorTag
+
+
+@enum_docstrings
+class _IsolationErrorTag(ErrorTag):
+    """ErrorTags for isolated (fork server) execution related exceptions."""
+    FORKSERVER_NOT_AVAILABLE = "FORKSERVER_NOT_AVAILABLE"
+    """The 'forkserver' multiprocessing start method is not available on this platform."""
+    CASE_NOT_TRANSFERABLE = "CASE_NOT_TRANSFERABLE"
+    """The Case could neither be pickled nor located by benchmark_id in the child process."""
+    CHILD_PROCESS_DIED = "CHILD_PROCESS_DIED"
+    """The isolated child process exited without returning results."""
+    CHILD_PROCESS_HUNG = "CHILD_PROCESS_HUNG"
+    """The isolated child process did not return results before the case timeout and was terminated."""
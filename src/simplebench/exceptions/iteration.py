@@ -21,6 +21,22 @@ class _IterationErrorTag(ErrorTag):
     """Invalid memory argument passed to the Iteration() constructor - must be an int"""
     PEAK_MEMORY_ARG_TYPE = "PEAK_MEMORY_ARG_TYPE"
     """Invalid peak_memory argument passed to the Iteration() constructor - must be an int"""
+    GC_COLLECTIONS_ARG_TYPE = "GC_COLLECTIONS_ARG_TYPE"
+    """Invalid gc_collections argument passed to the Iteration() constructor - must be an int"""
+    GC_COLLECTIONS_ARG_VALUE = "GC_COLLECTIONS_ARG_VALUE"
+    """Invalid gc_collections argument passed to the Iteration() constructor - must be zero or greater"""
+    GC_ELAPSED_ARG_TYPE = "GC_ELAPSED_ARG_TYPE"
+    """Invalid gc_elapsed argument passed to the Iteration() constructor - must be a float"""
+    GC_ELAPSED_ARG_VALUE = "GC_ELAPSED_ARG_VALUE"
+    """Invalid gc_elapsed argument passed to the Iteration() constructor - must be zero or greater"""
+    CPU_ELAPSED_ARG_TYPE = "CPU_ELAPSED_ARG_TYPE"
+    """Invalid cpu_elapsed argument passed to the Iteration() constructor - must be a float"""
+    CPU_ELAPSED_ARG_VALUE = "CPU_ELAPSED_ARG_VALUE"
+    """Invalid cpu_elapsed argument passed to the Iteration() constructor - must be zero or greater"""
+    RUSAGE_ARG_TYPE = "RUSAGE_ARG_TYPE"
+    """Invalid rusage argument passed to the Iteration() constructor - must be an RUsage"""
+    NATIVE_MEMORY_ARG_TYPE = "NATIVE_MEMORY_ARG_TYPE"
+    """Invalid native_memory argument passed to the Iteration() constructor - must be a NativeMemory"""
     UNIT_ARG_TYPE = "UNIT_ARG_TYPE"
     """Invalid unit argument passed to the Iteration() constructor - must be a str"""
     UNIT_ARG_VALUE = "UNIT_ARG_VALUE"
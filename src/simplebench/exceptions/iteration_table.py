@@ -0,0 +1,34 @@
+"""ErrorTags for simplebench.iteration_table in SimpleBench."""
+from ..enums import enum_docstrings
+from .base import ErrorTag
+
+
+@enum_docstrings
+class _IterationTableErrorTag(ErrorTag):
+    """ErrorTags for simplebench.iteration_table in SimpleBench."""
+    UNIT_ARG_TYPE = "UNIT_ARG_TYPE"
+    """Invalid unit argument passed to the IterationTable() constructor - must be a str"""
+    UNIT_ARG_VALUE = "UNIT_ARG_VALUE"
+    """Invalid unit argument passed to the IterationTable() constructor - must be a non-blank str"""
+    CAPACITY_ARG_TYPE = "CAPACITY_ARG_TYPE"
+    """Invalid capacity argument passed to the IterationTable() constructor - must be an int"""
+    CAPACITY_ARG_VALUE = "CAPACITY_ARG_VALUE"
+    """Invalid capacity argument passed to the IterationTable() constructor - must be greater than zero"""
+    APPEND_INVALID_ITERATION_ARG_TYPE = "APPEND_INVALID_ITERATION_ARG_TYPE"
+    """Something other than an Iteration was passed to IterationTable.append()"""
+    APPEND_MISMATCHED_UNIT = "APPEND_MISMATCHED_UNIT"
+    """The Iteration passed to IterationTable.append() has a different unit from the table"""
+    APPEND_TO_FROZEN_TABLE = "APPEND_TO_FROZEN_TABLE"
+    """An iteration was appended to a frozen IterationTable"""
+    FROM_ITERATIONS_INVALID_ARG_TYPE = "FROM_ITERATIONS_INVALID_ARG_TYPE"
+    """The iterations argument passed to IterationTable.from_iterations() is not a Sequence"""
+    FROM_ITERATIONS_INVALID_ARG_IN_SEQUENCE = "FROM_ITERATIONS_INVALID_ARG_IN_SEQUENCE"
+    """The iterations argument passed to IterationTable.from_iterations() contains something other than Iterations"""
+    FROM_ITERATIONS_MIXED_UNITS = "FROM_ITERATIONS_MIXED_UNITS"
+    """The iterations passed to IterationTable.from_iterations() do not all have the same unit"""
+    COLUMN_INVALID_NAME_ARG_VALUE = "COLUMN_INVALID_NAME_ARG_VALUE"
+    """The name passed to IterationTable.column() is not the name of a column"""
+    SECTION_INVALID_SECTION_ARG_TYPE = "SECTION_INVALID_SECTION_ARG_TYPE"
+    """Something other than a Section was passed to IterationTable.section()"""
+    SECTION_UNSUPPORTED_SECTION_ARG_VALUE = "SECTION_UNSUPPORTED_SECTION_ARG_VALUE"
+    """The Section passed to IterationTable.section() is not a per-iteration section"""
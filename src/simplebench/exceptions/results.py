@@ -62,6 +62,8 @@ class _ResultsErrorTag(ErrorTag):
     """Something other than a Sequence of Iteration instances was passed as the iterations arg"""
     ITERATIONS_INVALID_ARG_IN_SEQUENCE = "ITERATIONS_INVALID_ARG_IN_SEQUENCE"
     """Something other than an Iteration instance was found in the Sequence passed as the iterations arg"""
+    ITERATIONS_MIXED_UNITS = "ITERATIONS_MIXED_UNITS"
+    """The iterations passed as the iterations arg do not all have the same unit"""
     VARIATION_COLS_INVALID_ARG_TYPE = "VARIATION_COLS_INVALID_ARG_TYPE"
     """Something other than a dict of str to str was passed as the variation_cols arg"""
     VARIATION_COLS_INVALID_ARG_KEY_TYPE = "VARIATION_COLS_INVALID_ARG_KEY_TYPE"
@@ -74,10 +76,24 @@ class _ResultsErrorTag(ErrorTag):
     """Something other than a Section enum was passed as the results_sections arg"""
     RESULTS_SECTION_UNSUPPORTED_SECTION_ARG_VALUE = "RESULTS_SECTION_UNSUPPORTED_SECTION_ARG_VALUE"
     """Something other than a Section.OPS or Section.TIMING was passed to the Results.result_section() method"""
+    RESULTS_SECTION_NOT_MEASURED = "RESULTS_SECTION_NOT_MEASURED"
+    """A memory section was requested from the Results.result_section() method of results without memory usage"""
+    MEMORY_MEASURED_INVALID_ARG_TYPE = "MEMORY_MEASURED_INVALID_ARG_TYPE"
+    """Something other than a bool was passed as the memory_measured arg"""
     MEMORY_INVALID_ARG_TYPE = "MEMORY_INVALID_ARG_TYPE"
     """Something other than a MemoryUsage instance was passed as the memory arg"""
     PEAK_MEMORY_INVALID_ARG_TYPE = "PEAK_MEMORY_INVALID_ARG_TYPE"
     """Something other than a PeakMemoryUsage instance was passed as the peak_memory arg"""
+    CPU_TIMINGS_INVALID_ARG_TYPE = "CPU_TIMINGS_INVALID_ARG_TYPE"
+    """Something other than a CPUTimings instance was passed as the cpu_timings arg"""
+    GC_COLLECTIONS_INVALID_ARG_TYPE = "GC_COLLECTIONS_INVALID_ARG_TYPE"
+    """Something other than a GCCollections instance was passed as the gc_collections arg"""
+    WARMUP_TIMINGS_INVALID_ARG_TYPE = "WARMUP_TIMINGS_INVALID_ARG_TYPE"
+    """Something other than an OperationTimings instance or None was passed as the warmup_timings arg"""
+    LATENCY_INVALID_ARG_TYPE = "LATENCY_INVALID_ARG_TYPE"
+    """Something other than a LatencyHistogram or None was passed as the latency arg"""
+    ALLOCATION_SITES_INVALID_ARG_TYPE = "ALLOCATION_SITES_INVALID_ARG_TYPE"
+    """Something other than a Sequence of AllocationSite instances or None was passed as the allocation_sites arg"""
     PEAK_MEMORY_SCALE_INVALID_ARG_TYPE = "PEAK_MEMORY_SCALE_INVALID_ARG_TYPE"
     """Something other than a float was passed as the peak_memory_scale arg"""
     PEAK_MEMORY_SCALE_INVALID_ARG_VALUE = "PEAK_MEMORY_SCALE_INVALID_ARG_VALUE"
@@ -14,6 +14,34 @@ class _RunnersErrorTag(ErrorTag):
     """The rounds argument was less than 1"""
     SIMPLERUNNER_BENCHMARK_TIMEOUT = "SIMPLERUNNER_BENCHMARK_TIMEOUT"
     """The benchmark execution exceeded the allowed time limit."""
+    SIMPLERUNNER_RUN_INVALID_INPUT_FACTORY = "SIMPLERUNNER_RUN_INVALID_INPUT_FACTORY"
+    """The input_factory argument was not a callable"""
+    SIMPLERUNNER_RUN_INVALID_THREADS_TYPE = "SIMPLERUNNER_RUN_INVALID_THREADS_TYPE"
+    """The threads argument was not an int"""
+    SIMPLERUNNER_RUN_INVALID_THREADS_VALUE = "SIMPLERUNNER_RUN_INVALID_THREADS_VALUE"
+    """The threads argument was less than 1"""
+    SIMPLERUNNER_RUN_THREADS_WITH_INPUT_FACTORY = "SIMPLERUNNER_RUN_THREADS_WITH_INPUT_FACTORY"
+    """An input_factory was passed together with more than one thread"""
+
+    # AsyncRunner tags
+    ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_TYPE = "ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_TYPE"
+    """The rounds argument was not an int"""
+    ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_VALUE = "ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_VALUE"
+    """The rounds argument was less than 1"""
+    ASYNCRUNNER_ACTION_NOT_COROUTINE_FUNCTION = "ASYNCRUNNER_ACTION_NOT_COROUTINE_FUNCTION"
+    """The action passed to an AsyncRunner was not a coroutine function"""
+    ASYNCRUNNER_THREADS_NOT_SUPPORTED = "ASYNCRUNNER_THREADS_NOT_SUPPORTED"
+    """More than one thread was requested from an AsyncRunner, which runs its action in a single event loop"""
+
+    # LoadRunner tags
+    LOADRUNNER_RUN_INVALID_RATE_TYPE = "LOADRUNNER_RUN_INVALID_RATE_TYPE"
+    """The rate argument was not a float or int"""
+    LOADRUNNER_RUN_INVALID_RATE_VALUE = "LOADRUNNER_RUN_INVALID_RATE_VALUE"
+    """The rate argument was not positive"""
+    LOADRUNNER_RUN_INVALID_ARRIVAL_PROCESS = "LOADRUNNER_RUN_INVALID_ARRIVAL_PROCESS"
+    """The arrival_process argument was not an ArrivalProcess"""
+    LOADRUNNER_RUN_UNSUPPORTED_OPTION = "LOADRUNNER_RUN_UNSUPPORTED_OPTION"
+    """An input_factory or more than one thread was requested from a LoadRunner, which issues single calls"""
 
     # calibrate_rounds() tags
     SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_TIMER_FUNCTION = "SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_TIMER_FUNCTION"
@@ -30,3 +58,5 @@ class _RunnersErrorTag(ErrorTag):
     """The setup argument was not a callable"""
     SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_TEARDOWN = "SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_TEARDOWN"
     """The teardown argument was not a callable"""
+    SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_INPUT_FACTORY = "SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_INPUT_FACTORY"
+    """The input_factory argument was not a callable"""
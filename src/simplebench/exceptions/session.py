@@ -53,3 +53,21 @@ class _SessionErrorTag(ErrorTag):
     method as the args argument"""
     ARGUMENT_ERROR_ADDING_FLAGS = "ARGUMENT_ERROR_ADDING_FLAGS"
     """An error occurred while adding flags to the ArgumentParser instance"""
+    PROPERTY_INVALID_JOBS_ARG = "PROPERTY_INVALID_JOBS_ARG"
+    """Something other than an int was assigned to the jobs property"""
+    PROPERTY_INVALID_JOBS_VALUE = "PROPERTY_INVALID_JOBS_VALUE"
+    """A value less than 1 was assigned to the jobs property"""
+    PROPERTY_INVALID_ISOLATED_ARG = "PROPERTY_INVALID_ISOLATED_ARG"
+    """Something other than a bool was assigned to the isolated property"""
+    PROPERTY_INVALID_INTERLEAVE_ARG = "PROPERTY_INVALID_INTERLEAVE_ARG"
+    """Something other than a bool was assigned to the interleave property"""
+    PROPERTY_INVALID_USE_CALIBRATION_CACHE_ARG = "PROPERTY_INVALID_USE_CALIBRATION_CACHE_ARG"
+    """Something other than a bool was assigned to the use_calibration_cache property"""
+    PROPERTY_INVALID_CPU_AFFINITY_ARG = "PROPERTY_INVALID_CPU_AFFINITY_ARG"
+    """Something other than None or a sequence of ints was assigned to the cpu_affinity property"""
+    PROPERTY_INVALID_CPU_AFFINITY_VALUE = "PROPERTY_INVALID_CPU_AFFINITY_VALUE"
+    """An empty sequence or a negative CPU number was assigned to the cpu_affinity property"""
+    PROPERTY_INVALID_PRIORITY_ARG = "PROPERTY_INVALID_PRIORITY_ARG"
+    """Something other than None or an int was assigned to the priority property"""
+    PROPERTY_INVALID_PRIORITY_VALUE = "PROPERTY_INVALID_PRIORITY_VALUE"
+    """A value outside -20 to 19 was assigned to the priority property"""
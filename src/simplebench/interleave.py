@@ -0,0 +1,275 @@
+"""Interleaved execution of benchmark variations.
+
+Variations are normally run back to back in grid order, so slow drifts of the environment
+(thermal throttling, CPU frequency scaling, background load) land on the variations run
+last. In interleaved mode all the variations are started at once, each in its own thread,
+and take turns: a single turn is handed from variation to variation after every iteration,
+in round-robin order with the order reshuffled at random for every round. Only the
+variation holding the turn runs, so the measurements never overlap, and a drift is spread
+evenly over all the variations instead of biasing the comparison between them.
+
+Each variation still produces its own :class:`~simplebench.results.Results`. The time a
+variation spends waiting for its turn is not counted against its ``min_time`` and
+``max_time``, and its timeout is scaled by the number of variations taking turns.
+"""
+from __future__ import annotations
+
+import queue
+import random
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from .exceptions import (
+    SimpleBenchBenchmarkError,
+    SimpleBenchRuntimeError,
+    SimpleBenchTimeoutError,
+    _CaseErrorTag,
+    _InterleaveErrorTag,
+)
+from .tasks import ProgressTracker
+from .validators import validate_positive_int
+
+if TYPE_CHECKING:
+    from .case import Case
+    from .results import Results
+    from .session import Session
+
+
+class InterleavedScheduler:
+    """Hands a single turn between a fixed set of participants in randomized round-robin order.
+
+    Participants are numbered from 0. Every participant gets exactly one turn per round and
+    the order of the participants within each round is shuffled. A participant that has
+    finished is removed from the rotation. The scheduler is thread-safe; each participant is
+    expected to run in its own thread and block in :meth:`wait_turn` or :meth:`yield_turn`
+    while another participant holds the turn.
+
+    :param participants: The number of participants.
+    :param seed: The seed of the shuffling, or None to seed it from the OS.
+    :raises SimpleBenchTypeError: If ``participants`` is not an int.
+    :raises SimpleBenchValueError: If ``participants`` is not positive.
+    """
+    __slots__ = ('_participants', '_condition', '_active', '_order', '_turn', '_random', '_cancelled')
+
+    def __init__(self, participants: int, *, seed: int | None = None) -> None:
+        self._participants: int = validate_positive_int(
+            participants, 'participants',
+            _InterleaveErrorTag.INVALID_PARTICIPANTS_ARG_TYPE,
+            _InterleaveErrorTag.INVALID_PARTICIPANTS_ARG_VALUE)
+        self._condition = threading.Condition()
+        self._active: list[int] = list(range(self._participants))
+        self._order: list[int] = []
+        self._turn: int | None = None
+        self._random = random.Random(seed)
+        self._cancelled: bool = False
+        with self._condition:
+            self._next_turn()
+
+    @property
+    def participants(self) -> int:
+        """The number of participants the scheduler was created for."""
+        return self._participants
+
+    @property
+    def turn(self) -> int | None:
+        """The participant holding the turn, or None once all participants have finished."""
+        with self._condition:
+            return self._turn
+
+    def _next_turn(self) -> None:
+        """Hand the turn to the next participant of the current round, starting a new round if needed.
+
+        Must be called with the condition held.
+        """
+        if not self._order:
+            self._order = self._active.copy()
+            self._random.shuffle(self._order)
+        self._turn = self._order.pop(0) if self._order else None
+        self._condition.notify_all()
+
+    def _validate_participant(self, participant: int) -> None:
+        """Raise if ``participant`` is not one of the scheduler's participants.
+
+        :param participant: The participant number.
+        :raises SimpleBenchRuntimeError: If the participant number is out of range.
+        """
+        if not 0 <= participant < self._participants:
+            raise SimpleBenchRuntimeError(
+                f'Invalid participant {participant}: the scheduler has {self._participants} participants',
+                tag=_InterleaveErrorTag.INVALID_PARTICIPANT)
+
+    def _await_turn(self, participant: int) -> None:
+        """Block until ``participant`` holds the turn. Must be called with the condition held.
+
+        :param participant: The participant number.
+        :raises SimpleBenchRuntimeError: If the run was cancelled or the participant has finished.
+        """
+        self._condition.wait_for(
+            lambda: self._turn == participant or self._cancelled or participant not in self._active)
+        if self._cancelled or self._turn != participant:
+            raise SimpleBenchRuntimeError(
+                f'Interleaved run cancelled while participant {participant} was waiting for its turn',
+                tag=_InterleaveErrorTag.CANCELLED)
+
+    def wait_turn(self, participant: int) -> None:
+        """Block until ``participant`` holds the turn.
+
+        Returns immediately if the participant already holds it.
+
+        :param participant: The participant number.
+        :raises SimpleBenchRuntimeError: If the participant number is invalid, the run was
+            cancelled or the participant has finished.
+        """
+        self._validate_participant(participant)
+        with self._condition:
+            self._await_turn(participant)
+
+    def yield_turn(self, participant: int) -> None:
+        """Hand the turn to the next participant and block until it comes back to ``participant``.
+
+        If ``participant`` is the only participant left, it keeps the turn.
+
+        :param participant: The participant number.
+        :raises SimpleBenchRuntimeError: If the participant number is invalid, the run was
+            cancelled or the participant has finished.
+        """
+        self._validate_participant(participant)
+        with self._condition:
+            if self._turn == participant:
+                self._next_turn()
+            self._await_turn(participant)
+
+    def finish(self, participant: int) -> None:
+        """Remove ``participant`` from the rotation, passing the turn on if it holds it.
+
+        Finishing a participant more than once has no further effect.
+
+        :param participant: The participant number.
+        :raises SimpleBenchRuntimeError: If the participant number is invalid.
+        """
+        self._validate_participant(participant)
+        with self._condition:
+            if participant not in self._active:
+                return
+            self._active.remove(participant)
+            if participant in self._order:
+                self._order.remove(participant)
+            if self._turn == participant:
+                self._next_turn()
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Cancel the run: every participant waiting for its turn, now or later, raises."""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+
+def _run_participant(scheduler: InterleavedScheduler,
+                     index: int,
+                     run: tuple[Case, dict[str, Any]],
+                     session: Optional[Session],
+                     ordered_results: list[Results | None],
+                     errors: list[Exception | None],
+                     completions: queue.SimpleQueue[int]) -> None:
+    """Run one interleaved variation in its participant thread (see :func:`run_interleaved`).
+
+    A failure is stored in ``errors`` and cancels the other participants. Whatever the
+    outcome, the participant is finished and its index is put on ``completions``.
+
+    :param scheduler: The scheduler the participants take turns through.
+    :param index: The participant number of the variation.
+    :param run: The ``(case, kwargs)`` pair of the variation.
+    :param session: The session running the cases, if any.
+    :param ordered_results: The Results of the variations, stored by participant number.
+    :param errors: The errors raised by the variations, stored by participant number.
+    :param completions: The queue the participant number is put on once it has finished.
+    """
+    case, kwargs = run
+    try:
+        scheduler.wait_turn(index)
+        with case.pinned(session):
+            bench = case._create_runner(kwargs=kwargs, session=session)  # pylint: disable=protected-access
+            bench.interleave(scheduler, index)
+            ordered_results[index] = case.action(bench, **kwargs)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        errors[index] = e
+        scheduler.cancel()
+    finally:
+        scheduler.finish(index)
+        completions.put(index)
+
+
+def _raise_first_failure(runs: Sequence[tuple[Case, dict[str, Any]]], errors: list[Exception | None]) -> None:
+    """Raise the error of the failed interleaved variation, if any.
+
+    The error that caused the cancellation is reported rather than the cancellations it caused.
+
+    :param runs: The ``(case, kwargs)`` pairs of the variations.
+    :param errors: The errors raised by the variations, in the same order as ``runs``.
+    :raises SimpleBenchTimeoutError: If a timeout occurred during a benchmark action.
+    :raises SimpleBenchBenchmarkError: If an error occurred during a benchmark action.
+    """
+    failures = [(index, error) for index, error in enumerate(errors) if error is not None]
+    failures.sort(key=lambda failure: getattr(failure[1], 'tag_code', None) == _InterleaveErrorTag.CANCELLED)
+    if not failures:
+        return
+    index, error = failures[0]
+    case, kwargs = runs[index]
+    if isinstance(error, SimpleBenchTimeoutError):
+        raise SimpleBenchTimeoutError(
+            f'Timeout occurred running benchmark action {str(case.action)} for case '
+            f'"{case.title}" with kwargs {kwargs}: {error}',
+            tag=_CaseErrorTag.BENCHMARK_ACTION_TIMEOUT_OCCURRED) from error
+    raise SimpleBenchBenchmarkError(
+        f'Error occurred running benchmark action {str(case.action)} for case '
+        f'"{case.title}" with kwargs {kwargs}: {error}, {type(error)}',
+        tag=_CaseErrorTag.BENCHMARK_ACTION_RAISED_EXCEPTION) from error
+
+
+def run_interleaved(runs: Sequence[tuple[Case, dict[str, Any]]], *,
+                    session: Optional[Session],
+                    progress_tracker: Optional[ProgressTracker] = None,
+                    seed: int | None = None) -> list[Results]:
+    """Run kwargs variations of one or more Cases interleaved with each other.
+
+    Each variation is run by calling its Case's action in its own thread, restricted to the
+    Case's effective CPU affinity and priority. The runners take turns through an
+    :class:`InterleavedScheduler`, yielding the turn after every iteration.
+
+    If a variation fails, the remaining variations are cancelled and the error is raised
+    once all the threads have stopped.
+
+    :param runs: The ``(case, kwargs)`` pairs of the variations to run.
+    :param session: The session running the cases, if any.
+    :param progress_tracker: A progress tracker updated as variations complete, or None.
+    :param seed: The seed of the turn order shuffling, or None to seed it from the OS.
+    :return: The Results for each variation, in the same order as ``runs``.
+    :raises SimpleBenchTimeoutError: If a timeout occurs during the benchmark action.
+    :raises SimpleBenchBenchmarkError: If an error occurs during the benchmark action.
+    """
+    if not runs:
+        return []
+    scheduler = InterleavedScheduler(len(runs), seed=seed)
+    ordered_results: list[Results | None] = [None] * len(runs)
+    errors: list[Exception | None] = [None] * len(runs)
+    completions: queue.SimpleQueue[int] = queue.SimpleQueue()
+
+    threads = [threading.Thread(target=_run_participant,
+                                args=(scheduler, index, runs[index], session, ordered_results, errors, completions),
+                                name=f'simplebench-interleave-{index}', daemon=True)
+               for index in range(len(runs))]
+    for thread in threads:
+        thread.start()
+    for completed in range(1, len(runs) + 1):
+        completions.get()
+        if progress_tracker is not None:
+            progress_tracker.update(
+                description=f'Running interleaved variations ({completed}/{len(runs)})',
+                completed=completed,
+                refresh=True)
+    for thread in threads:
+        thread.join()
+
+    _raise_first_failure(runs, errors)
+    return [result for result in ordered_results if result is not None]
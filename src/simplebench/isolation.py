@@ -0,0 +1,322 @@
+"""Isolated execution of benchmark cases in fresh child processes.
+
+When a :class:`~simplebench.session.Session` is in isolated mode, each kwargs variation of
+each :class:`~simplebench.case.Case` is run in its own child process. Caches, interned objects,
+heap fragmentation and garbage left over from earlier benchmarks therefore cannot distort later
+measurements, and a crashing extension module only takes down the child process.
+
+The children are forked from a :mod:`multiprocessing` fork server that has already imported
+``simplebench``, ``numpy`` (see :data:`~simplebench.defaults.DEFAULT_FORKSERVER_PRELOAD`),
+the ``__main__`` module and the modules defining the benchmark actions, so isolation does not
+cost a full interpreter start-up per variation. Results come back to the parent over a pipe.
+
+The Case is sent to the child by pickling it. Cases that cannot be pickled (such as those
+created by the :func:`@benchmark <simplebench.decorators.benchmark>` decorator) are instead
+located in the child by their :attr:`~simplebench.case.Case.benchmark_id` among the cases
+registered when the benchmark module was imported.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import time
+from multiprocessing.connection import Connection, wait
+from typing import TYPE_CHECKING, Any, Iterable
+
+from rich.console import Console
+
+from . import defaults
+from .enums import Verbosity
+from .exceptions import (
+    SimpleBenchBenchmarkError,
+    SimpleBenchRuntimeError,
+    SimpleBenchTimeoutError,
+    _CaseErrorTag,
+    _IsolationErrorTag,
+)
+from .tasks import ProgressTracker
+from .utils import available_cpus, current_priority, pin_to_cpu, set_priority, spread_over_cores
+
+if TYPE_CHECKING:
+    from .case import Case
+    from .results import Results
+    from .session import Session
+
+
+_FORKSERVER_CONFIGURED: bool = False
+"""Whether the fork server preload list has been set for this process."""
+
+
+def is_isolation_available() -> bool:
+    """Whether isolated execution is supported on this platform.
+
+    Isolation requires the ``forkserver`` :mod:`multiprocessing` start method.
+
+    :return: True if isolated execution is available, False otherwise.
+    """
+    return 'forkserver' in multiprocessing.get_all_start_methods()
+
+
+def configure_forkserver(cases: Iterable[Case]) -> None:
+    """Set the modules the fork server imports before forking isolated benchmark processes.
+
+    The preload list is the :data:`~simplebench.defaults.DEFAULT_FORKSERVER_PRELOAD` modules,
+    ``__main__`` and the modules defining the actions of ``cases``. It only takes effect if
+    the fork server has not been started yet, so only the first call in a process has an effect.
+
+    :param cases: The cases that will be run in isolated processes.
+    """
+    global _FORKSERVER_CONFIGURED  # pylint: disable=global-statement
+    if _FORKSERVER_CONFIGURED or not is_isolation_available():
+        return
+    modules: set[str] = set(defaults.DEFAULT_FORKSERVER_PRELOAD) | {'__main__'}
+    for case in cases:
+        module = getattr(case.action, '__module__', None)
+        if isinstance(module, str) and module:
+            modules.add(module)
+    multiprocessing.get_context('forkserver').set_forkserver_preload(sorted(modules))
+    _FORKSERVER_CONFIGURED = True
+
+
+def _resolve_case(case_payload: bytes | None, benchmark_id: str) -> Case | None:
+    """Reconstruct the Case in an isolated child process.
+
+    :param case_payload: The pickled Case, or None if it could not be pickled.
+    :param benchmark_id: The benchmark_id of the Case.
+    :return: The Case, or None if it could not be located.
+    """
+    if case_payload is not None:
+        return pickle.loads(case_payload)
+    from .decorators import get_registered_cases  # pylint: disable=import-outside-toplevel
+    for case in get_registered_cases():
+        if case.benchmark_id == benchmark_id:
+            return case
+    return None
+
+
+def _child_session_settings(session: Session | None) -> dict[str, Any]:
+    """The settings of the parent session to run an isolated child process's session with.
+
+    :param session: The session running the case, if any.
+    :return: The :class:`~simplebench.session.Session` keyword arguments for the child session.
+    """
+    if session is None:
+        return {'timer': defaults.DEFAULT_TIMER}
+    return {'default_runner': session.default_runner,
+            'timer': session.timer,
+            'output_path': session.output_path,
+            'use_calibration_cache': session.use_calibration_cache,
+            'cpu_affinity': session.cpu_affinity,
+            'priority': session.priority}
+
+
+def _isolated_child(conn: Connection,
+                    case_payload: bytes | None,
+                    benchmark_id: str,
+                    kwargs: dict[str, Any],
+                    session_settings: dict[str, Any],
+                    cpu: int | None,
+                    priority: int | None) -> None:
+    """Run one kwargs variation of a Case in an isolated child process.
+
+    The outcome is sent back over ``conn`` as a ``(kind, payload)`` tuple where ``kind`` is
+    ``'ok'`` (payload is the Results), ``'timeout'``, ``'error'`` or ``'unresolved'``
+    (payload is an error message).
+
+    :param conn: The child end of the results pipe.
+    :param case_payload: The pickled Case, or None if it could not be pickled.
+    :param benchmark_id: The benchmark_id of the Case.
+    :param kwargs: The keyword arguments for the variation.
+    :param session_settings: The parent session's settings (see :func:`_child_session_settings`).
+    :param cpu: The CPU to pin the child process to, or None.
+    :param priority: The niceness to run the child process with, or None.
+    """
+    from .session import Session  # pylint: disable=import-outside-toplevel
+    pin_to_cpu(cpu)
+    if priority is not None:
+        set_priority(priority)
+    try:
+        case = _resolve_case(case_payload, benchmark_id)
+        if case is None:
+            conn.send(('unresolved', f'no registered case with benchmark_id {benchmark_id!r}'))
+            return
+        session = Session(**session_settings, verbosity=Verbosity.QUIET, console=Console(quiet=True))
+        bench = case._create_runner(kwargs=kwargs, session=session)  # pylint: disable=protected-access
+        results = case.action(bench, **kwargs)
+    except SimpleBenchTimeoutError as e:
+        conn.send(('timeout', str(e)))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        conn.send(('error', f'{e}, {type(e)}'))
+    else:
+        conn.send(('ok', results))
+    finally:
+        conn.close()
+
+
+def _pickle_case(case: Case) -> bytes | None:
+    """Pickle a Case for sending to isolated child processes.
+
+    :param case: The Case to pickle.
+    :return: The pickled Case, or None if it cannot be pickled.
+    """
+    try:
+        return pickle.dumps(case)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+
+
+def _receive_result(case: Case, kwargs: dict[str, Any], conn: Connection, process: Any) -> tuple[str, Any]:
+    """Receive the outcome of an isolated child process and wait for it to exit.
+
+    :param case: The Case being run.
+    :param kwargs: The keyword arguments of the variation the child ran.
+    :param conn: The parent end of the child's results pipe. It is closed afterwards.
+    :param process: The child process.
+    :return: The ``(kind, payload)`` outcome sent by the child (see :func:`_isolated_child`).
+    :raises SimpleBenchBenchmarkError: If the child exited without sending its outcome.
+    """
+    try:
+        outcome: tuple[str, Any] = conn.recv()
+    except EOFError:
+        process.join()
+        raise SimpleBenchBenchmarkError(  # pylint: disable=raise-missing-from
+            f'Isolated process for case "{case.title}" with kwargs {kwargs} exited '
+            f'with code {process.exitcode} without returning results',
+            tag=_IsolationErrorTag.CHILD_PROCESS_DIED)
+    finally:
+        conn.close()
+    process.join()
+    return outcome
+
+
+def _decode_result(case: Case, kwargs: dict[str, Any], kind: str, payload: Any) -> Results:
+    """Turn the outcome of an isolated child process into its Results.
+
+    :param case: The Case being run.
+    :param kwargs: The keyword arguments of the variation the child ran.
+    :param kind: The kind of outcome sent by the child (see :func:`_isolated_child`).
+    :param payload: The Results, or an error message.
+    :return: The Results of the variation.
+    :raises SimpleBenchTimeoutError: If a timeout occurred during the benchmark action.
+    :raises SimpleBenchBenchmarkError: If an error occurred during the benchmark action.
+    :raises SimpleBenchRuntimeError: If the Case could not be located in the child process.
+    """
+    if kind == 'timeout':
+        raise SimpleBenchTimeoutError(
+            f'Timeout occurred running benchmark action {str(case.action)} for case '
+            f'"{case.title}" with kwargs {kwargs}: {payload}',
+            tag=_CaseErrorTag.BENCHMARK_ACTION_TIMEOUT_OCCURRED)
+    if kind == 'error':
+        raise SimpleBenchBenchmarkError(
+            f'Error occurred running benchmark action {str(case.action)} for case '
+            f'"{case.title}" with kwargs {kwargs}: {payload}',
+            tag=_CaseErrorTag.BENCHMARK_ACTION_RAISED_EXCEPTION)
+    if kind == 'unresolved':
+        raise SimpleBenchRuntimeError(
+            f'Case "{case.title}" could not be pickled or located in the isolated process: {payload}',
+            tag=_IsolationErrorTag.CASE_NOT_TRANSFERABLE)
+    return payload
+
+
+def _check_hung(case: Case,
+                all_variations: list[dict[str, Any]],
+                running: dict[Connection, tuple[Any, int, int, float]],
+                child_timeout: float) -> None:
+    """Check that no running child process has passed its deadline without returning results.
+
+    :param case: The Case being run.
+    :param all_variations: The expanded kwargs variations being run.
+    :param running: The running child processes, by the parent end of their results pipe.
+    :param child_timeout: The time allowed for each child process, in seconds.
+    :raises SimpleBenchTimeoutError: If a child process has hung.
+    """
+    now = time.monotonic()
+    for conn, (_, index, _, deadline) in running.items():
+        if deadline <= now and not conn.poll():
+            raise SimpleBenchTimeoutError(
+                f'Isolated process for case "{case.title}" with kwargs {all_variations[index]} '
+                f'did not return results within {child_timeout} seconds',
+                tag=_IsolationErrorTag.CHILD_PROCESS_HUNG)
+
+
+def run_isolated(case: Case, *,
+                 all_variations: list[dict[str, Any]],
+                 session: Session | None,
+                 jobs: int,
+                 progress_tracker: ProgressTracker) -> list[Results]:
+    """Run each kwargs variation of a Case in its own fork server child process.
+
+    Up to ``jobs`` children run at once, each pinned to its own CPU (one physical core at a
+    time before SMT siblings) where the platform supports it. The children run with the
+    niceness of the case's :attr:`~simplebench.case.Case.pinning`, or else of the current
+    process, as the fork server does not inherit it. A child that has not returned its results
+    within the case's timeout (plus :data:`~simplebench.defaults.DEFAULT_TIMEOUT_GRACE_PERIOD`)
+    is terminated.
+
+    :param case: The Case to run.
+    :param all_variations: The expanded kwargs variations to run.
+    :param session: The session running the case, if any.
+    :param jobs: The maximum number of child processes to run at once.
+    :param progress_tracker: The ``Case:run`` progress tracker.
+    :return: The Results for each variation, in the same order as ``all_variations``.
+    :raises SimpleBenchRuntimeError: If isolation is not available on this platform or the
+        Case cannot be transferred to the child process.
+    :raises SimpleBenchTimeoutError: If a timeout occurs during the benchmark action or a child hangs.
+    :raises SimpleBenchBenchmarkError: If an error occurs during the benchmark action or a child dies.
+    """
+    if not is_isolation_available():
+        raise SimpleBenchRuntimeError(
+            "Isolated execution requires the 'forkserver' multiprocessing start method",
+            tag=_IsolationErrorTag.FORKSERVER_NOT_AVAILABLE)
+    configure_forkserver([case])
+    mp_context = multiprocessing.get_context('forkserver')
+
+    case_payload = _pickle_case(case)
+    session_settings = _child_session_settings(session)
+    child_timeout: float = case.timeout + defaults.DEFAULT_TIMEOUT_GRACE_PERIOD
+    cpus: list[int | None] = list(spread_over_cores(available_cpus())) or [None]
+    priority: int | None = case.pinning.priority if case.pinning is not None else current_priority()
+
+    pending: list[int] = list(range(len(all_variations)))
+    free_slots: list[int] = list(range(jobs))
+    running: dict[Connection, tuple[Any, int, int, float]] = {}
+    ordered_results: list[Results | None] = [None] * len(all_variations)
+    completed: int = 0
+    try:
+        while pending or running:
+            while pending and free_slots:
+                index = pending.pop(0)
+                slot = free_slots.pop(0)
+                parent_conn, child_conn = mp_context.Pipe(duplex=False)
+                process = mp_context.Process(
+                    target=_isolated_child,
+                    args=(child_conn, case_payload, case.benchmark_id, all_variations[index],
+                          session_settings, cpus[slot % len(cpus)], priority),
+                    daemon=True)
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (process, index, slot, time.monotonic() + child_timeout)
+
+            next_deadline = min(deadline for _, _, _, deadline in running.values())
+            for conn in wait(list(running), timeout=max(0.0, next_deadline - time.monotonic())):
+                process, index, slot, _ = running.pop(conn)  # type: ignore[index]
+                kwargs = all_variations[index]
+                kind, payload = _receive_result(case, kwargs, conn, process)  # type: ignore[arg-type]
+                free_slots.append(slot)
+                ordered_results[index] = _decode_result(case, kwargs, kind, payload)
+                completed += 1
+                progress_tracker.update(
+                    description=(
+                        f'Running case {case.title} isolated ({completed}/{len(all_variations)})'),
+                    completed=completed,
+                    refresh=True)
+
+            _check_hung(case, all_variations, running, child_timeout)
+    finally:
+        for conn, (process, _, _, _) in running.items():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            conn.close()
+
+    return [result for result in ordered_results if result is not None]
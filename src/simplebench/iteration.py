@@ -3,12 +3,16 @@ from .defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT
 from .doc_utils import format_docstring
 from .enums import Section
 from .exceptions import SimpleBenchTypeError, SimpleBenchValueError, _IterationErrorTag
+from .utils.native_memory import NativeMemory
+from .utils.resource_usage import RUsage
 from .validators import (
     validate_int,
     validate_non_blank_string,
     validate_non_negative_float,
+    validate_non_negative_int,
     validate_positive_float,
     validate_positive_int,
+    validate_type,
 )
 
 
@@ -57,9 +61,24 @@ class Iteration:
     :vartype memory: int
     :ivar peak_memory: The peak memory usage in bytes. (read only)
     :vartype peak_memory: int
+    :ivar gc_collections: The number of garbage collections during the iteration. (defaults to 0) (read only)
+    :vartype gc_collections: int
+    :ivar gc_elapsed: The time spent in garbage collections during the iteration in seconds. (read only)
+    :vartype gc_elapsed: float
+    :ivar cpu_elapsed: The CPU time consumed by the process during the iteration in seconds. (read only)
+    :vartype cpu_elapsed: float
+    :ivar per_round_cpu_elapsed: The mean CPU time for a single round in seconds. (read only)
+    :vartype per_round_cpu_elapsed: float
+    :ivar cpu_utilization: The ratio of CPU time to wall-clock time for the iteration. (read only)
+    :vartype cpu_utilization: float
+    :ivar rusage: The operating system resource counters for the iteration. (read only)
+    :vartype rusage: RUsage
+    :ivar native_memory: The native memory changes of the process for the iteration. (read only)
+    :vartype native_memory: NativeMemory
     """
 
-    __slots__ = ('_n', '_rounds', '_elapsed', '_unit', '_scale', '_memory', '_peak_memory')
+    __slots__ = ('_n', '_rounds', '_elapsed', '_unit', '_scale', '_memory', '_peak_memory',
+                 '_gc_collections', '_gc_elapsed', '_cpu_elapsed', '_rusage', '_native_memory')
 
     @format_docstring(DEFAULT_INTERVAL_UNIT=DEFAULT_INTERVAL_UNIT, DEFAULT_INTERVAL_SCALE=DEFAULT_INTERVAL_SCALE)
     def __init__(self,
@@ -71,6 +90,11 @@ class Iteration:
                  elapsed: float = 0.0,
                  memory: int = 0,  # in bytes
                  peak_memory: int = 0,  # in bytes
+                 gc_collections: int = 0,
+                 gc_elapsed: float = 0.0,  # in seconds
+                 cpu_elapsed: float = 0.0,  # in seconds
+                 rusage: RUsage = RUsage(),
+                 native_memory: NativeMemory = NativeMemory(),
                  ) -> None:
         """Initialize an Iteration instance.
 
@@ -90,6 +114,21 @@ class Iteration:
         :type memory: int
         :param peak_memory: The peak memory usage in bytes. Must be an integer.
         :type peak_memory: int
+        :param gc_collections: The number of garbage collections during the iteration.
+            Must be a non-negative integer.
+        :type gc_collections: int
+        :param gc_elapsed: The time spent in garbage collections during the iteration in seconds.
+            Must be a non-negative float.
+        :type gc_elapsed: float
+        :param cpu_elapsed: The CPU time (user and system) consumed by the process during the
+            iteration in seconds. Must be a non-negative float.
+        :type cpu_elapsed: float
+        :param rusage: The operating system resource counters (page faults, context switches,
+            block I/O and maximum resident set size) for the iteration. Defaults to all zeros.
+        :type rusage: RUsage
+        :param native_memory: The changes in the resident, unique and proportional set sizes of
+            the process over the iteration, and its peak resident set size. Defaults to all zeros.
+        :type native_memory: NativeMemory
         :raises SimpleBenchTypeError: If any of the arguments are of the wrong type.
         :raises SimpleBenchValueError: If any of the arguments have invalid values.
         """
@@ -119,6 +158,24 @@ class Iteration:
         self._peak_memory: int = validate_int(
             peak_memory, 'peak_memory',
             _IterationErrorTag.PEAK_MEMORY_ARG_TYPE)
+        self._gc_collections: int = validate_non_negative_int(
+            gc_collections, 'gc_collections',
+            _IterationErrorTag.GC_COLLECTIONS_ARG_TYPE,
+            _IterationErrorTag.GC_COLLECTIONS_ARG_VALUE)
+        self._gc_elapsed: float = validate_non_negative_float(
+            gc_elapsed, 'gc_elapsed',
+            _IterationErrorTag.GC_ELAPSED_ARG_TYPE,
+            _IterationErrorTag.GC_ELAPSED_ARG_VALUE)
+        self._cpu_elapsed: float = validate_non_negative_float(
+            cpu_elapsed, 'cpu_elapsed',
+            _IterationErrorTag.CPU_ELAPSED_ARG_TYPE,
+            _IterationErrorTag.CPU_ELAPSED_ARG_VALUE)
+        self._rusage: RUsage = validate_type(
+            rusage, RUsage, 'rusage',
+            _IterationErrorTag.RUSAGE_ARG_TYPE)
+        self._native_memory: NativeMemory = validate_type(
+            native_memory, NativeMemory, 'native_memory',
+            _IterationErrorTag.NATIVE_MEMORY_ARG_TYPE)
 
     def __eq__(self, other: object) -> bool:
         """Check equality between two Iteration instances.
@@ -132,7 +189,12 @@ class Iteration:
                 self.unit == other.unit and
                 self.scale == other.scale and
                 self.memory == other.memory and
-                self.peak_memory == other.peak_memory)
+                self.peak_memory == other.peak_memory and
+                self.gc_collections == other.gc_collections and
+                self.gc_elapsed == other.gc_elapsed and
+                self.cpu_elapsed == other.cpu_elapsed and
+                self.rusage == other.rusage and
+                self.native_memory == other.native_memory)
 
     @property
     def n(self) -> float:
@@ -176,6 +238,68 @@ class Iteration:
         """
         return self._peak_memory
 
+    @property
+    def gc_collections(self) -> int:
+        """The number of garbage collections (of any generation) during the timed iteration."""
+        return self._gc_collections
+
+    @property
+    def gc_elapsed(self) -> float:
+        """The time spent in garbage collections during the timed iteration in seconds."""
+        return self._gc_elapsed
+
+    @property
+    def cpu_elapsed(self) -> float:
+        """The CPU time (user and system) consumed by the process during the timed iteration in seconds."""
+        return self._cpu_elapsed
+
+    @property
+    def rusage(self) -> RUsage:
+        """The operating system resource counters for the timed iteration.
+
+        Page faults, context switches and block I/O operations are the counts during the
+        iteration. The maximum resident set size is the process's high-water mark after it.
+        All are zero on platforms without :func:`resource.getrusage`.
+        """
+        return self._rusage
+
+    @property
+    def native_memory(self) -> NativeMemory:
+        """The native memory of the process for the timed iteration.
+
+        The resident, unique and proportional set sizes are the changes over the iteration.
+        The peak resident set size is the high-water mark after it. All are zero unless the
+        case measured native memory on a platform that provides it (see
+        :attr:`~simplebench.case.Case.native_memory`).
+        """
+        return self._native_memory
+
+    @property
+    def per_round_cpu_elapsed(self) -> float:
+        """The mean CPU time for a single round in seconds.
+
+        :return: The CPU time of the iteration divided by the number of rounds.
+        :rtype: float
+        """
+        return self._cpu_elapsed / self._rounds
+
+    @property
+    def cpu_utilization(self) -> float:
+        """The ratio of the CPU time to the wall-clock time of the iteration.
+
+        A value near 1.0 means the action was computing for the whole iteration, a value
+        well below 1.0 that it spent time off the CPU (blocking I/O, lock waits, sleeps),
+        and a value above 1.0 that it kept more than one CPU busy.
+
+        The edge case of 0 elapsed time results in a returned value of 0.0
+
+        :return: The CPU time divided by the elapsed time.
+        :rtype: float
+        """
+        if self._elapsed == 0.0:
+            return 0.0
+        return self._cpu_elapsed / (self._elapsed * self._scale)
+
     @property
     def per_round_elapsed(self) -> float:
         """The mean time for a single round scaled to the base unit.
@@ -223,12 +347,36 @@ class Iteration:
         match section:
             case Section.OPS:
                 return self.ops_per_second
-            case Section.TIMING:
+            case Section.TIMING | Section.WARMUP:
                 return self.per_round_elapsed
             case Section.MEMORY:
                 return self.memory
             case Section.PEAK_MEMORY:
                 return self.peak_memory
+            case Section.GC:
+                return self.gc_collections
+            case Section.CPU_TIME:
+                return self.per_round_cpu_elapsed
+            case Section.MINOR_PAGE_FAULTS:
+                return self._rusage.minor_faults
+            case Section.MAJOR_PAGE_FAULTS:
+                return self._rusage.major_faults
+            case Section.VOLUNTARY_CONTEXT_SWITCHES:
+                return self._rusage.voluntary_switches
+            case Section.INVOLUNTARY_CONTEXT_SWITCHES:
+                return self._rusage.involuntary_switches
+            case Section.BLOCK_IO:
+                return self._rusage.block_io
+            case Section.MAX_RSS:
+                return self._rusage.max_rss
+            case Section.RSS:
+                return self._native_memory.rss
+            case Section.USS:
+                return self._native_memory.uss
+            case Section.PSS:
+                return self._native_memory.pss
+            case Section.PEAK_RSS:
+                return self._native_memory.peak_rss
             case _:  # needed for mypy
                 raise SimpleBenchValueError(
                     f'Invalid section: {section}. Must be Section.OPS or Section.TIMING.',
@@ -0,0 +1,299 @@
+"""IterationTable class"""
+from __future__ import annotations
+
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+
+from .defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT, DEFAULT_ITERATION_TABLE_CAPACITY
+from .enums import Section
+from .exceptions import SimpleBenchTypeError, SimpleBenchValueError, _IterationTableErrorTag
+from .iteration import Iteration
+from .utils.native_memory import NativeMemory
+from .utils.resource_usage import RUsage
+from .validators import validate_non_blank_string, validate_positive_int
+
+_RUSAGE_COLUMNS: tuple[str, ...] = RUsage._fields
+"""The columns holding the operating system resource counters, in :class:`RUsage` field order."""
+
+_NATIVE_MEMORY_COLUMNS: tuple[str, ...] = NativeMemory._fields
+"""The columns holding the native memory sizes, in :class:`NativeMemory` field order."""
+
+_COLUMNS: dict[str, type[np.generic]] = {
+    'n': np.float64,
+    'rounds': np.int64,
+    'scale': np.float64,
+    'elapsed': np.float64,
+    'memory': np.int64,
+    'peak_memory': np.int64,
+    'gc_collections': np.int64,
+    'gc_elapsed': np.float64,
+    'cpu_elapsed': np.float64,
+    **{name: np.int64 for name in _RUSAGE_COLUMNS},
+    **{name: np.int64 for name in _NATIVE_MEMORY_COLUMNS},
+}
+"""The columns of an IterationTable and their dtypes."""
+
+_SECTION_COLUMNS: dict[Section, str] = {
+    Section.MEMORY: 'memory',
+    Section.PEAK_MEMORY: 'peak_memory',
+    Section.GC: 'gc_collections',
+    Section.MINOR_PAGE_FAULTS: 'minor_faults',
+    Section.MAJOR_PAGE_FAULTS: 'major_faults',
+    Section.VOLUNTARY_CONTEXT_SWITCHES: 'voluntary_switches',
+    Section.INVOLUNTARY_CONTEXT_SWITCHES: 'involuntary_switches',
+    Section.BLOCK_IO: 'block_io',
+    Section.MAX_RSS: 'max_rss',
+    Section.RSS: 'rss',
+    Section.USS: 'uss',
+    Section.PSS: 'pss',
+    Section.PEAK_RSS: 'peak_rss',
+}
+"""The sections whose per-iteration values are stored as is in a column."""
+
+
+class IterationTable:
+    """Columnar storage for the iterations of a benchmark.
+
+    Each attribute of :class:`~simplebench.iteration.Iteration` is held in its own NumPy
+    column instead of one Python object per iteration, which keeps long runs compact and
+    lets the statistics of a section be computed from a single array
+    (see :meth:`section`).
+
+    Rows are added either from validated :class:`~simplebench.iteration.Iteration` objects
+    (:meth:`append`, :meth:`from_iterations`) or, by the runners, from raw measurements with
+    :meth:`append_values`, which skips the per-value validation. Once :meth:`frozen`, for
+    example when it is passed to :class:`~simplebench.results.Results`, a table is read only.
+
+    :ivar unit: The unit of measurement for the elapsed times (e.g. "ns"). (read only)
+    :vartype unit: str
+    :ivar read_only: Whether the table is frozen. (read only)
+    :vartype read_only: bool
+    """
+
+    __slots__ = ('_unit', '_size', '_columns', '_frozen')
+
+    def __init__(self,
+                 *,
+                 unit: str = DEFAULT_INTERVAL_UNIT,
+                 capacity: int = DEFAULT_ITERATION_TABLE_CAPACITY) -> None:
+        """Create an empty table.
+
+        :param unit: The unit of measurement for the elapsed times of the iterations.
+        :param capacity: The number of rows allocated up front. The columns grow as needed.
+        :raises SimpleBenchTypeError: If any of the arguments are of the wrong type.
+        :raises SimpleBenchValueError: If any of the arguments have invalid values.
+        """
+        self._unit: str = validate_non_blank_string(
+            unit, 'unit',
+            _IterationTableErrorTag.UNIT_ARG_TYPE,
+            _IterationTableErrorTag.UNIT_ARG_VALUE)
+        capacity = validate_positive_int(
+            capacity, 'capacity',
+            _IterationTableErrorTag.CAPACITY_ARG_TYPE,
+            _IterationTableErrorTag.CAPACITY_ARG_VALUE)
+        self._size: int = 0
+        self._columns: dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in _COLUMNS.items()}
+        self._frozen: bool = False
+
+    @classmethod
+    def from_iterations(cls, iterations: Sequence[Iteration]) -> IterationTable:
+        """Create a table holding a sequence of iterations.
+
+        :param iterations: The iterations, which must all have the same unit.
+        :return: The table, with the unit of the iterations (or the default unit if there are none).
+        :raises SimpleBenchTypeError: If ``iterations`` is not a sequence of Iteration objects.
+        :raises SimpleBenchValueError: If the iterations have different units.
+        """
+        if not isinstance(iterations, Sequence):
+            raise SimpleBenchTypeError(
+                f'Invalid iterations type: {type(iterations)}. Must be a Sequence of Iteration objects.',
+                tag=_IterationTableErrorTag.FROM_ITERATIONS_INVALID_ARG_TYPE)
+        for iteration in iterations:
+            if not isinstance(iteration, Iteration):
+                raise SimpleBenchTypeError(
+                    f'Invalid iteration element type: {type(iteration)}. Must be of type Iteration.',
+                    tag=_IterationTableErrorTag.FROM_ITERATIONS_INVALID_ARG_IN_SEQUENCE)
+        units = {iteration.unit for iteration in iterations}
+        if len(units) > 1:
+            raise SimpleBenchValueError(
+                f'Iterations with different units cannot be stored in one table: {sorted(units)}',
+                tag=_IterationTableErrorTag.FROM_ITERATIONS_MIXED_UNITS)
+        table = cls(unit=units.pop() if units else DEFAULT_INTERVAL_UNIT, capacity=max(len(iterations), 1))
+        for iteration in iterations:
+            table._append_row(iteration.n, iteration.rounds, iteration.scale, iteration.elapsed,
+                              iteration.memory, iteration.peak_memory, iteration.gc_collections,
+                              iteration.gc_elapsed, iteration.cpu_elapsed, iteration.rusage,
+                              iteration.native_memory)
+        return table
+
+    @property
+    def unit(self) -> str:
+        """The unit of measurement for the elapsed times."""
+        return self._unit
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the table is frozen (see :meth:`frozen`)."""
+        return self._frozen
+
+    def append(self, iteration: Iteration) -> None:
+        """Add an iteration to the table.
+
+        :param iteration: The iteration, which must have the unit of the table.
+        :raises SimpleBenchTypeError: If ``iteration`` is not an Iteration.
+        :raises SimpleBenchValueError: If the unit of the iteration differs from the unit of the table.
+        """
+        if not isinstance(iteration, Iteration):
+            raise SimpleBenchTypeError(
+                f'Invalid iteration type: {type(iteration)}. Must be of type Iteration.',
+                tag=_IterationTableErrorTag.APPEND_INVALID_ITERATION_ARG_TYPE)
+        if iteration.unit != self._unit:
+            raise SimpleBenchValueError(
+                f'Cannot append an iteration in {iteration.unit!r} to a table in {self._unit!r}.',
+                tag=_IterationTableErrorTag.APPEND_MISMATCHED_UNIT)
+        self._append_row(iteration.n, iteration.rounds, iteration.scale, iteration.elapsed,
+                         iteration.memory, iteration.peak_memory, iteration.gc_collections,
+                         iteration.gc_elapsed, iteration.cpu_elapsed, iteration.rusage,
+                         iteration.native_memory)
+
+    def append_values(self,
+                      *,
+                      n: int | float,
+                      rounds: int,
+                      elapsed: float,
+                      scale: float = DEFAULT_INTERVAL_SCALE,
+                      memory: int = 0,
+                      peak_memory: int = 0,
+                      gc_collections: int = 0,
+                      gc_elapsed: float = 0.0,
+                      cpu_elapsed: float = 0.0,
+                      rusage: RUsage = RUsage(),
+                      native_memory: NativeMemory = NativeMemory()) -> None:
+        """Add an iteration to the table from raw measurements, without validating them.
+
+        This is the fast path for the runners, whose measurements are valid by construction.
+        The arguments have the same meaning as those of :class:`~simplebench.iteration.Iteration`.
+        """
+        self._append_row(n, rounds, scale, elapsed, memory, peak_memory, gc_collections,
+                         gc_elapsed, cpu_elapsed, rusage, native_memory)
+
+    def _append_row(self, *values: Any) -> None:
+        """Add a row, growing the columns if they are full.
+
+        :param values: The values of the row in column order, with the resource counters
+            as a single :class:`RUsage` and the native memory as a single :class:`NativeMemory` last.
+        :raises SimpleBenchValueError: If the table is frozen.
+        """
+        if self._frozen:
+            raise SimpleBenchValueError(
+                'Cannot append to a frozen IterationTable.',
+                tag=_IterationTableErrorTag.APPEND_TO_FROZEN_TABLE)
+        index = self._size
+        if index == len(self._columns['n']):
+            self._columns = {name: np.resize(column, 2 * len(column)) for name, column in self._columns.items()}
+        *scalars, rusage, native_memory = values
+        for name, value in zip(_COLUMNS, (*scalars, *rusage, *native_memory)):
+            self._columns[name][index] = value
+        self._size = index + 1
+
+    def frozen(self) -> IterationTable:
+        """Return a read-only copy of the table trimmed to its rows, or the table itself if it is frozen.
+
+        :return: The frozen table.
+        """
+        if self._frozen:
+            return self
+        table = IterationTable.__new__(IterationTable)
+        table._unit = self._unit  # pylint: disable=protected-access
+        table._size = self._size  # pylint: disable=protected-access
+        table._columns = {}  # pylint: disable=protected-access
+        for name, column in self._columns.items():
+            trimmed = column[:self._size].copy()
+            trimmed.flags.writeable = False
+            table._columns[name] = trimmed  # pylint: disable=protected-access
+        table._frozen = True  # pylint: disable=protected-access
+        return table
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only view of a column, without copying it.
+
+        :param name: The column name: ``'n'``, ``'rounds'``, ``'scale'``, ``'elapsed'``, ``'memory'``,
+            ``'peak_memory'``, ``'gc_collections'``, ``'gc_elapsed'``, ``'cpu_elapsed'`` or one of
+            the :class:`RUsage` or :class:`NativeMemory` fields.
+        :return: The values of the column, one per iteration.
+        :raises SimpleBenchValueError: If ``name`` is not a column name.
+        """
+        if name not in self._columns:
+            raise SimpleBenchValueError(
+                f'Invalid column name: {name!r}. Must be one of {list(_COLUMNS)}.',
+                tag=_IterationTableErrorTag.COLUMN_INVALID_NAME_ARG_VALUE)
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def section(self, section: Section) -> np.ndarray:
+        """Return the per-iteration values of a section, as returned by
+        :meth:`Iteration.iteration_section <simplebench.iteration.Iteration.iteration_section>`.
+
+        The memory, GC, resource counter and native memory sections are read-only views of their column.
+        The timing sections are computed from the elapsed time, scale and rounds columns.
+
+        :param section: The section.
+        :return: The values of the section, one per iteration.
+        :raises SimpleBenchTypeError: If ``section`` is not a Section.
+        :raises SimpleBenchValueError: If ``section`` has no per-iteration values.
+        """
+        if not isinstance(section, Section):
+            raise SimpleBenchTypeError(
+                f'Invalid section type: {type(section)}. Must be of type Section.',
+                tag=_IterationTableErrorTag.SECTION_INVALID_SECTION_ARG_TYPE)
+        if section in _SECTION_COLUMNS:
+            return self.column(_SECTION_COLUMNS[section])
+        rounds = self.column('rounds')
+        match section:
+            case Section.TIMING | Section.WARMUP:
+                return self.column('elapsed') * self.column('scale') / rounds
+            case Section.OPS:
+                interval = self.column('elapsed') * self.column('scale')
+                return np.divide(rounds, interval, out=np.zeros(self._size), where=interval != 0.0)
+            case Section.CPU_TIME:
+                return self.column('cpu_elapsed') / rounds
+            case _:
+                raise SimpleBenchValueError(
+                    f'Invalid section: {section}. It has no per-iteration values.',
+                    tag=_IterationTableErrorTag.SECTION_UNSUPPORTED_SECTION_ARG_VALUE)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Iteration:
+        """Return a row of the table as an Iteration.
+
+        :param index: The row index. Negative indices count from the end.
+        :return: The iteration.
+        :raises IndexError: If the index is out of range.
+        """
+        if not -self._size <= index < self._size:
+            raise IndexError('IterationTable index out of range')
+        index %= self._size
+        values = {name: column[index].item() for name, column in self._columns.items()}
+        rusage = RUsage(*(values.pop(name) for name in _RUSAGE_COLUMNS))
+        native_memory = NativeMemory(*(values.pop(name) for name in _NATIVE_MEMORY_COLUMNS))
+        return Iteration(unit=self._unit, rusage=rusage, native_memory=native_memory, **values)
+
+    def __iter__(self) -> Iterator[Iteration]:
+        return (self[index] for index in range(self._size))
+
+    def __eq__(self, other: object) -> bool:
+        """Tables are equal if they have the same unit and rows."""
+        if not isinstance(other, IterationTable):
+            return NotImplemented
+        return (self._unit == other.unit and len(self) == len(other)
+                and all(np.array_equal(self.column(name), other.column(name)) for name in _COLUMNS))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(unit={self._unit!r}, rows={self._size})'
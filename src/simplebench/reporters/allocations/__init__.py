@@ -0,0 +1,19 @@
+"""Allocation Sites Reporter for SimpleBench.
+
+This package provides a reporter for the allocation sites measured for a case
+(see :attr:`Case.allocation_sites <simplebench.case.Case.allocation_sites>`), as rich text
+tables or as JSON.
+
+Public API
+----------
+- :class:`~.AllocationsConfig`: Configuration class for the allocation sites reporter.
+- :class:`~.AllocationsOptions`: Options class for the allocation sites reporter.
+- :class:`~.AllocationsReporter`: The allocation sites reporter class.
+"""
+from .reporter import AllocationsConfig, AllocationsOptions, AllocationsReporter
+
+__all__ = [
+    'AllocationsConfig',
+    'AllocationsOptions',
+    'AllocationsReporter',
+]
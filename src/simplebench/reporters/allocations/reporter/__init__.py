@@ -0,0 +1,16 @@
+"""Allocation Sites Reporter public API
+
+Provides the following classes:
+- :class:`~.AllocationsConfig`
+- :class:`~.AllocationsOptions`
+- :class:`~.AllocationsReporter`
+"""
+from .config import AllocationsConfig
+from .options import AllocationsOptions
+from .reporter import AllocationsReporter
+
+__all__ = [
+    "AllocationsConfig",
+    "AllocationsOptions",
+    "AllocationsReporter",
+]
@@ -0,0 +1,110 @@
+"""Configuration for an AllocationsReporter."""
+from __future__ import annotations
+
+from typing import Any
+
+from simplebench.enums import FlagType, Format, Section, Target
+from simplebench.reporters.allocations.reporter.options import AllocationsOptions
+from simplebench.reporters.choice.choice_conf import ChoiceConf
+from simplebench.reporters.choices.choices_conf import ChoicesConf
+from simplebench.reporters.reporter.config import ReporterConfig
+
+
+class AllocationsConfig(ReporterConfig):
+    """Configuration for an AllocationsReporter.
+
+    This class inherits from :class:`~.ReporterConfig` and provides a
+    type-safe, discoverable interface for overriding the default settings
+    of an :class:`~.AllocationsReporter`.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        sections: set[Section] | None = None,
+        targets: set[Target] | None = None,
+        default_targets: set[Target] | None = None,
+        formats: set[Format] | None = None,
+        choices: ChoicesConf | None = None,
+        file_suffix: str | None = None,
+        file_unique: bool | None = None,
+        file_append: bool | None = None,
+        subdir: str | None = None
+    ) -> None:
+        """Initialize the AllocationsReporter configuration.
+
+        Accepts keyword arguments to override any of the default configurations.
+        All arguments are optional. If not provided, the default value for
+        AllocationsReporter will be used.
+
+        **Default Values**:
+
+        *   **name**: ``'allocations'``
+        *   **description**: ``'Reports the allocation sites of benchmarks as rich text tables or JSON.'``
+        *   **sections**: ``{Section.ALLOCATIONS}``
+        *   **targets**: ``{Target.CONSOLE, Target.FILESYSTEM, Target.CALLBACK}``
+        *   **default_targets**: ``{Target.CONSOLE}``
+        *   **formats**: ``{Format.RICH_TEXT, Format.JSON}``
+        *   **choices**: ``--allocations`` (rich text tables, default target console) and
+            ``--allocations-json`` (JSON, default target filesystem).
+        *   **file_suffix**: ``'txt'`` (``'json'`` for ``--allocations-json``)
+        *   **file_unique**: ``False`` (``True`` for ``--allocations-json``)
+        *   **file_append**: ``True`` (``False`` for ``--allocations-json``)
+        *   **subdir**: ``'allocations'``
+
+        :param name: The name of the reporter.
+        :param description: A brief description of the reporter.
+        :param sections: The sections to include in the report.
+        :param targets: The output targets for the report.
+        :param default_targets: The default output targets if none are specified.
+        :param formats: The output formats for the report.
+        :param choices: The choice configurations for the reporter.
+        :param file_suffix: The file suffix to use for filesystem outputs.
+        :param file_unique: Whether to use unique filenames for outputs.
+        :param file_append: Whether to append to existing files.
+        :param subdir: The subdirectory to use for filesystem outputs.
+        :raises SimpleBenchTypeError: If any provided argument has an invalid type.
+        :raises SimpleBenchValueError: If any provided argument has an invalid value or combination of values.
+        """
+        init_sections = {Section.ALLOCATIONS}
+        init_targets = {Target.CONSOLE, Target.FILESYSTEM, Target.CALLBACK}
+
+        defaults: dict[str, Any] = {
+            'name': 'allocations',
+            'description': 'Reports the allocation sites of benchmarks as rich text tables or JSON.',
+            'sections': init_sections,
+            'targets': init_targets,
+            'default_targets': {Target.CONSOLE},
+            'formats': {Format.RICH_TEXT, Format.JSON},
+            'file_suffix': 'txt',
+            'file_unique': False,
+            'file_append': True,
+            'subdir': 'allocations',
+            'choices': ChoicesConf([
+                ChoiceConf(
+                    flags=['--allocations'], flag_type=FlagType.TARGET_LIST, name='allocations',
+                    description=(
+                        'Allocation sites as rich text tables (filesystem, console, callback, default=console)'),
+                    sections=init_sections,
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--allocations-json'], flag_type=FlagType.TARGET_LIST, name='allocations-json',
+                    description='Allocation sites to JSON (filesystem, console, callback, default=filesystem)',
+                    sections=init_sections,
+                    targets=init_targets,
+                    default_targets={Target.FILESYSTEM},
+                    output_format=Format.JSON,
+                    file_suffix='json',
+                    file_unique=True,
+                    file_append=False,
+                    options=AllocationsOptions()),
+            ])
+        }
+        # Collect all provided overrides from the method signature, filtering out `None`s.
+        overrides = {k: v for k, v in locals().items() if k in defaults and v is not None}
+
+        final_config = defaults | overrides
+        super().__init__(**final_config)
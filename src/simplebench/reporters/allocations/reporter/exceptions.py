@@ -0,0 +1,22 @@
+"""ErrorTags for the ``simplebench.reporters.allocations`` module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions import ErrorTag
+
+
+@enum_docstrings
+class _AllocationsReporterErrorTag(ErrorTag):
+    """ErrorTags for the :class:`~.AllocationsReporter` class."""
+    RENDER_INVALID_CASE = "RENDER_INVALID_CASE"
+    """The ``case`` argument passed to :meth:`~.AllocationsReporter.render` or
+    :meth:`~.AllocationsReporter.render_json` is not a :class:`~simplebench.case.Case` instance.
+    """
+    RENDER_INVALID_SECTION = "RENDER_INVALID_SECTION"
+    """The ``section`` argument passed to :meth:`~.AllocationsReporter.render` or
+    :meth:`~.AllocationsReporter.render_json` is not a :class:`~simplebench.enums.Section` enum member.
+    """
+    RENDER_INVALID_OPTIONS = "RENDER_INVALID_OPTIONS"
+    """The ``options`` argument passed to :meth:`~.AllocationsReporter.render` or
+    :meth:`~.AllocationsReporter.render_json` is not an :class:`~.AllocationsOptions` instance.
+    """
+    JSON_OUTPUT_ERROR = "JSON_OUTPUT_ERROR"
+    """An error occurred while serializing the JSON output."""
@@ -0,0 +1,5 @@
+"""Allocation Sites Options Module public interface."""
+from .exceptions import _AllocationsOptionsErrorTag
+from .options import AllocationsOptions
+
+__all__ = ['AllocationsOptions', '_AllocationsOptionsErrorTag']
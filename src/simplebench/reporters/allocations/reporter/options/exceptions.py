@@ -0,0 +1,12 @@
+"""ErrorTags for the allocations reporter Options() class."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions import ErrorTag
+
+
+@enum_docstrings
+class _AllocationsOptionsErrorTag(ErrorTag):
+    """ErrorTags for exceptions in the :class:`~.AllocationsOptions` class."""
+    INVALID_FRAMES_TYPE = "INVALID_FRAMES_TYPE"
+    """The ``frames`` specified in the :class:`~.AllocationsOptions` must be an integer."""
+    INVALID_FRAMES_VALUE = "INVALID_FRAMES_VALUE"
+    """The ``frames`` specified in the :class:`~.AllocationsOptions` must be greater than zero."""
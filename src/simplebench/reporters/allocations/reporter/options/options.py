@@ -0,0 +1,30 @@
+"""Options for the reporter of the allocation sites of benchmarks."""
+from simplebench.reporters.reporter import ReporterOptions
+from simplebench.validators import validate_positive_int
+
+from .exceptions import _AllocationsOptionsErrorTag
+
+
+class AllocationsOptions(ReporterOptions):
+    """Class for holding allocation sites reporter specific options in a Choice or Case.
+
+    :param frames: The maximum number of frames of each allocation site's traceback shown
+        in the rich text table, most recent call first. The JSON output always includes every
+        recorded frame. Defaults to ``1`` (only the line that made the allocations).
+    :raises ~simplebench.exceptions.SimpleBenchTypeError: If ``frames`` is not an integer.
+    :raises ~simplebench.exceptions.SimpleBenchValueError: If ``frames`` is not positive.
+    """
+    def __init__(self, *, frames: int = 1) -> None:
+        """Initialize AllocationsOptions instance."""
+        self._frames: int = validate_positive_int(
+            frames, 'frames',
+            _AllocationsOptionsErrorTag.INVALID_FRAMES_TYPE,
+            _AllocationsOptionsErrorTag.INVALID_FRAMES_VALUE)
+
+    @property
+    def frames(self) -> int:
+        """Return the maximum number of traceback frames shown per allocation site.
+
+        :return: The number of frames.
+        """
+        return self._frames
@@ -0,0 +1,199 @@
+"""Reporter for the allocation sites of benchmarks."""
+from __future__ import annotations
+
+import json
+from argparse import Namespace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+
+from rich.table import Table
+
+from simplebench.enums import Format, Section
+from simplebench.exceptions import SimpleBenchTypeError
+from simplebench.reporters.log.report_log_metadata import ReportLogMetadata
+from simplebench.reporters.protocols.reporter_callback import ReporterCallback
+from simplebench.reporters.reporter import Reporter, ReporterOptions
+from simplebench.si_units import si_scale_for_smallest
+from simplebench.type_proxies import is_case
+from simplebench.utils import sigfigs
+from simplebench.validators import validate_type
+
+from .config import AllocationsConfig
+from .exceptions import _AllocationsReporterErrorTag
+from .options import AllocationsOptions
+
+Options: TypeAlias = AllocationsOptions
+
+if TYPE_CHECKING:
+    from simplebench.case import Case
+    from simplebench.reporters.choice.choice import Choice
+    from simplebench.session import Session
+
+
+class AllocationsReporter(Reporter):
+    """Class for outputting the allocation sites of benchmarks.
+
+    Allocation sites are only collected for cases with ``allocation_sites`` set (see
+    :attr:`~simplebench.case.Case.allocation_sites`). Results without them are left out
+    of the report.
+
+    **Defined command-line flags:**
+
+    * ``--allocations: {console, filesystem, callback}`` (default=console) Outputs the top
+      allocation sites of each variation as rich text tables.
+    * ``--allocations-json: {filesystem, console, callback}`` (default=filesystem) Outputs
+      the top allocation sites of each variation, with their full tracebacks, to JSON.
+
+    :ivar name: The unique identifying name of the reporter.
+    :vartype name: str
+    :ivar description: A brief description of the reporter.
+    :vartype description: str
+    :ivar choices: A collection of :class:`~simplebench.reporters.choices.Choices` instances
+        defining the reporter instance, CLI flags, :class:`~simplebench.reporters.choice.Choice`
+        name, supported :class:`~simplebench.enums.Section` objects, supported output
+        :class:`~simplebench.enums.Target` objects, and supported output
+        :class:`~simplebench.enums.Format` objects for the reporter.
+    :vartype choices: ~simplebench.reporters.choices.Choices
+    """
+    _OPTIONS_TYPE: ClassVar[type[AllocationsOptions]] = AllocationsOptions  # pylint: disable=line-too-long # type: ignore[reportIncompatibleVariableOveride]  # noqa: E501
+    """:ivar: The type of :class:`~.ReporterOptions` used by the :class:`~.AllocationsReporter`.
+    :vartype: ~typing.ClassVar[type[~.AllocationsOptions]]
+    """
+    _OPTIONS_KWARGS: ClassVar[dict[str, Any]] = {'frames': 1}
+    """:ivar: The default keyword arguments for the :class:`~.AllocationsReporter` options.
+    :vartype: ~typing.ClassVar[dict[str, ~typing.Any]]
+    """
+
+    def __init__(self, config: AllocationsConfig | None = None) -> None:
+        """Initialize the AllocationsReporter.
+
+        :param config: An optional configuration object to override default reporter settings.
+                       If not provided, default settings will be used.
+        :type config: AllocationsConfig | None
+
+        :raises ~simplebench.exceptions.SimpleBenchTypeError: If the subclass configuration
+            types are invalid.
+        :raises ~simplebench.exceptions.SimpleBenchValueError: If the subclass configuration
+            values are invalid.
+        """
+        if config is None:
+            config = AllocationsConfig()
+
+        super().__init__(config)
+
+    def run_report(self,
+                   *,
+                   args: Namespace,
+                   log_metadata: ReportLogMetadata,
+                   case: Case,
+                   choice: Choice,
+                   path: Path | None = None,
+                   session: Session | None = None,
+                   callback: ReporterCallback | None = None
+                   ) -> None:
+        """Output the allocation sites as rich text tables or JSON, depending on the choice.
+
+        :param args: The parsed command-line arguments.
+        :param log_metadata: The :class:`~.ReportLogMetadata` instance containing metadata
+            about the report being generated.
+        :param case: The :class:`~simplebench.case.Case` instance representing the
+            benchmarked code.
+        :param choice: The :class:`~simplebench.reporters.choice.Choice` instance specifying
+            the report configuration. Its ``output_format`` selects the renderer.
+        :param path: The path to the directory where the report file(s) will be saved.
+        :param session: The :class:`~simplebench.session.Session` instance containing
+            benchmark results.
+        :param callback: A callback function for additional processing of the report.
+        """
+        self.render_by_section(
+            renderer=self.render_json if choice.output_format == Format.JSON else self.render,
+            log_metadata=log_metadata,
+            args=args,
+            case=case,
+            choice=choice,
+            path=path,
+            session=session,
+            callback=callback)
+
+    def _validate_render_args(self, case: Case, section: Section, options: ReporterOptions) -> Options:
+        """Validate the arguments of the render methods.
+
+        :param case: The :class:`~simplebench.case.Case` instance to render.
+        :param section: The :class:`~simplebench.enums.Section` to render.
+        :param options: The options specifying the report configuration.
+        :return: The validated options.
+        """
+        # is_* checks provide deferred import validation to avoid circular imports
+        if not is_case(case):
+            raise SimpleBenchTypeError(
+                f"'case' argument must be a Case instance, got {type(case)}",
+                tag=_AllocationsReporterErrorTag.RENDER_INVALID_CASE)
+        validate_type(section, Section, 'section', _AllocationsReporterErrorTag.RENDER_INVALID_SECTION)
+        return validate_type(options, Options, 'options', _AllocationsReporterErrorTag.RENDER_INVALID_OPTIONS)
+
+    def render(self, *, case: Case, section: Section, options: ReporterOptions) -> Table:
+        """Render the allocation sites of a case as a rich table.
+
+        Each variation contributes one row per allocation site, largest first, showing up
+        to :attr:`~.AllocationsOptions.frames` frames of the site's traceback.
+
+        :param case: The :class:`~simplebench.case.Case` instance representing the
+            benchmarked code.
+        :param section: The :class:`~simplebench.enums.Section` to render.
+        :param options: The :class:`~.AllocationsOptions` specifying the report configuration.
+        :return: The :class:`~rich.table.Table` instance.
+        """
+        options = self._validate_render_args(case, section, options)
+        results = [result for result in case.results if result.allocation_sites is not None]
+
+        size_unit, size_scale = si_scale_for_smallest(
+            numbers=[site.size for result in results for site in result.allocation_sites or ()],
+            base_unit=self.get_base_unit_for_section(section=section))
+
+        table = Table(title=(case.title + f'\n{section.value}\n\n' + case.description),
+                      show_header=True,
+                      title_style='bold green1',
+                      header_style='bold magenta')
+        for value in case.variation_cols.values():
+            table.add_column(value, justify='center', vertical='top', overflow='fold')
+        table.add_column('#', justify='right', vertical='top')
+        table.add_column('site', justify='left', vertical='top', overflow='fold')
+        table.add_column(f'size {size_unit}', justify='right', vertical='top')
+        table.add_column('blocks', justify='right', vertical='top')
+
+        for result in results:
+            marks = [f'{value!s}' for value in result.variation_marks.values()]
+            for rank, site in enumerate(result.allocation_sites or (), start=1):
+                frames = '\n'.join(f'{filename}:{lineno}' for filename, lineno in site.frames[:options.frames])
+                table.add_row(*marks, f'{rank}', frames or site.location,
+                              f'{sigfigs(site.size * size_scale):.2f}', f'{site.blocks}')
+        return table
+
+    def render_json(self, *, case: Case, section: Section, options: ReporterOptions) -> str:
+        """Render the allocation sites of a case as a JSON string.
+
+        Every recorded frame of each site is included, regardless of
+        :attr:`~.AllocationsOptions.frames`. Sizes are in bytes.
+
+        :param case: The :class:`~simplebench.case.Case` instance representing the
+            benchmarked code.
+        :param section: The :class:`~simplebench.enums.Section` to render.
+        :param options: The :class:`~.AllocationsOptions` specifying the report configuration.
+        :return: The JSON string.
+        """
+        self._validate_render_args(case, section, options)
+        report = {
+            'group': case.group,
+            'title': case.title,
+            'description': case.description,
+            'variations': [
+                {'variation_marks': dict(result.variation_marks),
+                 'allocation_sites': [site.as_dict() for site in result.allocation_sites]}
+                for result in case.results if result.allocation_sites is not None],
+        }
+        try:
+            return json.dumps(report, indent=4, default=str)
+        except Exception as exc:
+            raise SimpleBenchTypeError(
+                f'Error generating JSON output for case {case.title}: {exc}',
+                tag=_AllocationsReporterErrorTag.JSON_OUTPUT_ERROR) from exc
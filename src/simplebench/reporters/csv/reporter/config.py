@@ -7,6 +7,7 @@ from simplebench.enums import FlagType, Format, Section, Target
 from simplebench.reporters.choice.choice_conf import ChoiceConf
 from simplebench.reporters.choices.choices_conf import ChoicesConf
 from simplebench.reporters.reporter.config import ReporterConfig
+from simplebench.stats import NATIVE_MEMORY_SECTION_UNITS, RUSAGE_SECTION_UNITS
 
 
 class CSVConfig(ReporterConfig):
@@ -18,8 +19,9 @@ class CSVConfig(ReporterConfig):
 
     By default, the CSVReporter is configured to output benchmark results
     to CSV files in the filesystem, with options to also output to console
-    and via callback. The default sections included are OPS, TIMING, MEMORY,
-    and PEAK_MEMORY.
+    and via callback. The default sections included are OPS, TIMING, CPU_TIME,
+    MEMORY, PEAK_MEMORY, GC, WARMUP, LATENCY and the operating system resource counter and native
+    memory sections.
 
     Attributes
     ----------
@@ -27,7 +29,8 @@ class CSVConfig(ReporterConfig):
     :ivar description: A brief description of the reporter. Default is
         'Outputs benchmark results to CSV files.'.
     :ivar sections: The sections to include in the report. Default includes
-        OPS, TIMING, MEMORY, and PEAK_MEMORY.
+        OPS, TIMING, CPU_TIME, MEMORY, PEAK_MEMORY, GC, WARMUP, LATENCY and the resource counter and native
+        memory sections.
     :ivar targets: The output targets for the report. Default includes
         FILESYSTEM, CONSOLE, and CALLBACK.
     :ivar default_targets: The default output target if none is specified. Default is FILESYSTEM.
@@ -64,7 +67,9 @@ class CSVConfig(ReporterConfig):
         defaults: dict[str, Any] = {
             'name': 'csv',
             'description': 'Outputs benchmark results to CSV files.',
-            'sections': {Section.OPS, Section.TIMING, Section.MEMORY, Section.PEAK_MEMORY},
+            'sections': {Section.OPS, Section.TIMING, Section.CPU_TIME, Section.MEMORY, Section.PEAK_MEMORY,
+                         Section.GC, Section.WARMUP, Section.LATENCY, *RUSAGE_SECTION_UNITS,
+                         *NATIVE_MEMORY_SECTION_UNITS},
             'targets': {Target.FILESYSTEM, Target.CALLBACK, Target.CONSOLE},
             'default_targets': {Target.FILESYSTEM},
             'formats': {Format.CSV},
@@ -91,12 +96,53 @@ class CSVConfig(ReporterConfig):
                     sections=[Section.TIMING],
                     targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
                     output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.cpu'], flag_type=FlagType.TARGET_LIST, name='csv-cpu',
+                    description='Output CPU time results to CSV (filesystem, console, callback, default=filesystem)',
+                    sections=[Section.CPU_TIME],
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
                 ChoiceConf(
                     flags=['--csv.memory'], flag_type=FlagType.TARGET_LIST, name='csv-memory',
                     description='Output memory results to CSV (filesystem, console, callback, default=filesystem)',
                     sections=[Section.MEMORY, Section.PEAK_MEMORY],
                     targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
                     output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.gc'], flag_type=FlagType.TARGET_LIST, name='csv-gc',
+                    description=('Output garbage collection results to CSV '
+                                 '(filesystem, console, callback, default=filesystem)'),
+                    sections=[Section.GC],
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.warmup'], flag_type=FlagType.TARGET_LIST, name='csv-warmup',
+                    description=('Output warmup iteration timing results to CSV '
+                                 '(filesystem, console, callback, default=filesystem)'),
+                    sections=[Section.WARMUP],
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.latency'], flag_type=FlagType.TARGET_LIST, name='csv-latency',
+                    description=('Output per-call latency results to CSV '
+                                 '(filesystem, console, callback, default=filesystem)'),
+                    sections=[Section.LATENCY],
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.rusage'], flag_type=FlagType.TARGET_LIST, name='csv-rusage',
+                    description=('Output OS resource counter results to CSV '
+                                 '(filesystem, console, callback, default=filesystem)'),
+                    sections=list(RUSAGE_SECTION_UNITS),
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
+                ChoiceConf(
+                    flags=['--csv.native-memory'], flag_type=FlagType.TARGET_LIST, name='csv-native-memory',
+                    description=('Output native memory (RSS/USS/PSS) results to CSV '
+                                 '(filesystem, console, callback, default=filesystem)'),
+                    sections=list(NATIVE_MEMORY_SECTION_UNITS),
+                    targets=[Target.FILESYSTEM, Target.CONSOLE, Target.CALLBACK],
+                    output_format=Format.CSV),
             ])
         }
         # Collect all provided overrides from the method signature, filtering out `None`s.
@@ -31,3 +31,21 @@ class CSVField(str, Enum):
     """The adjusted standard deviation of operation times."""
     RSD_PERCENT = "rsd%"
     """The relative standard deviation percentage."""
+    PRECISION_PERCENT = "precision%"
+    """The achieved relative precision (confidence interval half-width) of the timing, as a percentage."""
+    CPU_UTILIZATION_PERCENT = "cpu%"
+    """The CPU time as a percentage of the wall-clock time of the timed iterations."""
+    OUTLIERS = "outliers"
+    """The number of mild and severe (Tukey) outliers among the iterations."""
+    FILTERED_MEAN = "filtered mean"
+    """The mean value without the mild and severe (Tukey) outliers."""
+    FILTERED_RSD_PERCENT = "filtered rsd%"
+    """The relative standard deviation percentage without the mild and severe (Tukey) outliers."""
+    MEAN_CI = "mean ci"
+    """The bootstrap confidence interval of the mean."""
+    MEDIAN_CI = "median ci"
+    """The bootstrap confidence interval of the median."""
+    P5_CI = "5th ci"
+    """The bootstrap confidence interval of the 5th percentile."""
+    P95_CI = "95th ci"
+    """The bootstrap confidence interval of the 95th percentile."""
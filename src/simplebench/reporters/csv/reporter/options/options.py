@@ -25,6 +25,8 @@ _DEFAULT_RICH_TABLE_FIELDS: Sequence[CSVField] = [
     CSVField.P95,
     CSVField.STD_DEV,
     CSVField.RSD_PERCENT,
+    CSVField.PRECISION_PERCENT,
+    CSVField.CPU_UTILIZATION_PERCENT,
 ]
 
 
@@ -55,6 +57,14 @@ class CSVOptions(ReporterOptions):
         - :attr:`~.CSVField.P95`
         - :attr:`~.CSVField.STD_DEV`
         - :attr:`~.CSVField.RSD_PERCENT`
+        - :attr:`~.CSVField.PRECISION_PERCENT`
+        - :attr:`~.CSVField.CPU_UTILIZATION_PERCENT`
+
+        The outlier fields :attr:`~.CSVField.OUTLIERS`, :attr:`~.CSVField.FILTERED_MEAN` and
+        :attr:`~.CSVField.FILTERED_RSD_PERCENT` are available but not included by default.
+
+        The bootstrap confidence interval fields :attr:`~.CSVField.MEAN_CI`, :attr:`~.CSVField.MEDIAN_CI`,
+        :attr:`~.CSVField.P5_CI` and :attr:`~.CSVField.P95_CI` are also available but not included by default.
 
     :param variation_cols_last: Whether to place the variation columns (if any) at the end of the rows.
         Defaults to ``False`` - which places the variation columns at the start of the rows.
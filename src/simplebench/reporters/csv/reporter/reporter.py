@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import csv
 from io import StringIO
-from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, TypeAlias
 
 from simplebench.defaults import DEFAULT_INTERVAL_SCALE
 from simplebench.enums import Section
@@ -16,6 +16,7 @@ from simplebench.reporters.reporter import Reporter
 from simplebench.reporters.reporter.options import ReporterOptions
 from simplebench.results import Results
 from simplebench.si_units import si_scale_for_smallest
+from simplebench.stats import ConfidenceInterval, Stats, StatsSummary
 from simplebench.type_proxies import is_case
 from simplebench.utils import sigfigs
 from simplebench.validators import validate_type
@@ -29,6 +30,121 @@ Options: TypeAlias = CSVOptions
 if TYPE_CHECKING:
     from simplebench.case import Case
 
+_Cell: TypeAlias = str | float | int
+"""A value in a CSV row."""
+
+
+class _CSVColumns(NamedTuple):
+    """The CSV columns of a :class:`~.CSVField`.
+
+    :ivar headers: The header of each column, formatted with the ``unit`` of the values.
+    :vartype headers: tuple[str, ...]
+    :ivar cells: Returns the value of each column for a result: called with the reporter, the
+        result, the section, the statistics of the section and the scale factor of the values.
+    :vartype cells: Callable[[Reporter, Results, Section, Stats | StatsSummary, float], list[_Cell]]
+    """
+    headers: tuple[str, ...]
+    cells: Callable[[Reporter, Results, Section, Stats | StatsSummary, float], list[_Cell]]
+
+
+def _raw_data_cells(stats: Stats | StatsSummary, cells: Callable[[Stats], list[_Cell]],
+                    columns: int = 1) -> list[_Cell]:
+    """Return the CSV values of statistics computed from the raw data points of a section.
+
+    Sections summarized without their raw data points (a :class:`~.StatsSummary`) leave the values empty.
+
+    :param stats: The statistics of the section.
+    :param cells: Returns the values from the statistics of the raw data points.
+    :param columns: The number of values.
+    :return: The values.
+    """
+    return cells(stats) if isinstance(stats, Stats) else [''] * columns
+
+
+def _interval_cells(interval: ConfidenceInterval, scale: float) -> list[_Cell]:
+    """Return the scaled bounds of a confidence interval as CSV values.
+
+    :param interval: The confidence interval.
+    :param scale: The factor the bounds are multiplied by.
+    :return: The lower and upper bounds.
+    """
+    return [sigfigs(interval.lower * scale), sigfigs(interval.upper * scale)]
+
+
+def _percent_cell(value: float | None) -> list[_Cell]:
+    """Return a fraction as a percentage CSV value, left empty if it is not available.
+
+    :param value: The fraction, or None.
+    :return: The percentage.
+    """
+    return ['' if value is None else sigfigs(value * 100.0)]
+
+
+_CSV_COLUMNS: dict[CSVField, _CSVColumns] = {
+    CSVField.N: _CSVColumns(
+        ('N',), lambda reporter, result, section, stats, scale: [result.n]),
+    CSVField.ITERATIONS: _CSVColumns(
+        ('Iterations',), lambda reporter, result, section, stats, scale: [len(result.iteration_table)]),
+    CSVField.ROUNDS: _CSVColumns(
+        ('Rounds',), lambda reporter, result, section, stats, scale: [result.rounds]),
+    CSVField.ELAPSED_SECONDS: _CSVColumns(
+        ('Elapsed Seconds',),
+        lambda reporter, result, section, stats, scale: [sigfigs(result.total_elapsed * DEFAULT_INTERVAL_SCALE, 10)]),
+    CSVField.MEAN: _CSVColumns(
+        ('mean ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.mean * scale)]),
+    CSVField.MEDIAN: _CSVColumns(
+        ('median ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.median * scale)]),
+    CSVField.MIN: _CSVColumns(
+        ('min ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.minimum * scale)]),
+    CSVField.MAX: _CSVColumns(
+        ('max ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.maximum * scale)]),
+    CSVField.P5: _CSVColumns(
+        ('5th ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.percentiles[5] * scale)]),
+    CSVField.P95: _CSVColumns(
+        ('95th ({unit})',), lambda reporter, result, section, stats, scale: [sigfigs(stats.percentiles[95] * scale)]),
+    CSVField.STD_DEV: _CSVColumns(
+        ('std dev ({unit})',),
+        lambda reporter, result, section, stats, scale: [sigfigs(stats.standard_deviation * scale)]),
+    CSVField.RSD_PERCENT: _CSVColumns(
+        ('rsd (%)',), lambda reporter, result, section, stats, scale: [sigfigs(stats.relative_standard_deviation)]),
+    CSVField.PRECISION_PERCENT: _CSVColumns(
+        ('precision (%)',),
+        lambda reporter, result, section, stats, scale: _percent_cell(
+            reporter.timing_precision(result=result, section=section))),
+    CSVField.CPU_UTILIZATION_PERCENT: _CSVColumns(
+        ('cpu (%)',),
+        lambda reporter, result, section, stats, scale: _percent_cell(
+            reporter.cpu_utilization(result=result, section=section))),
+    CSVField.OUTLIERS: _CSVColumns(
+        ('outliers',),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(stats, lambda data: [data.outliers().total])),
+    CSVField.FILTERED_MEAN: _CSVColumns(
+        ('filtered mean ({unit})',),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: [sigfigs(data.filtered_mean * scale)])),
+    CSVField.FILTERED_RSD_PERCENT: _CSVColumns(
+        ('filtered rsd (%)',),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: [sigfigs(data.filtered_relative_standard_deviation)])),
+    CSVField.MEAN_CI: _CSVColumns(
+        ('mean ci low ({unit})', 'mean ci high ({unit})'),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: _interval_cells(data.bootstrap_intervals().mean, scale), 2)),
+    CSVField.MEDIAN_CI: _CSVColumns(
+        ('median ci low ({unit})', 'median ci high ({unit})'),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: _interval_cells(data.bootstrap_intervals().median, scale), 2)),
+    CSVField.P5_CI: _CSVColumns(
+        ('5th ci low ({unit})', '5th ci high ({unit})'),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: _interval_cells(data.bootstrap_intervals().percentile(5.0), scale), 2)),
+    CSVField.P95_CI: _CSVColumns(
+        ('95th ci low ({unit})', '95th ci high ({unit})'),
+        lambda reporter, result, section, stats, scale: _raw_data_cells(
+            stats, lambda data: _interval_cells(data.bootstrap_intervals().percentile(95.0), scale), 2)),
+}
+"""The CSV columns of each :class:`~.CSVField`."""
+
 
 class CSVReporter(Reporter):
     """Class for outputting benchmark results to CSV files.
@@ -42,6 +158,9 @@ class CSVReporter(Reporter):
 
     Defined command-line flags:
         --csv: {file, console, callback} (default=file) Outputs results to CSV.
+        --csv.latency: {file, console, callback} (default=file) Outputs the per-call latency
+        distribution to CSV. The p99.9 and p99.99 tail latencies are reported in the
+        ``tail_latencies`` extra info of the JSON output.
 
     .. code-block:: bash
 
@@ -129,84 +248,19 @@ class CSVReporter(Reporter):
             writer.writerow([f'# title: {case.title}'])
             writer.writerow([f'# description: {case.description}'])
             writer.writerow([f'# unit: {common_unit}'])
-            header: list[str] = []
-
-            if not options.variation_cols_last:
-                for value in case.variation_cols.values():
-                    header.append(value)
-
-            for field in included_fields:
-                match field:
-                    case CSVField.N:
-                        header.append('N')
-                    case CSVField.ITERATIONS:
-                        header.append('Iterations')
-                    case CSVField.ROUNDS:
-                        header.append('Rounds')
-                    case CSVField.ELAPSED_SECONDS:
-                        header.append('Elapsed Seconds')
-                    case CSVField.MEAN:
-                        header.append(f'mean ({common_unit})')
-                    case CSVField.MEDIAN:
-                        header.append(f'median ({common_unit})')
-                    case CSVField.MIN:
-                        header.append(f'min ({common_unit})')
-                    case CSVField.MAX:
-                        header.append(f'max ({common_unit})')
-                    case CSVField.P5:
-                        header.append(f'5th ({common_unit})')
-                    case CSVField.P95:
-                        header.append(f'95th ({common_unit})')
-                    case CSVField.STD_DEV:
-                        header.append(f'std dev ({common_unit})')
-                    case CSVField.RSD_PERCENT:
-                        header.append('rsd (%)')
-
-            if options.variation_cols_last:
-                for value in case.variation_cols.values():
-                    header.append(value)
-
-            writer.writerow(header)
+
+            header: list[str] = [header.format(unit=common_unit)
+                                 for field in included_fields for header in _CSV_COLUMNS[field].headers]
+            variation_header: list[str] = list(case.variation_cols.values())
+            writer.writerow(header + variation_header if options.variation_cols_last else variation_header + header)
+
             for result in results:
                 stats_target = result.results_section(section)
-                row: list[str | float | int] = []
-
-                if not options.variation_cols_last:
-                    for value in result.variation_marks.values():
-                        row.append(value)
-
-                    for field in included_fields:
-                        match field:
-                            case CSVField.N:
-                                row.append(result.n)
-                            case CSVField.ITERATIONS:
-                                row.append(len(result.iterations))
-                            case CSVField.ROUNDS:
-                                row.append(result.rounds)
-                            case CSVField.ELAPSED_SECONDS:
-                                row.append(sigfigs(result.total_elapsed * DEFAULT_INTERVAL_SCALE, 10))
-                            case CSVField.MEAN:
-                                row.append(sigfigs(stats_target.mean * common_scale))
-                            case CSVField.MEDIAN:
-                                row.append(sigfigs(stats_target.median * common_scale))
-                            case CSVField.MIN:
-                                row.append(sigfigs(stats_target.minimum * common_scale))
-                            case CSVField.MAX:
-                                row.append(sigfigs(stats_target.maximum * common_scale))
-                            case CSVField.P5:
-                                row.append(sigfigs(stats_target.percentiles[5] * common_scale))
-                            case CSVField.P95:
-                                row.append(sigfigs(stats_target.percentiles[95] * common_scale))
-                            case CSVField.STD_DEV:
-                                row.append(sigfigs(stats_target.standard_deviation * common_scale))
-                            case CSVField.RSD_PERCENT:
-                                row.append(sigfigs(stats_target.relative_standard_deviation))
-
-                if options.variation_cols_last:
-                    for value in result.variation_marks.values():
-                        row.append(value)
-
-                writer.writerow(row)
+                row: list[_Cell] = [
+                    cell for field in included_fields
+                    for cell in _CSV_COLUMNS[field].cells(self, result, section, stats_target, common_scale)]
+                marks: list[_Cell] = list(result.variation_marks.values())
+                writer.writerow(row + marks if options.variation_cols_last else marks + row)
 
             csvfile.seek(0)
             return csvfile.read()
@@ -7,6 +7,7 @@ from simplebench.enums import FlagType, Format, Section, Target
 from simplebench.reporters.choice.choice_conf import ChoiceConf
 from simplebench.reporters.choices.choices_conf import ChoicesConf
 from simplebench.reporters.reporter.config import ReporterConfig
+from simplebench.stats import RUSAGE_SECTION_UNITS
 
 
 class ScatterPlotConfig(ReporterConfig):
@@ -41,7 +42,8 @@ class ScatterPlotConfig(ReporterConfig):
         defaults: dict[str, Any] = {
             'name': 'scatter-plot',
             'description': 'Outputs benchmark results as scatter plot graphs.',
-            'sections': {Section.OPS, Section.TIMING, Section.MEMORY, Section.PEAK_MEMORY},
+            'sections': {Section.OPS, Section.TIMING, Section.CPU_TIME, Section.MEMORY, Section.PEAK_MEMORY,
+                         *RUSAGE_SECTION_UNITS},
             'targets': {Target.FILESYSTEM, Target.CALLBACK},
             'default_targets': {Target.FILESYSTEM},
             'formats': {Format.GRAPH},
@@ -68,12 +70,24 @@ class ScatterPlotConfig(ReporterConfig):
                     sections=[Section.TIMING],
                     targets=[Target.FILESYSTEM, Target.CALLBACK],
                     output_format=Format.GRAPH),
+                ChoiceConf(
+                    flags=['--scatter-plot.cpu'], flag_type=FlagType.TARGET_LIST, name='scatter-plot-cpu',
+                    description='Create scatter plots of CPU time results.',
+                    sections=[Section.CPU_TIME],
+                    targets=[Target.FILESYSTEM, Target.CALLBACK],
+                    output_format=Format.GRAPH),
                 ChoiceConf(
                     flags=['--scatter-plot.memory'], flag_type=FlagType.TARGET_LIST, name='scatter-plot-memory',
                     description='Create scatter plots of memory usage results.',
                     sections=[Section.MEMORY, Section.PEAK_MEMORY],
                     targets=[Target.FILESYSTEM, Target.CALLBACK],
                     output_format=Format.GRAPH),
+                ChoiceConf(
+                    flags=['--scatter-plot.rusage'], flag_type=FlagType.TARGET_LIST, name='scatter-plot-rusage',
+                    description='Create scatter plots of OS resource counter results.',
+                    sections=list(RUSAGE_SECTION_UNITS),
+                    targets=[Target.FILESYSTEM, Target.CALLBACK],
+                    output_format=Format.GRAPH),
             ])
         }
         # Collect all provided overrides from the method signature, filtering out `None`s.
@@ -13,7 +13,7 @@ from simplebench.reporters.log.report_log_metadata import ReportLogMetadata
 from simplebench.reporters.protocols.reporter_callback import ReporterCallback
 from simplebench.reporters.reporter import Reporter, ReporterOptions
 from simplebench.type_proxies import is_case
-from simplebench.utils import get_machine_info
+from simplebench.utils import current_pinning, get_machine_info
 from simplebench.validators import validate_type
 
 from .config import JSONConfig
@@ -161,7 +161,9 @@ class JSONReporter(Reporter):
     def render(self, *, case: Case, section: Section, options: ReporterOptions) -> str:
         """Convert the Case data for all sections to a JSON string.
 
-        Machine info is included in the JSON output under the 'metadata' key.
+        Machine info is included in the JSON output under the 'metadata' key, together with
+        the CPU pinning and niceness the case was run with under 'metadata.cpu_pinning'
+        (see :attr:`~simplebench.case.Case.pinning`).
 
         :param case: The :class:`~simplebench.case.Case` instance holding the benchmarked
             code statistics.
@@ -186,7 +188,8 @@ class JSONReporter(Reporter):
         with StringIO() as jsonfile:
             case_dict = case.as_dict(full_data=full_data)
             try:
-                case_dict['metadata'] = get_machine_info()
+                pinning = case.pinning if case.pinning is not None else current_pinning()
+                case_dict['metadata'] = {**get_machine_info(), 'cpu_pinning': pinning.as_dict()}
                 json.dump(case_dict, jsonfile, indent=4)
                 jsonfile.seek(0)
             except Exception as exc:
@@ -250,6 +250,11 @@ class _ReporterOrchestrationMixin:
 
         It calls the subclass's render() method to actually generate the report output.
 
+        The memory sections (:attr:`~Section.MEMORY` and :attr:`~Section.PEAK_MEMORY`) are
+        skipped for cases whose results did not measure memory usage (see
+        :attr:`Results.memory_measured <simplebench.results.Results.memory_measured>`), and the
+        :attr:`~Section.LATENCY` section for cases whose results recorded no latency histogram.
+
         Usage of this method is appropriate when the report output divides each case by
         section, such as separate files or outputs for each section of the report.
 
@@ -322,7 +327,14 @@ class _ReporterOrchestrationMixin:
         prioritized = Prioritized(reporter=self, choice=choice, case=case)
         log_metadata.case = case
         log_metadata.choice = choice
+        skipped: set[Section] = set()
+        if case.results and not any(result.memory_measured for result in case.results):
+            skipped |= {Section.MEMORY, Section.PEAK_MEMORY}
+        if case.results and all(result.latency is None for result in case.results):
+            skipped.add(Section.LATENCY)
         for section in choice.sections:
+            if section in skipped:
+                continue
             output = actual_renderer(case=case, section=section, options=prioritized.options)
             self.dispatch_to_targets(
                 output=output,
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from simplebench.reporters.choice.choice import Choice
     from simplebench.reporters.choices.choices import Choices
     from simplebench.reporters.reporter.options import ReporterOptions
+    from simplebench.results import Results
     from simplebench.session import Session
 
 T = TypeVar('T')
@@ -609,6 +610,28 @@ class ReporterProtocol(Protocol):
         """
         ...
 
+    def timing_precision(self, result: Results, section: Section) -> float | None:
+        """Return the achieved relative timing precision of a result for display in a section.
+
+        :param result: The :class:`~simplebench.results.Results` instance.
+        :param section: The section being rendered.
+        :return: The relative precision as a fraction, or None if it is not applicable
+            to the section or was not recorded.
+        :rtype: float | None
+        """
+        ...
+
+    def cpu_utilization(self, result: Results, section: Section) -> float | None:
+        """Return the CPU/wall-clock utilization ratio of a result for display in a section.
+
+        :param result: The :class:`~simplebench.results.Results` instance.
+        :param section: The section being rendered.
+        :return: The CPU time divided by the wall-clock time, or None if it is not applicable
+            to the section.
+        :rtype: float | None
+        """
+        ...
+
     def _validate_render_by_args(
         self, *,
         renderer: ReportRenderer,
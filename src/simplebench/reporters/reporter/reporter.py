@@ -23,7 +23,12 @@ from typing import TYPE_CHECKING, Any, Iterable, Optional, TypeAlias, TypeVar
 from rich.table import Table
 from rich.text import Text
 
-from simplebench.defaults import BASE_INTERVAL_UNIT, BASE_MEMORY_UNIT, BASE_OPS_PER_INTERVAL_UNIT
+from simplebench.defaults import (
+    BASE_GC_COLLECTIONS_UNIT,
+    BASE_INTERVAL_UNIT,
+    BASE_MEMORY_UNIT,
+    BASE_OPS_PER_INTERVAL_UNIT,
+)
 from simplebench.enums import Format, Section, Target
 from simplebench.exceptions import SimpleBenchNotImplementedError, SimpleBenchTypeError, SimpleBenchValueError
 # simplebench.reporters
@@ -42,6 +47,7 @@ from simplebench.reporters.reporter.mixins import (
 from simplebench.reporters.reporter.options import ReporterOptions
 from simplebench.reporters.reporter.protocols import ReporterProtocol
 from simplebench.results import Results
+from simplebench.stats import NATIVE_MEMORY_SECTION_UNITS, RUSAGE_SECTION_UNITS
 from simplebench.type_proxies import is_case, is_choice, is_session
 from simplebench.validators import validate_iterable_of_type, validate_type
 
@@ -606,10 +612,24 @@ class Reporter(ABC, _ReporterArgparseMixin, _ReporterOrchestrationMixin,
                 return BASE_OPS_PER_INTERVAL_UNIT
             case Section.TIMING:
                 return BASE_INTERVAL_UNIT
+            case Section.CPU_TIME:
+                return BASE_INTERVAL_UNIT
+            case Section.WARMUP:
+                return BASE_INTERVAL_UNIT
+            case Section.LATENCY:
+                return BASE_INTERVAL_UNIT
             case Section.MEMORY:
                 return BASE_MEMORY_UNIT
             case Section.PEAK_MEMORY:
                 return BASE_MEMORY_UNIT
+            case Section.ALLOCATIONS:
+                return BASE_MEMORY_UNIT
+            case Section.GC:
+                return BASE_GC_COLLECTIONS_UNIT
+            case _ if section in RUSAGE_SECTION_UNITS:
+                return RUSAGE_SECTION_UNITS[section]
+            case _ if section in NATIVE_MEMORY_SECTION_UNITS:
+                return NATIVE_MEMORY_SECTION_UNITS[section]
             case _:
                 raise SimpleBenchValueError(
                     f"Unsupported section: {section} (this should never happen)",
@@ -644,3 +664,38 @@ class Reporter(ABC, _ReporterArgparseMixin, _ReporterOrchestrationMixin,
                 stats.percentiles[5], stats.percentiles[95]
             ])
         return all_numbers
+
+    def timing_precision(self, result: Results, section: Section) -> float | None:
+        """Return the achieved relative timing precision of a result for display in a section.
+
+        The precision (the relative confidence interval half-width of the per-round time,
+        recorded by the runner in :attr:`~simplebench.results.Results.extra_info`) applies
+        to the timing derived sections (:attr:`~Section.OPS` and :attr:`~Section.TIMING`) only.
+
+        :param result: The :class:`~simplebench.results.Results` instance.
+        :param section: The section being rendered.
+        :return: The relative precision as a fraction, or None if it is not applicable
+            to the section or was not recorded.
+        :rtype: float | None
+        """
+        if section not in (Section.OPS, Section.TIMING):
+            return None
+        precision = result.extra_info.get('precision')
+        return float(precision) if isinstance(precision, (int, float)) else None
+
+    def cpu_utilization(self, result: Results, section: Section) -> float | None:
+        """Return the CPU/wall-clock utilization ratio of a result for display in a section.
+
+        The utilization (see :attr:`~simplebench.results.Results.cpu_utilization`) applies to
+        the timing derived sections (:attr:`~Section.OPS`, :attr:`~Section.TIMING` and
+        :attr:`~Section.CPU_TIME`) only.
+
+        :param result: The :class:`~simplebench.results.Results` instance.
+        :param section: The section being rendered.
+        :return: The CPU time divided by the wall-clock time, or None if it is not applicable
+            to the section.
+        :rtype: float | None
+        """
+        if section not in (Section.OPS, Section.TIMING, Section.CPU_TIME):
+            return None
+        return result.cpu_utilization
@@ -26,6 +26,7 @@ _PREDEFINED_REPORTERS: list[tuple[str, str]] = [
     ("simplebench.reporters.graph.scatterplot", "ScatterPlotReporter"),
     ("simplebench.reporters.rich_table", "RichTableReporter"),
     ("simplebench.reporters.json", "JSONReporter"),
+    ("simplebench.reporters.allocations", "AllocationsReporter"),
 ]
 """Container for all predefined Reporter classes.
 
@@ -34,6 +35,7 @@ These reporters are registered by default in the ReporterManager.
 - :class:`~simplebench.reporters.graph.scatterplot.reporter.ScatterPlotReporter`
 - :class:`~simplebench.reporters.rich_table.reporter.RichTableReporter`
 - :class:`~simplebench.reporters.json.reporter.JSONReporter`
+- :class:`~simplebench.reporters.allocations.reporter.AllocationsReporter`
 """
 
 
@@ -7,6 +7,7 @@ from simplebench.enums import FlagType, Format, Section, Target
 from simplebench.reporters.choice.choice_conf import ChoiceConf
 from simplebench.reporters.choices.choices_conf import ChoicesConf
 from simplebench.reporters.reporter.config import ReporterConfig
+from simplebench.stats import NATIVE_MEMORY_SECTION_UNITS, RUSAGE_SECTION_UNITS
 
 
 class RichTableConfig(ReporterConfig):
@@ -53,7 +54,8 @@ class RichTableConfig(ReporterConfig):
 
         *   **name**: ``'rich-table'``
         *   **description**: ``'Displays benchmark results as a rich text table on the console.'``
-        *   **sections**: ``{Section.OPS, Section.TIMING, Section.MEMORY, Section.PEAK_MEMORY}``
+        *   **sections**: ``{Section.OPS, Section.TIMING, Section.CPU_TIME, Section.MEMORY, Section.PEAK_MEMORY,
+            Section.GC, Section.WARMUP, Section.LATENCY}`` and the resource counter sections
         *   **targets**: ``{Target.CONSOLE, Target.FILESYSTEM, Target.CALLBACK}``
         *   **default_targets**: ``{Target.CONSOLE}``
         *   **formats**: ``{Format.RICH_TEXT}``
@@ -78,12 +80,14 @@ class RichTableConfig(ReporterConfig):
         :raises SimpleBenchValueError: If any provided argument has an invalid value or combination of values.
         """
         init_sections = {Section.OPS, Section.TIMING, Section.MEMORY, Section.PEAK_MEMORY}
+        supported_sections = init_sections | {Section.CPU_TIME, Section.GC, Section.WARMUP, Section.LATENCY,
+                                              *RUSAGE_SECTION_UNITS, *NATIVE_MEMORY_SECTION_UNITS}
         init_targets = {Target.CONSOLE, Target.FILESYSTEM, Target.CALLBACK}
 
         defaults: dict[str, Any] = {
             'name': 'rich-table',
             'description': 'Displays benchmark results as a rich text table on the console.',
-            'sections': init_sections,
+            'sections': supported_sections,
             'targets': init_targets,  # <-- This line was missing
             'default_targets': {Target.CONSOLE},
             'formats': {Format.RICH_TEXT},
@@ -111,12 +115,59 @@ class RichTableConfig(ReporterConfig):
                     sections={Section.TIMING},
                     targets=init_targets,
                     output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.cpu'], flag_type=FlagType.TARGET_LIST, name='rich-table-cpu',
+                    description='CPU time results as rich text tables (filesystem, console, callback, default=console)',
+                    sections={Section.CPU_TIME},
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
                 ChoiceConf(
                     flags=['--rich-table.memory'], flag_type=FlagType.TARGET_LIST, name='rich-table-memory',
                     description='Memory results as rich text tables (filesystem, console, callback, default=console)',
                     sections={Section.MEMORY, Section.PEAK_MEMORY},
                     targets={Target.CONSOLE, Target.FILESYSTEM, Target.CALLBACK},
                     output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.gc'], flag_type=FlagType.TARGET_LIST, name='rich-table-gc',
+                    description=(
+                        'Garbage collection results as rich text tables (filesystem, console, callback, '
+                        'default=console)'),
+                    sections={Section.GC},
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.warmup'], flag_type=FlagType.TARGET_LIST, name='rich-table-warmup',
+                    description=(
+                        'Warmup iteration timing results as rich text tables (filesystem, console, callback, '
+                        'default=console)'),
+                    sections={Section.WARMUP},
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.latency'], flag_type=FlagType.TARGET_LIST, name='rich-table-latency',
+                    description=(
+                        'Per-call latency results as rich text tables (filesystem, console, callback, '
+                        'default=console)'),
+                    sections={Section.LATENCY},
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.rusage'], flag_type=FlagType.TARGET_LIST, name='rich-table-rusage',
+                    description=(
+                        'OS resource counter results as rich text tables (filesystem, console, callback, '
+                        'default=console)'),
+                    sections=set(RUSAGE_SECTION_UNITS),
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
+                ChoiceConf(
+                    flags=['--rich-table.native-memory'], flag_type=FlagType.TARGET_LIST,
+                    name='rich-table-native-memory',
+                    description=(
+                        'Native memory (RSS/USS/PSS) results as rich text tables (filesystem, console, callback, '
+                        'default=console)'),
+                    sections=set(NATIVE_MEMORY_SECTION_UNITS),
+                    targets=init_targets,
+                    output_format=Format.RICH_TEXT),
             ])
         }
         # Collect all provided overrides from the method signature, filtering out `None`s.
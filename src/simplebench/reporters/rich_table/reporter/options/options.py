@@ -20,6 +20,8 @@ _DEFAULT_RICH_TABLE_FIELDS: Sequence[RichTableField] = [
     RichTableField.P95,
     RichTableField.STD_DEV,
     RichTableField.RSD_PERCENT,
+    RichTableField.PRECISION_PERCENT,
+    RichTableField.CPU_UTILIZATION_PERCENT,
 ]
 
 
@@ -57,6 +59,15 @@ class RichTableOptions(ReporterOptions):
         - :attr:`~.RichTableField.P95`
         - :attr:`~.RichTableField.STD_DEV`
         - :attr:`~.RichTableField.RSD_PERCENT`
+        - :attr:`~.RichTableField.PRECISION_PERCENT`
+        - :attr:`~.RichTableField.CPU_UTILIZATION_PERCENT`
+
+        The outlier fields :attr:`~.RichTableField.OUTLIERS`, :attr:`~.RichTableField.FILTERED_MEAN` and
+        :attr:`~.RichTableField.FILTERED_RSD_PERCENT` are available but not included by default.
+
+        The bootstrap confidence interval fields :attr:`~.RichTableField.MEAN_CI`,
+        :attr:`~.RichTableField.MEDIAN_CI`, :attr:`~.RichTableField.P5_CI` and :attr:`~.RichTableField.P95_CI`
+        are also available but not included by default.
 
     :param variation_cols_last: Whether to place the variation columns (if any) at the end of the rows.
         Defaults to ``False`` - which places the variation columns at the start of the rows.
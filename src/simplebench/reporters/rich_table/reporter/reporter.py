@@ -1,16 +1,17 @@
 """Reporter for benchmark results using Rich tables on the console."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, Optional, TypeAlias
 
 from rich.table import Table
 
-from simplebench.defaults import DEFAULT_INTERVAL_SCALE
+from simplebench.defaults import DEFAULT_CONFIDENCE_LEVEL, DEFAULT_INTERVAL_SCALE
 from simplebench.enums import Section
 from simplebench.exceptions import SimpleBenchTypeError
 from simplebench.reporters.reporter import Reporter, ReporterOptions
 from simplebench.results import Results
 from simplebench.si_units import si_scale_for_smallest
+from simplebench.stats import ConfidenceInterval, Stats, StatsSummary
 from simplebench.type_proxies import is_case
 from simplebench.utils import sigfigs
 from simplebench.validators import validate_type
@@ -24,6 +25,155 @@ Options: TypeAlias = RichTableOptions
 if TYPE_CHECKING:
     from simplebench.case import Case
 
+_STATISTIC_COLUMN: dict[str, Any] = {'justify': 'center', 'vertical': 'bottom', 'overflow': 'fold'}
+"""The :meth:`~rich.table.Table.add_column` arguments of the columns of statistics."""
+_CI_PERCENT: str = f'{DEFAULT_CONFIDENCE_LEVEL * 100:g}%'
+"""The confidence level of the bootstrap confidence intervals, for the column headers."""
+
+
+class _RichTableColumn(NamedTuple):
+    """The table column of a :class:`~.RichTableField`.
+
+    :ivar header: The column header, formatted with the SI ``unit`` of the values.
+    :vartype header: str
+    :ivar cell: Returns the cell of a result: called with the reporter, the result, the
+        section, the statistics of the section and the scale factor of the values.
+    :vartype cell: Callable[[Reporter, Results, Section, Stats | StatsSummary, float], str]
+    :ivar statistic: Returns the statistic whose values across the results choose the SI unit
+        and scale of the column, or None if the column is not scaled.
+    :vartype statistic: Callable[[Stats | StatsSummary], float] | None
+    :ivar options: The :meth:`~rich.table.Table.add_column` arguments of the column.
+    :vartype options: dict[str, Any]
+    """
+    header: str
+    cell: Callable[[Reporter, Results, Section, Stats | StatsSummary, float], str]
+    statistic: Optional[Callable[[Stats | StatsSummary], float]] = None
+    options: dict[str, Any] = _STATISTIC_COLUMN
+
+
+def _raw_data_cell(stats: Stats | StatsSummary, cell: Callable[[Stats], str]) -> str:
+    """Format a statistic computed from the raw data points of a section as a table cell.
+
+    Sections summarized without their raw data points (a :class:`~.StatsSummary`) show a dash.
+
+    :param stats: The statistics of the section.
+    :param cell: Formats the cell from the statistics of the raw data points.
+    :return: The cell.
+    """
+    return cell(stats) if isinstance(stats, Stats) else '-'
+
+
+def _interval_cell(interval: ConfidenceInterval, scale: float) -> str:
+    """Format a confidence interval as a table cell.
+
+    :param interval: The confidence interval.
+    :param scale: The factor the bounds are multiplied by for display.
+    :return: The scaled bounds, separated by a dash.
+    """
+    return f'{sigfigs(interval.lower * scale):.2f} – {sigfigs(interval.upper * scale):.2f}'
+
+
+def _percent_cell(value: float | None, precision: int) -> str:
+    """Format a fraction as a percentage table cell, or a dash if it is not available.
+
+    :param value: The fraction, or None.
+    :param precision: The number of decimal places shown.
+    :return: The percentage.
+    """
+    return '-' if value is None else f'{sigfigs(value * 100.0):>5.{precision}f}%'
+
+
+def _outliers_cell(stats: Stats) -> str:
+    """Format the counts of the mild and severe outliers of a section as a table cell.
+
+    :param stats: The statistics of the section.
+    :return: The mild and severe outlier counts, separated by a slash.
+    """
+    outliers = stats.outliers()
+    return f'{len(outliers.mild)}/{len(outliers.severe)}'
+
+
+_RICH_TABLE_COLUMNS: dict[RichTableField, _RichTableColumn] = {
+    RichTableField.N: _RichTableColumn(
+        'N', lambda reporter, result, section, stats, scale: f'{str(result.n):>6}',
+        options={'justify': 'center'}),
+    RichTableField.ITERATIONS: _RichTableColumn(
+        'Iterations', lambda reporter, result, section, stats, scale: f'{len(result.iteration_table):>6d}',
+        options={'justify': 'center'}),
+    RichTableField.ROUNDS: _RichTableColumn(
+        'Rounds', lambda reporter, result, section, stats, scale: f'{result.rounds:>6d}',
+        options={'justify': 'center'}),
+    RichTableField.ELAPSED_SECONDS: _RichTableColumn(
+        'Elapsed Seconds',
+        lambda reporter, result, section, stats, scale: f'{result.total_elapsed * DEFAULT_INTERVAL_SCALE:>4.2f}',
+        options={'justify': 'center', 'max_width': 7}),
+    RichTableField.MEAN: _RichTableColumn(
+        'mean {unit}', lambda reporter, result, section, stats, scale: f'{sigfigs(stats.mean * scale):>8.2f}',
+        lambda stats: stats.mean),
+    RichTableField.MEDIAN: _RichTableColumn(
+        'median {unit}', lambda reporter, result, section, stats, scale: f'{sigfigs(stats.median * scale):>8.2f}',
+        lambda stats: stats.median),
+    RichTableField.MIN: _RichTableColumn(
+        'min {unit}', lambda reporter, result, section, stats, scale: f'{sigfigs(stats.minimum * scale):>8.2f}',
+        lambda stats: stats.minimum),
+    RichTableField.MAX: _RichTableColumn(
+        'max {unit}', lambda reporter, result, section, stats, scale: f'{sigfigs(stats.maximum * scale):>8.2f}',
+        lambda stats: stats.maximum),
+    RichTableField.P5: _RichTableColumn(
+        '5th {unit}',
+        lambda reporter, result, section, stats, scale: f'{sigfigs(stats.percentiles[5] * scale):>8.2f}',
+        lambda stats: stats.percentiles[5]),
+    RichTableField.P95: _RichTableColumn(
+        '95th {unit}',
+        lambda reporter, result, section, stats, scale: f'{sigfigs(stats.percentiles[95] * scale):>8.2f}',
+        lambda stats: stats.percentiles[95]),
+    RichTableField.STD_DEV: _RichTableColumn(
+        'std dev {unit}',
+        lambda reporter, result, section, stats, scale: f'{sigfigs(stats.standard_deviation * scale):>8.2f}',
+        lambda stats: stats.standard_deviation),
+    RichTableField.RSD_PERCENT: _RichTableColumn(
+        'rsd%', lambda reporter, result, section, stats, scale: f'{sigfigs(stats.relative_standard_deviation):>5.2f}%'),
+    RichTableField.PRECISION_PERCENT: _RichTableColumn(
+        '±%', lambda reporter, result, section, stats, scale: _percent_cell(
+            reporter.timing_precision(result=result, section=section), 2)),
+    RichTableField.CPU_UTILIZATION_PERCENT: _RichTableColumn(
+        'cpu%', lambda reporter, result, section, stats, scale: _percent_cell(
+            reporter.cpu_utilization(result=result, section=section), 1)),
+    RichTableField.OUTLIERS: _RichTableColumn(
+        'outliers\nmild/severe',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(stats, _outliers_cell)),
+    RichTableField.FILTERED_MEAN: _RichTableColumn(
+        'filtered mean {unit}',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: f'{sigfigs(data.filtered_mean * scale):>8.2f}'),
+        lambda stats: stats.filtered_mean if isinstance(stats, Stats) else stats.mean),
+    RichTableField.FILTERED_RSD_PERCENT: _RichTableColumn(
+        'filtered rsd%',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: f'{sigfigs(data.filtered_relative_standard_deviation):>5.2f}%')),
+    RichTableField.MEAN_CI: _RichTableColumn(
+        f'mean {_CI_PERCENT} CI {{unit}}',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: _interval_cell(data.bootstrap_intervals().mean, scale)),
+        lambda stats: stats.mean),
+    RichTableField.MEDIAN_CI: _RichTableColumn(
+        f'median {_CI_PERCENT} CI {{unit}}',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: _interval_cell(data.bootstrap_intervals().median, scale)),
+        lambda stats: stats.median),
+    RichTableField.P5_CI: _RichTableColumn(
+        f'5th {_CI_PERCENT} CI {{unit}}',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: _interval_cell(data.bootstrap_intervals().percentile(5.0), scale)),
+        lambda stats: stats.percentiles[5]),
+    RichTableField.P95_CI: _RichTableColumn(
+        f'95th {_CI_PERCENT} CI {{unit}}',
+        lambda reporter, result, section, stats, scale: _raw_data_cell(
+            stats, lambda data: _interval_cell(data.bootstrap_intervals().percentile(95.0), scale)),
+        lambda stats: stats.percentiles[95]),
+}
+"""The table column of each :class:`~.RichTableField`."""
+
 
 class RichTableReporter(Reporter):
     """Class for outputting benchmark results as Rich Tables.
@@ -38,6 +188,8 @@ class RichTableReporter(Reporter):
     * ``--rich-table.timings``: Outputs only per round timing results.
     * ``--rich-table.memory``: Outputs only memory usage results.
     * ``--rich-table.peak-memory``: Outputs only peak memory usage results.
+    * ``--rich-table.latency``: Outputs only the per-call latency distribution. The p99.9 and
+      p99.99 tail latencies are reported in the ``tail_latencies`` extra info of the JSON output.
 
     Each flag supports multiple targets: ``console``, ``filesystem``, and ``callback`` with
     the default target being ``console``.
@@ -117,28 +269,7 @@ class RichTableReporter(Reporter):
 
         base_unit: str = self.get_base_unit_for_section(section=section)
         results: list[Results] = case.results
-
-        mean_unit, mean_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).mean for result in results],
-            base_unit=base_unit)
-        median_unit, median_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).median for result in results],
-            base_unit=base_unit)
-        min_unit, min_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).minimum for result in results],
-            base_unit=base_unit)
-        max_unit, max_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).maximum for result in results],
-            base_unit=base_unit)
-        p5_unit, p5_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).percentiles[5] for result in results],
-            base_unit=base_unit)
-        p95_unit, p95_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).percentiles[95] for result in results],
-            base_unit=base_unit)
-        stddev_unit, stddev_scale = si_scale_for_smallest(
-            numbers=[result.results_section(section).standard_deviation for result in results],
-            base_unit=base_unit)
+        section_stats = [result.results_section(section) for result in results]
 
         table = Table(title=(case.title + f'\n{section.value}\n\n' + case.description),
                       show_header=True,
@@ -149,77 +280,25 @@ class RichTableReporter(Reporter):
             for value in case.variation_cols.values():
                 table.add_column(value, justify='center', vertical='bottom', overflow='fold')
 
+        # Each scaled column gets the SI unit that suits its statistic across the results
+        scales: list[float] = []
         for field in included_fields:
-            match field:
-                case RichTableField.N:
-                    table.add_column('N', justify='center')
-                case RichTableField.ITERATIONS:
-                    table.add_column('Iterations', justify='center')
-                case RichTableField.ROUNDS:
-                    table.add_column('Rounds', justify='center')
-                case RichTableField.ELAPSED_SECONDS:
-                    table.add_column('Elapsed Seconds', justify='center', max_width=7)
-                case RichTableField.MEAN:
-                    table.add_column(f'mean {mean_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.MEDIAN:
-                    table.add_column(f'median {median_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.MIN:
-                    table.add_column(f'min {min_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.MAX:
-                    table.add_column(f'max {max_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.P5:
-                    table.add_column(f'5th {p5_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.P95:
-                    table.add_column(f'95th {p95_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.STD_DEV:
-                    table.add_column(f'std dev {stddev_unit}', justify='center', vertical='bottom', overflow='fold')
-                case RichTableField.RSD_PERCENT:
-                    table.add_column('rsd%', justify='center', vertical='bottom', overflow='fold')
+            column = _RICH_TABLE_COLUMNS[field]
+            unit, scale = '', 1.0
+            if column.statistic is not None:
+                unit, scale = si_scale_for_smallest(
+                    numbers=[column.statistic(stats) for stats in section_stats], base_unit=base_unit)
+            scales.append(scale)
+            table.add_column(column.header.format(unit=unit), **column.options)
 
         if options.variation_cols_last:
             for value in case.variation_cols.values():
                 table.add_column(value, justify='center', vertical='bottom', overflow='fold')
 
-        for result in results:
-            stats_target = result.results_section(section)
-            row: list[str] = []
-
-            if not options.variation_cols_last:
-                for value in result.variation_marks.values():
-                    row.append(f'{value!s}')
-
-            # Add main fields
-            for field in included_fields:
-                match field:
-                    case RichTableField.N:
-                        row.append(f'{str(result.n):>6}')
-                    case RichTableField.ITERATIONS:
-                        row.append(f'{len(result.iterations):>6d}')
-                    case RichTableField.ROUNDS:
-                        row.append(f'{result.rounds:>6d}')
-                    case RichTableField.ELAPSED_SECONDS:
-                        row.append(f'{result.total_elapsed * DEFAULT_INTERVAL_SCALE:>4.2f}')
-                    case RichTableField.MEAN:
-                        row.append(f'{sigfigs(stats_target.mean * mean_scale):>8.2f}')
-                    case RichTableField.MEDIAN:
-                        row.append(f'{sigfigs(stats_target.median * median_scale):>8.2f}')
-                    case RichTableField.MIN:
-                        row.append(f'{sigfigs(stats_target.minimum * min_scale):>8.2f}')
-                    case RichTableField.MAX:
-                        row.append(f'{sigfigs(stats_target.maximum * max_scale):>8.2f}')
-                    case RichTableField.P5:
-                        row.append(f'{sigfigs(stats_target.percentiles[5] * p5_scale):>8.2f}')
-                    case RichTableField.P95:
-                        row.append(f'{sigfigs(stats_target.percentiles[95] * p95_scale):>8.2f}')
-                    case RichTableField.STD_DEV:
-                        row.append(f'{sigfigs(stats_target.standard_deviation * stddev_scale):>8.2f}')
-                    case RichTableField.RSD_PERCENT:
-                        row.append(f'{sigfigs(stats_target.relative_standard_deviation):>5.2f}%')
-
-            if options.variation_cols_last:
-                for value in result.variation_marks.values():
-                    row.append(f'{value!s}')
-
-            table.add_row(*row)
+        for result, stats_target in zip(results, section_stats):
+            row: list[str] = [_RICH_TABLE_COLUMNS[field].cell(self, result, section, stats_target, scale)
+                              for field, scale in zip(included_fields, scales)]
+            marks: list[str] = [f'{value!s}' for value in result.variation_marks.values()]
+            table.add_row(*(row + marks if options.variation_cols_last else marks + row))
 
         return table
@@ -11,8 +11,23 @@ from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError,
 from .defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT, DEFAULT_MEMORY_SCALE, DEFAULT_MEMORY_UNIT
 from .enums import Section
 from .iteration import Iteration
-from .stats import MemoryUsage, OperationsPerInterval, OperationTimings, PeakMemoryUsage, Stats
-from .validators import validate_non_blank_string, validate_positive_float, validate_positive_int
+from .iteration_table import IterationTable
+from .stats import (
+    NATIVE_MEMORY_SECTION_UNITS,
+    RUSAGE_SECTION_UNITS,
+    CPUTimings,
+    GCCollections,
+    LatencyHistogram,
+    MemoryUsage,
+    OperationsPerInterval,
+    OperationTimings,
+    PeakMemoryUsage,
+    ResourceUsage,
+    Stats,
+    StatsSummary,
+)
+from .utils import AllocationSite
+from .validators import validate_bool, validate_non_blank_string, validate_positive_float, validate_positive_int
 
 
 class Results:
@@ -52,14 +67,40 @@ class Results:
     :ivar iterations: A tuple of Iteration objects representing each iteration of
         the benchmark. (read only)
     :vartype iterations: tuple[Iteration, ...]
+    :ivar iteration_table: The iterations of the benchmark in columnar form. (read only)
+    :vartype iteration_table: IterationTable
     :ivar ops_per_second: Statistics for operations per interval. (read only)
     :vartype ops_per_second: OperationsPerInterval
     :ivar per_round_timings: Statistics for per-round timings. (read only)
     :vartype per_round_timings: OperationTimings
-    :ivar memory: Statistics for memory usage. (read only)
-    :vartype memory: MemoryUsage
-    :ivar peak_memory: Statistics for peak memory usage. (read only)
-    :vartype peak_memory: PeakMemoryUsage
+    :ivar cpu_timings: Statistics for per-round CPU times. (read only)
+    :vartype cpu_timings: CPUTimings
+    :ivar cpu_utilization: The ratio of the total CPU time to the total wall-clock time. (read only)
+    :vartype cpu_utilization: float
+    :ivar memory: Statistics for memory usage, or None if it was not measured. (read only)
+    :vartype memory: MemoryUsage | None
+    :ivar peak_memory: Statistics for peak memory usage, or None if it was not measured. (read only)
+    :vartype peak_memory: PeakMemoryUsage | None
+    :ivar memory_measured: Whether memory usage was measured. (read only)
+    :vartype memory_measured: bool
+    :ivar gc_collections: Statistics for the garbage collections per iteration. (read only)
+    :vartype gc_collections: GCCollections
+    :ivar warmup_timings: Statistics for the per-round times of the warmup iterations, in the
+        order they ran (the warmup curve), or None if there were no warmup iterations. (read only)
+    :vartype warmup_timings: OperationTimings | None
+    :ivar latency: The histogram of the per-call latencies, or None if they were not
+        recorded (see :class:`~simplebench.runners.LoadRunner`). (read only)
+    :vartype latency: LatencyHistogram | None
+    :ivar allocation_sites: The sites that allocated the most memory in a dedicated call of the
+        action, largest first, or None if they were not measured. (read only)
+    :vartype allocation_sites: tuple[AllocationSite, ...] | None
+    :ivar rusage: Statistics for each operating system resource counter, keyed by
+        its :class:`~simplebench.enums.Section`. (read only)
+    :vartype rusage: MappingProxyType[Section, ResourceUsage]
+    :ivar native_memory: Statistics for each native memory size (resident, unique and
+        proportional set size changes and peak resident set size), keyed by its
+        :class:`~simplebench.enums.Section`. (read only)
+    :vartype native_memory: MappingProxyType[Section, ResourceUsage]
     :ivar total_elapsed: The total elapsed time for the benchmark. (read only)
     :vartype total_elapsed: float
     :ivar extra_info: Additional information about the benchmark run. This is a
@@ -79,12 +120,20 @@ class Results:
         '_ops_per_interval_unit',
         '_ops_per_interval_scale',
         '_memory',
+        '_memory_measured',
         '_memory_unit',
         '_memory_scale',
         '_peak_memory',
+        '_gc_collections',
+        '_rusage',
+        '_native_memory',
         '_iterations',
         '_ops_per_second',
         '_per_round_timings',
+        '_cpu_timings',
+        '_warmup_timings',
+        '_latency',
+        '_allocation_sites',
         '_total_elapsed',
         '_extra_info',
         '_repr_cache',
@@ -98,7 +147,7 @@ class Results:
                  n: int | float,
                  rounds: int,
                  total_elapsed: float,
-                 iterations: Sequence[Iteration],
+                 iterations: Sequence[Iteration] | IterationTable,
                  variation_cols: dict[str, str] | None = None,
                  variation_marks: dict[str, Any] | None = None,
                  interval_unit: str = DEFAULT_INTERVAL_UNIT,
@@ -109,9 +158,15 @@ class Results:
                  memory_scale: float = DEFAULT_MEMORY_SCALE,
                  ops_per_second: Optional[OperationsPerInterval] = None,
                  per_round_timings: Optional[OperationTimings] = None,
+                 cpu_timings: Optional[CPUTimings] = None,
                  memory: Optional[MemoryUsage] = None,
                  peak_memory: Optional[PeakMemoryUsage] = None,
-                 extra_info: Optional[dict[str, Any]] = None) -> None:
+                 gc_collections: Optional[GCCollections] = None,
+                 warmup_timings: Optional[OperationTimings] = None,
+                 latency: Optional[LatencyHistogram] = None,
+                 allocation_sites: Optional[Sequence[AllocationSite]] = None,
+                 extra_info: Optional[dict[str, Any]] = None,
+                 memory_measured: bool = True) -> None:
         """Initialize a Results object.
 
         :param group: The reporting group to which the benchmark case belongs.
@@ -126,8 +181,10 @@ class Results:
         :type rounds: int
         :param total_elapsed: The total elapsed time for the benchmark.
         :type total_elapsed: float
-        :param iterations: The list of Iteration objects representing each iteration of the benchmark.
-        :type iterations: list[Iteration]
+        :param iterations: The iterations of the benchmark, either as a list of Iteration objects or
+            as an IterationTable. A table is used as is (frozen if it is not already) without
+            revalidating its rows.
+        :type iterations: list[Iteration] | IterationTable
         :param variation_cols: The columns to use for labelling kwarg variations
             in the benchmark. Defaults to None, which results in an empty dictionary.
         :type variation_cols: dict[str, str], optional
@@ -158,15 +215,34 @@ class Results:
         :param per_round_timings: The per-round timings for the benchmark.
             Defaults to a new OperationTimings object initialized from the benchmark's iterations.
         :type per_round_timings: Optional[OperationTimings], optional
+        :param cpu_timings: The per-round CPU times for the benchmark.
+            Defaults to a new CPUTimings object initialized from the benchmark's iterations.
+        :type cpu_timings: Optional[CPUTimings], optional
         :param memory: The memory usage for the benchmark.
             Defaults to a new MemoryUsage object initialized from the benchmark's iterations.
         :type memory: Optional[MemoryUsage], optional
         :param peak_memory: The peak memory usage for the benchmark.
             Defaults to a new PeakMemoryUsage object initialized from the benchmark's iterations.
         :type peak_memory: Optional[PeakMemoryUsage], optional
+        :param gc_collections: The garbage collections per iteration for the benchmark.
+            Defaults to a new GCCollections object initialized from the benchmark's iterations.
+        :type gc_collections: Optional[GCCollections], optional
+        :param warmup_timings: The per-round timings of the warmup iterations, in the order they ran.
+            Defaults to None (no warmup iterations).
+        :type warmup_timings: Optional[OperationTimings], optional
+        :param latency: The histogram of the per-call latencies.
+            Defaults to None (latencies not recorded).
+        :type latency: Optional[LatencyHistogram], optional
+        :param allocation_sites: The sites that allocated the most memory, largest first.
+            Defaults to None (allocation sites not measured).
+        :type allocation_sites: Optional[Sequence[AllocationSite]], optional
         :param extra_info: Any extra information to include in the benchmark results.
             Defaults to {}.
         :type extra_info: Optional[dict[str, Any]], optional
+        :param memory_measured: Whether memory usage was measured. If False, ``memory`` and
+            ``peak_memory`` are ignored and the memory sections are reported as not measured.
+            Defaults to True.
+        :type memory_measured: bool, optional
         :raises SimpleBenchTypeError: If any of the arguments are of incorrect type.
         :raises SimpleBenchValueError: If any of the arguments have invalid values.
         """
@@ -190,7 +266,7 @@ class Results:
             rounds, 'rounds',
             _ResultsErrorTag.ROUNDS_INVALID_ARG_TYPE,
             _ResultsErrorTag.ROUNDS_INVALID_ARG_VALUE)
-        self._iterations: tuple[Iteration, ...] = self._validate_iterations(iterations)
+        self._iterations: IterationTable = self._validate_iterations(iterations)
         self._variation_cols: dict[str, str] = self._validate_variation_cols(variation_cols)
         self._variation_marks: dict[str, Any] = self._validate_variation_marks(variation_marks)
         self._interval_unit: str = validate_non_blank_string(
@@ -217,10 +293,27 @@ class Results:
             memory_scale, 'memory_scale',
             _ResultsErrorTag.MEMORY_SCALE_INVALID_ARG_TYPE,
             _ResultsErrorTag.MEMORY_SCALE_INVALID_ARG_VALUE)
-        self._memory: MemoryUsage = self._validate_memory(memory)
-        self._peak_memory: PeakMemoryUsage = self._validate_peak_memory(peak_memory)
+        self._memory_measured: bool = validate_bool(
+            memory_measured, 'memory_measured', _ResultsErrorTag.MEMORY_MEASURED_INVALID_ARG_TYPE)
+        self._memory: MemoryUsage | None = None
+        self._peak_memory: PeakMemoryUsage | None = None
+        if self._memory_measured:
+            self._memory = self._validate_memory(memory)
+            self._peak_memory = self._validate_peak_memory(peak_memory)
+        self._gc_collections: GCCollections = self._validate_gc_collections(gc_collections)
+        self._rusage: dict[Section, ResourceUsage] = {
+            section: ResourceUsage(section=section, rounds=self._rounds, iterations=self._iterations)
+            for section in RUSAGE_SECTION_UNITS}
+        self._native_memory: dict[Section, ResourceUsage] = {
+            section: ResourceUsage(section=section, rounds=self._rounds, iterations=self._iterations)
+            for section in NATIVE_MEMORY_SECTION_UNITS}
         self._ops_per_second: OperationsPerInterval = self._validate_ops_per_second(ops_per_second)
         self._per_round_timings: OperationTimings = self._validate_per_round_timings(per_round_timings)
+        self._cpu_timings: CPUTimings = self._validate_cpu_timings(cpu_timings)
+        self._warmup_timings: OperationTimings | None = self._validate_warmup_timings(warmup_timings)
+        self._latency: LatencyHistogram | None = self._validate_latency(latency)
+        self._allocation_sites: tuple[AllocationSite, ...] | None = self._validate_allocation_sites(
+            allocation_sites)
         self._total_elapsed: float = validate_positive_float(
             total_elapsed, 'total_elapsed',
             _ResultsErrorTag.TOTAL_ELAPSED_INVALID_ARG_TYPE,
@@ -269,15 +362,22 @@ class Results:
         # shallow copy to prevent external mutation
         return copy(value)
 
-    def _validate_iterations(self, value: Sequence[Iteration]) -> tuple[Iteration, ...]:
-        """Validate the iterations Sequence.
+    def _validate_iterations(self, value: Sequence[Iteration] | IterationTable) -> IterationTable:
+        """Validate the iterations Sequence or IterationTable.
 
         Args:
-            value (Sequence[Iteration]): The iterations Sequence to validate.
+            value (Sequence[Iteration] | IterationTable): The iterations to validate.
 
         Returns:
-            tuple[Iteration, ...]: A copy of the validated iterations as a tuple.
+            IterationTable: A frozen table holding the iterations.
+
+        Raises:
+            SimpleBenchTypeError: If the value is neither an IterationTable nor a Sequence
+                of Iteration objects.
+            SimpleBenchValueError: If the iterations do not all have the same unit.
         """
+        if isinstance(value, IterationTable):
+            return value.frozen()
         if not isinstance(value, Sequence):
             raise SimpleBenchTypeError(
                 f'Invalid iterations type: {type(value)}. Must be of type list.',
@@ -289,8 +389,13 @@ class Results:
                     f'Invalid iteration element type: {type(iteration)}. Must be of type Iteration.',
                     tag=_ResultsErrorTag.ITERATIONS_INVALID_ARG_IN_SEQUENCE
                 )
-        # shallow copy to prevent external mutation of iterations sequence itself
-        return tuple(value)
+        if len({iteration.unit for iteration in value}) > 1:
+            raise SimpleBenchValueError(
+                'Invalid iterations: the iterations do not all have the same unit.',
+                tag=_ResultsErrorTag.ITERATIONS_MIXED_UNITS
+            )
+        # copied into a frozen table to prevent external mutation of the iterations sequence itself
+        return IterationTable.from_iterations(value).frozen()
 
     def _validate_variation_marks(self, value: dict[str, Any] | None) -> dict[str, Any]:
         """Validate the variation_marks dictionary.
@@ -365,6 +470,120 @@ class Results:
             )
         return value
 
+    def _validate_cpu_timings(self, value: CPUTimings | None) -> CPUTimings:
+        """Validate the cpu_timings object if passed, or create a default one if None.
+
+        The default CPUTimings object will have its iterations set to the same list
+        of Iteration objects as the Results object and initialized with the values from
+        `interval_unit` and `interval_scale` for unit and scale.
+
+        Args:
+            value (CPUTimings | None): The cpu_timings object to validate or None.
+
+        Returns:
+            CPUTimings: The validated or default CPUTimings object.
+
+        Raises:
+            SimpleBenchTypeError: If the value is not None and not of type CPUTimings.
+        """
+        if value is None:
+            return CPUTimings(unit=self._interval_unit,
+                              scale=self._interval_scale,
+                              rounds=self._rounds,
+                              iterations=self._iterations)
+
+        if not isinstance(value, CPUTimings):
+            raise SimpleBenchTypeError(
+                f'Invalid cpu_timings type: {type(value)}. Must be of type CPUTimings.',
+                tag=_ResultsErrorTag.CPU_TIMINGS_INVALID_ARG_TYPE
+            )
+        return value
+
+    def _validate_gc_collections(self, value: GCCollections | None) -> GCCollections:
+        """Validate the gc_collections object if passed, or create a default one if None.
+
+        The default GCCollections object will have its iterations set to the same list
+        of Iteration objects as the Results object.
+
+        Args:
+            value (GCCollections | None): The gc_collections object to validate or None.
+
+        Returns:
+            GCCollections: The validated or default GCCollections object.
+
+        Raises:
+            SimpleBenchTypeError: If the value is not None and not of type GCCollections.
+        """
+        if value is None:
+            return GCCollections(rounds=self._rounds, iterations=self._iterations)
+
+        if not isinstance(value, GCCollections):
+            raise SimpleBenchTypeError(
+                f'Invalid gc_collections type: {type(value)}. Must be of type GCCollections.',
+                tag=_ResultsErrorTag.GC_COLLECTIONS_INVALID_ARG_TYPE
+            )
+        return value
+
+    def _validate_warmup_timings(self, value: OperationTimings | None) -> OperationTimings | None:
+        """Validate the warmup_timings object if passed.
+
+        Args:
+            value (OperationTimings | None): The warmup_timings object to validate or None.
+
+        Returns:
+            OperationTimings | None: The validated warmup_timings object or None.
+
+        Raises:
+            SimpleBenchTypeError: If the value is not None and not of type OperationTimings.
+        """
+        if value is not None and not isinstance(value, OperationTimings):
+            raise SimpleBenchTypeError(
+                f'Invalid warmup_timings type: {type(value)}. Must be of type OperationTimings or None.',
+                tag=_ResultsErrorTag.WARMUP_TIMINGS_INVALID_ARG_TYPE
+            )
+        return value
+
+    def _validate_latency(self, value: LatencyHistogram | None) -> LatencyHistogram | None:
+        """Validate the latency histogram if passed.
+
+        Args:
+            value (LatencyHistogram | None): The latency histogram to validate or None.
+
+        Returns:
+            LatencyHistogram | None: The validated latency histogram or None.
+
+        Raises:
+            SimpleBenchTypeError: If the value is not None and not of type LatencyHistogram.
+        """
+        if value is not None and not isinstance(value, LatencyHistogram):
+            raise SimpleBenchTypeError(
+                f'Invalid latency type: {type(value)}. Must be of type LatencyHistogram or None.',
+                tag=_ResultsErrorTag.LATENCY_INVALID_ARG_TYPE
+            )
+        return value
+
+    def _validate_allocation_sites(
+            self, value: Sequence[AllocationSite] | None) -> tuple[AllocationSite, ...] | None:
+        """Validate the allocation sites if passed.
+
+        Args:
+            value (Sequence[AllocationSite] | None): The allocation sites to validate or None.
+
+        Returns:
+            tuple[AllocationSite, ...] | None: A copy of the validated allocation sites as a tuple or None.
+
+        Raises:
+            SimpleBenchTypeError: If the value is not None and not a Sequence of AllocationSite objects.
+        """
+        if value is None:
+            return None
+        if not isinstance(value, Sequence) or not all(isinstance(site, AllocationSite) for site in value):
+            raise SimpleBenchTypeError(
+                f'Invalid allocation_sites type: {type(value)}. Must be a Sequence of AllocationSite or None.',
+                tag=_ResultsErrorTag.ALLOCATION_SITES_INVALID_ARG_TYPE
+            )
+        return tuple(value)
+
     def _validate_memory(self, value: MemoryUsage | None) -> MemoryUsage:
         """Validate the memory object if passed, or create a default one if None.
 
@@ -537,7 +756,15 @@ class Results:
 
     @property
     def iterations(self) -> tuple[Iteration, ...]:
-        """The tuple of Iteration objects representing each iteration of the benchmark."""
+        """The tuple of Iteration objects representing each iteration of the benchmark.
+
+        The Iteration objects are created from :attr:`iteration_table` on each access.
+        """
+        return tuple(self._iterations)
+
+    @property
+    def iteration_table(self) -> IterationTable:
+        """The iterations of the benchmark in columnar form."""
         return self._iterations
 
     @property
@@ -551,8 +778,8 @@ class Results:
         return self._per_round_timings
 
     @property
-    def memory(self) -> MemoryUsage:
-        """Statistics for memory usage."""
+    def memory(self) -> MemoryUsage | None:
+        """Statistics for memory usage, or None if memory usage was not measured."""
         return self._memory
 
     @property
@@ -566,10 +793,84 @@ class Results:
         return self._memory_scale
 
     @property
-    def peak_memory(self) -> PeakMemoryUsage:
-        """Statistics for peak memory usage."""
+    def peak_memory(self) -> PeakMemoryUsage | None:
+        """Statistics for peak memory usage, or None if memory usage was not measured."""
         return self._peak_memory
 
+    @property
+    def memory_measured(self) -> bool:
+        """Whether memory usage was measured.
+
+        Memory usage is not measured for cases run with
+        :attr:`MemoryStrategy.OFF <simplebench.enums.MemoryStrategy.OFF>`. Their
+        :attr:`~Section.MEMORY` and :attr:`~Section.PEAK_MEMORY` sections are then
+        left out of reports rather than reported as zero.
+        """
+        return self._memory_measured
+
+    @property
+    def cpu_timings(self) -> CPUTimings:
+        """Statistics for per-round CPU times."""
+        return self._cpu_timings
+
+    @property
+    def cpu_utilization(self) -> float:
+        """The ratio of the total CPU time to the total wall-clock time of the iterations.
+
+        A value near 1.0 means the action was computing for the whole timed region and a
+        value well below 1.0 that it spent time off the CPU (blocking I/O, lock waits, sleeps).
+        Values above 1.0 are possible if the action keeps more than one CPU busy.
+        It is 0.0 if nothing was timed.
+        """
+        table = self._iterations
+        wall = sum((table.column('elapsed') * table.column('scale')).tolist())
+        if wall <= 0.0:
+            return 0.0
+        return sum(table.column('cpu_elapsed').tolist()) / wall
+
+    @property
+    def gc_collections(self) -> GCCollections:
+        """Statistics for the garbage collections per iteration."""
+        return self._gc_collections
+
+    @property
+    def warmup_timings(self) -> OperationTimings | None:
+        """Statistics for the per-round times of the warmup iterations (the warmup curve), or None
+        if there were no warmup iterations.
+
+        The data points are in the order the iterations ran, so the first is the coldest.
+        """
+        return self._warmup_timings
+
+    @property
+    def latency(self) -> LatencyHistogram | None:
+        """The histogram of the per-call latencies, or None if they were not recorded.
+
+        The histogram holds every call in a fixed amount of memory. Its statistics are
+        available as the :attr:`~simplebench.enums.Section.LATENCY` section.
+        """
+        return self._latency
+
+    @property
+    def allocation_sites(self) -> tuple[AllocationSite, ...] | None:
+        """The sites that allocated the most memory in a dedicated call of the action, largest
+        first, or None if they were not measured (see :attr:`Case.allocation_sites
+        <simplebench.case.Case.allocation_sites>`)."""
+        return self._allocation_sites
+
+    @property
+    def rusage(self) -> MappingProxyType[Section, ResourceUsage]:
+        """Statistics for each operating system resource counter (page faults, context
+        switches, block I/O and maximum resident set size), keyed by its section."""
+        return MappingProxyType(self._rusage)
+
+    @property
+    def native_memory(self) -> MappingProxyType[Section, ResourceUsage]:
+        """Statistics for each native memory size (resident, unique and proportional set size
+        changes and peak resident set size), keyed by its section. All are zero unless the case
+        measured native memory (see :attr:`Case.native_memory <simplebench.case.Case.native_memory>`)."""
+        return MappingProxyType(self._native_memory)
+
     @property
     def total_elapsed(self) -> float:
         """The total elapsed time for the benchmark."""
@@ -580,14 +881,15 @@ class Results:
         """Additional information about the benchmark run."""
         return deepcopy(self._extra_info)
 
-    def results_section(self, section: Section) -> Stats:
+    def results_section(self, section: Section) -> Stats | StatsSummary:
         """Returns the requested section of the benchmark results.
 
         Args:
             section (Section): The section of the results to return. Must be Section.OPS or Section.TIMING.
 
         Returns:
-            Stats: The requested section of the benchmark results.
+            Stats | StatsSummary: The requested section of the benchmark results. The
+            :attr:`~Section.LATENCY` section is a StatsSummary computed from the latency histogram.
         """
         if not isinstance(section, Section):
             raise SimpleBenchTypeError(
@@ -599,14 +901,37 @@ class Results:
                 return self.ops_per_second
             case Section.TIMING:
                 return self.per_round_timings
-            case Section.MEMORY:
-                return self.memory
-            case Section.PEAK_MEMORY:
-                return self.peak_memory
+            case Section.CPU_TIME:
+                return self.cpu_timings
+            case Section.MEMORY | Section.PEAK_MEMORY:
+                if self._memory is None or self._peak_memory is None:
+                    raise SimpleBenchValueError(
+                        f'The {section} section was not measured (see Results.memory_measured).',
+                        tag=_ResultsErrorTag.RESULTS_SECTION_NOT_MEASURED)
+                return self._memory if section == Section.MEMORY else self._peak_memory
+            case Section.GC:
+                return self.gc_collections
+            case Section.WARMUP:
+                if self._warmup_timings is None:
+                    return OperationTimings(unit=self._interval_unit, scale=self._interval_scale,
+                                            rounds=self._rounds, data=[0])
+                return self._warmup_timings
+            case Section.LATENCY:
+                if self._latency is None:
+                    return StatsSummary.from_histogram(
+                        LatencyHistogram(unit=self._interval_unit, scale=self._interval_scale))
+                return StatsSummary.from_histogram(self._latency)
+            case (Section.MINOR_PAGE_FAULTS | Section.MAJOR_PAGE_FAULTS | Section.VOLUNTARY_CONTEXT_SWITCHES
+                  | Section.INVOLUNTARY_CONTEXT_SWITCHES | Section.BLOCK_IO | Section.MAX_RSS):
+                return self._rusage[section]
+            case Section.RSS | Section.USS | Section.PSS | Section.PEAK_RSS:
+                return self._native_memory[section]
             case _:  # should be unreachable due to the enum type check above, but mypy needs this
                 raise SimpleBenchValueError(
                     (f'Invalid section: {section}. Must be Section.OPS, Section.TIMING, '
-                     'Section.MEMORY, or Section.PEAK_MEMORY.'),
+                     'Section.CPU_TIME, Section.MEMORY, Section.PEAK_MEMORY, Section.GC, Section.WARMUP, '
+                     'Section.LATENCY '
+                     'or a resource counter or native memory section.'),
                     tag=_ResultsErrorTag.RESULTS_SECTION_UNSUPPORTED_SECTION_ARG_VALUE
                 )
 
@@ -629,14 +954,39 @@ class Results:
             'extra_info': self.extra_info,
             'per_round_timings': self.per_round_timings.stats_summary.as_dict,
             'ops_per_second': self.ops_per_second.stats_summary.as_dict,
-            'memory': self.memory.stats_summary.as_dict,
-            'peak_memory': self.peak_memory.stats_summary.as_dict,
+            'cpu_timings': self.cpu_timings.stats_summary.as_dict,
+            'cpu_utilization': self.cpu_utilization,
+            'memory': None if self._memory is None else self._memory.stats_summary.as_dict,
+            'peak_memory': None if self._peak_memory is None else self._peak_memory.stats_summary.as_dict,
+            'gc_collections': self.gc_collections.stats_summary.as_dict,
+            'rusage': {section.value: stats.stats_summary.as_dict for section, stats in self._rusage.items()},
+            'native_memory': {section.value: stats.stats_summary.as_dict
+                              for section, stats in self._native_memory.items()},
+            'warmup_timings': (None if self.warmup_timings is None
+                               else self.warmup_timings.stats_summary.as_dict),
+            'latency': (None if self.latency is None
+                        else StatsSummary.from_histogram(self.latency).as_dict),
+            'allocation_sites': (None if self.allocation_sites is None
+                                 else [site.as_dict() for site in self.allocation_sites]),
         }
         if full_data:
             results_dict['per_round_timings'] = self.per_round_timings.as_dict
             results_dict['ops_per_second'] = self.ops_per_second.as_dict
-            results_dict['memory'] = self.memory.as_dict
-            results_dict['peak_memory'] = self.peak_memory.as_dict
+            # bootstrap resampling is costly, so only the headline sections carry confidence intervals
+            for key, stats in (('per_round_timings', self.per_round_timings), ('ops_per_second', self.ops_per_second)):
+                results_dict[key]['bootstrap'] = stats.bootstrap_intervals().as_dict(stats.scale)
+            results_dict['cpu_timings'] = self.cpu_timings.as_dict
+            if self._memory is not None and self._peak_memory is not None:
+                results_dict['memory'] = self._memory.as_dict
+                results_dict['peak_memory'] = self._peak_memory.as_dict
+            results_dict['gc_collections'] = self.gc_collections.as_dict
+            results_dict['rusage'] = {section.value: stats.as_dict for section, stats in self._rusage.items()}
+            results_dict['native_memory'] = {section.value: stats.as_dict
+                                             for section, stats in self._native_memory.items()}
+            if self.warmup_timings is not None:
+                results_dict['warmup_timings'] = self.warmup_timings.as_dict
+            if self.latency is not None:
+                results_dict['latency'] = self.latency.as_dict
         return results_dict
 
     def __repr__(self) -> str:
@@ -664,6 +1014,14 @@ class Results:
                 f'iterations={self.iterations!r}, '
                 f'ops_per_second={self.ops_per_second!r}, '
                 f'per_round_timings={self.per_round_timings!r}, '
+                f'cpu_timings={self.cpu_timings!r}, '
                 f'memory={self.memory!r}, '
                 f'peak_memory={self.peak_memory!r}, '
-                f'extra_info={self.extra_info!r})')
+                f'gc_collections={self.gc_collections!r}, '
+                f'rusage={self._rusage!r}, '
+                f'native_memory={self._native_memory!r}, '
+                f'warmup_timings={self.warmup_timings!r}, '
+                f'latency={self.latency!r}, '
+                f'allocation_sites={self.allocation_sites!r}, '
+                f'extra_info={self.extra_info!r}, '
+                f'memory_measured={self.memory_measured!r})')
@@ -2,26 +2,93 @@
 """Test runners for benchmarking."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import gc
 import importlib.util
+import inspect
 import math
+import random
+import statistics
 import sys
+import threading
+import time
 import tracemalloc
+from array import array
+from contextlib import contextmanager
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Optional
-
-from .defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_SIGNIFICANT_FIGURES, DEFAULT_TIMER, MIN_MEASURED_ITERATIONS
-from .enums import Color
-from .exceptions import SimpleBenchImportError, SimpleBenchTimeoutError, SimpleBenchTypeError, _RunnersErrorTag
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
+
+import numpy as np
+
+from .defaults import (
+    DEFAULT_BASELINE_ITERATIONS,
+    DEFAULT_CALIBRATION_DRIFT_THRESHOLD,
+    DEFAULT_CALIBRATION_VERIFY_SAMPLES,
+    DEFAULT_INTERVAL_SCALE,
+    DEFAULT_LOAD_RATE,
+    DEFAULT_LOAD_SPIN_THRESHOLD,
+    DEFAULT_LOAD_WINDOW_CALLS,
+    DEFAULT_MAX_ITERATION_TIME_FRACTION,
+    DEFAULT_MAX_WARMUP_ITERATIONS,
+    DEFAULT_QUANTIZATION_RATIO,
+    DEFAULT_SATURATION_TOLERANCE,
+    DEFAULT_SCALING_REFERENCE_ITERATIONS,
+    DEFAULT_SIGNIFICANT_FIGURES,
+    DEFAULT_TAIL_PERCENTILES,
+    DEFAULT_TIMER,
+    DEFAULT_WARMUP_WINDOW,
+    MIN_MEASURED_ITERATIONS,
+)
+from .enums import (
+    ArrivalProcess,
+    BindingStrategy,
+    Color,
+    GCPolicy,
+    MemoryStrategy,
+    Section,
+    WarmupStrategy,
+)
+from .exceptions import (
+    SimpleBenchImportError,
+    SimpleBenchTimeoutError,
+    SimpleBenchTypeError,
+    SimpleBenchValueError,
+    _RunnersErrorTag,
+)
 from .iteration import Iteration
+from .iteration_table import IterationTable
 from .results import Results
+from .stats import (
+    LatencyHistogram,
+    MemoryUsage,
+    OperationsPerInterval,
+    OperationTimings,
+    PeakMemoryUsage,
+    PrecisionTracker,
+    relative_ci_half_width,
+    steady_state_start,
+)
 from .tasks import ProgressTracker
 from .timeout import Timeout
 from .timers import is_valid_timer, timer_overhead_ns, timer_precision_ns
-from .validators import validate_positive_int
+from .utils import (
+    AllocationSite,
+    NativeMemory,
+    RUsage,
+    allocation_sites,
+    available_cpus,
+    current_cpu,
+    current_priority,
+    reset_peak_rss,
+    sample_native_memory,
+    sample_rusage,
+)
+from .validators import validate_positive_float, validate_positive_int
 
 if TYPE_CHECKING:
     from .case import Case
+    from .interleave import InterleavedScheduler
     from .session import Session
 
 
@@ -57,6 +124,424 @@ def _mock_action(**kwargs) -> None:  # pylint: disable=unused-argument
     return None
 
 
+async def _async_mock_action(**kwargs) -> None:  # pylint: disable=unused-argument
+    """A mock coroutine action that does nothing."""
+    return None
+
+
+def _no_input() -> None:
+    """An input factory for the baseline of batched benchmarks. The empty action ignores its input."""
+    return None
+
+
+class _IterationMonitor:
+    """Records what happens in the process while a timed region runs.
+
+    Garbage collections are recorded with a :data:`gc.callbacks` hook, and the operating system
+    resource counters of the process (:func:`~simplebench.utils.sample_rusage`) are read around
+    the region. The CPU time consumed by the process (:func:`time.process_time_ns`) is only
+    accumulated between :meth:`start_cpu` and :meth:`stop_cpu`, which the runner calls right
+    around each call of a generated timer function so that, like the wall clock timer, it
+    leaves out the argument binding and the generation of batched inputs. The CPU the process is running on
+    (:func:`~simplebench.utils.current_cpu`) is read as the region is entered and left to
+    count the CPU migrations observed since the previous region. If enabled, the native memory
+    of the process (:func:`~simplebench.utils.sample_native_memory`) is read first as the
+    region is entered and last as it is left, after resetting its peak resident set size.
+
+    :ivar collections: The number of collections (of any generation) started while active.
+    :vartype collections: int
+    :ivar gc_elapsed_ns: The time spent in those collections, in nanoseconds.
+    :vartype gc_elapsed_ns: int
+    :ivar cpu_elapsed_ns: The CPU time (user and system) consumed by the process between
+        :meth:`start_cpu` and :meth:`stop_cpu` while active, in nanoseconds.
+    :vartype cpu_elapsed_ns: int
+    :ivar rusage: The resource counters for the region (all zeros if the platform does not
+        provide them).
+    :vartype rusage: RUsage
+    :ivar cpu_migrations: The number of times the process was seen on a different CPU than
+        before, from the end of the previous region to the end of this one. This is a lower
+        bound: migrations to and back from another CPU in between are not seen.
+    :vartype cpu_migrations: int
+    :ivar native_memory: The native memory changes for the region (all zeros if not enabled or
+        the platform does not provide them).
+    :vartype native_memory: NativeMemory
+    """
+    __slots__ = ('collections', 'gc_elapsed_ns', 'cpu_elapsed_ns', 'rusage', 'cpu_migrations', 'native_memory',
+                 '_started_ns', '_cpu_started_ns', '_rusage_started', '_last_cpu', '_sample_native_memory',
+                 '_native_memory_started')
+
+    def __init__(self, native_memory: bool = False) -> None:
+        self.collections: int = 0
+        self.gc_elapsed_ns: int = 0
+        self.cpu_elapsed_ns: int = 0
+        self._started_ns: int | None = None
+        self._cpu_started_ns: int = 0
+        self.rusage: RUsage = RUsage()
+        self._rusage_started: RUsage | None = None
+        self.cpu_migrations: int = 0
+        self._last_cpu: int | None = None
+        self.native_memory: NativeMemory = NativeMemory()
+        self._sample_native_memory: bool = native_memory
+        self._native_memory_started: NativeMemory | None = None
+
+    def _callback(self, phase: str, info: dict[str, int]) -> None:  # pylint: disable=unused-argument
+        """The :data:`gc.callbacks` hook. It is called at the start and stop of every collection."""
+        if phase == 'start':
+            self.collections += 1
+            self._started_ns = time.perf_counter_ns()
+        elif self._started_ns is not None:
+            self.gc_elapsed_ns += time.perf_counter_ns() - self._started_ns
+            self._started_ns = None
+
+    def __enter__(self) -> _IterationMonitor:
+        self.native_memory = NativeMemory()
+        if self._sample_native_memory:
+            reset_peak_rss()
+            self._native_memory_started = sample_native_memory()
+        self.collections = 0
+        self.gc_elapsed_ns = 0
+        self.cpu_elapsed_ns = 0
+        self._started_ns = None
+        self.rusage = RUsage()
+        self.cpu_migrations = 0
+        self._observe_cpu()
+        gc.callbacks.append(self._callback)
+        self._rusage_started = sample_rusage()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        rusage_stopped = sample_rusage()
+        if rusage_stopped is not None and self._rusage_started is not None:
+            self.rusage = rusage_stopped.since(self._rusage_started)
+        gc.callbacks.remove(self._callback)
+        self._observe_cpu()
+        if self._sample_native_memory:
+            native_memory_stopped = sample_native_memory()
+            if native_memory_stopped is not None and self._native_memory_started is not None:
+                self.native_memory = native_memory_stopped.since(self._native_memory_started)
+
+    def start_cpu(self) -> None:
+        """Start accumulating the CPU time consumed by the process."""
+        self._cpu_started_ns = time.process_time_ns()
+
+    def stop_cpu(self) -> None:
+        """Stop accumulating the CPU time consumed by the process."""
+        self.cpu_elapsed_ns += time.process_time_ns() - self._cpu_started_ns
+
+    def _observe_cpu(self) -> None:
+        """Read the CPU the process is running on and count a migration if it changed."""
+        cpu = current_cpu()
+        if cpu is not None and self._last_cpu is not None and cpu != self._last_cpu:
+            self.cpu_migrations += 1
+        self._last_cpu = cpu
+
+
+class _ThreadWorkers:
+    """Worker threads that run the timed rounds of an iteration concurrently.
+
+    The workers are started once and then released together at the start of every
+    iteration by a :class:`threading.Barrier`. Each worker runs all the rounds of the
+    iteration with the runner's generated timer functions, and records its own elapsed
+    time, the timer readings around it and the CPU time its thread consumed
+    (:func:`time.thread_time_ns`). A thread that got less CPU time than elapsed time
+    spent the difference waiting, on the GIL, a lock or the operating system scheduler.
+
+    :ivar threads: The number of worker threads.
+    :vartype threads: int
+    :ivar elapsed: The elapsed time of each worker's rounds in the last iteration, in timer units.
+    :vartype elapsed: list[float]
+    :ivar thread_cpu_ns: The CPU time each worker's thread consumed in the last iteration, in nanoseconds.
+    :vartype thread_cpu_ns: list[int]
+    :ivar latencies: The per-call latency seen by each worker in each tallied iteration, in seconds.
+    :vartype latencies: list[float]
+    :ivar elapsed_total: The elapsed time of all the workers in the tallied iterations, in seconds.
+    :vartype elapsed_total: float
+    :ivar thread_cpu_total_ns: The CPU time of all the workers in the tallied iterations, in nanoseconds.
+    :vartype thread_cpu_total_ns: int
+    """
+    __slots__ = ('threads', 'elapsed', 'thread_cpu_ns', 'latencies', 'elapsed_total', 'thread_cpu_total_ns',
+                 '_time_rounds', '_job', '_spans', '_errors', '_start', '_done', '_stopping', '_workers')
+
+    def __init__(self, threads: int, time_rounds: Callable[..., float]) -> None:
+        self.threads: int = threads
+        self.elapsed: list[float] = [0.0] * threads
+        self.thread_cpu_ns: list[int] = [0] * threads
+        self.latencies: list[float] = []
+        self.elapsed_total: float = 0.0
+        self.thread_cpu_total_ns: int = 0
+        self._time_rounds: Callable[..., float] = time_rounds
+        self._job: dict[str, Any] = {}
+        self._spans: list[tuple[float, float]] = [(0.0, 0.0)] * threads
+        self._errors: list[BaseException | None] = [None] * threads
+        self._start = threading.Barrier(threads + 1)
+        self._done = threading.Barrier(threads + 1)
+        self._stopping: bool = False
+        self._workers: list[threading.Thread] = [
+            threading.Thread(target=self._work, args=(index,), name=f'simplebench-worker-{index}', daemon=True)
+            for index in range(threads)]
+        for worker in self._workers:
+            worker.start()
+
+    def _work(self, index: int) -> None:
+        """The loop of one worker thread: run the rounds of each iteration as it is released."""
+        while True:
+            self._start.wait()
+            if self._stopping:
+                return
+            self._errors[index] = None
+            try:
+                timer = self._job['timer']
+                cpu_started = time.thread_time_ns()
+                started = float(timer())
+                self.elapsed[index] = self._time_rounds(**self._job)
+                self._spans[index] = (started, float(timer()))
+                self.thread_cpu_ns[index] = time.thread_time_ns() - cpu_started
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                self._errors[index] = e
+            self._done.wait()
+
+    def time_rounds(self, **job: Any) -> float:
+        """Run the rounds of one iteration in all the workers at once.
+
+        :param job: The keyword arguments of :meth:`SimpleRunner._time_rounds`.
+        :return: The elapsed time from the first worker starting to the last one finishing, in timer units.
+        :raises BaseException: The first exception raised by a worker, if any.
+        """
+        self._job = job
+        self._start.wait()
+        self._done.wait()
+        for error in self._errors:
+            if error is not None:
+                raise error
+        return max(stopped for _, stopped in self._spans) - min(started for started, _ in self._spans)
+
+    def tally(self, rounds: int) -> None:
+        """Add the last iteration to the totals of the measured iterations.
+
+        :param rounds: The number of rounds each worker ran in the iteration.
+        """
+        self.latencies.extend(elapsed * DEFAULT_INTERVAL_SCALE / rounds for elapsed in self.elapsed)
+        self.elapsed_total += sum(self.elapsed) * DEFAULT_INTERVAL_SCALE
+        self.thread_cpu_total_ns += sum(self.thread_cpu_ns)
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        self._stopping = True
+        self._start.wait()
+        for worker in self._workers:
+            worker.join()
+
+
+def _gil_enabled() -> bool:
+    """Return whether the global interpreter lock is enabled.
+
+    On free-threaded builds of Python (3.13+) the GIL can be disabled, letting threads run
+    Python code in parallel. Earlier versions always have it enabled.
+
+    :return: True if the GIL is enabled.
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _gc_time_fraction(iterations: IterationTable) -> float:
+    """Return the share of the timed time of the iterations that was spent in garbage collections.
+
+    :param iterations: The measured iterations.
+    :return: The fraction of the total elapsed time spent collecting, or 0.0 if nothing was timed.
+    """
+    timed = sum((iterations.column('elapsed') * iterations.column('scale')).tolist())
+    if timed <= 0.0:
+        return 0.0
+    return min(sum(iterations.column('gc_elapsed').tolist()) / timed, 1.0)
+
+
+def _memory_measured_on(memory_strategy: MemoryStrategy, memory_samples: int, iteration_pass: int) -> bool:
+    """Return whether the memory strategy measures memory after an iteration.
+
+    :param memory_strategy: The memory strategy of the case.
+    :param memory_samples: The N of :attr:`MemoryStrategy.EVERY_NTH`.
+    :param iteration_pass: The pass number of the iteration (zero or less for warmup iterations).
+    :return: True if memory is measured after the iteration.
+    """
+    if memory_strategy == MemoryStrategy.EVERY_ITERATION:
+        return True
+    return (memory_strategy == MemoryStrategy.EVERY_NTH
+            and iteration_pass >= 1 and (iteration_pass - 1) % memory_samples == 0)
+
+
+def _auto_warmup_done(warmup_table: IterationTable, now: float, warmup_stop_at: float) -> bool | None:
+    """Return whether automatic warmup is done after a warmup iteration.
+
+    :param warmup_table: The warmup iterations so far.
+    :param now: The current timer value.
+    :param warmup_stop_at: The timer value at which automatic warmup gives up.
+    :return: True if the recent iteration times have reached a steady state, False if the
+        warmup time is used up without one, or None to keep warming up.
+    """
+    recent = warmup_table.column('elapsed')[-2 * DEFAULT_WARMUP_WINDOW:].tolist()
+    if steady_state_start(recent) is not None:
+        return True
+    if now >= warmup_stop_at:
+        return False
+    return None
+
+
+def _stop_criterion_completion(*,
+                               wall_time: float,
+                               time_start: float,
+                               min_stop_at: float,
+                               target_precision: float | None,
+                               precision: float) -> float:
+    """Return how far a benchmark is towards meeting its time or precision stopping criterion.
+
+    :param wall_time: The current timer reading.
+    :param time_start: The timer reading when the benchmark started.
+    :param min_stop_at: The timer reading at which the min_time criterion is met.
+    :param target_precision: The target relative precision, or None for the min_time criterion.
+    :param precision: The relative precision reached so far.
+    :return: The completed fraction, which may exceed 1.0 for the min_time criterion.
+    """
+    if target_precision is None:
+        return (wall_time - time_start) / (min_stop_at - time_start)
+    return min(1.0, target_precision / precision) if precision else 1.0
+
+
+def _baseline_action(action: Callable[..., Any], *, is_async: bool) -> Callable[..., Any]:
+    """Return an empty action with the same parameters as ``action``.
+
+    Parameter names and kinds are copied from the action's signature (annotations are dropped
+    and defaults replaced by None), so :func:`bind_arguments` chooses the same binding strategy
+    and the call sequence costs the same as for the action itself. If the signature cannot be
+    inspected, the empty action accepts any arguments.
+
+    The generated functions are cached in the module ``simplebench._timers``.
+
+    :param action: The benchmark action.
+    :param is_async: Whether to return a coroutine function.
+    :return: The empty action.
+    """
+    try:
+        signature = inspect.signature(action)
+        parameters = str(signature.replace(
+            parameters=[parameter.replace(
+                annotation=inspect.Parameter.empty,
+                default=inspect.Parameter.empty if parameter.default is inspect.Parameter.empty else None)
+                for parameter in signature.parameters.values()],
+            return_annotation=inspect.Signature.empty))
+    except (TypeError, ValueError):
+        parameters = '(*args, **kwargs)'
+    function_code = f'{"async def" if is_async else "def"} _baseline_action{parameters}:\n    return None'
+    baseline_actions: dict[str, Callable[..., Any]] = _timers_module.__dict__.setdefault('_baseline_actions', {})
+    if function_code not in baseline_actions:
+        namespace: dict[str, Any] = {}
+        exec(function_code, namespace)  # pylint: disable=exec-used
+        baseline_actions[function_code] = namespace['_baseline_action']
+    return baseline_actions[function_code]
+
+
+def _timer_function_code(timer_name: str,
+                         rounds: int,
+                         *,
+                         batched: bool,
+                         binding: BindingStrategy,
+                         arity: int,
+                         is_async: bool) -> str:
+    """Return the source code of a generated, unrolled timer function.
+
+    The function calls (or awaits) the action ``rounds`` times between two timer calls.
+    Its third parameter holds the arguments for the action in the form required by the
+    binding strategy: a kwargs dict for :attr:`BindingStrategy.KEYWORDS`, a tuple of
+    ``arity`` positional arguments for :attr:`BindingStrategy.POSITIONAL` (unpacked into
+    locals before the timer starts), or an ignored value for :attr:`BindingStrategy.NO_ARGS`.
+    A batched function takes a fourth ``inputs`` parameter with one pre-generated input per round.
+
+    :param timer_name: The name of the generated function.
+    :param rounds: The number of unrolled calls of the action.
+    :param batched: Whether each call gets its own pre-generated input as first argument.
+    :param binding: How the arguments are passed to the action.
+    :param arity: The number of positional arguments (for :attr:`BindingStrategy.POSITIONAL`).
+    :param is_async: Whether to generate a coroutine function that awaits the action.
+    :return: The source code of the timer function.
+    """
+    arguments_param = 'args: tuple[Any, ...]' if binding == BindingStrategy.POSITIONAL else 'kwargs: dict[str, Any]'
+    inputs_param = ', inputs: Sequence[Any]' if batched else ''
+    lines: list[str] = [
+        f'{"async def" if is_async else "def"} {timer_name}(timer: Callable[[], float | int], '
+        f'action: Callable[..., Any], {arguments_param}{inputs_param}) -> float:']
+    if batched:
+        lines.append(f'    ({"".join(f"input_{i}, " for i in range(rounds))}) = inputs')
+    call_args: list[str] = []
+    if binding == BindingStrategy.POSITIONAL:
+        lines.append(f'    ({"".join(f"arg_{i}, " for i in range(arity))}) = args')
+        call_args = [f'arg_{i}' for i in range(arity)]
+    elif binding == BindingStrategy.KEYWORDS:
+        call_args = ['**kwargs']
+    await_prefix = 'await ' if is_async else ''
+    lines.append('    start = timer()')
+    for i in range(rounds):
+        lines.append(f'    {await_prefix}action({", ".join(([f"input_{i}"] if batched else []) + call_args)})')
+    lines.append('    end = timer()')
+    lines.append('    return float(end - start)')
+    return '\n'.join(lines)
+
+
+def _timer_function_name(prefix: str, rounds: int, *, batched: bool, binding: BindingStrategy, arity: int) -> str:
+    """Return the name of a generated timer function.
+
+    :param prefix: The runner specific name prefix (e.g. ``'_simplerunner'``).
+    :param rounds: The number of unrolled calls of the action.
+    :param batched: Whether each call gets its own pre-generated input.
+    :param binding: How the arguments are passed to the action.
+    :param arity: The number of positional arguments (for :attr:`BindingStrategy.POSITIONAL`).
+    :return: The function name.
+    """
+    binding_part = {BindingStrategy.KEYWORDS: '',
+                    BindingStrategy.NO_ARGS: 'noargs_',
+                    BindingStrategy.POSITIONAL: f'positional{arity}_'}[binding]
+    return f'{prefix}_{"batched_" if batched else ""}{binding_part}timer_function_{rounds}'
+
+
+def bind_arguments(action: Callable[..., Any],
+                   kwargs: dict[str, Any],
+                   *,
+                   batched: bool = False) -> tuple[BindingStrategy, dict[str, Any] | tuple[Any, ...]]:
+    """Choose the cheapest way to pass ``kwargs`` to ``action`` from the action's signature.
+
+    Without arguments the action is called directly (:attr:`BindingStrategy.NO_ARGS`). If the
+    keyword arguments are exactly the leading positional parameters of the action (after the
+    batched input, if any) and any remaining positional parameters have defaults, they are
+    passed positionally (:attr:`BindingStrategy.POSITIONAL`). Otherwise, or if the signature
+    cannot be inspected, they are passed as ``**kwargs`` (:attr:`BindingStrategy.KEYWORDS`).
+
+    :param action: The benchmark action.
+    :param kwargs: The keyword arguments for the action.
+    :param batched: Whether the action also receives a batched input as its first argument.
+    :return: The binding strategy and the arguments in the form it requires (the kwargs dict
+        or a tuple of positional arguments).
+    """
+    if not kwargs:
+        return BindingStrategy.NO_ARGS, kwargs
+    try:
+        parameters = list(inspect.signature(action).parameters.values())
+    except (TypeError, ValueError):
+        return BindingStrategy.KEYWORDS, kwargs
+    positional = [parameter for parameter in parameters
+                  if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                        inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    if batched:
+        if not positional:
+            return BindingStrategy.KEYWORDS, kwargs
+        positional = positional[1:]
+    leading, remaining = positional[:len(kwargs)], positional[len(kwargs):]
+    if (len(leading) == len(kwargs)
+            and all(parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+                    and parameter.name in kwargs for parameter in leading)
+            and all(parameter.default is not inspect.Parameter.empty for parameter in remaining)):
+        return BindingStrategy.POSITIONAL, tuple(kwargs[parameter.name] for parameter in leading)
+    return BindingStrategy.KEYWORDS, kwargs
+
+
 class SimpleRunner:
     """A class to run benchmarks for various actions.
 
@@ -79,6 +564,9 @@ class SimpleRunner:
     :ivar run: The function to use to run the benchmark.
     :vartype run: Callable[..., Any]
     """
+    _mock_action = staticmethod(_mock_action)
+    """A do-nothing action used to measure the memory overhead of calling the action."""
+
     def __init__(self,
                  *,
                  case: Case,
@@ -107,6 +595,34 @@ class SimpleRunner:
         """
         self.session: Session | None = session
         """The session in which the benchmark is run."""
+        self._interleave: tuple[InterleavedScheduler, int] | None = None
+        """The scheduler and participant number the runner takes turns with, or None if not interleaved."""
+
+    def interleave(self, scheduler: InterleavedScheduler, participant: int) -> None:
+        """Take turns with other runners through ``scheduler`` (see :mod:`simplebench.interleave`).
+
+        The runner must be called from the thread of ``participant`` while it holds the turn.
+        It then yields the turn after every iteration, and neither the time spent waiting for the
+        turn to come back nor the other runners' iterations count towards the case's ``min_time``
+        and ``max_time``. The case's timeout is multiplied by the number of participants.
+
+        :param scheduler: The scheduler handing out the turns.
+        :param participant: The runner's participant number in the scheduler.
+        """
+        self._interleave = (scheduler, participant)
+
+    def _yield_turn(self, timer: Callable[[], int | float]) -> float:
+        """Hand the turn to the next interleaved runner and wait for it to come back.
+
+        :param timer: The timer used to measure the wait.
+        :return: The time spent waiting, in timer units (0.0 if the runner is not interleaved).
+        """
+        if self._interleave is None:
+            return 0.0
+        scheduler, participant = self._interleave
+        started = float(timer())
+        scheduler.yield_turn(participant)
+        return float(timer()) - started
 
     def run(self,
             *,
@@ -114,7 +630,9 @@ class SimpleRunner:
             action: Callable[..., Any],
             setup: Optional[Callable[..., Any]] = None,
             teardown: Optional[Callable[..., Any]] = None,
-            kwargs: Optional[dict[str, Any]] = None) -> Results:
+            kwargs: Optional[dict[str, Any]] = None,
+            input_factory: Optional[Callable[[], Any]] = None,
+            threads: int = 1) -> Results:
         """Enforce a timeout while running the benchmark with the specified runner.
 
         This method wraps the benchmark execution in a :class:`~.simplebench.timeout.Timeout`
@@ -140,8 +658,24 @@ class SimpleRunner:
         :param setup: A setup function to run before each iteration.
         :param teardown: A teardown function to run after each iteration.
         :param kwargs: Keyword arguments to pass to the function being benchmarked.
+        :param input_factory: A function returning a fresh input for a single call of the action
+            (batched mode). If given, the action is called as ``action(input, **kwargs)`` with a
+            new input for every round. The inputs for each batch of rounds are generated before
+            the batch is timed, so the factory's cost is excluded from the timing. Use this to
+            benchmark actions that mutate their input. It is only passed on to the runner
+            function if not None. Defaults to None.
+        :param threads: The number of threads calling the action concurrently (thread scaling mode).
+
+            If greater than 1, every iteration releases ``threads`` worker threads at once, each
+            running all the rounds of the iteration. The OPS section then reports the aggregate
+            throughput of all threads and the TIMING section the distribution of the per-call
+            latency seen by each thread. Sweep the thread count with a kwargs variation to see
+            how the action scales. It is only passed on to the runner function if not 1 and
+            cannot be combined with ``input_factory``. Defaults to 1.
         :return: The results of the benchmark.
         :rtype: Results
+        :raises SimpleBenchTypeError: If ``input_factory`` is not callable or ``threads`` is not an int.
+        :raises SimpleBenchValueError: If ``threads`` is less than 1, or greater than 1 with an ``input_factory``.
         :raises SimpleBenchTimeoutError: If the benchmark exceeds the specified timeout for the case.
         """
         # The Timeout class acts similarly to a context manager, but here we use it
@@ -156,6 +690,25 @@ class SimpleRunner:
                                     repr(action)))
         benchmark_id = self.case.benchmark_id
         timeout_interval = self.case.timeout
+        if self._interleave is not None:
+            timeout_interval *= self._interleave[0].participants
+        runner_kwargs: dict[str, Any] = {}
+        if input_factory is not None:
+            if not callable(input_factory):
+                raise SimpleBenchTypeError(
+                    f'input_factory must be callable - cannot be a {type(input_factory)}',
+                    tag=_RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_INPUT_FACTORY)
+            runner_kwargs['input_factory'] = input_factory
+        threads = validate_positive_int(
+            threads, 'threads',
+            _RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_THREADS_TYPE,
+            _RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_THREADS_VALUE)
+        if threads > 1:
+            if input_factory is not None:
+                raise SimpleBenchValueError(
+                    'input_factory cannot be combined with more than one thread',
+                    tag=_RunnersErrorTag.SIMPLERUNNER_RUN_THREADS_WITH_INPUT_FACTORY)
+            runner_kwargs['threads'] = threads
         try:
             result = Timeout(timeout_interval).run(
                 self._runner,
@@ -163,7 +716,8 @@ class SimpleRunner:
                 action=action,
                 setup=setup,
                 teardown=teardown,
-                kwargs=kwargs)
+                kwargs=kwargs,
+                **runner_kwargs)
         except SimpleBenchTimeoutError as e:
             raise SimpleBenchTimeoutError(
                 f'Benchmark "{benchmark_id}" timed out after {timeout_interval} seconds without a result',
@@ -171,8 +725,11 @@ class SimpleRunner:
                 func_name=func_name) from e
         return result
 
-    def _timer_function(self, rounds: int) -> Callable[
-            [Callable[[], int | float], Callable[..., Any], dict[str, Any]], float]:
+    def _timer_function(self,
+                        rounds: int,
+                        batched: bool = False,
+                        binding: BindingStrategy = BindingStrategy.KEYWORDS,
+                        arity: int = 0) -> Callable[..., float]:
         """Return a timer function for the benchmark.
 
         The generated function will call the action `rounds` times and return the total time taken.
@@ -188,6 +745,14 @@ class SimpleRunner:
                     action: Callable[..., Any],
                     kwargs: dict[str, Any]) -> float:
 
+        If ``batched`` is True, the generated function takes an additional ``inputs`` sequence
+        of ``rounds`` pre-generated inputs, unpacks it into local variables before starting
+        the timer, and calls ``action(input_{i}, **kwargs)`` with a different input each round.
+
+        The ``binding`` strategy (see :func:`bind_arguments`) replaces ``**kwargs`` by no
+        arguments at all, or by ``arity`` positional arguments that are passed in as a tuple
+        in place of ``kwargs`` and unpacked into local variables before starting the timer.
+
         It is created in the module ``simplebench._timers`` to avoid polluting the global namespace.
 
         By creating a new dedicated function for each needed rounds value, we avoid the overhead
@@ -196,8 +761,15 @@ class SimpleRunner:
 
         :param rounds: The number of test rounds that will be run by the action on each iteration. Must be >= 1.
         :type rounds: int
+        :param batched: Whether to generate a timer function that passes a pre-generated input
+            to each call of the action.
+        :type batched: bool
+        :param binding: How the arguments are passed to the action.
+        :type binding: BindingStrategy
+        :param arity: The number of positional arguments (for :attr:`BindingStrategy.POSITIONAL`).
+        :type arity: int
         :return: A function that returns the elapsed time for the benchmark as a float.
-        :rtype: Callable[[Callable[[], int | float], Callable[..., Any], dict[str, Any]], float]
+        :rtype: Callable[..., float]
         """
         rounds = validate_positive_int(
             rounds, 'rounds',
@@ -209,19 +781,221 @@ class SimpleRunner:
         # in the timing function.
         # The function is created as a string and then compiled to avoid the overhead
         # of a loop in Python during the actual timing benchmark.
-        timer_name = f'_simplerunner_timer_function_{rounds}'
+        timer_name = _timer_function_name('_simplerunner', rounds, batched=batched, binding=binding, arity=arity)
         if not hasattr(_timers_module, timer_name):
-            time_function_lines: list[str] = []
-            time_function_lines.append(f'def {timer_name}(timer: Callable[[], float | int], action: Callable[..., Any], kwargs: dict[str, Any]) -> float:')  # pylint: disable=line-too-long  # noqa: E501
-            time_function_lines.append('    start = timer()')
-            time_function_lines.extend(['    action(**kwargs)'] * rounds)
-            time_function_lines.append('    end = timer()')
-            time_function_lines.append('    return float(end - start)')
-            time_function_code = '\n'.join(time_function_lines)
+            time_function_code = _timer_function_code(
+                timer_name, rounds, batched=batched, binding=binding, arity=arity, is_async=False)
             exec(time_function_code, _timers_module.__dict__)  # pylint: disable=exec-used
 
         return getattr(_timers_module, timer_name)
 
+    def _measure_memory(
+            self,
+            *,
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            collect: bool,
+            input_factory: Optional[Callable[[], Any]] = None) -> tuple[int, int]:
+        """Measure the memory allocated by a single untimed call of the action.
+
+        We use the tracemalloc module to measure memory allocations during the action.
+        We start and stop tracemalloc around the action to capture only the memory
+        allocations made during the action. It is run separately from the timing to
+        avoid it affecting the timing measurements.
+
+        :param action: The action to measure.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the call.
+        :param teardown: A teardown function to run after the call.
+        :param collect: Whether to force a garbage collection before measuring to reduce
+            noise from uncollected garbage.
+        :param input_factory: A function returning the input for the call (batched mode).
+            The input is generated before memory tracing starts.
+        :return: The change in traced memory and in peak traced memory, in bytes.
+        """
+        if callable(setup):
+            setup()
+        if input_factory is not None:
+            action = functools.partial(action, input_factory())
+        if collect:
+            gc.collect()
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_memory_current, start_memory_peak = tracemalloc.get_traced_memory()
+        self._invoke(action, kwargs)
+        end_memory_current, end_memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if callable(teardown):
+            teardown()
+        return end_memory_current - start_memory_current, end_memory_peak - start_memory_peak
+
+    def _measure_allocation_sites(
+            self,
+            *,
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            limit: int,
+            frames: int,
+            input_factory: Optional[Callable[[], Any]] = None) -> tuple[AllocationSite, ...]:
+        """Attribute the memory allocated by a single untimed call of the action to its sites.
+
+        Like :meth:`_measure_memory`, the call is made with tracemalloc running, here recording
+        ``frames`` frames per allocation, and snapshots taken before and after it are diffed.
+        Allocations made by the runner itself are left out.
+
+        :param action: The action to measure.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the call.
+        :param teardown: A teardown function to run after the call.
+        :param limit: The maximum number of sites returned.
+        :param frames: The number of frames recorded per allocation.
+        :param input_factory: A function returning the input for the call (batched mode).
+            The input is generated before memory tracing starts.
+        :return: The sites that allocated the most memory still held after the call, largest first.
+        """
+        if callable(setup):
+            setup()
+        if input_factory is not None:
+            action = functools.partial(action, input_factory())
+        gc.collect()
+        tracemalloc.start(frames)
+        try:
+            before = tracemalloc.take_snapshot()
+            self._invoke(action, kwargs)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        if callable(teardown):
+            teardown()
+        return allocation_sites(before, after, limit, ignored=(__file__,))
+
+    def _invoke(self, action: Callable[..., Any], kwargs: dict[str, Any]) -> None:
+        """Call the action once outside of the timed region (used for memory measurements).
+
+        :param action: The action to call.
+        :param kwargs: Keyword arguments to pass to the action.
+        """
+        action(**kwargs)
+
+    def _empty_action(self, action: Callable[..., Any]) -> Callable[..., Any]:
+        """Return an empty action with the same parameters as the action, used to measure the baseline.
+
+        :param action: The benchmark action.
+        :return: The empty action.
+        """
+        return _baseline_action(action, is_async=False)
+
+    def _measure_baseline(
+            self,
+            *,
+            n: int | float,
+            rounds: int,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            input_factory: Optional[Callable[[], Any]]) -> float:
+        """Measure the per-round time of calling an empty action with the same signature and binding.
+
+        This is the constant cost of the generated call sequence and timer reads included in every
+        per-round timing of the action. It is timed with the same rounds and timer as the action.
+
+        :param n: The **O()** 'n' weight of the benchmark.
+        :param rounds: The number of rounds per iteration.
+        :param timer: The timer function to use for timing.
+        :param action: The benchmark action.
+        :param kwargs: Keyword arguments for the action.
+        :param input_factory: The input factory of a batched benchmark, or None.
+        :return: The median per-round time of the empty action, in the same unit as
+            :attr:`Iteration.per_round_elapsed <simplebench.iteration.Iteration.per_round_elapsed>`.
+        """
+        empty_action = self._empty_action(action)
+        baseline_input_factory = None if input_factory is None else _no_input
+        return statistics.median(
+            Iteration(n=n, rounds=rounds, elapsed=self._time_rounds(
+                rounds=rounds, timer=timer, action=empty_action, kwargs=kwargs,
+                input_factory=baseline_input_factory)).per_round_elapsed
+            for _ in range(DEFAULT_BASELINE_ITERATIONS))
+
+    def _sample_call_latencies(
+            self,
+            *,
+            samples: int,
+            sample_rate: float,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]] = None) -> array:
+        """Time single calls of the action into a preallocated buffer.
+
+        Every call is timed on its own by a generated single round timer function. With a
+        ``sample_rate`` below 1.0, a geometrically distributed number of untimed calls (made in
+        a plain loop by the same timer function, their time discarded) precedes each timed call,
+        so each call is timed with probability ``sample_rate``. The setup, teardown and garbage
+        collector policy are applied around the whole sampling run as for one iteration.
+
+        :param samples: The number of calls to time.
+        :param sample_rate: The fraction of calls that are timed.
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the sampling run.
+        :param teardown: A teardown function to run after the sampling run.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
+        :return: The elapsed time of each timed call, in timer units.
+        """
+        batched = input_factory is not None
+        binding, arguments = bind_arguments(action, kwargs, batched=batched)
+        arity = len(arguments) if binding == BindingStrategy.POSITIONAL else 0
+        timer_function = self._timer_function(1, batched=batched, binding=binding, arity=arity)
+        buffer = array('q', [0]) * samples
+        rng = random.Random()
+        log_skip = math.log1p(-sample_rate) if sample_rate < 1.0 else 0.0
+        time_call: Callable[[], float] = (
+            functools.partial(timer_function, timer, action, arguments) if input_factory is None
+            else lambda: timer_function(timer, action, arguments, [input_factory()]))
+        if callable(setup):
+            setup()
+        gc_policy: GCPolicy = self.case.gc_policy
+        if gc_policy == GCPolicy.COLLECT_BEFORE_ITERATION:
+            gc.collect()
+        gc_was_enabled: bool = gc.isenabled()
+        if gc_policy == GCPolicy.DISABLE_DURING_TIMING:
+            gc.disable()
+        try:
+            for index in range(samples):
+                if log_skip:
+                    # a plain loop, as unrolling each random skip count would compile a new timer function
+                    for _ in range(int(math.log(1.0 - rng.random()) / log_skip)):
+                        time_call()
+                buffer[index] = round(time_call())
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if callable(teardown):
+            teardown()
+        return buffer
+
+    def _benchmark_timer(self) -> Callable[[], int | float]:
+        """Return the timer to use for the benchmark.
+
+        The timer from the case takes priority, then the timer from the session, then
+        :data:`~simplebench.defaults.DEFAULT_TIMER`.
+
+        :return: The timer function.
+        """
+        if self.case.timer is not None:
+            return self.case.timer
+        if self.session is not None and self.session.timer is not None:
+            return self.session.timer
+        return DEFAULT_TIMER
+
     @property
     def variation_marks(self) -> dict[str, Any]:
         """Return the variation marks for the benchmark.
@@ -237,6 +1011,55 @@ class SimpleRunner:
         """
         return {key: self.kwargs.get(key, None) for key in self.case.variation_cols.keys()}
 
+    def _time_rounds(
+            self,
+            *,
+            rounds: int,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            input_factory: Optional[Callable[[], Any]] = None,
+            monitor: Optional[_IterationMonitor] = None) -> float:
+        """Time the given number of rounds of the benchmark action using generated timer functions.
+
+        For 1000 or more rounds, the timing is broken into chunks of 1000 rounds (a "kiloround")
+        to reduce the footprint of the generated timer functions and avoid hitting Python's
+        function size limits. Breaking into chunks of 1000 also reduces the overhead of the
+        loop in the timing function to a negligible level.
+
+        In batched mode the inputs for each chunk are generated by ``input_factory`` before
+        the chunk is timed. The arguments are passed using the cheapest binding strategy
+        for the action's signature (see :func:`bind_arguments`).
+
+        :param rounds: The number of rounds to time.
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param input_factory: A function returning a fresh input for each call of the action, or None.
+        :param monitor: A monitor accumulating the CPU time of each timed chunk, or None.
+        :return: The total elapsed time for the rounds.
+        """
+        batched = input_factory is not None
+        binding, arguments = bind_arguments(action, kwargs, batched=batched)
+        arity = len(arguments) if binding == BindingStrategy.POSITIONAL else 0
+        elapsed = 0.0
+        kiloround_chunks, remaining_rounds = divmod(rounds, 1000)
+        chunks = [1000] * kiloround_chunks + ([remaining_rounds] if remaining_rounds else [])
+        for chunk in chunks:
+            timer_function = self._timer_function(chunk, batched=batched, binding=binding, arity=arity)
+            if input_factory is None:
+                if monitor is not None:
+                    monitor.start_cpu()
+                elapsed += timer_function(timer, action, arguments)
+            else:
+                inputs = [input_factory() for _ in range(chunk)]
+                if monitor is not None:
+                    monitor.start_cpu()
+                elapsed += timer_function(timer, action, arguments, inputs)
+            if monitor is not None:
+                monitor.stop_cpu()
+        return elapsed
+
     def _run_timed_iteration(
             self,
             *,
@@ -245,47 +1068,413 @@ class SimpleRunner:
             action: Callable[..., Any],
             kwargs: dict[str, Any],
             setup: Optional[Callable[..., Any]],
-            teardown: Optional[Callable[..., Any]]) -> float:
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]] = None,
+            monitor: Optional[_IterationMonitor] = None,
+            workers: Optional[_ThreadWorkers] = None) -> float:
         """Run a single timed iteration of the benchmark action for a given number of rounds.
         This method uses an unrolled loop to call the action the specified number of rounds,
         minimizing the overhead of loop control in Python.
 
+        The garbage collector is handled according to the case's
+        :attr:`~.case.Case.gc_policy` after the setup function has run.
+
         :param rounds: The number of test rounds that will be run by the action for the iteration.
         :param timer: The timer function to use for timing.
         :param action: The action to benchmark.
         :param kwargs: Keyword arguments to pass to the action.
         :param setup: A setup function to run before the iteration.
         :param teardown: A teardown function to run after the iteration.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
+        :param monitor: A monitor recording the garbage collections and CPU time of the timed region,
+            or None.
+        :param workers: Worker threads that each run all the rounds concurrently, or None to
+            run the rounds in the calling thread.
         :return: The elapsed time for the iteration in seconds.
         """
-        kiloround_timer = self._timer_function(1000)
-
-        if rounds < 1000:
-            # for less than 1000 rounds, we can use the generated timer function directly
-            if callable(setup):
-                setup()
-            elapsed = self._timer_function(rounds)(timer, action, kwargs)
-            if callable(teardown):
-                teardown()
-        else:
-            # for 1000 or more rounds, we break the timing into chunks of 1000 rounds (a "kiloround")
-            # to reduce the footprint of the generated timer functions and avoid hitting
-            # Python's function size limits. Breaking into chunks of 1000 also
-            # reduces the overhead of the loop in the timing function to a negligible level.
-            elapsed = 0.0
-            kiloround_chunks, remaining_rounds = divmod(rounds, 1000)
-            if callable(setup):
-                setup()
-            while kiloround_chunks:
-                elapsed += kiloround_timer(timer, action, kwargs)
-                kiloround_chunks -= 1
-            if remaining_rounds:
-                partial_timer = self._timer_function(remaining_rounds)
-                elapsed += partial_timer(timer, action, kwargs)
-            if callable(teardown):
-                teardown()
+        time_rounds = self._time_rounds if workers is None else workers.time_rounds
+        if callable(setup):
+            setup()
+        gc_policy: GCPolicy = self.case.gc_policy
+        if gc_policy == GCPolicy.COLLECT_BEFORE_ITERATION:
+            gc.collect()
+        gc_was_enabled: bool = gc.isenabled()
+        if gc_policy == GCPolicy.DISABLE_DURING_TIMING:
+            gc.disable()
+        try:
+            if monitor is None:
+                elapsed = time_rounds(
+                    rounds=rounds, timer=timer, action=action, kwargs=kwargs, input_factory=input_factory)
+            elif workers is None:
+                with monitor:
+                    elapsed = self._time_rounds(rounds=rounds, timer=timer, action=action, kwargs=kwargs,
+                                                input_factory=input_factory, monitor=monitor)
+            else:
+                # The CPU time of all the worker threads is read around the whole concurrent run.
+                with monitor:
+                    monitor.start_cpu()
+                    elapsed = workers.time_rounds(
+                        rounds=rounds, timer=timer, action=action, kwargs=kwargs, input_factory=input_factory)
+                    monitor.stop_cpu()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if callable(teardown):
+            teardown()
         return elapsed
 
+    def _memory_overhead(self, kwargs: dict[str, Any]) -> tuple[int, int]:
+        """Measure the memory allocated by invoking a mock action with the benchmark's keyword arguments.
+
+        This is the overhead included in every memory measurement of the action. We force a
+        garbage collection before measuring to reduce noise from uncollected garbage.
+
+        :param kwargs: Keyword arguments for the action.
+        :return: The memory and peak memory overheads, in bytes.
+        """
+        gc.collect()
+        tracemalloc.start()
+        start_memory_current, start_memory_peak = tracemalloc.get_traced_memory()
+        self._invoke(self._mock_action, kwargs)
+        end_memory_current, end_memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return end_memory_current - start_memory_current, end_memory_peak - start_memory_peak
+
+    def _measure_latency(
+            self,
+            *,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]]) -> tuple[LatencyHistogram | None, dict[str, Any]]:
+        """Measure the per-call latencies of the action, corrected for the cost of reading the timer.
+
+        The calls are sampled as configured by the case's :attr:`~.case.Case.latency_samples`
+        and :attr:`~.case.Case.latency_sample_rate` (see :meth:`_sample_call_latencies`).
+
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the sampling run.
+        :param teardown: A teardown function to run after the sampling run.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
+        :return: The histogram of the latencies and the ``extra_info`` entries describing them,
+            or None and no entries if the case does not sample latencies.
+        """
+        latency_samples: int | None = self.case.latency_samples
+        if latency_samples is None:
+            return None, {}
+        timer_overhead: float = timer_overhead_ns(timer)
+        timer_precision: float = timer_precision_ns(timer)
+        call_elapsed = self._sample_call_latencies(
+            samples=latency_samples, sample_rate=self.case.latency_sample_rate, timer=timer,
+            action=action, kwargs=kwargs, setup=setup, teardown=teardown, input_factory=input_factory)
+        latency = LatencyHistogram()
+        latency.record_values(np.maximum(np.frombuffer(call_elapsed, dtype=np.int64) - timer_overhead, 0.0))
+        tail_latencies = {f'{percentile:g}': latency.value_at_percentile(percentile)
+                          for percentile in DEFAULT_TAIL_PERCENTILES}
+        return latency, {
+            'latency_samples': latency_samples,
+            'latency_sample_rate': self.case.latency_sample_rate,
+            'timer_overhead_ns': timer_overhead,
+            'timer_precision_ns': timer_precision,
+            'tail_latencies': {label: value * DEFAULT_INTERVAL_SCALE for label, value in tail_latencies.items()},
+            'quantized_tail_latencies': [label for label, value in tail_latencies.items()
+                                         if value < DEFAULT_QUANTIZATION_RATIO * timer_precision],
+        }
+
+    def _thread_scaling_info(
+            self,
+            *,
+            n: int | float,
+            rounds: int,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            workers: _ThreadWorkers | None,
+            iteration_table: IterationTable) -> dict[str, Any]:
+        """Return the ``extra_info`` entries describing how the throughput scaled with the threads.
+
+        The scaling reference is the throughput of the same rounds run in a single thread.
+        Runs without worker threads, or without measured iterations, have no entries.
+
+        :param n: The **O()** 'n' weight of the benchmark.
+        :param rounds: The number of rounds per iteration.
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before each reference iteration.
+        :param teardown: A teardown function to run after each reference iteration.
+        :param workers: The worker threads, with the measured iterations tallied, or None.
+        :param iteration_table: The measured iterations.
+        :return: The thread scaling entries.
+        """
+        if workers is None or not iteration_table:
+            return {}
+        single_thread_ops: float = statistics.median(
+            Iteration(n=n, rounds=rounds, elapsed=self._run_timed_iteration(
+                rounds=rounds, timer=timer, action=action, kwargs=kwargs, setup=setup,
+                teardown=teardown)).ops_per_second
+            for _ in range(DEFAULT_SCALING_REFERENCE_ITERATIONS))
+        aggregate_ops: float = statistics.median(iteration_table.section(Section.OPS).tolist())
+        return {
+            'threads': workers.threads,
+            'single_thread_ops_per_second': single_thread_ops,
+            'scaling_efficiency': (
+                aggregate_ops / (workers.threads * single_thread_ops) if single_thread_ops > 0.0 else None),
+            'thread_cpu_fraction': (workers.thread_cpu_total_ns * 1e-9 / workers.elapsed_total
+                                    if workers.elapsed_total > 0.0 else None),
+            'gil_enabled': _gil_enabled(),
+        }
+
+    def _extra_info(
+            self,
+            *,
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            input_factory: Optional[Callable[[], Any]],
+            elapsed_data: list[float],
+            baseline_per_round: float,
+            iteration_table: IterationTable,
+            warmup_table: IterationTable,
+            cpu_migrations: int,
+            steady_state: bool | None,
+            first_call_elapsed: float | None) -> dict[str, Any]:
+        """Return the ``extra_info`` entries describing how the benchmark was run.
+
+        The tracked median precision is only re-evaluated as the sample grows, so the
+        reported precision is always computed over all of the iterations.
+
+        :param action: The benchmark action.
+        :param kwargs: Keyword arguments for the action.
+        :param input_factory: The input factory of a batched benchmark, or None.
+        :param elapsed_data: The elapsed times of the measured iterations.
+        :param baseline_per_round: The per-round time of the empty action (see :meth:`_measure_baseline`).
+        :param iteration_table: The measured iterations.
+        :param warmup_table: The warmup iterations.
+        :param cpu_migrations: The CPU migrations seen during the measured iterations.
+        :param steady_state: Whether automatic warmup reached a steady state, or None with a fixed warmup.
+        :param first_call_elapsed: The time of the first call of the action in seconds, or None.
+        :return: The run entries.
+        """
+        precision: float = math.inf
+        if elapsed_data:
+            precision = relative_ci_half_width(
+                elapsed_data, statistic=self.case.precision_statistic, confidence_level=self.case.confidence_level)
+        extra_info: dict[str, Any] = {
+            'precision': None if math.isinf(precision) else precision,
+            'precision_statistic': self.case.precision_statistic.value,
+            'confidence_level': self.case.confidence_level,
+            'binding_strategy': bind_arguments(action, kwargs, batched=input_factory is not None)[0].value,
+            'baseline_per_round': baseline_per_round,
+            'baseline_subtracted': self.case.subtract_baseline,
+            'gc_policy': self.case.gc_policy.value,
+            'gc_time_fraction': _gc_time_fraction(iteration_table),
+            'cpu_affinity': available_cpus(),
+            'priority': current_priority(),
+            'cpu_migrations': cpu_migrations,
+            'warmup_strategy': self.case.warmup_strategy.value,
+            'warmup_iterations': len(warmup_table),
+            'steady_state': steady_state,
+            'first_call_elapsed': first_call_elapsed,
+            'interleaved': self._interleave is not None,
+        }
+        if self.case.target_precision is not None:
+            extra_info['target_precision'] = self.case.target_precision
+        return extra_info
+
+    def _memory_usage(
+            self,
+            *,
+            rounds: int,
+            memory_data: list[int],
+            peak_memory_data: list[int],
+            memory_overhead: int,
+            peak_memory_overhead: int,
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]]) -> tuple[MemoryUsage | None, PeakMemoryUsage | None]:
+        """Return the memory sections built from the memory samples of the case's memory strategy.
+
+        With :attr:`MemoryStrategy.AFTER_TIMING` the samples are taken here, in dedicated calls of
+        the action. Iterations only carry memory data when it was measured on every iteration, so
+        for the other strategies the memory sections are built from the samples actually taken.
+
+        :param rounds: The number of rounds per iteration.
+        :param memory_data: The memory samples taken during the measured iterations.
+        :param peak_memory_data: The peak memory samples taken during the measured iterations.
+        :param memory_overhead: The memory overhead to subtract from each sample (see :meth:`_memory_overhead`).
+        :param peak_memory_overhead: The peak memory overhead to subtract from each sample.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before each sample.
+        :param teardown: A teardown function to run after each sample.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
+        :return: The memory and peak memory sections, or None where the defaults built from
+            the iterations apply or memory was not measured.
+        """
+        memory_strategy: MemoryStrategy = self.case.memory_strategy
+        if memory_strategy in (MemoryStrategy.EVERY_ITERATION, MemoryStrategy.OFF):
+            return None, None
+        if memory_strategy == MemoryStrategy.AFTER_TIMING:
+            for sample in range(self.case.memory_samples):
+                memory, peak_memory = self._measure_memory(
+                    action=action, kwargs=kwargs, setup=setup, teardown=teardown,
+                    collect=sample == 0, input_factory=input_factory)
+                memory_data.append(memory - memory_overhead)
+                peak_memory_data.append(peak_memory - peak_memory_overhead)
+        return (MemoryUsage(rounds=rounds, data=memory_data or [0]),
+                PeakMemoryUsage(rounds=rounds, data=peak_memory_data or [0]))
+
+    def _corrected_timings(
+            self,
+            *,
+            rounds: int,
+            baseline_per_round: float,
+            iteration_table: IterationTable,
+            workers: _ThreadWorkers | None) -> tuple[OperationTimings | None, OperationsPerInterval | None]:
+        """Return the overhead-corrected per-round timings and ops/s.
+
+        A corrected time of zero or less means the action could not be distinguished from the
+        baseline and is reported as zero time and zero ops/s, as for zero elapsed time iterations.
+        With worker threads the per-round timings are the per-call latencies seen by each thread
+        and the ops/s stay the aggregate throughput of the iterations.
+
+        :param rounds: The number of rounds per iteration.
+        :param baseline_per_round: The per-round time of the empty action (see :meth:`_measure_baseline`).
+        :param iteration_table: The measured iterations.
+        :param workers: The worker threads, with the measured iterations tallied, or None.
+        :return: The per-round timings and ops/s, each None where the defaults built from the
+            iterations apply.
+        """
+        if workers is not None and workers.latencies:
+            latencies = workers.latencies
+            if self.case.subtract_baseline:
+                latencies = [max(latency - baseline_per_round, 0.0) for latency in latencies]
+            return OperationTimings(rounds=rounds, data=latencies), None
+        if not (self.case.subtract_baseline and iteration_table):
+            return None, None
+        corrected = [max(per_round_elapsed - baseline_per_round, 0.0)
+                     for per_round_elapsed in iteration_table.section(Section.TIMING).tolist()]
+        return (OperationTimings(rounds=rounds, data=corrected),
+                OperationsPerInterval(rounds=rounds,
+                                      data=[1.0 / timing if timing > 0.0 else 0.0 for timing in corrected]))
+
+    @contextmanager
+    def _thread_workers(self, threads: int) -> Iterator[_ThreadWorkers | None]:
+        """Start the worker threads of thread scaling mode for the duration of a run.
+
+        In thread scaling mode every iteration makes rounds calls in each of the worker
+        threads, and the per-call latency seen by each thread is kept for the TIMING section.
+
+        :param threads: The number of threads calling the action concurrently.
+        :return: The worker threads, or None for a single thread. They are closed on exit.
+        """
+        if threads == 1:
+            yield None
+            return
+        workers = _ThreadWorkers(threads, self._time_rounds)
+        try:
+            yield workers
+        finally:
+            workers.close()
+
+    def _first_call_elapsed(
+            self,
+            *,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]]) -> float | None:
+        """Time the first call of the action on its own with automatic warmup.
+
+        The call is timed before calibration and warmup have exercised the action, so that
+        its cold-path latency is recorded as the start of the warmup curve rather than lost.
+        It costs an extra call of the action with its setup and teardown, so it is skipped
+        with a fixed warmup.
+
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the call.
+        :param teardown: A teardown function to run after the call.
+        :param input_factory: A function returning a fresh input for the call (batched mode), or None.
+        :return: The elapsed time of the call in seconds, or None with a fixed warmup.
+        """
+        if self.case.warmup_strategy != WarmupStrategy.AUTO:
+            return None
+        return self._run_timed_iteration(
+            rounds=1, timer=timer, action=action, kwargs=kwargs, setup=setup, teardown=teardown,
+            input_factory=input_factory) * DEFAULT_INTERVAL_SCALE
+
+    def _rounds(
+            self,
+            *,
+            timer: Callable[[], int | float],
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]]) -> int:
+        """Return the rounds per iteration: the case's rounds, or else calibrated rounds.
+
+        :param timer: The timer function to use for timing.
+        :param action: The action to benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before each calibration iteration.
+        :param teardown: A teardown function to run after each calibration iteration.
+        :param input_factory: A function returning a fresh input for each call (batched mode), or None.
+        :return: The number of rounds.
+        """
+        if self.case.rounds is not None:
+            return self.case.rounds
+        return self._cached_calibrate_rounds(
+            timer=timer, kwargs=kwargs, setup=setup, teardown=teardown, action=action, input_factory=input_factory)
+
+    def _iteration_memory(
+            self,
+            *,
+            iteration_pass: int,
+            memory_overhead: int,
+            peak_memory_overhead: int,
+            action: Callable[..., Any],
+            kwargs: dict[str, Any],
+            setup: Optional[Callable[..., Any]],
+            teardown: Optional[Callable[..., Any]],
+            input_factory: Optional[Callable[[], Any]]) -> tuple[int, int] | None:
+        """Measure the memory usage of an iteration selected by the case's memory strategy.
+
+        The memory is measured in a separate untimed call of the action (see :meth:`_measure_memory`).
+
+        :param iteration_pass: The iteration number (warmup iterations are 0 or less).
+        :param memory_overhead: The memory overhead of the measurement, subtracted from the memory.
+        :param peak_memory_overhead: The peak memory overhead of the measurement, subtracted from the peak memory.
+        :param action: The action to measure.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before the call.
+        :param teardown: A teardown function to run after the call.
+        :param input_factory: A function returning the input for the call (batched mode), or None.
+        :return: The memory and peak memory of the call, or None if the iteration is not measured.
+        """
+        if not _memory_measured_on(self.case.memory_strategy, self.case.memory_samples, iteration_pass):
+            return None
+        # Only collect garbage before the first measured iteration
+        memory, peak_memory = self._measure_memory(
+            action=action, kwargs=kwargs, setup=setup, teardown=teardown,
+            collect=iteration_pass <= 1, input_factory=input_factory)
+        return memory - memory_overhead, peak_memory - peak_memory_overhead
+
     def default_runner(
             self,
             *,
@@ -293,7 +1482,9 @@ class SimpleRunner:
             action: Callable[..., Any],
             setup: Optional[Callable[..., Any]] = None,
             teardown: Optional[Callable[..., Any]] = None,
-            kwargs: Optional[dict[str, Any]] = None) -> Results:
+            kwargs: Optional[dict[str, Any]] = None,
+            input_factory: Optional[Callable[[], Any]] = None,
+            threads: int = 1) -> Results:
         """Run a generic benchmark using the specified action and test case.
 
         :param n: The **O()** 'n' weight of the benchmark. This is used to calculate
@@ -307,6 +1498,9 @@ class SimpleRunner:
         :param setup: A setup function to run before each iteration.
         :param teardown: A teardown function to run after each iteration.
         :param kwargs: Keyword arguments to pass to the action.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode). See :meth:`run`.
+        :param threads: The number of threads calling the action concurrently. See :meth:`run`.
         :return: The results of the benchmark.
         :rtype: Results
         """
@@ -320,48 +1514,34 @@ class SimpleRunner:
         max_time: float = self.case.max_time
         iterations: int = self.case.iterations
 
-        # Prioritize the timer from the case, then from the session, then use the default timer
-        timer = DEFAULT_TIMER
-        if self.case.timer is not None:
-            timer = self.case.timer
-        elif self.session is not None and self.session.timer is not None:
-            timer = self.session.timer
+        timer = self._benchmark_timer()
+        memory_overhead, peak_memory_overhead = self._memory_overhead(kwargs)
 
-        # We force a garbage collection before measuring memory usage to reduce noise
-        # from uncollected garbage. It is run separately from the timing to avoid
-        # it affecting the timing measurements.
-        gc.collect()
-        tracemalloc.start()
-        start_memory_current, start_memory_peak = tracemalloc.get_traced_memory()
-        _mock_action(**kwargs)
-        end_memory_current, end_memory_peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        memory_overhead: int = end_memory_current - start_memory_current
-        peak_memory_overhead: int = end_memory_peak - start_memory_peak
-
-        # warmup iterations are not included in the final stats
+        # warmup iterations are not included in the final stats, but are kept as the warmup curve.
         # We start the count from -warmup_iterations to ensure we do the correct number of warmup
-        # iterations even if warmup_iterations is 0.
-        iteration_pass: int = -self.case.warmup_iterations
+        # iterations even if warmup_iterations is 0. With automatic warmup the count starts from
+        # the maximum and is cut short once the iteration times reach a steady state.
+        auto_warmup: bool = self.case.warmup_strategy == WarmupStrategy.AUTO
+        iteration_pass: int = -(DEFAULT_MAX_WARMUP_ITERATIONS if auto_warmup else self.case.warmup_iterations)
         time_start: float = float(timer())
         max_stop_at: float = float(max_time / DEFAULT_INTERVAL_SCALE) + time_start
         min_stop_at: float = float(min_time / DEFAULT_INTERVAL_SCALE) + time_start
         wall_time: float = float(timer())
         iterations_min: int = max(MIN_MEASURED_ITERATIONS, iterations)
 
-        rounds: int
-        if self.case.rounds is None:
-            rounds = self.calibrate_rounds(
-                timer=timer,
-                kwargs=kwargs,
-                setup=setup,
-                teardown=teardown,
-                action=action)
-        else:
-            rounds = self.case.rounds
+        first_call_elapsed: float | None = self._first_call_elapsed(
+            timer=timer, action=action, kwargs=kwargs, setup=setup, teardown=teardown, input_factory=input_factory)
+        rounds: int = self._rounds(
+            timer=timer, action=action, kwargs=kwargs, setup=setup, teardown=teardown, input_factory=input_factory)
+
+        baseline_per_round: float = self._measure_baseline(
+            n=n, rounds=rounds, timer=timer, action=action, kwargs=kwargs, input_factory=input_factory)
 
         gc.collect()
 
+        # Automatic warmup may use up to half of the time remaining after calibration.
+        warmup_stop_at: float = (float(timer()) + max_stop_at) / 2.0
+
         progress_max: float = 100.0
         progress_tracker = ProgressTracker(
             session=self.session,
@@ -371,64 +1551,128 @@ class SimpleRunner:
             color=Color.GREEN)
 
         total_elapsed: float = 0.0
-        iterations_list: list[Iteration] = []
-
-        while ((iteration_pass <= iterations_min or wall_time < min_stop_at)
-                and wall_time < max_stop_at):
-            iteration_pass += 1
-            # Time the action
-            elapsed = self._run_timed_iteration(
-                rounds=rounds,
-                timer=timer,
-                action=action,
-                kwargs=kwargs,
-                setup=setup,
-                teardown=teardown)
-
-            # Measure memory usage of the action
-            # We force a garbage collection before measuring memory usage to reduce noise
-            # from uncollected garbage. It is run separately from the timing to avoid
-            # it affecting the timing measurements.
-            #
-            # We use the tracemalloc module to measure memory allocations during the action.
-            # We start and stop tracemalloc around the action to capture only the memory
-            # allocations made during the action.
-            if callable(setup):
-                setup()
-
-            if iteration_pass <= 1:
-                gc.collect()  # Only collect garbage before the first measured iteration
-            tracemalloc.start()
-            tracemalloc.reset_peak()
-            start_memory_current, start_memory_peak = tracemalloc.get_traced_memory()
-            action(**kwargs)
-            end_memory_current, end_memory_peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            if callable(teardown):
-                teardown()
-
-            if iteration_pass < 1:
-                # Warmup iterations not included in final stats
-                continue
-
-            memory = end_memory_current - start_memory_current - memory_overhead
-            peak_memory = end_memory_peak - start_memory_peak - peak_memory_overhead
-            iteration_result = Iteration(
-                n=n, rounds=rounds, elapsed=elapsed, memory=memory, peak_memory=peak_memory)
-            iterations_list.append(iteration_result)
-            total_elapsed += iteration_result.elapsed
-            wall_time = float(timer())
-
-            # Update progress display if showing progress
-            iteration_completion: float = progress_max * iteration_pass / iterations_min
-            wall_time_elapsed_seconds: float = (wall_time - time_start) * DEFAULT_INTERVAL_SCALE
-            time_completion: float = progress_max * (wall_time - time_start) / (min_stop_at - time_start)
-            progress_current = int(min(iteration_completion, time_completion))
-            progress_tracker.update(
-                completed=progress_current,
-                description=(
-                    f'Benchmarking {group} (iteration {iteration_pass:6d}; '
-                    f'time {wall_time_elapsed_seconds:<3.2f}s)'))
+        # Iterations are recorded straight into columnar tables; the measurements are valid
+        # by construction, so the unvalidated append_values path is used.
+        iteration_table: IterationTable = IterationTable()
+        warmup_table: IterationTable = IterationTable()
+        steady_state: bool | None = False if auto_warmup else None
+        memory_strategy: MemoryStrategy = self.case.memory_strategy
+        memory_data: list[int] = []
+        peak_memory_data: list[int] = []
+
+        # With a target precision, the min_time criterion is replaced by a precision
+        # criterion: stop once the confidence interval of the per-round time is tight enough.
+        target_precision: float | None = self.case.target_precision
+        precision: float = math.inf
+        elapsed_data: list[float] = []
+        precision_tracker = PrecisionTracker(
+            statistic=self.case.precision_statistic, confidence_level=self.case.confidence_level)
+        cpu_migrations: int = 0
+
+        monitor = _IterationMonitor(native_memory=self.case.native_memory)
+        with self._thread_workers(threads) as workers:
+            while ((iteration_pass <= iterations_min
+                    or (wall_time < min_stop_at if target_precision is None else precision > target_precision))
+                    and wall_time < max_stop_at):
+                # Interleaved runners take turns between iterations. Time spent waiting for the
+                # turn is not counted against this runner's time limits.
+                waited: float = self._yield_turn(timer)
+                time_start += waited
+                min_stop_at += waited
+                max_stop_at += waited
+                warmup_stop_at += waited
+
+                iteration_pass += 1
+                # Time the action
+                elapsed = self._run_timed_iteration(
+                    rounds=rounds,
+                    timer=timer,
+                    action=action,
+                    kwargs=kwargs,
+                    setup=setup,
+                    teardown=teardown,
+                    input_factory=input_factory,
+                    monitor=monitor,
+                    workers=workers)
+                gc_collections: int = monitor.collections
+                gc_elapsed: float = monitor.gc_elapsed_ns * 1e-9
+                cpu_elapsed: float = monitor.cpu_elapsed_ns * 1e-9
+                rusage: RUsage = monitor.rusage
+                native_memory: NativeMemory = monitor.native_memory
+
+                measured_memory: tuple[int, int] | None = self._iteration_memory(
+                    iteration_pass=iteration_pass, memory_overhead=memory_overhead,
+                    peak_memory_overhead=peak_memory_overhead, action=action, kwargs=kwargs, setup=setup,
+                    teardown=teardown, input_factory=input_factory)
+                memory, peak_memory = measured_memory if measured_memory is not None else (0, 0)
+
+                # Warmup iterations are not included in the final stats
+                table: IterationTable = iteration_table if iteration_pass >= 1 else warmup_table
+                table.append_values(
+                    n=n, rounds=rounds * threads, elapsed=elapsed, memory=memory, peak_memory=peak_memory,
+                    gc_collections=gc_collections, gc_elapsed=gc_elapsed, cpu_elapsed=cpu_elapsed,
+                    rusage=rusage, native_memory=native_memory)
+
+                if iteration_pass < 1:
+                    warmup_done: bool | None = (
+                        _auto_warmup_done(warmup_table, float(timer()), warmup_stop_at)
+                        if auto_warmup and iteration_pass < 0 else None)
+                    if warmup_done is not None:
+                        steady_state = warmup_done
+                        iteration_pass = 0
+                    continue
+
+                if measured_memory is not None:
+                    memory_data.append(memory)
+                    peak_memory_data.append(peak_memory)
+                cpu_migrations += monitor.cpu_migrations
+                if workers is not None:
+                    workers.tally(rounds)
+                total_elapsed += elapsed
+                wall_time = float(timer())
+
+                # All iterations use the same rounds, so the relative precision of the
+                # elapsed times is the relative precision of the per-round times.
+                elapsed_data.append(elapsed)
+                precision = precision_tracker.add(elapsed) if target_precision is not None else precision
+
+                # Update progress display if showing progress
+                wall_time_elapsed_seconds: float = (wall_time - time_start) * DEFAULT_INTERVAL_SCALE
+                completion: float = min(
+                    iteration_pass / iterations_min,
+                    _stop_criterion_completion(wall_time=wall_time, time_start=time_start, min_stop_at=min_stop_at,
+                                               target_precision=target_precision, precision=precision))
+                progress_tracker.update(
+                    completed=int(progress_max * completion),
+                    description=(
+                        f'Benchmarking {group} (iteration {iteration_pass:6d}; '
+                        f'time {wall_time_elapsed_seconds:<3.2f}s)'))
+
+        memory_stats, peak_memory_stats = self._memory_usage(
+            rounds=rounds, memory_data=memory_data, peak_memory_data=peak_memory_data,
+            memory_overhead=memory_overhead, peak_memory_overhead=peak_memory_overhead,
+            action=action, kwargs=kwargs, setup=setup, teardown=teardown, input_factory=input_factory)
+
+        sites: tuple[AllocationSite, ...] | None = None
+        if self.case.allocation_sites is not None:
+            sites = self._measure_allocation_sites(
+                action=action, kwargs=kwargs, setup=setup, teardown=teardown, limit=self.case.allocation_sites,
+                frames=self.case.allocation_frames, input_factory=input_factory)
+
+        latency, latency_info = self._measure_latency(
+            timer=timer, action=action, kwargs=kwargs, setup=setup, teardown=teardown, input_factory=input_factory)
+
+        extra_info: dict[str, Any] = self._extra_info(
+            action=action, kwargs=kwargs, input_factory=input_factory, elapsed_data=elapsed_data,
+            baseline_per_round=baseline_per_round, iteration_table=iteration_table, warmup_table=warmup_table,
+            cpu_migrations=cpu_migrations, steady_state=steady_state, first_call_elapsed=first_call_elapsed)
+        extra_info.update(latency_info)
+        extra_info.update(self._thread_scaling_info(
+            n=n, rounds=rounds, timer=timer, action=action, kwargs=kwargs, setup=setup, teardown=teardown,
+            workers=workers, iteration_table=iteration_table))
+
+        per_round_timings, ops_per_second = self._corrected_timings(
+            rounds=rounds, baseline_per_round=baseline_per_round, iteration_table=iteration_table, workers=workers)
 
         benchmark_results = Results(
             group=group,
@@ -437,19 +1681,29 @@ class SimpleRunner:
             variation_marks=self.variation_marks,
             n=n,
             rounds=rounds,
-            iterations=iterations_list,
+            iterations=iteration_table,
             total_elapsed=total_elapsed,
-            extra_info={})
+            memory=memory_stats,
+            peak_memory=peak_memory_stats,
+            per_round_timings=per_round_timings,
+            ops_per_second=ops_per_second,
+            warmup_timings=(OperationTimings(rounds=rounds, iterations=warmup_table)
+                            if warmup_table else None),
+            latency=latency,
+            allocation_sites=sites,
+            extra_info=extra_info,
+            memory_measured=memory_strategy != MemoryStrategy.OFF)
         progress_tracker.stop()
 
         return benchmark_results
 
     def calibrate_rounds(self, *,
-                         timer: Callable[[], int],
+                         timer: Callable[[], int | float],
                          kwargs: dict[str, Any],
                          setup: Optional[Callable[..., Any]] = None,
                          teardown: Optional[Callable[..., Any]] = None,
-                         action: Callable[..., Any]) -> int:
+                         action: Callable[..., Any],
+                         input_factory: Optional[Callable[[], Any]] = None) -> int:
         """Auto-calibrate the number of rounds for the benchmark.
 
         This method estimates an appropriate number of rounds to use for the benchmark
@@ -460,11 +1714,20 @@ class SimpleRunner:
         for the action is significantly larger than the timer precision and overhead,
         to reduce the impact of timer quantization errors on the measurement.
 
+        The rounds are capped so that an iteration, including its untimed work such as
+        generating the inputs of a batched benchmark, takes at most
+        :data:`~.defaults.DEFAULT_MAX_ITERATION_TIME_FRACTION` of the case's
+        :attr:`~.case.Case.max_time`. An action whose inputs are expensive to generate
+        then gets fewer rounds than the timer precision calls for, rather than iterations
+        too long for the benchmark to finish in time.
+
         :param timer: The timer function to use for the benchmark.
         :param kwargs: Keyword arguments to pass to the action.
         :param setup: A setup function to run before each iteration.
         :param teardown: A teardown function to run after each iteration.
         :param action: The action to benchmark.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
         :return: The calibrated number of rounds for the benchmark.
         """
         if not is_valid_timer(timer):
@@ -491,6 +1754,10 @@ class SimpleRunner:
             raise SimpleBenchTypeError(
                 'Invalid teardown function provided for rounds calibration; must be callable',
                 tag=_RunnersErrorTag.SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_TEARDOWN)
+        if input_factory is not None and not callable(input_factory):
+            raise SimpleBenchTypeError(
+                'Invalid input_factory function provided for rounds calibration; must be callable',
+                tag=_RunnersErrorTag.SIMPLERUNNER_CALIBRATE_ROUNDS_INVALID_INPUT_FACTORY)
 
         timer_overhead: float = timer_overhead_ns(timer)
         timer_precision: float = timer_precision_ns(timer)
@@ -499,27 +1766,18 @@ class SimpleRunner:
         multiplier: float = math.pow(10, DEFAULT_SIGNIFICANT_FIGURES)
         noise_floor_ns = timer_precision + timer_overhead
         target_time_ns = multiplier * noise_floor_ns
+        max_iteration_time_ns = self.case.max_time * DEFAULT_MAX_ITERATION_TIME_FRACTION / DEFAULT_INTERVAL_SCALE
 
         if callable(setup):
             setup()
 
-        kiloround_timer = self._timer_function(1000)
         estimate_rounds: int = 1
         while True:  # Loop until we find an adequate rounds estimate
-            # Use kiloround chunking to avoid generating excessively large timer functions
-            total_action_time_ns: float
-            if estimate_rounds < 1000:
-                estimate_timer = self._timer_function(estimate_rounds)
-                total_action_time_ns = estimate_timer(timer, action, kwargs)
-            else:
-                total_action_time_ns = 0.0
-                kiloround_chunks, remaining_rounds = divmod(estimate_rounds, 1000)
-                while kiloround_chunks:
-                    total_action_time_ns += kiloround_timer(timer, action, kwargs)
-                    kiloround_chunks -= 1
-                if remaining_rounds:
-                    partial_timer = self._timer_function(remaining_rounds)
-                    total_action_time_ns += partial_timer(timer, action, kwargs)
+            iteration_started_ns = float(timer())
+            total_action_time_ns: float = self._time_rounds(
+                rounds=estimate_rounds, timer=timer, action=action, kwargs=kwargs,
+                input_factory=input_factory)
+            iteration_time_ns = float(timer()) - iteration_started_ns
 
             # Subtract the overhead of one timer call (start/end) to get the true action time.
             total_measured_time_ns = total_action_time_ns - timer_overhead
@@ -528,16 +1786,631 @@ class SimpleRunner:
             if total_measured_time_ns >= target_time_ns:
                 break
 
+            # The most rounds an iteration can run within its time budget, untimed work included.
+            max_rounds = (int(max_iteration_time_ns * estimate_rounds / iteration_time_ns)
+                          if iteration_time_ns > 0 else estimate_rounds * 10)
+            if estimate_rounds >= max_rounds:
+                break
+
             if total_action_time_ns <= 0:
-                estimate_rounds *= 10
+                estimate_rounds = min(estimate_rounds * 10, max_rounds)
                 continue
 
             # Calculate the average time to estimate the next number of rounds.
             avg_action_time_ns = total_action_time_ns / estimate_rounds
             required_rounds = target_time_ns / avg_action_time_ns
-            estimate_rounds = int(max(required_rounds, estimate_rounds * 10))
+            estimate_rounds = min(int(max(required_rounds, estimate_rounds * 10)), max_rounds)
 
         if callable(teardown):
             teardown()
 
         return estimate_rounds
+
+    def _cached_calibrate_rounds(self, *,
+                                 timer: Callable[[], int | float],
+                                 kwargs: dict[str, Any],
+                                 setup: Optional[Callable[..., Any]] = None,
+                                 teardown: Optional[Callable[..., Any]] = None,
+                                 action: Callable[..., Any],
+                                 input_factory: Optional[Callable[[], Any]] = None) -> int:
+        """Calibrate the number of rounds, reusing the session's calibration cache if possible.
+
+        If the session has a :attr:`~.session.Session.calibration_cache` holding an entry for
+        this benchmark variation, timer and machine, the cached rounds are verified by timing
+        :data:`~.defaults.DEFAULT_CALIBRATION_VERIFY_SAMPLES` iterations with them instead of
+        searching from a single round upwards. The cached rounds are used unless the fastest
+        of those iterations shows the per-call time has drifted from the cached one by more
+        than :data:`~.defaults.DEFAULT_CALIBRATION_DRIFT_THRESHOLD` (relative), in which
+        case the rounds are recalibrated with :meth:`calibrate_rounds` and the cache entry
+        is replaced. Cases with transient benchmark ids are always calibrated from scratch.
+
+        :param timer: The timer function to use for the benchmark.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param setup: A setup function to run before each iteration.
+        :param teardown: A teardown function to run after each iteration.
+        :param action: The action to benchmark.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode), or None.
+        :return: The calibrated number of rounds for the benchmark.
+        """
+        cache = self.session.calibration_cache if self.session is not None else None
+        if cache is None or not cache.cacheable(self.case.benchmark_id):
+            return self.calibrate_rounds(
+                timer=timer, kwargs=kwargs, setup=setup, teardown=teardown, action=action,
+                input_factory=input_factory)
+
+        def per_call_time(rounds: int, samples: int) -> float:
+            return min(self._run_timed_iteration(
+                rounds=rounds, timer=timer, action=action, kwargs=kwargs,
+                setup=setup, teardown=teardown, input_factory=input_factory) for _ in range(samples)) / rounds
+
+        key = cache.key(benchmark_id=self.case.benchmark_id,
+                        variation_marks=self.variation_marks,
+                        timer=timer)
+        entry = cache.get(key)
+        if entry is not None:
+            per_call = per_call_time(entry.rounds, DEFAULT_CALIBRATION_VERIFY_SAMPLES)
+            if abs(per_call - entry.per_call_ns) <= DEFAULT_CALIBRATION_DRIFT_THRESHOLD * entry.per_call_ns:
+                return entry.rounds
+
+        rounds = self.calibrate_rounds(
+            timer=timer, kwargs=kwargs, setup=setup, teardown=teardown, action=action,
+            input_factory=input_factory)
+        per_call = per_call_time(rounds, DEFAULT_CALIBRATION_VERIFY_SAMPLES)
+        if per_call > 0:
+            cache.store(key, rounds=rounds, per_call_ns=per_call)
+        return rounds
+
+
+class AsyncRunner(SimpleRunner):
+    """A runner for benchmarking coroutine functions (``async def`` actions).
+
+    The action is awaited by generated, unrolled timer functions that run inside a single
+    event loop which is created when the benchmark starts and closed when it finishes.
+    This avoids measuring event loop creation and teardown as :func:`asyncio.run` based
+    wrappers would.
+
+    Rounds are auto-calibrated in the same way as by :class:`SimpleRunner`. Setup and
+    teardown functions are called synchronously outside of the event loop.
+
+    The :func:`~simplebench.decorators.benchmark` decorator selects this runner
+    automatically when the decorated function is a coroutine function.
+    """
+    _mock_action = staticmethod(_async_mock_action)
+
+    def __init__(self,
+                 *,
+                 case: Case,
+                 kwargs: dict[str, Any],
+                 session: Optional[Session] = None,
+                 runner: Optional[Callable[..., Any]] = None) -> None:
+        super().__init__(case=case, kwargs=kwargs, session=session, runner=runner)
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        """The event loop the action is run in - backing field for the 'event_loop' attribute."""
+
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop used to run the action.
+
+        It is created on first use and closed at the end of :meth:`default_runner`.
+        """
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop
+
+    def _timer_function(self,
+                        rounds: int,
+                        batched: bool = False,
+                        binding: BindingStrategy = BindingStrategy.KEYWORDS,
+                        arity: int = 0) -> Callable[..., float]:
+        """Return a timer function for the benchmark that awaits the action.
+
+        The generated coroutine function awaits the action `rounds` times between two
+        timer calls and returns the total time taken. It is created in the module
+        ``simplebench._timers`` alongside the :class:`SimpleRunner` timer functions
+        and has the following signature:
+
+        .. code-block:: python
+
+            async def _asyncrunner_timer_function_{rounds}(
+                    timer: Callable[[], float | int],
+                    action: Callable[..., Awaitable[Any]],
+                    kwargs: dict[str, Any]) -> float:
+
+        The returned function runs the coroutine to completion in :attr:`event_loop`, so
+        it has the same synchronous signature as the :class:`SimpleRunner` timer functions.
+        Scheduling the coroutine on the event loop happens outside of the timed region.
+
+        If ``batched`` is True, the generated function takes an additional ``inputs`` sequence
+        and awaits ``action(input_{i}, **kwargs)``, and ``binding`` selects how the arguments
+        are passed, as described in :meth:`SimpleRunner._timer_function`.
+
+        :param rounds: The number of test rounds that will be run by the action on each iteration. Must be >= 1.
+        :type rounds: int
+        :param batched: Whether to generate a timer function that passes a pre-generated input
+            to each call of the action.
+        :type batched: bool
+        :param binding: How the arguments are passed to the action.
+        :type binding: BindingStrategy
+        :param arity: The number of positional arguments (for :attr:`BindingStrategy.POSITIONAL`).
+        :type arity: int
+        :return: A function that returns the elapsed time for the benchmark as a float.
+        :rtype: Callable[..., float]
+        """
+        rounds = validate_positive_int(
+            rounds, 'rounds',
+            _RunnersErrorTag.ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_TYPE,
+            _RunnersErrorTag.ASYNCRUNNER_TIMER_FUNCTION_INVALID_ROUNDS_VALUE)
+
+        timer_name = _timer_function_name('_asyncrunner', rounds, batched=batched, binding=binding, arity=arity)
+        if not hasattr(_timers_module, timer_name):
+            time_function_code = _timer_function_code(
+                timer_name, rounds, batched=batched, binding=binding, arity=arity, is_async=True)
+            exec(time_function_code, _timers_module.__dict__)  # pylint: disable=exec-used
+
+        async_timer_function = getattr(_timers_module, timer_name)
+        event_loop = self.event_loop
+
+        def timer_function(timer: Callable[[], int | float],
+                           action: Callable[..., Any],
+                           arguments: Any,
+                           *inputs: Any) -> float:
+            """Run the generated timer coroutine to completion and return its elapsed time."""
+            return event_loop.run_until_complete(async_timer_function(timer, action, arguments, *inputs))
+
+        return timer_function
+
+    def _invoke(self, action: Callable[..., Any], kwargs: dict[str, Any]) -> None:
+        """Await the action once in :attr:`event_loop` outside of the timed region.
+
+        :param action: The coroutine function to await.
+        :param kwargs: Keyword arguments to pass to the action.
+        """
+        self.event_loop.run_until_complete(action(**kwargs))
+
+    def _empty_action(self, action: Callable[..., Any]) -> Callable[..., Any]:
+        """Return an empty coroutine function with the same parameters as the action.
+
+        :param action: The benchmark coroutine function.
+        :return: The empty coroutine function.
+        """
+        return _baseline_action(action, is_async=True)
+
+    def default_runner(
+            self,
+            *,
+            n: int | float,
+            action: Callable[..., Any],
+            setup: Optional[Callable[..., Any]] = None,
+            teardown: Optional[Callable[..., Any]] = None,
+            kwargs: Optional[dict[str, Any]] = None,
+            input_factory: Optional[Callable[[], Any]] = None,
+            threads: int = 1) -> Results:
+        """Run a benchmark of a coroutine function inside a single event loop.
+
+        :param n: The **O()** 'n' weight of the benchmark. See :meth:`SimpleRunner.default_runner`.
+        :param action: The coroutine function to benchmark.
+        :param setup: A setup function to run before each iteration.
+        :param teardown: A teardown function to run after each iteration.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param input_factory: A function returning a fresh input for each call of the action
+            (batched mode). See :meth:`SimpleRunner.run`.
+        :param threads: The number of threads calling the action concurrently. Must be 1: a
+            single event loop cannot be shared between threads.
+        :return: The results of the benchmark.
+        :rtype: Results
+        :raises SimpleBenchTypeError: If the action is not a coroutine function.
+        :raises SimpleBenchValueError: If ``threads`` is not 1.
+        """
+        if not (inspect.iscoroutinefunction(action)
+                or inspect.iscoroutinefunction(getattr(action, '__call__', None))):
+            raise SimpleBenchTypeError(
+                f'AsyncRunner action must be a coroutine function - cannot be {action!r}',
+                tag=_RunnersErrorTag.ASYNCRUNNER_ACTION_NOT_COROUTINE_FUNCTION)
+        if threads != 1:
+            raise SimpleBenchValueError(
+                f'AsyncRunner cannot run a coroutine function in {threads} threads',
+                tag=_RunnersErrorTag.ASYNCRUNNER_THREADS_NOT_SUPPORTED)
+        # Create and spin the event loop once up front so that its one-time allocations
+        # are not counted in the memory overhead baseline or attributed to the action.
+        self._invoke(self._mock_action, {})
+        try:
+            return super().default_runner(
+                n=n, action=action, setup=setup, teardown=teardown, kwargs=kwargs,
+                input_factory=input_factory)
+        finally:
+            if self._event_loop is not None:
+                self._event_loop.close()
+                self._event_loop = None
+
+
+def _wait_until(timer: Callable[[], int | float], deadline: float, spin_threshold: float) -> None:
+    """Sleep, then spin, until the timer reaches the deadline.
+
+    :param timer: The benchmark timer.
+    :param deadline: The timer value to wait for.
+    :param spin_threshold: The time before the deadline spent spinning instead of sleeping, in timer units.
+    """
+    remaining = deadline - float(timer())
+    if remaining > spin_threshold:
+        time.sleep((remaining - spin_threshold) * DEFAULT_INTERVAL_SCALE)
+    while float(timer()) < deadline:
+        pass
+
+
+class _LoadWindows:
+    """The latencies of the measured calls of a load run, recorded a window of calls at a time.
+
+    Latencies are kept in histograms so that memory does not grow with the number of calls.
+    The calls of each window of :data:`~simplebench.defaults.DEFAULT_LOAD_WINDOW_CALLS` calls
+    are buffered and recorded together, and each window becomes one iteration of the results.
+
+    :ivar latency: The latency of every call, from its intended start to its completion.
+    :vartype latency: LatencyHistogram
+    :ivar service: The service time of every call.
+    :vartype service: LatencyHistogram
+    :ivar iterations: One iteration per window.
+    :vartype iterations: list[Iteration]
+    :ivar mean_latencies: The mean latency of each window, in seconds.
+    :vartype mean_latencies: list[float]
+    :ivar calls: The number of measured calls.
+    :vartype calls: int
+    """
+    def __init__(self, n: int | float) -> None:
+        """Create the empty windows of a load run.
+
+        :param n: The **O()** 'n' weight of the iterations.
+        """
+        self._n: int | float = n
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.iterations: list[Iteration] = []
+        self.mean_latencies: list[float] = []
+        self.calls: int = 0
+        self._latencies: list[float] = []
+        self._service_times: list[float] = []
+        self._start: float = 0.0
+
+    def start(self, at: float) -> None:
+        """Start the first window.
+
+        :param at: The start time of the window, in timer units.
+        """
+        self._start = at
+
+    def add(self, latency: float, service_time: float, completed: float) -> bool:
+        """Add a call to the current window, recording the window if it is full.
+
+        :param latency: The latency of the call, in timer units.
+        :param service_time: The service time of the call, in timer units.
+        :param completed: The completion time of the call, in timer units.
+        :return: True if the window was full and has been recorded.
+        """
+        self._latencies.append(latency)
+        self._service_times.append(service_time)
+        self.calls += 1
+        if len(self._latencies) < DEFAULT_LOAD_WINDOW_CALLS:
+            return False
+        self.flush(completed)
+        return True
+
+    def flush(self, completed: float) -> None:
+        """Record the calls of the current window, if any, and start the next one.
+
+        :param completed: The completion time of the last call of the window, in timer units.
+        """
+        if not self._latencies:
+            return
+        self.iterations.append(Iteration(n=self._n, rounds=len(self._latencies), elapsed=completed - self._start))
+        self.mean_latencies.append(statistics.fmean(self._latencies) * DEFAULT_INTERVAL_SCALE)
+        self.latency.record_values(self._latencies)
+        self.service.record_values(self._service_times)
+        self._latencies.clear()
+        self._service_times.clear()
+        self._start = completed
+
+
+class LoadRunner(SimpleRunner):
+    """A runner for open-loop load tests that call the action at a fixed offered rate.
+
+    :class:`SimpleRunner` calls the action back to back (a closed loop), so a slow call
+    delays the calls after it and the time they would have spent queued behind it is never
+    measured (coordinated omission). This runner instead issues the calls on a schedule of
+    ``rate`` calls per second, with constant or Poisson distributed intervals (see
+    :class:`~simplebench.enums.ArrivalProcess`), and measures the latency of every call
+    from its *intended* start time. A call that starts late because the previous calls
+    overran the schedule has the delay counted in its latency.
+
+    The calls are issued from a single thread, so the action is served like a single server
+    queue: below its capacity the latency is close to the service time, above it the calls
+    fall further and further behind the schedule. If the run reaches the case's ``max_time``
+    while behind the schedule, the calls that were due but never issued are recorded with the
+    time they had already waited (a lower bound of their latency) rather than being dropped.
+
+    The warmup calls (the case's ``warmup_iterations``) are issued at the same rate and then
+    the calls are measured for at least the case's ``min_time`` and ``iterations`` calls.
+    The setup function is called once before the warmup and the teardown function once
+    after the last call.
+
+    The latency of every call is recorded in the :attr:`~simplebench.results.Results.latency`
+    histogram (the LATENCY section), whose memory use does not grow with the number of calls.
+    Each iteration of the :class:`~simplebench.results.Results` groups
+    :data:`~simplebench.defaults.DEFAULT_LOAD_WINDOW_CALLS` consecutive calls, so the OPS
+    section is the throughput achieved over the run and the TIMING section holds the mean
+    latency of each group. Sweep the offered rate with a kwargs
+    variation of the case and pass the case results to :func:`saturation_knee` to find the
+    highest rate served without saturating.
+
+    .. code-block:: python
+
+        def handle_requests(_bench: SimpleRunner, **kwargs: Any) -> Results:
+            assert isinstance(_bench, LoadRunner)
+            return _bench.run(n=kwargs['rate'], action=handler, rate=kwargs['rate'])
+
+        case = Case(group='server', title='handler', description='Handler latency under load',
+                    action=handle_requests, runner=LoadRunner,
+                    kwargs_variations={'rate': [100, 1000, 10000]}, variation_cols={'rate': 'Rate'})
+    """
+    def __init__(self,
+                 *,
+                 case: Case,
+                 kwargs: dict[str, Any],
+                 session: Optional[Session] = None,
+                 runner: Optional[Callable[..., Any]] = None) -> None:
+        super().__init__(case=case, kwargs=kwargs, session=session, runner=runner)
+        self._rate: float = 1.0
+        """The offered rate of the current run, in calls per second."""
+        self._arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT
+        """The arrival process of the current run."""
+
+    def run(self,
+            *,
+            n: int | float,
+            action: Callable[..., Any],
+            setup: Optional[Callable[..., Any]] = None,
+            teardown: Optional[Callable[..., Any]] = None,
+            kwargs: Optional[dict[str, Any]] = None,
+            input_factory: Optional[Callable[[], Any]] = None,
+            threads: int = 1,
+            rate: float = DEFAULT_LOAD_RATE,
+            arrival_process: ArrivalProcess = ArrivalProcess.CONSTANT) -> Results:
+        """Run an open-loop load test of the action at the offered rate, enforcing the case's timeout.
+
+        :param n: The **O()** 'n' weight of the benchmark. See :meth:`SimpleRunner.run`.
+        :param action: The function to call.
+        :param setup: A setup function to run once before the calls.
+        :param teardown: A teardown function to run once after the calls.
+        :param kwargs: Keyword arguments to pass to the function being benchmarked.
+        :param input_factory: Not supported by load runs. Must be None.
+        :param threads: Not supported by load runs. Must be 1.
+        :param rate: The offered rate, in calls per second.
+            Defaults to :data:`~simplebench.defaults.DEFAULT_LOAD_RATE`.
+        :param arrival_process: How the intervals between the calls are distributed.
+            Defaults to :attr:`ArrivalProcess.CONSTANT`.
+        :return: The results of the load test.
+        :rtype: Results
+        :raises SimpleBenchTypeError: If ``rate`` is not a number or ``arrival_process`` is not
+            an :class:`~simplebench.enums.ArrivalProcess`.
+        :raises SimpleBenchValueError: If ``rate`` is not positive, or an ``input_factory`` or
+            more than one thread is requested.
+        :raises SimpleBenchTimeoutError: If the load test exceeds the specified timeout for the case.
+        """
+        self._rate = validate_positive_float(
+            rate, 'rate',
+            _RunnersErrorTag.LOADRUNNER_RUN_INVALID_RATE_TYPE,
+            _RunnersErrorTag.LOADRUNNER_RUN_INVALID_RATE_VALUE)
+        if not isinstance(arrival_process, ArrivalProcess):
+            raise SimpleBenchTypeError(
+                f'arrival_process must be an ArrivalProcess - cannot be a {type(arrival_process)}',
+                tag=_RunnersErrorTag.LOADRUNNER_RUN_INVALID_ARRIVAL_PROCESS)
+        self._arrival_process = arrival_process
+        if input_factory is not None or threads != 1:
+            raise SimpleBenchValueError(
+                'LoadRunner issues single calls from one thread - input_factory and threads are not supported',
+                tag=_RunnersErrorTag.LOADRUNNER_RUN_UNSUPPORTED_OPTION)
+        return super().run(n=n, action=action, setup=setup, teardown=teardown, kwargs=kwargs)
+
+    def _next_interval(self, generator: random.Random, interval: float) -> float:
+        """Return the time from one intended call start to the next, in timer units.
+
+        :param generator: The random number generator of the Poisson arrivals.
+        :param interval: The mean interval between the calls, in timer units.
+        :return: The interval to the next call.
+        """
+        if self._arrival_process == ArrivalProcess.POISSON:
+            return generator.expovariate(1.0) * interval
+        return interval
+
+    def _issue_calls(self,
+                     *,
+                     timer: Callable[[], int | float],
+                     call: Callable[..., float],
+                     action: Callable[..., Any],
+                     arguments: Any,
+                     windows: _LoadWindows,
+                     progress_tracker: ProgressTracker) -> tuple[float, float, float, list[float]]:
+        """Issue the warmup and measured calls on the schedule of the offered rate.
+
+        :param timer: The benchmark timer.
+        :param call: The single round timer function returning the service time of a call.
+        :param action: The function to call.
+        :param arguments: The bound arguments of the action.
+        :param windows: Records the latency and service time of the measured calls.
+        :param progress_tracker: The progress tracker of the run.
+        :return: The intended start of the first measured call, the completion time of the last
+            call, the intended start of the next call and the latencies of the calls that were due
+            but never issued, in timer units.
+        """
+        interval: float = 1.0 / self._rate / DEFAULT_INTERVAL_SCALE
+        spin_threshold: float = DEFAULT_LOAD_SPIN_THRESHOLD / DEFAULT_INTERVAL_SCALE
+        generator = random.Random()
+
+        intended: float = float(timer())
+        for _ in range(self.case.warmup_iterations):
+            _wait_until(timer, intended, spin_threshold)
+            call(timer, action, arguments)
+            intended += self._next_interval(generator, interval)
+
+        measure_start: float = intended
+        min_stop_at: float = measure_start + self.case.min_time / DEFAULT_INTERVAL_SCALE
+        max_stop_at: float = measure_start + self.case.max_time / DEFAULT_INTERVAL_SCALE
+        min_calls: int = max(MIN_MEASURED_ITERATIONS, self.case.iterations)
+        completed: float = measure_start
+        windows.start(measure_start)
+        while (intended < min_stop_at or windows.calls < min_calls) and completed < max_stop_at:
+            _wait_until(timer, intended, spin_threshold)
+            service_time = call(timer, action, arguments)
+            completed = float(timer())
+            if windows.add(completed - intended, service_time, completed):
+                progress_tracker.update(
+                    completed=int(100.0 * min(1.0, (completed - measure_start) / (min_stop_at - measure_start))),
+                    description=(f'Load testing {self.case.group} at {self._rate:g} calls/s '
+                                 f'(call {windows.calls:8d})'))
+            intended += self._next_interval(generator, interval)
+
+        # Calls that were due when the run was cut short have already waited this long.
+        omitted_latencies: list[float] = []
+        while intended < min_stop_at and intended <= completed:
+            omitted_latencies.append(completed - intended)
+            intended += self._next_interval(generator, interval)
+        return measure_start, completed, intended, omitted_latencies
+
+    def _load_extra_info(self,
+                         *,
+                         windows: _LoadWindows,
+                         omitted_calls: int,
+                         total_elapsed: float,
+                         offered_span: float,
+                         binding: BindingStrategy) -> dict[str, Any]:
+        """Return the extra info of a load run: the offered and achieved rates and the saturation.
+
+        :param windows: The recorded latencies and service times of the measured calls.
+        :param omitted_calls: The number of calls that were due but never issued.
+        :param total_elapsed: The time from the first measured call to the last completion, in timer units.
+        :param offered_span: The time the offered calls were scheduled over, in timer units.
+        :param binding: The binding strategy of the action's arguments.
+        :return: The extra info.
+        """
+        calls: int = windows.calls
+        offered_rate: float = ((calls + omitted_calls) / (offered_span * DEFAULT_INTERVAL_SCALE)
+                               if offered_span > 0.0 else self._rate)
+        achieved_rate: float = calls / (total_elapsed * DEFAULT_INTERVAL_SCALE) if total_elapsed > 0.0 else 0.0
+        return {
+            'rate': self._rate,
+            'arrival_process': self._arrival_process.value,
+            'offered_rate': offered_rate,
+            'achieved_rate': achieved_rate,
+            'saturated': (omitted_calls > 0
+                          or achieved_rate < offered_rate * (1.0 - DEFAULT_SATURATION_TOLERANCE)),
+            'calls': calls,
+            'omitted_calls': omitted_calls,
+            'warmup_calls': self.case.warmup_iterations,
+            'service_time_median': windows.service.median,
+            'binding_strategy': binding.value,
+            'gc_policy': self.case.gc_policy.value,
+        }
+
+    def default_runner(
+            self,
+            *,
+            n: int | float,
+            action: Callable[..., Any],
+            setup: Optional[Callable[..., Any]] = None,
+            teardown: Optional[Callable[..., Any]] = None,
+            kwargs: Optional[dict[str, Any]] = None,
+            input_factory: Optional[Callable[[], Any]] = None,
+            threads: int = 1) -> Results:
+        """Call the action on the schedule of the offered rate and record the latency of each call.
+
+        :param n: The **O()** 'n' weight of the benchmark. See :meth:`SimpleRunner.default_runner`.
+        :param action: The function to call.
+        :param setup: A setup function to run once before the calls.
+        :param teardown: A teardown function to run once after the calls.
+        :param kwargs: Keyword arguments to pass to the action.
+        :param input_factory: Not supported by load runs. Ignored.
+        :param threads: Not supported by load runs. Ignored.
+        :return: The results of the load test.
+        :rtype: Results
+        """
+        if kwargs is None:
+            kwargs = {}
+        timer = self._benchmark_timer()
+
+        # A single round timer function gives the service time of each call without the
+        # time spent waiting for the schedule.
+        binding, arguments = bind_arguments(action, kwargs)
+        arity = len(arguments) if binding == BindingStrategy.POSITIONAL else 0
+        call = self._timer_function(1, binding=binding, arity=arity)
+
+        progress_tracker = ProgressTracker(
+            session=self.session,
+            task_name='LoadRunner:case_runner',
+            progress_max=100.0,
+            description=f'Load testing {self.case.group} at {self._rate:g} calls/s',
+            color=Color.GREEN)
+
+        if callable(setup):
+            setup()
+        gc.collect()
+        gc_was_enabled: bool = gc.isenabled()
+        if self.case.gc_policy == GCPolicy.DISABLE_DURING_TIMING:
+            gc.disable()
+
+        windows = _LoadWindows(n)
+        try:
+            measure_start, completed, intended, omitted_latencies = self._issue_calls(
+                timer=timer, call=call, action=action, arguments=arguments, windows=windows,
+                progress_tracker=progress_tracker)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            if callable(teardown):
+                teardown()
+
+        windows.flush(completed)
+        windows.latency.record_values(omitted_latencies)
+        total_elapsed: float = completed - measure_start
+        extra_info = self._load_extra_info(
+            windows=windows, omitted_calls=len(omitted_latencies), total_elapsed=total_elapsed,
+            offered_span=intended - measure_start, binding=binding)
+
+        benchmark_results = Results(
+            group=self.case.group,
+            title=self.case.title,
+            description=self.case.description,
+            variation_marks=self.variation_marks,
+            n=n,
+            rounds=1,
+            iterations=windows.iterations,
+            total_elapsed=total_elapsed,
+            per_round_timings=OperationTimings(rounds=1, data=windows.mean_latencies),
+            latency=windows.latency,
+            extra_info=extra_info,
+            memory_measured=False)
+        progress_tracker.stop()
+
+        return benchmark_results
+
+
+def saturation_knee(results: Iterable[Results]) -> Results | None:
+    """Return the result of the highest offered rate a load test sustained before saturating.
+
+    The results of :class:`LoadRunner` runs (typically the results of a case sweeping the rate
+    with a kwargs variation) are ordered by their requested rate. The knee is the last result
+    before the first saturated one: beyond it the achieved rate falls short of the offered rate
+    and the latencies are dominated by the time the calls spend queued.
+
+    Results not produced by a :class:`LoadRunner` are ignored.
+
+    :param results: The results of the load tests.
+    :return: The result at the knee, or None if even the lowest rate saturated or there are
+        no load test results.
+    """
+    load_results = sorted((result for result in results if 'saturated' in result.extra_info),
+                          key=lambda result: result.extra_info['rate'])
+    knee: Results | None = None
+    for result in load_results:
+        if result.extra_info['saturated']:
+            break
+        knee = result
+    return knee
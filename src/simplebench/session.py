@@ -10,10 +10,17 @@ from rich.console import Console
 from rich.progress import Progress
 
 from simplebench import defaults
+from simplebench.calibration_cache import CalibrationCache
 from simplebench.case import Case
 from simplebench.doc_utils import format_docstring
 from simplebench.enums import Color, Target, Verbosity
-from simplebench.exceptions import SimpleBenchArgumentError, SimpleBenchTypeError, _SessionErrorTag
+from simplebench.exceptions import (
+    SimpleBenchArgumentError,
+    SimpleBenchTypeError,
+    SimpleBenchValueError,
+    _SessionErrorTag,
+)
+from simplebench.isolation import configure_forkserver
 from simplebench.reporters.choice import Choice
 from simplebench.reporters.choices import Choices
 from simplebench.reporters.log.report_log_metadata import ReportLogMetadata
@@ -22,6 +29,7 @@ from simplebench.reporters.reporter_manager import ReporterManager
 from simplebench.runners import SimpleRunner
 from simplebench.tasks import ProgressTracker, RichProgressTasks
 from simplebench.utils import sanitize_filename
+from simplebench.validators import validate_int_range, validate_positive_int, validate_sequence_of_type
 
 if TYPE_CHECKING:
     from simplebench.reporters.reporter import Reporter
@@ -36,7 +44,7 @@ class Session():
     This makes it the primary orchestrator for running benchmarks and generating
     reports.
     """
-    @format_docstring(DEFAULT_TIMER=defaults.DEFAULT_TIMER.__name__)
+    @format_docstring(DEFAULT_TIMER=defaults.DEFAULT_TIMER.__name__, DEFAULT_JOBS=defaults.DEFAULT_JOBS)
     def __init__(self,
                  *,
                  cases: Optional[Sequence[Case]] = None,
@@ -46,7 +54,13 @@ class Session():
                  show_progress: bool = False,
                  output_path: Optional[Path] = None,
                  console: Optional[Console] = None,
-                 timer: Callable[[], int] | None = None) -> None:
+                 timer: Callable[[], int] | None = None,
+                 jobs: int = defaults.DEFAULT_JOBS,
+                 isolated: bool = False,
+                 interleave: bool = False,
+                 use_calibration_cache: bool = False,
+                 cpu_affinity: Sequence[int] | None = None,
+                 priority: int | None = None) -> None:
         """Container and orchestrator for session related information while running benchmarks.
 
         :param cases: A Sequence of benchmark cases for the session.
@@ -67,7 +81,26 @@ class Session():
         :param timer: A callable that returns the current time for timing benchmarks.
             If None, a default timer `simplebench.defaults.DEFAULT_TIMER` ({DEFAULT_TIMER})
             will be used. Defaults to None.
+        :param jobs: The number of worker processes used to run the kwargs variations of
+            Cases that do not set their own ``jobs``. Defaults to {DEFAULT_JOBS} (serial).
+        :param isolated: Whether to run each kwargs variation of each Case in a fresh process
+            forked from a pre-warmed fork server. Defaults to False.
+        :param interleave: Whether to run the kwargs variations of all Cases interleaved with
+            each other, one iteration at a time, in randomized round-robin order, so that slow
+            environmental drift is spread evenly over them (see :mod:`simplebench.interleave`).
+            Interleaved variations are run in the current process, so ``jobs`` and ``isolated``
+            do not apply to them. Defaults to False.
+        :param use_calibration_cache: Whether auto-calibrated rounds are cached on disk in
+            ``output_path`` and reused (after a quick verification) by later sessions.
+            Has no effect if ``output_path`` is None. Defaults to False.
+        :param cpu_affinity: The CPUs to run Cases that do not set their own ``cpu_affinity`` on.
+            If None, the CPU affinity is left unchanged. Defaults to None.
+        :param priority: The niceness to run Cases that do not set their own ``priority`` with,
+            from -20 (highest priority) to 19. If None, the niceness is left unchanged.
+            Defaults to None.
         :raises SimpleBenchTypeError: If the arguments are of the wrong type.
+        :raises SimpleBenchValueError: If ``jobs`` is less than 1, ``cpu_affinity`` is empty or
+            contains a negative CPU number, or ``priority`` is out of range.
         """  # params here are for IDEs
         # public read/write properties with private backing fields
         self.default_runner = default_runner
@@ -79,8 +112,16 @@ class Session():
         self.output_path = output_path
         self.console = Console() if console is None else console
         self.timer = defaults.DEFAULT_TIMER if timer is None else timer
+        self.jobs = jobs
+        self.isolated = isolated
+        self.interleave = interleave
+        self.use_calibration_cache = use_calibration_cache
+        self.cpu_affinity = cpu_affinity
+        self.priority = priority
 
         # private attributes
+        self._calibration_cache: CalibrationCache | None = None
+        """The calibrated rounds cache - backing field for the 'calibration_cache' attribute."""
         self._args_parsed: bool = False
         """Whether the command line arguments have been parsed."""
         self._reporter_flags_added: bool = False
@@ -188,6 +229,8 @@ class Session():
 
         This method iterates over all :class:`~.case.Case` instances in the session's
         cases and invokes their :meth:`~.Case.run` method to execute the benchmarks.
+        If :attr:`interleave` is True, the variations of all the cases are instead run
+        together with :meth:`~.Case.run_interleaved`.
 
         If the :meth:`parse_args` method has not been called prior to invoking this method,
         it will be called authomatically with no arguments to parse from :data:`sys.argv`.
@@ -214,6 +257,9 @@ class Session():
         if self.show_progress and self.verbosity > Verbosity.QUIET and self.tasks:
             self.tasks.start()
 
+        if self.isolated:
+            configure_forkserver(self.cases)
+
         case_counter: int = 0
         progress_tracker.reset()
         progress_tracker.update(
@@ -221,13 +267,16 @@ class Session():
             description=f'Running benchmark cases (case {case_counter + 1:2d}/{len(self.cases)})')
         progress_tracker.start()
 
-        for case in self.cases:
-            progress_tracker.update(
-                description=f'Running benchmark cases (case {case_counter + 1:2d}/{len(self.cases)})',
-                completed=case_counter,
-                refresh=True)
-            case_counter += 1
-            case.run(session=self)
+        if self.interleave:
+            Case.run_interleaved(self.cases, session=self)
+        else:
+            for case in self.cases:
+                progress_tracker.update(
+                    description=f'Running benchmark cases (case {case_counter + 1:2d}/{len(self.cases)})',
+                    completed=case_counter,
+                    refresh=True)
+                case_counter += 1
+                case.run(session=self)
         progress_tracker.stop()
         self.tasks.stop()
         self.tasks.clear()
@@ -385,6 +434,150 @@ class Session():
             )
         self._timer = value
 
+    @property
+    def jobs(self) -> int:
+        """The number of worker processes used to run the kwargs variations of
+        Cases that do not set their own ``jobs``."""
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, value: int) -> None:
+        """Set the number of worker processes used to run the kwargs variations of Cases.
+
+        :param value: The number of worker processes. 1 runs variations serially.
+        :raises SimpleBenchTypeError: If the value is not an int.
+        :raises SimpleBenchValueError: If the value is less than 1.
+        """
+        self._jobs = validate_positive_int(
+            value, 'jobs',
+            _SessionErrorTag.PROPERTY_INVALID_JOBS_ARG,
+            _SessionErrorTag.PROPERTY_INVALID_JOBS_VALUE)
+
+    @property
+    def isolated(self) -> bool:
+        """Whether each kwargs variation of each Case is run in a fresh process forked
+        from a pre-warmed fork server."""
+        return self._isolated
+
+    @isolated.setter
+    def isolated(self, value: bool) -> None:
+        """Set whether to run each kwargs variation of each Case in an isolated process.
+
+        :param value: Whether to run variations in isolated processes.
+        :type value: bool
+        :raises SimpleBenchTypeError: If the value is not a bool.
+        """
+        if not isinstance(value, bool):
+            raise SimpleBenchTypeError(
+                f'isolated must be a bool - cannot be a {type(value)}',
+                tag=_SessionErrorTag.PROPERTY_INVALID_ISOLATED_ARG
+            )
+        self._isolated = value
+
+    @property
+    def interleave(self) -> bool:
+        """Whether the kwargs variations of all Cases are run interleaved with each other."""
+        return self._interleave
+
+    @interleave.setter
+    def interleave(self, value: bool) -> None:
+        """Set whether to run the kwargs variations of all Cases interleaved with each other.
+
+        :param value: Whether to run variations interleaved.
+        :type value: bool
+        :raises SimpleBenchTypeError: If the value is not a bool.
+        """
+        if not isinstance(value, bool):
+            raise SimpleBenchTypeError(
+                f'interleave must be a bool - cannot be a {type(value)}',
+                tag=_SessionErrorTag.PROPERTY_INVALID_INTERLEAVE_ARG
+            )
+        self._interleave = value
+
+    @property
+    def use_calibration_cache(self) -> bool:
+        """Whether auto-calibrated rounds are cached on disk and reused by later sessions."""
+        return self._use_calibration_cache
+
+    @use_calibration_cache.setter
+    def use_calibration_cache(self, value: bool) -> None:
+        """Set whether auto-calibrated rounds are cached on disk and reused by later sessions.
+
+        :param value: Whether to use the calibration cache.
+        :type value: bool
+        :raises SimpleBenchTypeError: If the value is not a bool.
+        """
+        if not isinstance(value, bool):
+            raise SimpleBenchTypeError(
+                f'use_calibration_cache must be a bool - cannot be a {type(value)}',
+                tag=_SessionErrorTag.PROPERTY_INVALID_USE_CALIBRATION_CACHE_ARG
+            )
+        self._use_calibration_cache = value
+
+    @property
+    def cpu_affinity(self) -> tuple[int, ...] | None:
+        """The CPUs to run Cases that do not set their own ``cpu_affinity`` on, or None
+        to leave the CPU affinity unchanged."""
+        return self._cpu_affinity
+
+    @cpu_affinity.setter
+    def cpu_affinity(self, value: Sequence[int] | None) -> None:
+        """Set the CPUs to run Cases that do not set their own ``cpu_affinity`` on.
+
+        :param value: The CPU numbers, or None to leave the CPU affinity unchanged.
+        :raises SimpleBenchTypeError: If the value is not None or a sequence of ints.
+        :raises SimpleBenchValueError: If the sequence is empty or a CPU number is negative.
+        """
+        if value is None:
+            self._cpu_affinity: tuple[int, ...] | None = None
+            return
+        cpus = validate_sequence_of_type(
+            value, int, 'cpu_affinity',
+            _SessionErrorTag.PROPERTY_INVALID_CPU_AFFINITY_ARG,
+            _SessionErrorTag.PROPERTY_INVALID_CPU_AFFINITY_VALUE,
+            allow_empty=False)
+        if any(cpu < 0 for cpu in cpus):
+            raise SimpleBenchValueError(
+                f'Invalid cpu_affinity: {value}. CPU numbers cannot be negative.',
+                tag=_SessionErrorTag.PROPERTY_INVALID_CPU_AFFINITY_VALUE)
+        self._cpu_affinity = tuple(sorted(set(cpus)))
+
+    @property
+    def priority(self) -> int | None:
+        """The niceness to run Cases that do not set their own ``priority`` with, or None
+        to leave the niceness unchanged."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: int | None) -> None:
+        """Set the niceness to run Cases that do not set their own ``priority`` with.
+
+        :param value: The niceness, from -20 to 19, or None to leave the niceness unchanged.
+        :raises SimpleBenchTypeError: If the value is not None or an int.
+        :raises SimpleBenchValueError: If the value is outside -20 to 19.
+        """
+        if value is None:
+            self._priority: int | None = None
+            return
+        self._priority = validate_int_range(
+            value, 'priority',
+            _SessionErrorTag.PROPERTY_INVALID_PRIORITY_ARG,
+            _SessionErrorTag.PROPERTY_INVALID_PRIORITY_VALUE,
+            min_value=-20, max_value=19)
+
+    @property
+    def calibration_cache(self) -> CalibrationCache | None:
+        """The on-disk cache of calibrated rounds in the output path.
+
+        None if :attr:`use_calibration_cache` is False or :attr:`output_path` is None.
+        """
+        if not self._use_calibration_cache or self._output_path is None:
+            return None
+        path = self._output_path / defaults.DEFAULT_CALIBRATION_CACHE_FILENAME
+        if self._calibration_cache is None or self._calibration_cache.path != path:
+            self._calibration_cache = CalibrationCache(path)
+        return self._calibration_cache
+
     @property
     def default_runner(self) -> type[SimpleRunner] | None:
         """The session scoped default runner class to use for Cases that do not specify a runner."""
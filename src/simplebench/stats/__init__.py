@@ -1,20 +1,49 @@
 '''Stats module for SimpleBench benchmarking framework.'''
+from .histogram import LatencyHistogram
 from .stats import Stats, StatsSummary
 from .operation_timings import OperationTimings, OperationTimingsSummary
+from .cpu_timings import CPUTimings, CPUTimingsSummary
 from .operations_per_interval import OperationsPerInterval, OperationsPerIntervalSummary
 from .memory_usage import MemoryUsage, MemoryUsageSummary
 from .peak_memory_usage import PeakMemoryUsage, PeakMemoryUsageSummary
+from .gc_collections import GCCollections, GCCollectionsSummary
+from .resource_usage import NATIVE_MEMORY_SECTION_UNITS, RUSAGE_SECTION_UNITS, ResourceUsage, ResourceUsageSummary
+from .bootstrap import BootstrapIntervals, ConfidenceInterval, bootstrap_intervals
+from .confidence import PrecisionTracker, ci_half_width, relative_ci_half_width, t_quantile
+from .outliers import Outliers, classify_outliers, median_absolute_deviation, trimmed_mean
+from .warmup import steady_state_start
 
 
 __all__ = [
     'Stats',
     'StatsSummary',
+    'LatencyHistogram',
     'OperationTimings',
     'OperationTimingsSummary',
+    'CPUTimings',
+    'CPUTimingsSummary',
     'OperationsPerInterval',
     'OperationsPerIntervalSummary',
     'MemoryUsage',
     'MemoryUsageSummary',
     'PeakMemoryUsage',
     'PeakMemoryUsageSummary',
+    'GCCollections',
+    'GCCollectionsSummary',
+    'NATIVE_MEMORY_SECTION_UNITS',
+    'RUSAGE_SECTION_UNITS',
+    'ResourceUsage',
+    'ResourceUsageSummary',
+    'BootstrapIntervals',
+    'ConfidenceInterval',
+    'bootstrap_intervals',
+    'PrecisionTracker',
+    'ci_half_width',
+    'relative_ci_half_width',
+    't_quantile',
+    'Outliers',
+    'classify_outliers',
+    'median_absolute_deviation',
+    'trimmed_mean',
+    'steady_state_start',
 ]
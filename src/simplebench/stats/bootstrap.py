@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Bootstrap confidence intervals for the mean, median and percentiles of benchmark data.
+
+The bootstrap makes no assumption about the distribution of the data, which for
+benchmark timings is typically skewed and often multi-modal. The data is resampled
+with replacement many times, the statistics are computed for every resample, and the
+percentile interval of the resampled statistics is reported.
+
+The resampling is vectorized with NumPy. Resamples are drawn in batches so that the
+memory used stays bounded regardless of the number of data points.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, NamedTuple, Sequence
+
+import numpy as np
+
+from ..defaults import (
+    DEFAULT_BOOTSTRAP_PERCENTILES,
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_BOOTSTRAP_SEED,
+    DEFAULT_CONFIDENCE_LEVEL,
+)
+from ..exceptions import SimpleBenchValueError
+from ..validators import (
+    validate_float_range,
+    validate_non_negative_int,
+    validate_positive_int,
+    validate_sequence_of_numbers,
+)
+from .exceptions.bootstrap import _BootstrapErrorTag
+
+_BOOTSTRAP_BATCH_ELEMENTS: int = 1_000_000
+"""The maximum number of resampled data points held in memory at once."""
+
+
+class ConfidenceInterval(NamedTuple):
+    """A confidence interval.
+
+    :ivar lower: The lower bound of the interval.
+    :vartype lower: float
+    :ivar upper: The upper bound of the interval.
+    :vartype upper: float
+    """
+    lower: float
+    upper: float
+
+    @property
+    def half_width(self) -> float:
+        """Half the width of the interval."""
+        return (self.upper - self.lower) / 2.0
+
+
+class BootstrapIntervals(NamedTuple):
+    """Bootstrap confidence intervals of the mean, median and selected percentiles of some data.
+
+    :ivar mean: The confidence interval of the mean.
+    :vartype mean: ConfidenceInterval
+    :ivar median: The confidence interval of the median.
+    :vartype median: ConfidenceInterval
+    :ivar percentiles: The confidence intervals of the selected percentiles, keyed by percentile.
+    :vartype percentiles: tuple[tuple[float, ConfidenceInterval], ...]
+    :ivar confidence_level: The confidence level of the intervals.
+    :vartype confidence_level: float
+    :ivar resamples: The number of bootstrap resamples the intervals are based on.
+    :vartype resamples: int
+    :ivar seed: The seed of the resampling, or None if it was not seeded.
+    :vartype seed: int | None
+    """
+    mean: ConfidenceInterval
+    median: ConfidenceInterval
+    percentiles: tuple[tuple[float, ConfidenceInterval], ...]
+    confidence_level: float
+    resamples: int
+    seed: int | None
+
+    def percentile(self, percent: float) -> ConfidenceInterval:
+        """Return the confidence interval of a selected percentile.
+
+        :param percent: The percentile, as passed to :func:`bootstrap_intervals`.
+        :return: The confidence interval of the percentile.
+        :raises KeyError: If no interval was computed for the percentile.
+        """
+        for selected, interval in self.percentiles:
+            if selected == percent:
+                return interval
+        raise KeyError(percent)
+
+    def as_dict(self, scale: float = 1.0) -> dict[str, Any]:
+        """Return the intervals as a JSON serializable dict.
+
+        :param scale: The factor the bounds are divided by (the scale of the data).
+        :return: The intervals, with each interval as a ``(lower, upper)`` tuple and the
+            percentile intervals keyed by the percentile formatted as a string.
+        """
+        def scaled(interval: ConfidenceInterval) -> tuple[float, float]:
+            return (interval.lower / scale, interval.upper / scale)
+
+        return {'confidence_level': self.confidence_level,
+                'resamples': self.resamples,
+                'seed': self.seed,
+                'mean': scaled(self.mean),
+                'median': scaled(self.median),
+                'percentiles': {f'{percent:g}': scaled(interval) for percent, interval in self.percentiles}}
+
+
+def bootstrap_intervals(data: Sequence[int | float],
+                        *,
+                        percentiles: Sequence[int | float] = DEFAULT_BOOTSTRAP_PERCENTILES,
+                        resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+                        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+                        seed: int | None = DEFAULT_BOOTSTRAP_SEED) -> BootstrapIntervals:
+    """Return percentile bootstrap confidence intervals of the mean, median and percentiles of ``data``.
+
+    :param data: The sample data. Must not be empty.
+    :param percentiles: The percentiles (0 to 100) whose intervals are computed besides the mean and median.
+    :param resamples: The number of bootstrap resamples.
+    :param confidence_level: The confidence level, between 0.0 and 1.0 exclusive.
+    :param seed: The seed of the random number generator, or None to seed it from the OS.
+    :return: The confidence intervals.
+    :raises SimpleBenchTypeError: If an argument is of the wrong type.
+    :raises SimpleBenchValueError: If ``data`` is empty or another argument is out of range.
+    """
+    values = validate_sequence_of_numbers(
+        data, 'data',
+        type_tag=_BootstrapErrorTag.INVALID_DATA_ARG_TYPE,
+        value_tag=_BootstrapErrorTag.INVALID_DATA_ARG_VALUE,
+        allow_empty=False)
+    percentiles = validate_sequence_of_numbers(
+        percentiles, 'percentiles',
+        type_tag=_BootstrapErrorTag.INVALID_PERCENTILES_ARG_TYPE,
+        value_tag=_BootstrapErrorTag.INVALID_PERCENTILES_ARG_VALUE)
+    for percent in percentiles:
+        if not 0 <= percent <= 100:
+            raise SimpleBenchValueError(
+                f'Invalid percentile: {percent}. Percentiles must be between 0 and 100, inclusive.',
+                tag=_BootstrapErrorTag.INVALID_PERCENTILES_ARG_VALUE)
+    resamples = validate_positive_int(
+        resamples, 'resamples',
+        _BootstrapErrorTag.INVALID_RESAMPLES_ARG_TYPE,
+        _BootstrapErrorTag.INVALID_RESAMPLES_ARG_VALUE)
+    confidence_level = validate_float_range(
+        confidence_level, 'confidence_level',
+        _BootstrapErrorTag.INVALID_CONFIDENCE_LEVEL_ARG_TYPE,
+        _BootstrapErrorTag.INVALID_CONFIDENCE_LEVEL_ARG_VALUE,
+        min_value=math.nextafter(0.0, 1.0), max_value=math.nextafter(1.0, 0.0))
+    if seed is not None:
+        seed = validate_non_negative_int(
+            seed, 'seed',
+            _BootstrapErrorTag.INVALID_SEED_ARG_TYPE,
+            _BootstrapErrorTag.INVALID_SEED_ARG_VALUE)
+
+    sample = np.asarray(values, dtype=np.float64)
+    n = sample.size
+    # The median is computed together with the selected percentiles, by linear interpolation
+    # between the order statistics of each sorted resample (numpy's default 'linear' method)
+    positions = np.array([50.0, *percentiles], dtype=np.float64) / 100.0 * (n - 1)
+    below = np.floor(positions).astype(np.intp)
+    above = np.minimum(below + 1, n - 1)
+    fraction = positions - below
+    means = np.empty(resamples, dtype=np.float64)
+    quantiles = np.empty((positions.size, resamples), dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    batch_size = max(1, _BOOTSTRAP_BATCH_ELEMENTS // n)
+    for start in range(0, resamples, batch_size):
+        stop = min(start + batch_size, resamples)
+        resampled = sample[rng.integers(0, n, size=(stop - start, n))]
+        means[start:stop] = resampled.mean(axis=1)
+        resampled.sort(axis=1)
+        quantiles[:, start:stop] = (resampled[:, below] * (1.0 - fraction) + resampled[:, above] * fraction).T
+
+    tail = (1.0 - confidence_level) / 2.0
+
+    def interval(estimates: np.ndarray) -> ConfidenceInterval:
+        lower, upper = np.quantile(estimates, [tail, 1.0 - tail])
+        return ConfidenceInterval(lower=float(lower), upper=float(upper))
+
+    return BootstrapIntervals(
+        mean=interval(means),
+        median=interval(quantiles[0]),
+        percentiles=tuple((float(percent), interval(quantiles[index + 1]))
+                          for index, percent in enumerate(percentiles)),
+        confidence_level=confidence_level,
+        resamples=resamples,
+        seed=seed)
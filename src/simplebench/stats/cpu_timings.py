@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Containers for benchmark statistics"""
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT
+from ..enums import Section
+from ..exceptions import SimpleBenchTypeError
+from ..iteration import Iteration
+from ..iteration_table import IterationTable
+from ..validators import validate_sequence_of_numbers
+from . import Stats, StatsSummary
+from .exceptions.cpu_timings import _CPUTimingsErrorTag
+
+
+class CPUTimings(Stats):
+    """Container for the per-round CPU time statistics of a benchmark.
+
+    The CPU time is measured around the same timed region as the wall-clock time, so
+    comparing the two separates computation from time spent off the CPU.
+
+    :ivar unit: The unit of measurement for the timings (e.g., "ns").
+    :vartype unit: str
+    :ivar scale: The scale factor for the timings (e.g., "1e-9" for nanoseconds).
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar data: Tuple of CPU time data points.
+    :vartype data: tuple[int | float, ...]
+    :ivar mean: The mean CPU time per operation.
+    :vartype mean: float
+    :ivar median: The median CPU time per operation.
+    :vartype median: float
+    :ivar minimum: The minimum CPU time per operation.
+    :vartype minimum: float
+    :ivar maximum: The maximum CPU time per operation.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the CPU time per operation.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the CPU time per
+        operation.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of CPU time per operation.
+    :vartype percentiles: dict[int, float]
+    """
+    def __init__(self,
+                 *,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
+                 unit: str = DEFAULT_INTERVAL_UNIT,
+                 scale: float = DEFAULT_INTERVAL_SCALE,
+                 rounds: int = 1,
+                 data: Optional[Sequence[int | float]] = None):
+        """Construct CPUTimings stats from Iteration or raw CPU time data.
+
+        :param iterations: Sequence of
+            :class:`~simplebench.iteration.Iteration` objects to extract CPU time data from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
+        :param unit: The unit of measurement for the timings (e.g., "ns").
+        :param scale: The scale factor for the timings (e.g., "1e-9" for nanoseconds).
+        :param rounds: The number of data points in the benchmark.
+        :param data: Optional sequence of CPU time data points. If not provided,
+            CPU time data will be extracted from the iterations if available.
+        :raises ~simplebench.exceptions.SimpleBenchTypeError: If any of the arguments are
+            of the wrong type.
+        :raises ~simplebench.exceptions.SimpleBenchValueError: If any of the arguments have
+            invalid values.
+        """
+        if iterations is None and data is None:
+            raise SimpleBenchTypeError(
+                "either iterations or data must be provided",
+                tag=_CPUTimingsErrorTag.NO_DATA_OR_ITERATIONS_PROVIDED)
+        if data is None:
+            data = []
+        imported_data: list[int | float] = list(validate_sequence_of_numbers(
+                data, 'data',
+                type_tag=_CPUTimingsErrorTag.INVALID_DATA_ARG_TYPE,
+                value_tag=_CPUTimingsErrorTag.INVALID_DATA_ARG_VALUE))
+
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.CPU_TIME) if not imported_data
+                            else imported_data + iterations.section(Section.CPU_TIME).tolist())
+        elif iterations is not None:
+            if not isinstance(iterations, Sequence):
+                raise SimpleBenchTypeError(
+                    "passed iterations arg is not a Sequence",
+                    tag=_CPUTimingsErrorTag.INVALID_ITERATIONS_ARG_TYPE)
+
+            if not all(isinstance(iteration, Iteration) for iteration in iterations):
+                raise SimpleBenchTypeError(
+                    "There are items in the iterations arg sequence that are not Iteration objects",
+                    tag=_CPUTimingsErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
+            imported_data.extend(iteration.per_round_cpu_elapsed for iteration in iterations)
+
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
+
+
+class CPUTimingsSummary(StatsSummary):
+    """Container for summary of per-round CPU time statistics of a benchmark.
+
+    :ivar unit: The unit of measurement for the timings (e.g., "ns").
+    :vartype unit: str
+    :ivar scale: The scale factor for the timings (e.g., "1e-9" for nanoseconds).
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar mean: The mean CPU time per operation.
+    :vartype mean: float
+    :ivar median: The median CPU time per operation.
+    :vartype median: float
+    :ivar minimum: The minimum CPU time per operation.
+    :vartype minimum: float
+    :ivar maximum: The maximum CPU time per operation.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the CPU time per operation.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the CPU time per
+        operation.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of CPU time per operation.
+    :vartype percentiles: dict[int, float]
+    """
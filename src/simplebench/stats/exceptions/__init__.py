@@ -1,16 +1,32 @@
 """ErrorTags for the simplebench.stats package."""
 
+from .bootstrap import _BootstrapErrorTag
+from .confidence import _ConfidenceErrorTag
+from .cpu_timings import _CPUTimingsErrorTag
+from .gc_collections import _GCCollectionsErrorTag
+from .histogram import _LatencyHistogramErrorTag
 from .memory_usage import _MemoryUsageErrorTag
 from .operation_timings import _OperationTimingsErrorTag
 from .operations_per_interval import _OperationsPerIntervalErrorTag
+from .outliers import _OutliersErrorTag
 from .peak_memory_usage import _PeakMemoryUsageErrorTag
+from .resource_usage import _ResourceUsageErrorTag
 from .stats import _StatsErrorTag, _StatsSummaryErrorTag
+from .warmup import _WarmupErrorTag
 
 __all__ = [
+    "_BootstrapErrorTag",
+    "_ConfidenceErrorTag",
+    "_CPUTimingsErrorTag",
+    "_GCCollectionsErrorTag",
+    "_LatencyHistogramErrorTag",
     "_StatsErrorTag",
     "_StatsSummaryErrorTag",
     "_MemoryUsageErrorTag",
     "_OperationTimingsErrorTag",
     "_OperationsPerIntervalErrorTag",
+    "_OutliersErrorTag",
     "_PeakMemoryUsageErrorTag",
+    "_ResourceUsageErrorTag",
+    "_WarmupErrorTag",
 ]
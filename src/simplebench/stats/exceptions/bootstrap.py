@@ -0,0 +1,28 @@
+"""ErrorTags for the simplebench.stats.bootstrap module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions.base import ErrorTag
+
+
+@enum_docstrings
+class _BootstrapErrorTag(ErrorTag):
+    """ErrorTags for the bootstrap confidence interval functions."""
+    INVALID_DATA_ARG_TYPE = "INVALID_DATA_ARG_TYPE"
+    """Invalid data argument - must be a sequence of numbers"""
+    INVALID_DATA_ARG_VALUE = "INVALID_DATA_ARG_VALUE"
+    """Invalid data argument - must not be empty"""
+    INVALID_PERCENTILES_ARG_TYPE = "INVALID_PERCENTILES_ARG_TYPE"
+    """Invalid percentiles argument - must be a sequence of numbers"""
+    INVALID_PERCENTILES_ARG_VALUE = "INVALID_PERCENTILES_ARG_VALUE"
+    """Invalid percentiles argument - all percentiles must be between 0 and 100, inclusive"""
+    INVALID_RESAMPLES_ARG_TYPE = "INVALID_RESAMPLES_ARG_TYPE"
+    """Invalid resamples argument - must be an int"""
+    INVALID_RESAMPLES_ARG_VALUE = "INVALID_RESAMPLES_ARG_VALUE"
+    """Invalid resamples argument - must be a positive int"""
+    INVALID_CONFIDENCE_LEVEL_ARG_TYPE = "INVALID_CONFIDENCE_LEVEL_ARG_TYPE"
+    """Invalid confidence_level argument - must be a float"""
+    INVALID_CONFIDENCE_LEVEL_ARG_VALUE = "INVALID_CONFIDENCE_LEVEL_ARG_VALUE"
+    """Invalid confidence_level argument - must be between 0.0 and 1.0, exclusive"""
+    INVALID_SEED_ARG_TYPE = "INVALID_SEED_ARG_TYPE"
+    """Invalid seed argument - must be an int or None"""
+    INVALID_SEED_ARG_VALUE = "INVALID_SEED_ARG_VALUE"
+    """Invalid seed argument - must be a non-negative int or None"""
@@ -0,0 +1,22 @@
+"""ErrorTags for the simplebench.stats.confidence module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions.base import ErrorTag
+
+
+@enum_docstrings
+class _ConfidenceErrorTag(ErrorTag):
+    """ErrorTags for the confidence interval functions."""
+    INVALID_DATA_ARG_TYPE = "INVALID_DATA_ARG_TYPE"
+    """Invalid data argument - must be a sequence of numbers"""
+    INVALID_DATA_ARG_VALUE = "INVALID_DATA_ARG_VALUE"
+    """Invalid data argument - must not be empty"""
+    INVALID_STATISTIC_ARG_TYPE = "INVALID_STATISTIC_ARG_TYPE"
+    """Invalid statistic argument - must be a PrecisionStatistic"""
+    INVALID_CONFIDENCE_LEVEL_ARG_TYPE = "INVALID_CONFIDENCE_LEVEL_ARG_TYPE"
+    """Invalid confidence_level argument - must be a float"""
+    INVALID_CONFIDENCE_LEVEL_ARG_VALUE = "INVALID_CONFIDENCE_LEVEL_ARG_VALUE"
+    """Invalid confidence_level argument - must be between 0.0 and 1.0, exclusive"""
+    INVALID_GROWTH_ARG_TYPE = "INVALID_GROWTH_ARG_TYPE"
+    """Invalid growth argument - must be a float"""
+    INVALID_GROWTH_ARG_VALUE = "INVALID_GROWTH_ARG_VALUE"
+    """Invalid growth argument - must be zero or greater"""
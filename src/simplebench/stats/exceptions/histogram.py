@@ -0,0 +1,54 @@
+"""ErrorTags for the simplebench.stats.histogram module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions.base import ErrorTag
+
+
+@enum_docstrings
+class _LatencyHistogramErrorTag(ErrorTag):
+    """ErrorTags for the LatencyHistogram class."""
+    INVALID_LOWEST_ARG_TYPE = "INVALID_LOWEST_ARG_TYPE"
+    """Invalid lowest_trackable_value argument - must be an int"""
+    INVALID_LOWEST_ARG_VALUE = "INVALID_LOWEST_ARG_VALUE"
+    """Invalid lowest_trackable_value argument - must be a positive int"""
+    INVALID_HIGHEST_ARG_TYPE = "INVALID_HIGHEST_ARG_TYPE"
+    """Invalid highest_trackable_value argument - must be an int"""
+    INVALID_HIGHEST_ARG_VALUE = "INVALID_HIGHEST_ARG_VALUE"
+    """Invalid highest_trackable_value argument - must be at least twice lowest_trackable_value and below 2**53"""
+    INVALID_SIGNIFICANT_FIGURES_ARG_TYPE = "INVALID_SIGNIFICANT_FIGURES_ARG_TYPE"
+    """Invalid significant_figures argument - must be an int"""
+    INVALID_SIGNIFICANT_FIGURES_ARG_VALUE = "INVALID_SIGNIFICANT_FIGURES_ARG_VALUE"
+    """Invalid significant_figures argument - must be between 1 and 5"""
+    INVALID_UNIT_ARG_TYPE = "INVALID_UNIT_ARG_TYPE"
+    """Invalid unit argument - must be a str"""
+    INVALID_UNIT_ARG_VALUE = "INVALID_UNIT_ARG_VALUE"
+    """Invalid unit argument - must be a non-blank str"""
+    INVALID_SCALE_ARG_TYPE = "INVALID_SCALE_ARG_TYPE"
+    """Invalid scale argument - must be a float"""
+    INVALID_SCALE_ARG_VALUE = "INVALID_SCALE_ARG_VALUE"
+    """Invalid scale argument - must be a positive float"""
+    INVALID_VALUE_ARG_TYPE = "INVALID_VALUE_ARG_TYPE"
+    """Invalid value argument - must be a number"""
+    VALUE_OUT_OF_RANGE = "VALUE_OUT_OF_RANGE"
+    """A recorded value was negative or above the highest trackable value of the histogram"""
+    INVALID_COUNT_ARG_TYPE = "INVALID_COUNT_ARG_TYPE"
+    """Invalid count argument - must be an int"""
+    INVALID_COUNT_ARG_VALUE = "INVALID_COUNT_ARG_VALUE"
+    """Invalid count argument - must be a positive int"""
+    INVALID_EXPECTED_INTERVAL_ARG_TYPE = "INVALID_EXPECTED_INTERVAL_ARG_TYPE"
+    """Invalid expected_interval argument - must be an int"""
+    INVALID_EXPECTED_INTERVAL_ARG_VALUE = "INVALID_EXPECTED_INTERVAL_ARG_VALUE"
+    """Invalid expected_interval argument - must be a positive int"""
+    INVALID_PERCENTILE_ARG_TYPE = "INVALID_PERCENTILE_ARG_TYPE"
+    """Invalid percentile argument - must be a float"""
+    INVALID_PERCENTILE_ARG_VALUE = "INVALID_PERCENTILE_ARG_VALUE"
+    """Invalid percentile argument - must be between 0 and 100"""
+    ADD_INVALID_OTHER_ARG_TYPE = "ADD_INVALID_OTHER_ARG_TYPE"
+    """The histogram added was not a LatencyHistogram"""
+    ADD_INCOMPATIBLE_HISTOGRAM = "ADD_INCOMPATIBLE_HISTOGRAM"
+    """The histogram added has a different value range, precision or unit"""
+    DECODE_INVALID_ENCODING = "DECODE_INVALID_ENCODING"
+    """The encoded histogram is not a valid compressed V2 HdrHistogram encoding"""
+    FROM_DICT_INVALID_DATA_ARG_TYPE = "FROM_DICT_INVALID_DATA_ARG_TYPE"
+    """The data argument was not a dict"""
+    FROM_DICT_MISSING_KEY = "FROM_DICT_MISSING_KEY"
+    """The data dict is missing a required key"""
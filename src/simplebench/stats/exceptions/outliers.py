@@ -0,0 +1,18 @@
+"""ErrorTags for the simplebench.stats.outliers module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions.base import ErrorTag
+
+
+@enum_docstrings
+class _OutliersErrorTag(ErrorTag):
+    """ErrorTags for the outlier detection and robust estimator functions."""
+    INVALID_DATA_ARG_TYPE = "INVALID_DATA_ARG_TYPE"
+    """Invalid data argument - must be a sequence of numbers"""
+    INVALID_DATA_ARG_VALUE = "INVALID_DATA_ARG_VALUE"
+    """Invalid data argument - must not be empty"""
+    INVALID_METHOD_ARG_TYPE = "INVALID_METHOD_ARG_TYPE"
+    """Invalid method argument - must be an OutlierMethod"""
+    INVALID_PROPORTION_ARG_TYPE = "INVALID_PROPORTION_ARG_TYPE"
+    """Invalid proportion argument - must be a float"""
+    INVALID_PROPORTION_ARG_VALUE = "INVALID_PROPORTION_ARG_VALUE"
+    """Invalid proportion argument - must be at least 0.0 and less than 0.5"""
@@ -0,0 +1,27 @@
+"""ErrorTags for the simplebench.stats.resource_usage module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions import ErrorTag
+
+
+@enum_docstrings
+class _ResourceUsageErrorTag(ErrorTag):
+    """ErrorTags for the ResourceUsage class."""
+    INVALID_SECTION_ARG_TYPE = "INVALID_SECTION_ARG_TYPE"
+    """Invalid section argument passed to the ResourceUsage() constructor - must be a Section"""
+    INVALID_SECTION_ARG_VALUE = "INVALID_SECTION_ARG_VALUE"
+    """Invalid section argument passed to the ResourceUsage() constructor
+    - must be one of the resource counter sections"""
+    INVALID_ITERATIONS_ARG_TYPE = "INVALID_ITERATIONS_ARG_TYPE"
+    """Invalid iterations argument passed to the ResourceUsage() constructor
+    - must be a Sequence of Iteration objects or None"""
+    INVALID_ITERATIONS_ITEM_ARG_TYPE = "INVALID_ITERATIONS_ITEM_ARG_TYPE"
+    """Invalid type of item passed to the ResourceUsage() constructor in the iterations argument
+    - all items must be Iteration objects"""
+    INVALID_DATA_ARG_TYPE = "INVALID_DATA_ARG_TYPE"
+    """Invalid data argument passed to the ResourceUsage() constructor
+    - must be a sequence of numbers (int or float) or None"""
+    INVALID_DATA_ARG_VALUE = "INVALID_DATA_ARG_VALUE"
+    """Invalid data argument value passed to the ResourceUsage() constructor
+    - must be a sequence of numbers (int or float)"""
+    NO_DATA_OR_ITERATIONS_PROVIDED = "NO_DATA_OR_ITERATIONS_PROVIDED"
+    """No data or iterations provided to the ResourceUsage() constructor"""
@@ -86,5 +86,7 @@ class _StatsSummaryErrorTag(ErrorTag):
     """Missing key in the data dictionary passed to the StatsSummary.from_dict() method"""
     FROM_STATS_INVALID_STATS_ARG_TYPE = "FROM_STATS_INVALID_STATS_ARG_TYPE"
     """Invalid stats argument passed to the StatsSummary.from_stats() method - must be a Stats instance"""
+    FROM_HISTOGRAM_INVALID_HISTOGRAM_ARG_TYPE = "FROM_HISTOGRAM_INVALID_HISTOGRAM_ARG_TYPE"
+    """Invalid histogram argument passed to StatsSummary.from_histogram() - must be a LatencyHistogram instance"""
     FROM_DICT_MISSING_ROUNDS_KEY = "FROM_DICT_MISSING_ROUNDS_KEY"
     """Missing rounds key in the data dictionary passed to the StatsSummary.from_dict() method"""
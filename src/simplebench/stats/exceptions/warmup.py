@@ -0,0 +1,20 @@
+"""ErrorTags for the simplebench.stats.warmup module."""
+from simplebench.enums import enum_docstrings
+from simplebench.exceptions.base import ErrorTag
+
+
+@enum_docstrings
+class _WarmupErrorTag(ErrorTag):
+    """ErrorTags for the steady state detection functions."""
+    INVALID_DATA_ARG_TYPE = "INVALID_DATA_ARG_TYPE"
+    """Invalid data argument - must be a sequence of numbers"""
+    INVALID_DATA_ARG_VALUE = "INVALID_DATA_ARG_VALUE"
+    """Invalid data argument value"""
+    INVALID_WINDOW_ARG_TYPE = "INVALID_WINDOW_ARG_TYPE"
+    """Invalid window argument - must be an int"""
+    INVALID_WINDOW_ARG_VALUE = "INVALID_WINDOW_ARG_VALUE"
+    """Invalid window argument - must be a positive int"""
+    INVALID_TOLERANCE_ARG_TYPE = "INVALID_TOLERANCE_ARG_TYPE"
+    """Invalid tolerance argument - must be a float"""
+    INVALID_TOLERANCE_ARG_VALUE = "INVALID_TOLERANCE_ARG_VALUE"
+    """Invalid tolerance argument - must be a non-negative float"""
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Containers for benchmark statistics"""
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..defaults import DEFAULT_GC_COLLECTIONS_SCALE, DEFAULT_GC_COLLECTIONS_UNIT
+from ..enums import Section
+from ..exceptions import SimpleBenchTypeError
+from ..iteration import Iteration
+from ..iteration_table import IterationTable
+from ..validators import validate_sequence_of_numbers
+from . import Stats, StatsSummary
+from .exceptions.gc_collections import _GCCollectionsErrorTag
+
+
+class GCCollections(Stats):
+    """Container for the garbage collection statistics of a benchmark.
+
+    Each data point is the number of garbage collections that happened during one
+    timed iteration. An allocation-heavy action triggers collections; an action that
+    is merely slow does not.
+
+    :ivar unit: The unit of measurement for the collections (e.g., "collections").
+    :vartype unit: str
+    :ivar scale: The scale factor for the collections.
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar data: Tuple of garbage collection count data points.
+    :vartype data: tuple[int | float, ...]
+    :ivar mean: The mean number of collections per iteration.
+    :vartype mean: float
+    :ivar median: The median number of collections per iteration.
+    :vartype median: float
+    :ivar minimum: The minimum number of collections per iteration.
+    :vartype minimum: float
+    :ivar maximum: The maximum number of collections per iteration.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the collections per iteration.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the collections per iteration.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of the collections per iteration.
+    :vartype percentiles: dict[int, float]
+    """
+    def __init__(self,
+                 *,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
+                 unit: str = DEFAULT_GC_COLLECTIONS_UNIT,
+                 scale: float = DEFAULT_GC_COLLECTIONS_SCALE,
+                 rounds: int = 1,
+                 data: Optional[Sequence[int | float]] = None):
+        """Construct GCCollections stats from Iteration or raw collection count data.
+
+        :param iterations: Sequence of
+            :class:`~simplebench.iteration.Iteration` objects to extract the collection
+            counts from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
+        :param unit: The unit of measurement for the collections.
+        :param scale: The scale factor for the collections.
+        :param rounds: The number of data points in the benchmark.
+        :param data: Optional Sequence of collection count data points. If not
+            provided, the counts will be extracted from the iterations if available.
+        :raises ~simplebench.exceptions.SimpleBenchTypeError: If any of the arguments are
+            of the wrong type.
+        :raises ~simplebench.exceptions.SimpleBenchValueError: If any of the arguments have
+            invalid values.
+        """
+        if iterations is None and data is None:
+            raise SimpleBenchTypeError(
+                "either iterations or data must be provided",
+                tag=_GCCollectionsErrorTag.NO_DATA_OR_ITERATIONS_PROVIDED)
+        if data is None:
+            data = []
+        imported_data: list[int | float] = list(validate_sequence_of_numbers(
+                data, 'data',
+                type_tag=_GCCollectionsErrorTag.INVALID_DATA_ARG_TYPE,
+                value_tag=_GCCollectionsErrorTag.INVALID_DATA_ARG_VALUE))
+
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.GC) if not imported_data
+                            else imported_data + iterations.section(Section.GC).tolist())
+        elif iterations is not None:
+            if not isinstance(iterations, Sequence):
+                raise SimpleBenchTypeError(
+                    "passed iterations arg is not a Sequence",
+                    tag=_GCCollectionsErrorTag.INVALID_ITERATIONS_ARG_TYPE)
+
+            if not all(isinstance(iteration, Iteration) for iteration in iterations):
+                raise SimpleBenchTypeError(
+                    "There are items in the iterations arg sequence that are not Iteration objects",
+                    tag=_GCCollectionsErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
+            imported_data.extend(iteration.gc_collections for iteration in iterations)
+
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
+
+
+class GCCollectionsSummary(StatsSummary):
+    """Container for the summary of garbage collection statistics of a benchmark.
+
+    :ivar unit: The unit of measurement for the collections (e.g., "collections").
+    :vartype unit: str
+    :ivar scale: The scale factor for the collections.
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar mean: The mean number of collections per iteration.
+    :vartype mean: float
+    :ivar median: The median number of collections per iteration.
+    :vartype median: float
+    :ivar minimum: The minimum number of collections per iteration.
+    :vartype minimum: float
+    :ivar maximum: The maximum number of collections per iteration.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the collections per iteration.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the collections
+        per iteration.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of the collections per iteration.
+    :vartype percentiles: dict[int, float]
+    """
@@ -0,0 +1,582 @@
+# -*- coding: utf-8 -*-
+"""HDR-style latency histogram with a fixed memory footprint.
+
+Storing every per-call latency of a long load test as a Python float grows memory
+without bound. A :class:`LatencyHistogram` instead counts the recorded values in
+logarithmically sized buckets, as in Gil Tene's HdrHistogram: every power of two range
+of values is split into the same number of linear sub-buckets, enough to resolve any
+value to the configured number of significant decimal digits. The counts are held in
+a single NumPy array whose size depends only on the trackable range and the precision,
+not on the number of values recorded.
+
+Histograms with the same configuration can be added together, so histograms recorded
+by separate workers can be merged. They can be exported in the compressed V2 encoding
+and the interval log format of HdrHistogram, which its tools (such as HistogramLogAnalyzer)
+read, and summarized with :meth:`StatsSummary.from_histogram
+<simplebench.stats.StatsSummary.from_histogram>` without materializing the samples.
+"""
+from __future__ import annotations
+
+import base64
+import datetime
+import math
+import struct
+import time
+import zlib
+from typing import Any, Sequence
+
+import numpy as np
+
+from ..defaults import (
+    DEFAULT_HISTOGRAM_HIGHEST_TRACKABLE,
+    DEFAULT_HISTOGRAM_LOWEST_TRACKABLE,
+    DEFAULT_HISTOGRAM_SIGNIFICANT_FIGURES,
+    DEFAULT_INTERVAL_SCALE,
+    DEFAULT_INTERVAL_UNIT,
+)
+from ..exceptions import SimpleBenchKeyError, SimpleBenchTypeError, SimpleBenchValueError
+from ..validators import (
+    validate_float_range,
+    validate_int_range,
+    validate_non_blank_string,
+    validate_positive_float,
+    validate_positive_int,
+)
+from .exceptions.histogram import _LatencyHistogramErrorTag
+
+_V2_ENCODING_COOKIE: int = 0x1c849303 | 0x10
+"""Cookie identifying the uncompressed V2 encoding of an HdrHistogram (0x10 flags the ZigZag LEB128 counts)."""
+
+_V2_COMPRESSED_ENCODING_COOKIE: int = 0x1c849304 | 0x10
+"""Cookie identifying the compressed V2 encoding of an HdrHistogram."""
+
+_V2_HEADER = struct.Struct('>iiiiqqd')
+"""Header of the V2 encoding: cookie, payload length, normalizing index offset,
+significant figures, lowest and highest trackable values and the integer to double ratio."""
+
+_COMPRESSED_HEADER = struct.Struct('>ii')
+"""Header of the compressed V2 encoding: cookie and length of the deflated V2 encoding."""
+
+_LOG_FORMAT_VERSION: str = '1.3'
+"""Version of the HdrHistogram interval log format written by :meth:`LatencyHistogram.to_hdr_log`."""
+
+_MAX_SAFE_VALUE: int = 2 ** 53
+"""Values below this are exactly representable as floats, which the vectorized indexing relies on."""
+
+
+def _put_zigzag(buffer: bytearray, value: int) -> None:
+    """Append a signed 64 bit integer to the buffer in the ZigZag LEB128 encoding of HdrHistogram.
+
+    :param buffer: The buffer to append to.
+    :param value: The value to encode.
+    """
+    value = ((value << 1) ^ (value >> 63)) & 0xFFFFFFFFFFFFFFFF
+    for _ in range(8):
+        if value >> 7 == 0:
+            buffer.append(value)
+            return
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _get_zigzag(buffer: bytes, offset: int) -> tuple[int, int]:
+    """Read a signed 64 bit integer in the ZigZag LEB128 encoding of HdrHistogram.
+
+    :param buffer: The buffer to read from.
+    :param offset: The offset of the first byte of the value.
+    :return: The value and the offset of the byte following it.
+    """
+    value = 0
+    for shift in range(0, 56, 7):
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+    else:
+        value |= buffer[offset] << 56
+        offset += 1
+    return (value >> 1) ^ -(value & 1), offset
+
+
+class LatencyHistogram:
+    """An HDR-style histogram of latencies recorded as integers in timer units.
+
+    Values from 0 up to ``highest_trackable_value`` are recorded with a relative error of
+    at most ``10 ** -significant_figures`` (values below ``lowest_trackable_value`` are
+    resolved to ``lowest_trackable_value``). The statistics are computed from the counts:
+    the mean and standard deviation use the midpoint of each bucket, and a percentile is
+    the highest value equivalent to the bucket it falls in, as reported by HdrHistogram.
+
+    Like the data of :class:`~simplebench.stats.OperationTimings`, the statistics are
+    scaled to the base unit (seconds for the default nanosecond timer) by ``scale``.
+
+    :ivar unit: The unit of the recorded values (e.g. "ns"). (read only)
+    :vartype unit: str
+    :ivar scale: The scale factor of the recorded values (e.g. 1e-9 for nanoseconds). (read only)
+    :vartype scale: float
+    :ivar lowest_trackable_value: The lowest value distinguished from zero. (read only)
+    :vartype lowest_trackable_value: int
+    :ivar highest_trackable_value: The highest value that can be recorded. (read only)
+    :vartype highest_trackable_value: int
+    :ivar significant_figures: The number of significant decimal digits values are resolved to. (read only)
+    :vartype significant_figures: int
+    :ivar total_count: The number of values recorded. (read only)
+    :vartype total_count: int
+    :ivar counts: A read-only view of the bucket counts. (read only)
+    :vartype counts: numpy.ndarray
+    """
+    __slots__ = ('_unit', '_scale', '_lowest', '_highest', '_significant_figures',
+                 '_unit_magnitude', '_sub_bucket_half_count_magnitude', '_sub_bucket_half_count',
+                 '_sub_bucket_count', '_sub_bucket_mask', '_bucket_count', '_counts', '_total_count')
+
+    def __init__(self,
+                 *,
+                 lowest_trackable_value: int = DEFAULT_HISTOGRAM_LOWEST_TRACKABLE,
+                 highest_trackable_value: int = DEFAULT_HISTOGRAM_HIGHEST_TRACKABLE,
+                 significant_figures: int = DEFAULT_HISTOGRAM_SIGNIFICANT_FIGURES,
+                 unit: str = DEFAULT_INTERVAL_UNIT,
+                 scale: float = DEFAULT_INTERVAL_SCALE) -> None:
+        """Create an empty histogram.
+
+        :param lowest_trackable_value: The lowest value distinguished from zero. Must be at least 1.
+        :param highest_trackable_value: The highest value that can be recorded. Must be at least
+            twice ``lowest_trackable_value`` and below 2**53.
+        :param significant_figures: The number of significant decimal digits values are resolved
+            to, from 1 to 5.
+        :param unit: The unit of the recorded values (e.g. "ns").
+        :param scale: The scale factor of the recorded values (e.g. 1e-9 for nanoseconds).
+        :raises SimpleBenchTypeError: If any of the arguments are of the wrong type.
+        :raises SimpleBenchValueError: If any of the arguments have invalid values.
+        """
+        self._lowest: int = validate_positive_int(
+            lowest_trackable_value, 'lowest_trackable_value',
+            _LatencyHistogramErrorTag.INVALID_LOWEST_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_LOWEST_ARG_VALUE)
+        self._highest: int = validate_int_range(
+            highest_trackable_value, 'highest_trackable_value',
+            _LatencyHistogramErrorTag.INVALID_HIGHEST_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_HIGHEST_ARG_VALUE,
+            min_value=2 * self._lowest, max_value=_MAX_SAFE_VALUE - 1)
+        self._significant_figures: int = validate_int_range(
+            significant_figures, 'significant_figures',
+            _LatencyHistogramErrorTag.INVALID_SIGNIFICANT_FIGURES_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_SIGNIFICANT_FIGURES_ARG_VALUE,
+            min_value=1, max_value=5)
+        self._unit: str = validate_non_blank_string(
+            unit, 'unit',
+            _LatencyHistogramErrorTag.INVALID_UNIT_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_UNIT_ARG_VALUE)
+        self._scale: float = validate_positive_float(
+            scale, 'scale',
+            _LatencyHistogramErrorTag.INVALID_SCALE_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_SCALE_ARG_VALUE)
+
+        # Each bucket covers a power of two range of values with sub_bucket_count linear
+        # sub-buckets; the lower half of every bucket but the first overlaps the previous bucket
+        # and is not stored.
+        largest_value_with_single_unit_resolution = 2 * 10 ** self._significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_value_with_single_unit_resolution))
+        self._sub_bucket_half_count_magnitude: int = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_bucket_count: int = 1 << (self._sub_bucket_half_count_magnitude + 1)
+        self._sub_bucket_half_count: int = self._sub_bucket_count // 2
+        self._unit_magnitude: int = self._lowest.bit_length() - 1
+        self._sub_bucket_mask: int = (self._sub_bucket_count - 1) << self._unit_magnitude
+        smallest_untrackable_value = self._sub_bucket_count << self._unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable_value <= self._highest:
+            smallest_untrackable_value <<= 1
+            bucket_count += 1
+        self._bucket_count: int = bucket_count
+        self._counts: np.ndarray = np.zeros((bucket_count + 1) * self._sub_bucket_half_count, dtype=np.int64)
+        self._total_count: int = 0
+
+    @property
+    def unit(self) -> str:
+        """The unit of the recorded values."""
+        return self._unit
+
+    @property
+    def scale(self) -> float:
+        """The scale factor of the recorded values."""
+        return self._scale
+
+    @property
+    def lowest_trackable_value(self) -> int:
+        """The lowest value distinguished from zero."""
+        return self._lowest
+
+    @property
+    def highest_trackable_value(self) -> int:
+        """The highest value that can be recorded."""
+        return self._highest
+
+    @property
+    def significant_figures(self) -> int:
+        """The number of significant decimal digits values are resolved to."""
+        return self._significant_figures
+
+    @property
+    def total_count(self) -> int:
+        """The number of values recorded."""
+        return self._total_count
+
+    @property
+    def counts(self) -> np.ndarray:
+        """A read-only view of the bucket counts."""
+        view = self._counts.view()
+        view.flags.writeable = False
+        return view
+
+    def _indices(self, values: np.ndarray) -> np.ndarray:
+        """Return the counts indices of an array of values.
+
+        :param values: The values, as an int64 array in the trackable range.
+        :return: The indices of the buckets counting the values.
+        """
+        # frexp gives the bit length of the integers exactly as they are below 2**53
+        bit_lengths = np.frexp((values | self._sub_bucket_mask).astype(np.float64))[1].astype(np.int64)
+        bucket_indices = bit_lengths - self._unit_magnitude - (self._sub_bucket_half_count_magnitude + 1)
+        sub_bucket_indices = values >> (bucket_indices + self._unit_magnitude)
+        return (((bucket_indices + 1) << self._sub_bucket_half_count_magnitude)
+                + (sub_bucket_indices - self._sub_bucket_half_count))
+
+    def _equivalent_ranges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the lowest value and the size of the range of values counted by every bucket.
+
+        :return: The lowest equivalent values and the range sizes, indexed like :attr:`counts`.
+        """
+        indices = np.arange(len(self._counts), dtype=np.int64)
+        bucket_indices = (indices >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_indices = (indices & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        first_bucket = bucket_indices < 0
+        sub_bucket_indices[first_bucket] -= self._sub_bucket_half_count
+        bucket_indices[first_bucket] = 0
+        shifts = bucket_indices + self._unit_magnitude
+        return sub_bucket_indices << shifts, np.left_shift(1, shifts)
+
+    def _validated_values(self, values: Any) -> np.ndarray:
+        """Return the values as a rounded int64 array, checking that they can be recorded.
+
+        :param values: The values to record.
+        :return: The values as integers.
+        :raises SimpleBenchTypeError: If the values are not numbers.
+        :raises SimpleBenchValueError: If a value is negative or above the highest trackable value.
+        """
+        try:
+            array = np.rint(np.asarray(values, dtype=np.float64)).astype(np.int64)
+        except (TypeError, ValueError) as e:
+            raise SimpleBenchTypeError(
+                f'Invalid value type: {type(values)}. Values must be numbers.',
+                tag=_LatencyHistogramErrorTag.INVALID_VALUE_ARG_TYPE) from e
+        if array.size and (array.min() < 0 or array.max() > self._highest):
+            raise SimpleBenchValueError(
+                f'Values must be between 0 and the highest trackable value {self._highest}.',
+                tag=_LatencyHistogramErrorTag.VALUE_OUT_OF_RANGE)
+        return array.reshape(-1)
+
+    def record(self, value: int | float, count: int = 1) -> None:
+        """Record a value, ``count`` times.
+
+        :param value: The value, in timer units. Floats are rounded to the nearest integer.
+        :param count: The number of times the value occurred.
+        :raises SimpleBenchTypeError: If the value is not a number or the count is not an int.
+        :raises SimpleBenchValueError: If the value is out of range or the count is not positive.
+        """
+        count = validate_positive_int(
+            count, 'count',
+            _LatencyHistogramErrorTag.INVALID_COUNT_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_COUNT_ARG_VALUE)
+        if not isinstance(value, (int, float)):
+            raise SimpleBenchTypeError(
+                f'Invalid value type: {type(value)}. Must be an int or float.',
+                tag=_LatencyHistogramErrorTag.INVALID_VALUE_ARG_TYPE)
+        index = int(self._indices(self._validated_values(value))[0])
+        self._counts[index] += count
+        self._total_count += count
+
+    def record_values(self, values: Sequence[int | float] | np.ndarray) -> None:
+        """Record a sequence of values at once.
+
+        :param values: The values, in timer units. Floats are rounded to the nearest integer.
+        :raises SimpleBenchTypeError: If the values are not numbers.
+        :raises SimpleBenchValueError: If a value is out of range.
+        """
+        array = self._validated_values(values)
+        if array.size:
+            self._counts += np.bincount(self._indices(array), minlength=len(self._counts)).astype(np.int64)
+            self._total_count += int(array.size)
+
+    def record_corrected(self, value: int | float, expected_interval: int) -> None:
+        """Record a value measured by a closed loop, correcting for coordinated omission.
+
+        A closed loop that expects to make a call every ``expected_interval`` does not make the
+        calls that were due while a slow call was running. Besides the value, this records the
+        latencies those calls would have seen, ``value - expected_interval``,
+        ``value - 2 * expected_interval`` and so on down to ``expected_interval``, as
+        HdrHistogram's ``recordValueWithExpectedInterval`` does.
+
+        Open-loop measurements from the intended start time (see
+        :class:`~simplebench.runners.LoadRunner`) are already corrected and use :meth:`record`.
+
+        :param value: The measured value, in timer units.
+        :param expected_interval: The interval between calls expected by the loop, in timer units.
+        :raises SimpleBenchTypeError: If an argument is of the wrong type.
+        :raises SimpleBenchValueError: If the value is out of range or the interval is not positive.
+        """
+        expected_interval = validate_positive_int(
+            expected_interval, 'expected_interval',
+            _LatencyHistogramErrorTag.INVALID_EXPECTED_INTERVAL_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_EXPECTED_INTERVAL_ARG_VALUE)
+        self.record(value)
+        value = int(round(value))
+        if value > expected_interval:
+            self.record_values(np.arange(value - expected_interval, expected_interval - 1,
+                                         -expected_interval, dtype=np.int64))
+
+    def add(self, other: LatencyHistogram) -> None:
+        """Add the counts of another histogram with the same configuration (e.g. recorded by another worker).
+
+        :param other: The histogram to add.
+        :raises SimpleBenchTypeError: If ``other`` is not a LatencyHistogram.
+        :raises SimpleBenchValueError: If ``other`` has a different range, precision or unit.
+        """
+        if not isinstance(other, LatencyHistogram):
+            raise SimpleBenchTypeError(
+                f'Cannot add a {type(other)} to a LatencyHistogram.',
+                tag=_LatencyHistogramErrorTag.ADD_INVALID_OTHER_ARG_TYPE)
+        if self._configuration() != other._configuration():  # pylint: disable=protected-access
+            raise SimpleBenchValueError(
+                'Cannot add histograms with different trackable ranges, significant figures or units.',
+                tag=_LatencyHistogramErrorTag.ADD_INCOMPATIBLE_HISTOGRAM)
+        self._counts += other._counts  # pylint: disable=protected-access
+        self._total_count += other.total_count
+
+    def _configuration(self) -> tuple[Any, ...]:
+        """Return the settings that determine the bucket layout and the unit of the histogram."""
+        return (self._lowest, self._highest, self._significant_figures, self._unit, self._scale)
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Return the value below or equivalent to which ``percentile`` percent of the values fall.
+
+        :param percentile: The percentile, from 0.0 to 100.0.
+        :return: The value, in timer units, or 0 if the histogram is empty.
+        :raises SimpleBenchTypeError: If ``percentile`` is not a number.
+        :raises SimpleBenchValueError: If ``percentile`` is out of range.
+        """
+        if isinstance(percentile, int) and not isinstance(percentile, bool):
+            percentile = float(percentile)
+        percentile = validate_float_range(
+            percentile, 'percentile',
+            _LatencyHistogramErrorTag.INVALID_PERCENTILE_ARG_TYPE,
+            _LatencyHistogramErrorTag.INVALID_PERCENTILE_ARG_VALUE,
+            min_value=0.0, max_value=100.0)
+        return int(self._values_at_percentiles(np.array([percentile]))[0])
+
+    def _values_at_percentiles(self, percentiles: np.ndarray) -> np.ndarray:
+        """Return the values at an array of percentiles (see :meth:`value_at_percentile`).
+
+        :param percentiles: The percentiles, from 0.0 to 100.0.
+        :return: The values, in timer units.
+        """
+        if self._total_count == 0:
+            return np.zeros(len(percentiles), dtype=np.int64)
+        lowest, sizes = self._equivalent_ranges()
+        cumulative = np.cumsum(self._counts)
+        targets = np.maximum(np.floor(percentiles / 100.0 * self._total_count + 0.5), 1).astype(np.int64)
+        indices = np.searchsorted(cumulative, targets)
+        values = lowest[indices] + sizes[indices] - 1
+        # The 0th percentile is the lowest value equivalent to the minimum
+        values[percentiles == 0.0] = lowest[indices[percentiles == 0.0]]
+        return values
+
+    @property
+    def minimum(self) -> float:
+        """The lowest value equivalent to the smallest recorded value, scaled to the base unit."""
+        if self._total_count == 0:
+            return 0.0
+        lowest, _ = self._equivalent_ranges()
+        return float(lowest[np.flatnonzero(self._counts)[0]]) * self._scale
+
+    @property
+    def maximum(self) -> float:
+        """The highest value equivalent to the largest recorded value, scaled to the base unit."""
+        if self._total_count == 0:
+            return 0.0
+        lowest, sizes = self._equivalent_ranges()
+        index = np.flatnonzero(self._counts)[-1]
+        return float(lowest[index] + sizes[index] - 1) * self._scale
+
+    @property
+    def mean(self) -> float:
+        """The mean of the recorded values, scaled to the base unit."""
+        if self._total_count == 0:
+            return 0.0
+        lowest, sizes = self._equivalent_ranges()
+        midpoints = (lowest + (sizes >> 1)).astype(np.float64)
+        return float(np.dot(self._counts, midpoints) / self._total_count) * self._scale
+
+    @property
+    def median(self) -> float:
+        """The median of the recorded values, scaled to the base unit."""
+        return self.value_at_percentile(50.0) * self._scale
+
+    @property
+    def standard_deviation(self) -> float:
+        """The standard deviation of the recorded values, scaled to the base unit."""
+        if self._total_count < 2:
+            return 0.0
+        lowest, sizes = self._equivalent_ranges()
+        midpoints = (lowest + (sizes >> 1)).astype(np.float64) * self._scale
+        deviations = midpoints - self.mean
+        variance = np.dot(self._counts, deviations * deviations) / (self._total_count - 1)
+        return float(math.sqrt(variance))
+
+    @property
+    def relative_standard_deviation(self) -> float:
+        """The relative standard deviation of the recorded values, in percent."""
+        mean = self.mean
+        return abs(self.standard_deviation / mean * 100) if mean else 0.0
+
+    @property
+    def percentiles(self) -> tuple[float, ...]:
+        """The 0th through 100th percentiles of the recorded values, scaled to the base unit."""
+        values = self._values_at_percentiles(np.arange(101, dtype=np.float64))
+        return tuple(float(value) * self._scale for value in values)
+
+    def encode(self) -> str:
+        """Return the histogram in the base64 compressed V2 encoding of HdrHistogram.
+
+        :return: The encoded histogram.
+        """
+        nonzero = np.flatnonzero(self._counts)
+        limit = int(nonzero[-1]) + 1 if nonzero.size else 0
+        payload = bytearray()
+        zeros = 0
+        for count in self._counts[:limit].tolist():
+            if count == 0:
+                zeros += 1
+                continue
+            if zeros:
+                _put_zigzag(payload, -zeros if zeros > 1 else 0)
+                zeros = 0
+            _put_zigzag(payload, count)
+        header = _V2_HEADER.pack(_V2_ENCODING_COOKIE, len(payload), 0, self._significant_figures,
+                                 self._lowest, self._highest, 1.0)
+        deflated = zlib.compress(header + bytes(payload))
+        encoded = _COMPRESSED_HEADER.pack(_V2_COMPRESSED_ENCODING_COOKIE, len(deflated)) + deflated
+        return base64.b64encode(encoded).decode('ascii')
+
+    @classmethod
+    def decode(cls, encoded: str, *, unit: str = DEFAULT_INTERVAL_UNIT,
+               scale: float = DEFAULT_INTERVAL_SCALE) -> LatencyHistogram:
+        """Create a histogram from the base64 compressed V2 encoding of HdrHistogram.
+
+        :param encoded: The encoded histogram (as returned by :meth:`encode`).
+        :param unit: The unit of the encoded values (not part of the encoding).
+        :param scale: The scale factor of the encoded values (not part of the encoding).
+        :return: The decoded histogram.
+        :raises SimpleBenchValueError: If ``encoded`` is not a valid encoding.
+        """
+        try:
+            raw = base64.b64decode(encoded, validate=True)
+            cookie, length = _COMPRESSED_HEADER.unpack_from(raw)
+            if cookie != _V2_COMPRESSED_ENCODING_COOKIE:
+                raise ValueError(f'unexpected cookie {cookie:#x}')
+            inflated = zlib.decompress(raw[_COMPRESSED_HEADER.size:_COMPRESSED_HEADER.size + length])
+            cookie, payload_length, _, significant_figures, lowest, highest, _ = _V2_HEADER.unpack_from(inflated)
+            if cookie != _V2_ENCODING_COOKIE:
+                raise ValueError(f'unexpected cookie {cookie:#x}')
+            histogram = cls(lowest_trackable_value=lowest, highest_trackable_value=highest,
+                            significant_figures=significant_figures, unit=unit, scale=scale)
+            payload = inflated[_V2_HEADER.size:_V2_HEADER.size + payload_length]
+            index = offset = 0
+            while offset < len(payload):
+                count, offset = _get_zigzag(payload, offset)
+                if count < 0:
+                    index -= count
+                    continue
+                histogram._counts[index] = count  # pylint: disable=protected-access
+                index += 1
+        except (ValueError, TypeError, IndexError, struct.error, zlib.error,
+                SimpleBenchTypeError, SimpleBenchValueError) as e:
+            raise SimpleBenchValueError(
+                f'Invalid encoded histogram: {e}',
+                tag=_LatencyHistogramErrorTag.DECODE_INVALID_ENCODING) from e
+        histogram._total_count = int(histogram._counts.sum())  # pylint: disable=protected-access
+        return histogram
+
+    def to_hdr_log(self,
+                   *,
+                   start_time: float | None = None,
+                   interval_length: float = 0.0,
+                   tag: str | None = None,
+                   max_value_unit_ratio: float = 1e6) -> str:
+        """Return the histogram as a single interval in the HdrHistogram interval log format (.hlog).
+
+        :param start_time: The start of the interval, in seconds since the epoch. Defaults to now.
+        :param interval_length: The length of the interval, in seconds.
+        :param tag: An optional tag for the interval.
+        :param max_value_unit_ratio: The ratio the maximum value is divided by in the log
+            (1e6 reports nanoseconds as milliseconds, as HdrHistogram does by default).
+        :return: The log text.
+        """
+        if start_time is None:
+            start_time = time.time()
+        start = datetime.datetime.fromtimestamp(start_time, tz=datetime.timezone.utc)
+        maximum = (self.maximum / self._scale) / max_value_unit_ratio
+        tag_prefix = '' if tag is None else f'Tag={tag},'
+        return (f'#[Histogram log format version {_LOG_FORMAT_VERSION}]\n'
+                f'#[StartTime: {start_time:.3f} (seconds since epoch), {start.strftime("%a %b %d %H:%M:%S %Z %Y")}]\n'
+                '"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n'
+                f'{tag_prefix}0.000,{interval_length:.3f},{maximum:.3f},{self.encode()}\n')
+
+    @property
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram configuration and its encoded counts as a JSON-serializable dictionary."""
+        return {
+            'type': f'{self.__class__.__name__}:histogram',
+            'unit': self._unit,
+            'scale': self._scale,
+            'lowest_trackable_value': self._lowest,
+            'highest_trackable_value': self._highest,
+            'significant_figures': self._significant_figures,
+            'total_count': self._total_count,
+            'encoded': self.encode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyHistogram:
+        """Create a histogram from a dictionary returned by :attr:`as_dict`.
+
+        :param data: The dictionary.
+        :return: The histogram.
+        :raises SimpleBenchTypeError: If ``data`` is not a dict.
+        :raises SimpleBenchKeyError: If a required key is missing.
+        :raises SimpleBenchValueError: If the encoded counts are invalid.
+        """
+        if not isinstance(data, dict):
+            raise SimpleBenchTypeError(
+                'The data argument must be a dictionary.',
+                tag=_LatencyHistogramErrorTag.FROM_DICT_INVALID_DATA_ARG_TYPE)
+        for key in ('unit', 'scale', 'encoded'):
+            if key not in data:
+                raise SimpleBenchKeyError(
+                    f"The data dictionary is missing the required '{key}' key.",
+                    tag=_LatencyHistogramErrorTag.FROM_DICT_MISSING_KEY)
+        return cls.decode(data['encoded'], unit=data['unit'], scale=data['scale'])
+
+    def __eq__(self, other: object) -> bool:
+        """Histograms are equal if they have the same configuration and counts."""
+        if not isinstance(other, LatencyHistogram):
+            return NotImplemented
+        return (self._configuration() == other._configuration()  # pylint: disable=protected-access
+                and np.array_equal(self._counts, other._counts))  # pylint: disable=protected-access
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(lowest_trackable_value={self._lowest!r}, '
+                f'highest_trackable_value={self._highest!r}, significant_figures={self._significant_figures!r}, '
+                f'unit={self._unit!r}, scale={self._scale!r}, total_count={self._total_count!r})')
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from typing import Sequence
 
+import numpy as np
+
 from ..defaults import DEFAULT_MEMORY_SCALE, DEFAULT_MEMORY_UNIT
+from ..enums import Section
 from ..exceptions import SimpleBenchTypeError
 from ..iteration import Iteration
+from ..iteration_table import IterationTable
 from ..validators import validate_sequence_of_numbers
 from . import Stats, StatsSummary
 from .exceptions.memory_usage import _MemoryUsageErrorTag
@@ -40,7 +44,7 @@ class MemoryUsage(Stats):
     """
     def __init__(self,
                  *,
-                 iterations: Sequence[Iteration] | None = None,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
                  unit: str = DEFAULT_MEMORY_UNIT,
                  scale: float = DEFAULT_MEMORY_SCALE,
                  rounds: int = 1,
@@ -57,6 +61,7 @@ class MemoryUsage(Stats):
 
         :param iterations: Optional list of
             :class:`~simplebench.iteration.Iteration` objects to extract memory data from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
         :param unit: Optional unit of measurement for the memory usage (e.g., "MB").
             Defaults to 'bytes'.
         :param scale: Optional scale factor for the memory usage (e.g., "1e6" for
@@ -80,7 +85,12 @@ class MemoryUsage(Stats):
                 type_tag=_MemoryUsageErrorTag.INVALID_DATA_ARG_TYPE,
                 value_tag=_MemoryUsageErrorTag.INVALID_DATA_ARG_VALUE))
 
-        if iterations is not None:
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.MEMORY) if not imported_data
+                            else imported_data + iterations.section(Section.MEMORY).tolist())
+        elif iterations is not None:
             if not isinstance(iterations, Sequence):
                 raise SimpleBenchTypeError(
                     "passed iterations arg is not a Sequence",
@@ -92,7 +102,7 @@ class MemoryUsage(Stats):
                     tag=_MemoryUsageErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
             imported_data.extend(iteration.memory for iteration in iterations)
 
-        super().__init__(unit=unit, scale=scale, rounds=rounds, data=imported_data)
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
 
 
 class MemoryUsageSummary(StatsSummary):
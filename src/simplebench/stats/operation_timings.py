@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from typing import Optional, Sequence
 
+import numpy as np
+
 from ..defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT
+from ..enums import Section
 from ..exceptions import SimpleBenchTypeError
 from ..iteration import Iteration
+from ..iteration_table import IterationTable
 from ..validators import validate_sequence_of_numbers
 from . import Stats, StatsSummary
 from .exceptions.operation_timings import _OperationTimingsErrorTag
@@ -41,7 +45,7 @@ class OperationTimings(Stats):
     """
     def __init__(self,
                  *,
-                 iterations: Sequence[Iteration] | None = None,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
                  unit: str = DEFAULT_INTERVAL_UNIT,
                  scale: float = DEFAULT_INTERVAL_SCALE,
                  rounds: int = 1,
@@ -50,6 +54,7 @@ class OperationTimings(Stats):
 
         :param iterations: Sequence of
             :class:`~simplebench.iteration.Iteration` objects to extract timing data from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
         :param unit: The unit of measurement for the timings (e.g., "ns").
         :param scale: The scale factor for the timings (e.g., "1e-9" for nanoseconds).
         :param rounds: The number of data points in the benchmark.
@@ -71,7 +76,12 @@ class OperationTimings(Stats):
                 type_tag=_OperationTimingsErrorTag.INVALID_DATA_ARG_TYPE,
                 value_tag=_OperationTimingsErrorTag.INVALID_DATA_ARG_VALUE))
 
-        if iterations is not None:
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.TIMING) if not imported_data
+                            else imported_data + iterations.section(Section.TIMING).tolist())
+        elif iterations is not None:
             if not isinstance(iterations, Sequence):
                 raise SimpleBenchTypeError(
                     "passed iterations arg is not a Sequence",
@@ -83,7 +93,7 @@ class OperationTimings(Stats):
                     tag=_OperationTimingsErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
             imported_data.extend(iteration.per_round_elapsed for iteration in iterations)
 
-        super().__init__(unit=unit, scale=scale, rounds=rounds, data=imported_data)
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
 
 
 class OperationTimingsSummary(StatsSummary):
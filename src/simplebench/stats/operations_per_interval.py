@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from typing import Optional, Sequence
 
+import numpy as np
+
 from ..defaults import DEFAULT_OPS_PER_INTERVAL_SCALE, DEFAULT_OPS_PER_INTERVAL_UNIT
+from ..enums import Section
 from ..exceptions import SimpleBenchTypeError
 from ..iteration import Iteration
+from ..iteration_table import IterationTable
 from ..validators import validate_sequence_of_numbers
 from . import Stats, StatsSummary
 from .exceptions.operations_per_interval import _OperationsPerIntervalErrorTag
@@ -41,7 +45,7 @@ class OperationsPerInterval(Stats):
     """
     def __init__(self,
                  *,
-                 iterations: Sequence[Iteration] | None = None,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
                  unit: str = DEFAULT_OPS_PER_INTERVAL_UNIT,
                  scale: float = DEFAULT_OPS_PER_INTERVAL_SCALE,
                  rounds: int = 1,
@@ -50,6 +54,7 @@ class OperationsPerInterval(Stats):
 
         :param iterations: List of
             :class:`~simplebench.iteration.Iteration` objects to extract ops data from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
         :param unit: The unit of measurement for the benchmark (e.g., "ops/s").
         :param scale: The scale factor for the interval (e.g. 1 for seconds).
         :param rounds: The number of data points in the benchmark.
@@ -71,7 +76,12 @@ class OperationsPerInterval(Stats):
                 type_tag=_OperationsPerIntervalErrorTag.INVALID_DATA_ARG_TYPE,
                 value_tag=_OperationsPerIntervalErrorTag.INVALID_DATA_ARG_VALUE))
 
-        if iterations is not None:
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.OPS) if not imported_data
+                            else imported_data + iterations.section(Section.OPS).tolist())
+        elif iterations is not None:
             if not isinstance(iterations, Sequence):
                 raise SimpleBenchTypeError(
                     "passed iterations arg is not a Sequence",
@@ -83,7 +93,7 @@ class OperationsPerInterval(Stats):
                     tag=_OperationsPerIntervalErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
             imported_data.extend(iteration.ops_per_second for iteration in iterations)
 
-        super().__init__(unit=unit, scale=scale, rounds=rounds, data=imported_data)
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
 
 
 class OperationsPerIntervalSummary(StatsSummary):
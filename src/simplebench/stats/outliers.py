@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""Outlier classification and robust estimators for benchmark data.
+
+A single garbage collection pause, interrupt or page fault storm produces a sample far
+from the rest, which drags the mean and inflates the standard deviation. The functions
+here classify such samples as mild or severe outliers and provide estimators that are
+insensitive to them.
+"""
+from __future__ import annotations
+
+import math
+import statistics
+from typing import NamedTuple, Sequence
+
+from ..defaults import DEFAULT_TRIM_PROPORTION
+from ..enums import OutlierMethod
+from ..validators import validate_float_range, validate_sequence_of_numbers, validate_type
+from .exceptions.outliers import _OutliersErrorTag
+
+TUKEY_MILD_FENCE: float = 1.5
+"""Interquartile ranges outside the quartiles beyond which a sample is a mild outlier."""
+
+TUKEY_SEVERE_FENCE: float = 3.0
+"""Interquartile ranges outside the quartiles beyond which a sample is a severe outlier."""
+
+MAD_MILD_THRESHOLD: float = 3.5
+"""Modified z-score beyond which a sample is a mild outlier (Iglewicz and Hoaglin, 1993)."""
+
+MAD_SEVERE_THRESHOLD: float = 7.0
+"""Modified z-score beyond which a sample is a severe outlier."""
+
+MAD_NORMAL_CONSISTENCY: float = 1.4826
+"""Factor scaling the median absolute deviation to the standard deviation of normal data."""
+
+MEAN_AD_NORMAL_CONSISTENCY: float = 1.2533
+"""Factor scaling the mean absolute deviation to the standard deviation of normal data."""
+
+MIN_OUTLIER_SAMPLES: int = 4
+"""The minimum number of data points for which outliers are classified."""
+
+
+class Outliers(NamedTuple):
+    """The outliers in a sequence of data points.
+
+    :ivar mild: The indices of the mild outliers, in ascending order.
+    :vartype mild: tuple[int, ...]
+    :ivar severe: The indices of the severe outliers, in ascending order.
+    :vartype severe: tuple[int, ...]
+    """
+    mild: tuple[int, ...] = ()
+    severe: tuple[int, ...] = ()
+
+    @property
+    def total(self) -> int:
+        """The number of mild and severe outliers."""
+        return len(self.mild) + len(self.severe)
+
+    @property
+    def indices(self) -> tuple[int, ...]:
+        """The indices of all outliers, in ascending order."""
+        return tuple(sorted(self.mild + self.severe))
+
+
+def _validate_data(data: Sequence[int | float]) -> list[int | float]:
+    """Validate the data argument of the functions in this module.
+
+    :param data: The data points.
+    :return: The data points as a list.
+    """
+    return list(validate_sequence_of_numbers(
+        data, 'data',
+        type_tag=_OutliersErrorTag.INVALID_DATA_ARG_TYPE,
+        value_tag=_OutliersErrorTag.INVALID_DATA_ARG_VALUE,
+        allow_empty=False))
+
+
+def median_absolute_deviation(data: Sequence[int | float]) -> float:
+    """Return the median absolute deviation of ``data`` from its median.
+
+    The value is not scaled; multiply it by :data:`MAD_NORMAL_CONSISTENCY` to estimate
+    the standard deviation of normally distributed data.
+
+    :param data: The data points. Must not be empty.
+    :return: The median absolute deviation.
+    :raises SimpleBenchTypeError: If ``data`` is not a sequence of numbers.
+    :raises SimpleBenchValueError: If ``data`` is empty.
+    """
+    values = _validate_data(data)
+    median = statistics.median(values)
+    return float(statistics.median(abs(value - median) for value in values))
+
+
+def trimmed_mean(data: Sequence[int | float], proportion: float = DEFAULT_TRIM_PROPORTION) -> float:
+    """Return the mean of ``data`` after cutting ``proportion`` of the data points from each end.
+
+    The number of points cut from each end is rounded down, so a proportion of 0.0 (or too
+    few data points to cut any) gives the ordinary mean.
+
+    :param data: The data points. Must not be empty.
+    :param proportion: The proportion cut from each end, at least 0.0 and less than 0.5.
+    :return: The trimmed mean.
+    :raises SimpleBenchTypeError: If an argument is of the wrong type.
+    :raises SimpleBenchValueError: If ``data`` is empty or ``proportion`` is out of range.
+    """
+    values = sorted(_validate_data(data))
+    proportion = validate_float_range(
+        proportion, 'proportion',
+        _OutliersErrorTag.INVALID_PROPORTION_ARG_TYPE,
+        _OutliersErrorTag.INVALID_PROPORTION_ARG_VALUE,
+        min_value=0.0, max_value=math.nextafter(0.5, 0.0))
+    cut = int(len(values) * proportion)
+    return float(statistics.fmean(values[cut:len(values) - cut]))
+
+
+def _tukey_outliers(values: list[int | float]) -> Outliers:
+    """Classify the data points outside the Tukey fences of the interquartile range as outliers.
+
+    :param values: The data points. Must hold at least :data:`MIN_OUTLIER_SAMPLES` points.
+    :return: The indices of the mild and severe outliers.
+    """
+    mild: list[int] = []
+    severe: list[int] = []
+    first, _, third = statistics.quantiles(values, n=4, method='inclusive')
+    iqr = third - first
+    for index, value in enumerate(values):
+        if value < first - TUKEY_SEVERE_FENCE * iqr or value > third + TUKEY_SEVERE_FENCE * iqr:
+            severe.append(index)
+        elif value < first - TUKEY_MILD_FENCE * iqr or value > third + TUKEY_MILD_FENCE * iqr:
+            mild.append(index)
+    return Outliers(mild=tuple(mild), severe=tuple(severe))
+
+
+def _mad_outliers(values: list[int | float]) -> Outliers:
+    """Classify the data points far from the median in robust standard deviations as outliers.
+
+    :param values: The data points. Must hold at least :data:`MIN_OUTLIER_SAMPLES` points.
+    :return: The indices of the mild and severe outliers.
+    """
+    median = statistics.median(values)
+    deviations = [abs(value - median) for value in values]
+    sigma = MAD_NORMAL_CONSISTENCY * statistics.median(deviations)
+    if sigma == 0.0:
+        sigma = MEAN_AD_NORMAL_CONSISTENCY * statistics.fmean(deviations)
+    if sigma == 0.0:
+        return Outliers()
+    mild: list[int] = []
+    severe: list[int] = []
+    for index, deviation in enumerate(deviations):
+        score = deviation / sigma
+        if score > MAD_SEVERE_THRESHOLD:
+            severe.append(index)
+        elif score > MAD_MILD_THRESHOLD:
+            mild.append(index)
+    return Outliers(mild=tuple(mild), severe=tuple(severe))
+
+
+def classify_outliers(data: Sequence[int | float], method: OutlierMethod = OutlierMethod.TUKEY) -> Outliers:
+    """Classify the data points of ``data`` as mild or severe outliers.
+
+    With :attr:`OutlierMethod.TUKEY`, a point is a mild outlier if it lies more than
+    :data:`TUKEY_MILD_FENCE` interquartile ranges below the first or above the third
+    quartile, and a severe outlier beyond :data:`TUKEY_SEVERE_FENCE`.
+
+    With :attr:`OutlierMethod.MAD`, a point is a mild outlier if its distance from the
+    median is more than :data:`MAD_MILD_THRESHOLD` robust standard deviations, and a
+    severe outlier beyond :data:`MAD_SEVERE_THRESHOLD`. The robust standard deviation is
+    estimated from the median absolute deviation or, if more than half the points are
+    identical, from the mean absolute deviation.
+
+    Fewer than :data:`MIN_OUTLIER_SAMPLES` data points are never classified as outliers.
+
+    :param data: The data points. Must not be empty.
+    :param method: The classification method.
+    :return: The indices of the mild and severe outliers.
+    :raises SimpleBenchTypeError: If an argument is of the wrong type.
+    :raises SimpleBenchValueError: If ``data`` is empty.
+    """
+    values = _validate_data(data)
+    method = validate_type(method, OutlierMethod, 'method', _OutliersErrorTag.INVALID_METHOD_ARG_TYPE)
+    if len(values) < MIN_OUTLIER_SAMPLES:
+        return Outliers()
+
+    if method == OutlierMethod.TUKEY:
+        return _tukey_outliers(values)
+    return _mad_outliers(values)
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from typing import Optional, Sequence
 
+import numpy as np
+
 from ..defaults import DEFAULT_MEMORY_SCALE, DEFAULT_MEMORY_UNIT
+from ..enums import Section
 from ..exceptions import SimpleBenchTypeError
 from ..iteration import Iteration
+from ..iteration_table import IterationTable
 from ..validators import validate_sequence_of_numbers
 from . import Stats, StatsSummary
 from .exceptions.peak_memory_usage import _PeakMemoryUsageErrorTag
@@ -40,7 +44,7 @@ class PeakMemoryUsage(Stats):
     """
     def __init__(self,
                  *,
-                 iterations: Sequence[Iteration] | None = None,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
                  unit: str = DEFAULT_MEMORY_UNIT,
                  scale: float = DEFAULT_MEMORY_SCALE,
                  rounds: int = 1,
@@ -50,6 +54,7 @@ class PeakMemoryUsage(Stats):
         :param iterations: Sequence of
             :class:`~simplebench.iteration.Iteration` objects to extract peak memory data
             from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
         :param unit: The unit of measurement for the memory usage (e.g., "MB").
         :param scale: The scale factor for the memory usage (e.g., "1e6" for megabytes).
         :param rounds: The number of data points in the benchmark.
@@ -72,7 +77,12 @@ class PeakMemoryUsage(Stats):
                 type_tag=_PeakMemoryUsageErrorTag.INVALID_DATA_ARG_TYPE,
                 value_tag=_PeakMemoryUsageErrorTag.INVALID_DATA_ARG_VALUE))
 
-        if iterations is not None:
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(Section.PEAK_MEMORY) if not imported_data
+                            else imported_data + iterations.section(Section.PEAK_MEMORY).tolist())
+        elif iterations is not None:
             if not isinstance(iterations, Sequence):
                 raise SimpleBenchTypeError(
                     "passed iterations arg is not a Sequence",
@@ -84,7 +94,7 @@ class PeakMemoryUsage(Stats):
                     tag=_PeakMemoryUsageErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
             imported_data.extend(iteration.peak_memory for iteration in iterations)
 
-        super().__init__(unit=unit, scale=scale, rounds=rounds, data=imported_data)
+        super().__init__(unit=unit, scale=scale, rounds=rounds, data=section_data)
 
 
 class PeakMemoryUsageSummary(StatsSummary):
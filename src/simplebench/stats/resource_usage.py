@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Containers for benchmark statistics"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..enums import Section
+from ..exceptions import SimpleBenchTypeError, SimpleBenchValueError
+from ..iteration import Iteration
+from ..iteration_table import IterationTable
+from ..validators import validate_sequence_of_numbers, validate_type
+from . import Stats, StatsSummary
+from .exceptions.resource_usage import _ResourceUsageErrorTag
+
+RUSAGE_SECTION_UNITS: MappingProxyType[Section, str] = MappingProxyType({
+    Section.MINOR_PAGE_FAULTS: 'faults',
+    Section.MAJOR_PAGE_FAULTS: 'faults',
+    Section.VOLUNTARY_CONTEXT_SWITCHES: 'switches',
+    Section.INVOLUNTARY_CONTEXT_SWITCHES: 'switches',
+    Section.BLOCK_IO: 'ops',
+    Section.MAX_RSS: 'bytes',
+})
+"""The :class:`~simplebench.enums.Section` of each operating system resource counter and its unit."""
+
+NATIVE_MEMORY_SECTION_UNITS: MappingProxyType[Section, str] = MappingProxyType({
+    Section.RSS: 'bytes',
+    Section.USS: 'bytes',
+    Section.PSS: 'bytes',
+    Section.PEAK_RSS: 'bytes',
+})
+"""The :class:`~simplebench.enums.Section` of each native memory size and its unit."""
+
+_SECTION_UNITS: MappingProxyType[Section, str] = MappingProxyType(
+    {**RUSAGE_SECTION_UNITS, **NATIVE_MEMORY_SECTION_UNITS})
+"""The sections a :class:`ResourceUsage` can hold and their units."""
+
+
+class ResourceUsage(Stats):
+    """Container for the statistics of one operating system resource counter of a benchmark.
+
+    Each data point is the value of the counter selected by ``section`` (see
+    :data:`RUSAGE_SECTION_UNITS` and :data:`NATIVE_MEMORY_SECTION_UNITS`) for one timed
+    iteration, as recorded in :attr:`~simplebench.iteration.Iteration.rusage` or
+    :attr:`~simplebench.iteration.Iteration.native_memory`.
+
+    :ivar section: The resource counter section the statistics are for.
+    :vartype section: Section
+    :ivar unit: The unit of measurement for the counter (e.g., "faults").
+    :vartype unit: str
+    :ivar scale: The scale factor for the counter.
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar data: Tuple of counter data points.
+    :vartype data: tuple[int | float, ...]
+    :ivar mean: The mean counter value per iteration.
+    :vartype mean: float
+    :ivar median: The median counter value per iteration.
+    :vartype median: float
+    :ivar minimum: The minimum counter value per iteration.
+    :vartype minimum: float
+    :ivar maximum: The maximum counter value per iteration.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the counter values.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the counter values.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of the counter values.
+    :vartype percentiles: dict[int, float]
+    """
+    def __init__(self,
+                 *,
+                 section: Section,
+                 iterations: Sequence[Iteration] | IterationTable | None = None,
+                 unit: Optional[str] = None,
+                 scale: float = 1.0,
+                 rounds: int = 1,
+                 data: Optional[Sequence[int | float]] = None):
+        """Construct ResourceUsage stats from Iteration or raw counter data.
+
+        :param section: The resource counter section. Must be one of the keys of
+            :data:`RUSAGE_SECTION_UNITS` or :data:`NATIVE_MEMORY_SECTION_UNITS`.
+        :param iterations: Sequence of
+            :class:`~simplebench.iteration.Iteration` objects to extract the counter from.
+            An :class:`~simplebench.iteration_table.IterationTable` is read a column at a time.
+        :param unit: The unit of measurement for the counter. Defaults to the unit of the
+            section in :data:`RUSAGE_SECTION_UNITS` or :data:`NATIVE_MEMORY_SECTION_UNITS`.
+        :param scale: The scale factor for the counter.
+        :param rounds: The number of data points in the benchmark.
+        :param data: Optional Sequence of counter data points. If not provided, the
+            counter will be extracted from the iterations if available.
+        :raises ~simplebench.exceptions.SimpleBenchTypeError: If any of the arguments are
+            of the wrong type.
+        :raises ~simplebench.exceptions.SimpleBenchValueError: If any of the arguments have
+            invalid values.
+        """
+        section = validate_type(section, Section, 'section', _ResourceUsageErrorTag.INVALID_SECTION_ARG_TYPE)
+        if section not in _SECTION_UNITS:
+            raise SimpleBenchValueError(
+                f"section must be a resource counter or native memory section - cannot be {section}",
+                tag=_ResourceUsageErrorTag.INVALID_SECTION_ARG_VALUE)
+        self._section: Section = section
+        if iterations is None and data is None:
+            raise SimpleBenchTypeError(
+                "either iterations or data must be provided",
+                tag=_ResourceUsageErrorTag.NO_DATA_OR_ITERATIONS_PROVIDED)
+        if data is None:
+            data = []
+        imported_data: list[int | float] = list(validate_sequence_of_numbers(
+                data, 'data',
+                type_tag=_ResourceUsageErrorTag.INVALID_DATA_ARG_TYPE,
+                value_tag=_ResourceUsageErrorTag.INVALID_DATA_ARG_VALUE))
+
+        section_data: list[int | float] | np.ndarray = imported_data
+        if isinstance(iterations, IterationTable):
+            # The table section is used as is unless it has to be appended to explicit data
+            section_data = (iterations.section(section) if not imported_data
+                            else imported_data + iterations.section(section).tolist())
+        elif iterations is not None:
+            if not isinstance(iterations, Sequence):
+                raise SimpleBenchTypeError(
+                    "passed iterations arg is not a Sequence",
+                    tag=_ResourceUsageErrorTag.INVALID_ITERATIONS_ARG_TYPE)
+
+            if not all(isinstance(iteration, Iteration) for iteration in iterations):
+                raise SimpleBenchTypeError(
+                    "There are items in the iterations arg sequence that are not Iteration objects",
+                    tag=_ResourceUsageErrorTag.INVALID_ITERATIONS_ITEM_ARG_TYPE)
+            imported_data.extend(iteration.iteration_section(section) for iteration in iterations)
+
+        super().__init__(unit=_SECTION_UNITS[section] if unit is None else unit,
+                         scale=scale, rounds=rounds, data=section_data)
+
+    @property
+    def section(self) -> Section:
+        """The resource counter section the statistics are for."""
+        return self._section
+
+
+class ResourceUsageSummary(StatsSummary):
+    """Container for the summary of the statistics of one operating system resource counter.
+
+    :ivar unit: The unit of measurement for the counter (e.g., "faults").
+    :vartype unit: str
+    :ivar scale: The scale factor for the counter.
+    :vartype scale: float
+    :ivar rounds: The number of data points in the benchmark.
+    :vartype rounds: int
+    :ivar mean: The mean counter value per iteration.
+    :vartype mean: float
+    :ivar median: The median counter value per iteration.
+    :vartype median: float
+    :ivar minimum: The minimum counter value per iteration.
+    :vartype minimum: float
+    :ivar maximum: The maximum counter value per iteration.
+    :vartype maximum: float
+    :ivar standard_deviation: The standard deviation of the counter values.
+    :vartype standard_deviation: float
+    :ivar relative_standard_deviation: The relative standard deviation of the counter values.
+    :vartype relative_standard_deviation: float
+    :ivar percentiles: Percentiles of the counter values.
+    :vartype percentiles: dict[int, float]
+    """
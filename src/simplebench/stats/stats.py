@@ -6,7 +6,17 @@ import statistics
 from math import isclose
 from typing import Any, Sequence
 
-from ..exceptions import SimpleBenchKeyError, SimpleBenchTypeError
+import numpy as np
+
+from ..defaults import (
+    DEFAULT_BOOTSTRAP_PERCENTILES,
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_BOOTSTRAP_SEED,
+    DEFAULT_CONFIDENCE_LEVEL,
+    DEFAULT_TRIM_PROPORTION,
+)
+from ..enums import OutlierMethod
+from ..exceptions import SimpleBenchKeyError, SimpleBenchTypeError, SimpleBenchValueError
 from ..si_units import si_scale_to_unit, si_unit_base
 from ..validators import (
     validate_float,
@@ -16,7 +26,10 @@ from ..validators import (
     validate_positive_int,
     validate_sequence_of_numbers,
 )
+from .bootstrap import BootstrapIntervals, bootstrap_intervals
 from .exceptions.stats import _StatsErrorTag, _StatsSummaryErrorTag
+from .histogram import LatencyHistogram
+from .outliers import Outliers, classify_outliers, median_absolute_deviation, trimmed_mean
 
 
 class Stats:
@@ -33,17 +46,27 @@ class Stats:
     :ivar float standard_deviation: The standard deviation of operations per time interval. (read only)
     :ivar float relative_standard_deviation: The relative standard deviation of ops per time interval. (read only)
     :ivar tuple[float, ...] percentiles: Percentiles of operations per time interval. (read only)
+    :ivar float median_absolute_deviation: The median absolute deviation of the data. (read only)
+    :ivar float filtered_mean: The mean of the data without its Tukey outliers. (read only)
+    :ivar float filtered_standard_deviation: The standard deviation of the data without its
+        Tukey outliers. (read only)
+    :ivar float filtered_relative_standard_deviation: The relative standard deviation of the data
+        without its Tukey outliers. (read only)
     '''
     __slots__ = ('_unit', '_scale', '_rounds', '_data', '_percentiles', '_mean', '_median',
                  '_minimum', '_maximum', '_standard_deviation', '_relative_standard_deviation',
-                 '_statistics_as_dict', '_statistics_and_data_as_dict')
+                 '_statistics_as_dict', '_statistics_and_data_as_dict',
+                 '_outliers', '_median_absolute_deviation', '_bootstrap_intervals')
 
-    def __init__(self, *, unit: str, scale: float, data: Sequence[int | float], rounds: int = 1) -> None:
+    def __init__(self, *, unit: str, scale: float, data: Sequence[int | float] | np.ndarray, rounds: int = 1) -> None:
         """Initialize the Stats object.
 
         :param str unit: The unit of measurement for the benchmark (e.g., "ops/s").
         :param float scale: The scale factor for the interval (e.g. 1 for seconds).
-        :param Sequence[int | float] data: Sequence of data points.
+        :param Sequence[int | float] | numpy.ndarray data: Sequence of data points. A 1-dimensional
+            numeric NumPy array (such as a section of an
+            :class:`~simplebench.iteration_table.IterationTable`) is validated by its dtype
+            rather than element by element.
         :param int rounds: The number of rounds each data point represents.
         :raises SimpleBenchTypeError: If any of the arguments are of the wrong type.
         :raises SimpleBenchValueError: If any of the arguments have invalid values.
@@ -61,7 +84,21 @@ class Stats:
                                 _StatsErrorTag.INVALID_ROUNDS_ARG_TYPE,
                                 _StatsErrorTag.INVALID_ROUNDS_ARG_VALUE)
         # data is left unsorted to allow for time series data to be preserved
-        self._data: tuple[int | float, ...] = tuple(validate_sequence_of_numbers(
+        self._data: tuple[int | float, ...]
+        if isinstance(data, np.ndarray):
+            # Columnar data (e.g. an IterationTable section) is checked by its dtype instead of
+            # element by element and converted to Python numbers in a single pass.
+            if data.ndim != 1 or data.dtype.kind not in 'iuf':
+                raise SimpleBenchTypeError(
+                    f'Invalid data array: {data.ndim}-dimensional {data.dtype}. Must be a 1-dimensional numeric array.',
+                    tag=_StatsErrorTag.INVALID_DATA_ARG_TYPE)
+            if data.size == 0:
+                raise SimpleBenchValueError(
+                    'Invalid data: sequence cannot be empty.',
+                    tag=_StatsErrorTag.INVALID_DATA_ARG_ITEM_TYPE)
+            self._data = tuple(data.tolist())
+        else:
+            self._data = tuple(validate_sequence_of_numbers(
                                             value=data,
                                             field_name='data',
                                             allow_empty=False,
@@ -76,6 +113,9 @@ class Stats:
         self._relative_standard_deviation: float | None = None
         self._statistics_as_dict: dict[str, str | float | dict[int, float] | list[int | float]] | None = None
         self._statistics_and_data_as_dict: dict[str, str | float | dict[int, float] | list[int | float]] | None = None
+        self._outliers: dict[OutlierMethod, Outliers] = {}
+        self._median_absolute_deviation: float | None = None
+        self._bootstrap_intervals: dict[tuple[Any, ...], BootstrapIntervals] = {}
 
     @property
     def unit(self) -> str:
@@ -149,6 +189,92 @@ class Stats:
             self._percentiles = self._calculate_percentiles()
         return self._percentiles
 
+    def outliers(self, method: OutlierMethod = OutlierMethod.TUKEY) -> Outliers:
+        '''Classify the data points as mild or severe outliers.
+
+        See :func:`~simplebench.stats.outliers.classify_outliers`.
+
+        :param method: The classification method.
+        :return: The indices of the mild and severe outliers in :attr:`data`.
+        :raises SimpleBenchTypeError: If ``method`` is not an :class:`~simplebench.enums.OutlierMethod`.
+        '''
+        if method not in self._outliers:
+            self._outliers[method] = classify_outliers(self.data, method)
+        return self._outliers[method]
+
+    def filtered_data(self, method: OutlierMethod = OutlierMethod.TUKEY) -> tuple[int | float, ...]:
+        '''The data points that are not mild or severe outliers, in their original order.
+
+        :param method: The classification method.
+        :return: The data points without the outliers.
+        :raises SimpleBenchTypeError: If ``method`` is not an :class:`~simplebench.enums.OutlierMethod`.
+        '''
+        excluded = set(self.outliers(method).indices)
+        return tuple(value for index, value in enumerate(self.data) if index not in excluded)
+
+    @property
+    def median_absolute_deviation(self) -> float:
+        '''The median absolute deviation of the data from its median.'''
+        if self._median_absolute_deviation is None:
+            self._median_absolute_deviation = median_absolute_deviation(self.data)
+        return self._median_absolute_deviation
+
+    def trimmed_mean(self, proportion: float = DEFAULT_TRIM_PROPORTION) -> float:
+        '''The mean of the data after cutting ``proportion`` of the data points from each end.
+
+        :param proportion: The proportion cut from each end, at least 0.0 and less than 0.5.
+        :return: The trimmed mean.
+        :raises SimpleBenchTypeError: If ``proportion`` is not a float.
+        :raises SimpleBenchValueError: If ``proportion`` is out of range.
+        '''
+        return trimmed_mean(self.data, proportion)
+
+    @property
+    def filtered_mean(self) -> float:
+        '''The mean of the data without its (Tukey) mild and severe outliers.'''
+        return statistics.mean(self.filtered_data())
+
+    @property
+    def filtered_standard_deviation(self) -> float:
+        '''The standard deviation of the data without its (Tukey) mild and severe outliers.'''
+        filtered = self.filtered_data()
+        return statistics.stdev(filtered) if len(filtered) > 1 else 0.0
+
+    @property
+    def filtered_relative_standard_deviation(self) -> float:
+        '''The relative standard deviation of the data without its (Tukey) mild and severe outliers.'''
+        mean = self.filtered_mean
+        return abs(self.filtered_standard_deviation / mean * 100) if mean else 0.0
+
+    def bootstrap_intervals(self,
+                            *,
+                            percentiles: Sequence[int | float] = DEFAULT_BOOTSTRAP_PERCENTILES,
+                            resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+                            confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+                            seed: int | None = DEFAULT_BOOTSTRAP_SEED) -> BootstrapIntervals:
+        '''Bootstrap confidence intervals of the mean, median and selected percentiles of the data.
+
+        See :func:`~simplebench.stats.bootstrap.bootstrap_intervals`. The intervals are
+        cached per combination of arguments.
+
+        :param percentiles: The percentiles (0 to 100) whose intervals are computed besides the mean and median.
+        :param resamples: The number of bootstrap resamples.
+        :param confidence_level: The confidence level, between 0.0 and 1.0 exclusive.
+        :param seed: The seed of the resampling, or None to seed it from the OS.
+        :return: The confidence intervals, in the (unscaled) unit of the data.
+        :raises SimpleBenchTypeError: If an argument is of the wrong type.
+        :raises SimpleBenchValueError: If an argument is out of range.
+        '''
+        key = (tuple(percentiles) if isinstance(percentiles, Sequence) else percentiles,
+               resamples, confidence_level, seed)
+        try:
+            return self._bootstrap_intervals[key]
+        except (KeyError, TypeError):
+            intervals = bootstrap_intervals(self.data, percentiles=percentiles, resamples=resamples,
+                                            confidence_level=confidence_level, seed=seed)
+        self._bootstrap_intervals[key] = intervals
+        return intervals
+
     def _calculate_percentiles(self) -> tuple[float, ...]:
         """Helper to calculate percentiles.
 
@@ -168,10 +294,11 @@ class Stats:
         return tuple(quantile_values)
 
     @property
-    def as_dict(self) -> dict[str, str | float | dict[int, float] | tuple[int | float, ...]]:
+    def as_dict(self) -> dict[str, str | float | dict[int, float] | tuple[int | float, ...] | dict[str, Any]]:
         '''Returns the statistics and data as a JSON-serializable dictionary.
 
-        This includes all the statistics as well as the raw data points.
+        This includes all the statistics as well as the raw data points and the indices
+        of the data points classified as mild or severe (Tukey) outliers.
 
         The data values are scaled according to the scale factor to provide
         human-readable values using the base unit rather than the scaled unit.
@@ -184,9 +311,12 @@ class Stats:
             A dictionary containing the statistics and the scaled data points.
         '''
         # Immutability is preserved because all values are primitives or copies already
-        stats = self.stats_summary.as_dict
+        stats: dict[str, str | float | dict[int, float] | tuple[int | float, ...] | dict[str, Any]] = {
+            **self.stats_summary.as_dict}
         stats['type'] = f'{self.__class__.__name__}:statistics'
         stats['data'] = tuple(value / self.scale for value in self.data)
+        outliers = self.outliers()
+        stats['outliers'] = {'method': OutlierMethod.TUKEY.value, 'mild': outliers.mild, 'severe': outliers.severe}
         return stats
 
     @property
@@ -525,6 +655,34 @@ class StatsSummary:
             percentiles=stats.percentiles
         )
 
+    @classmethod
+    def from_histogram(cls, histogram: LatencyHistogram) -> StatsSummary:
+        """Construct a new StatsSummary object from the counts of a latency histogram.
+
+        The statistics are computed directly from the bucket counts of the histogram
+        without materializing the recorded values (see :class:`~simplebench.stats.LatencyHistogram`).
+
+        :param LatencyHistogram histogram: The histogram to summarize.
+        :return: A new StatsSummary object with the statistics of the recorded values.
+        :raises SimpleBenchTypeError: If the histogram argument is not a LatencyHistogram.
+        """
+        if not isinstance(histogram, LatencyHistogram):
+            raise SimpleBenchTypeError(
+                "The histogram argument must be a LatencyHistogram object.",
+                tag=_StatsSummaryErrorTag.FROM_HISTOGRAM_INVALID_HISTOGRAM_ARG_TYPE)
+        return cls(
+            unit=histogram.unit,
+            scale=histogram.scale,
+            rounds=1,
+            mean=histogram.mean,
+            median=histogram.median,
+            minimum=histogram.minimum,
+            maximum=histogram.maximum,
+            standard_deviation=histogram.standard_deviation,
+            relative_standard_deviation=histogram.relative_standard_deviation,
+            percentiles=histogram.percentiles
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> StatsSummary:
         """Construct a StatsSummary object from a dictionary.
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Steady state detection for the warmup iterations of a benchmark.
+
+The first iterations of a benchmark are often slower than the rest: caches are cold,
+the specializing interpreter has not yet quickened the hot code paths and lazily
+initialized state is still being built. How many iterations that takes varies by orders
+of magnitude between actions, so a fixed warmup count is either wasteful or too short.
+
+A steady state is detected with a changepoint test on consecutive windows of iteration
+times: the iterations have settled when the medians of two adjacent windows differ by
+no more than the noise of the data (or a small relative tolerance).
+"""
+from __future__ import annotations
+
+import math
+import statistics
+from typing import Sequence
+
+from ..defaults import DEFAULT_WARMUP_TOLERANCE, DEFAULT_WARMUP_WINDOW
+from ..validators import validate_non_negative_float, validate_positive_int, validate_sequence_of_numbers
+from .exceptions.warmup import _WarmupErrorTag
+from .outliers import MAD_NORMAL_CONSISTENCY
+
+STEADY_STATE_Z: float = 2.0
+"""Standard errors by which two window medians must differ to be considered a level shift."""
+
+MEDIAN_EFFICIENCY_FACTOR: float = 1.2533
+"""Ratio of the standard error of the median to that of the mean for normally distributed data."""
+
+
+def _is_level(before: Sequence[int | float], after: Sequence[int | float], tolerance: float) -> bool:
+    """Return True if there is no level shift between two adjacent windows of data points.
+
+    :param before: The earlier window.
+    :param after: The later window, of the same length.
+    :param tolerance: The relative difference between the medians that is always accepted.
+    :return: Whether the windows are at the same level.
+    """
+    before_median = statistics.median(before)
+    after_median = statistics.median(after)
+    # The noise is estimated from the successive differences, which a slow trend barely affects
+    combined = [*before, *after]
+    differences = [abs(later - earlier) for earlier, later in zip(combined, combined[1:])]
+    sigma = MAD_NORMAL_CONSISTENCY * statistics.median(differences) / math.sqrt(2.0)
+    noise = STEADY_STATE_Z * MEDIAN_EFFICIENCY_FACTOR * sigma * math.sqrt(2.0 / len(after))
+    return abs(after_median - before_median) <= max(tolerance * abs(after_median), noise)
+
+
+def steady_state_start(data: Sequence[int | float],
+                       *,
+                       window: int = DEFAULT_WARMUP_WINDOW,
+                       tolerance: float = DEFAULT_WARMUP_TOLERANCE) -> int | None:
+    """Return the index at which a time series of iteration times reaches a steady state.
+
+    The series is scanned for the first pair of adjacent windows of ``window`` data points
+    whose medians differ by no more than ``tolerance`` relative to the later median, or by
+    no more than :data:`STEADY_STATE_Z` standard errors of the difference of the medians
+    (with the noise estimated from the successive differences of the data points, so that
+    a trend within the windows is not mistaken for noise). The index of the
+    first data point of the earlier window is returned.
+
+    :param data: The iteration times, in the order they were measured.
+    :param window: The number of data points in each window.
+    :param tolerance: The relative difference between window medians that is always accepted.
+    :return: The index of the first steady state data point, or None if fewer than
+        ``2 * window`` data points are given or no steady state is found.
+    :raises SimpleBenchTypeError: If an argument is of the wrong type.
+    :raises SimpleBenchValueError: If ``window`` is not positive or ``tolerance`` is negative.
+    """
+    values = validate_sequence_of_numbers(
+        data, 'data',
+        type_tag=_WarmupErrorTag.INVALID_DATA_ARG_TYPE,
+        value_tag=_WarmupErrorTag.INVALID_DATA_ARG_VALUE)
+    window = validate_positive_int(
+        window, 'window',
+        _WarmupErrorTag.INVALID_WINDOW_ARG_TYPE,
+        _WarmupErrorTag.INVALID_WINDOW_ARG_VALUE)
+    tolerance = validate_non_negative_float(
+        tolerance, 'tolerance',
+        _WarmupErrorTag.INVALID_TOLERANCE_ARG_TYPE,
+        _WarmupErrorTag.INVALID_TOLERANCE_ARG_VALUE)
+    for start in range(len(values) - 2 * window + 1):
+        if _is_level(values[start:start + window], values[start + window:start + 2 * window], tolerance):
+            return start
+    return None
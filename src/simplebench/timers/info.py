@@ -14,6 +14,7 @@ from simplebench.exceptions import SimpleBenchImportError, SimpleBenchRuntimeErr
 from simplebench.validators import validate_positive_int
 
 from .exceptions import _TimersErrorTag
+from .profile_cache import clear_timer_profiles, load_timer_profile, store_timer_profile
 
 
 def fake_timer() -> int:
@@ -118,6 +119,10 @@ def timer_precision_ns(timer: Callable[[], int]) -> float:
 
     This reflects the fundamental resolution of the timer on the current system.
 
+    The result is cached for the process and persisted per machine (see
+    :mod:`simplebench.timers.profile_cache`) until :func:`reprofile_timers` is called or the
+    persisted profile expires.
+
     :param timer: The timer function to analyze.
     :return: The precision of the timer in nanoseconds.
     :raises SimpleBenchTypeError: If the provided timer is not supported.
@@ -129,6 +134,23 @@ def timer_precision_ns(timer: Callable[[], int]) -> float:
             tag=_TimersErrorTag.TIMER_PRECISION_NS_INVALID_TIMER_FUNCTION,
         )
 
+    timer_name = _BASE_TIMER_NAMES[timer]
+    precision = load_timer_profile('precision', timer_name)
+    if precision is None:
+        precision = _profile_timer_precision_ns(timer)
+        store_timer_profile('precision', timer_name, precision)
+    return precision
+
+
+def _profile_timer_precision_ns(timer: Callable[[], int]) -> float:
+    """Measure the precision of a supported timer in nanoseconds.
+
+    See :func:`timer_precision_ns`.
+
+    :param timer: The timer function to analyze.
+    :return: The precision of the timer in nanoseconds.
+    :raises SimpleBenchRuntimeError: If the timer does not advance during profiling.
+    """
     # 1. WARM-UP & DATA COLLECTION
     # Warm-up to get CPU caches hot and stabilize system state
     for _ in range(10000):
@@ -227,7 +249,9 @@ def timer_overhead_ns(timer: Callable[[], int], samples: int = 50000) -> float:
 
     The results are cached because the overhead of a timer function is expected
     to be fairly constant for a given system and timer on short timescales
-    while computing it is expensive.
+    while computing it is expensive. They are also persisted per machine (see
+    :mod:`simplebench.timers.profile_cache`) until :func:`reprofile_timers` is called
+    or the persisted profile expires.
 
     :param timer: The timer function to measure.
     :param samples: The number of samples to collect for the analysis.
@@ -240,6 +264,24 @@ def timer_overhead_ns(timer: Callable[[], int], samples: int = 50000) -> float:
             tag=_TimersErrorTag.TIMER_OVERHEAD_NS_INVALID_TIMER_FUNCTION,
         )
 
+    timer_name = _BASE_TIMER_NAMES[timer]
+    overhead = load_timer_profile('overhead', timer_name, samples)
+    if overhead is None:
+        overhead = _profile_timer_overhead_ns(timer, samples)
+        store_timer_profile('overhead', timer_name, overhead, samples)
+    return overhead
+
+
+def _profile_timer_overhead_ns(timer: Callable[[], int], samples: int) -> float:
+    """Measure the mean overhead of calling a supported timer in nanoseconds.
+
+    See :func:`timer_overhead_ns`.
+
+    :param timer: The timer function to measure.
+    :param samples: The number of samples to collect for the analysis.
+    :return: The mean overhead of calling the timer in nanoseconds.
+    :raises SimpleBenchRuntimeError: If the timer does not advance during profiling.
+    """
     # Use the unrolled collector to get clean readings
     collector = _timer_collector_function(samples)
 
@@ -268,3 +310,14 @@ def timer_overhead_ns(timer: Callable[[], int], samples: int = 50000) -> float:
 
     # Return the mean of the observed overheads.
     return float(np.mean(diffs))
+
+
+def reprofile_timers() -> None:
+    """Discard the cached and persisted timer profiles for this machine.
+
+    The next calls to :func:`timer_precision_ns` and :func:`timer_overhead_ns` measure
+    the timers again and persist the new profiles.
+    """
+    clear_timer_profiles()
+    timer_precision_ns.cache_clear()
+    timer_overhead_ns.cache_clear()
@@ -0,0 +1,126 @@
+"""Persistent per-machine cache of timer precision and overhead profiles.
+
+Profiling a timer (see :func:`~simplebench.timers.timer_precision_ns` and
+:func:`~simplebench.timers.timer_overhead_ns`) takes tens of thousands of timer readings
+and is repeated by every process, including the workers of parallel and isolated runs.
+The profiles are therefore persisted to a small JSON file, keyed by the timer name and the
+:func:`~simplebench.utils.machine_fingerprint` of the host (which covers the CPU model, kernel
+and Python build), and reused until they are older than
+:data:`~simplebench.defaults.DEFAULT_TIMER_PROFILE_TTL`.
+
+The file is ``timer_profiles.json`` in the directory named by the
+:data:`~simplebench.defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV` environment variable, or
+else in ``$XDG_CACHE_HOME/simplebench`` (``~/.cache/simplebench`` by default).
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from simplebench import defaults
+from simplebench.utils import machine_fingerprint
+
+_TIMER_PROFILES_FILENAME: str = 'timer_profiles.json'
+"""The name of the timer profiles cache file."""
+
+
+def timer_profiles_path() -> Path:
+    """Return the path of the timer profiles cache file.
+
+    :return: The path of the cache file. It may not exist yet.
+    """
+    cache_dir = os.environ.get(defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV)
+    if not cache_dir:
+        xdg_cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        cache_dir = str(Path(xdg_cache_home) / 'simplebench')
+    return Path(cache_dir) / _TIMER_PROFILES_FILENAME
+
+
+def _profile_key(kind: str, timer_name: str, samples: int | None) -> str:
+    """Return the cache key of a timer profile.
+
+    :param kind: The kind of profile (``'precision'`` or ``'overhead'``).
+    :param timer_name: The name of the profiled timer.
+    :param samples: The number of samples the profile is based on, if configurable.
+    :return: The cache key.
+    """
+    return f'{machine_fingerprint()}|{timer_name}|{kind}|{samples}'
+
+
+def _read_profiles(path: Path) -> dict[str, Any]:
+    """Read the timer profiles file, ignoring a missing or unreadable file.
+
+    :param path: The path of the cache file.
+    :return: The profiles in the file.
+    """
+    try:
+        with path.open('r', encoding='utf-8') as profiles_file:
+            profiles = json.load(profiles_file)
+    except (OSError, ValueError):
+        return {}
+    return profiles if isinstance(profiles, dict) else {}
+
+
+def _write_profiles(path: Path, profiles: dict[str, Any]) -> None:
+    """Atomically replace the timer profiles file. Failures are ignored.
+
+    :param path: The path of the cache file.
+    :param profiles: The profiles to write.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            json.dump(profiles, tmp_file, indent=2)
+        os.replace(tmp_name, path)
+    except OSError:
+        pass
+
+
+def load_timer_profile(kind: str, timer_name: str, samples: int | None = None) -> float | None:
+    """Return a persisted timer profile value if there is an unexpired one for this machine.
+
+    :param kind: The kind of profile (``'precision'`` or ``'overhead'``).
+    :param timer_name: The name of the profiled timer.
+    :param samples: The number of samples the profile is based on, if configurable.
+    :return: The profile value, or None if it is missing or expired.
+    """
+    entry = _read_profiles(timer_profiles_path()).get(_profile_key(kind, timer_name, samples))
+    if not isinstance(entry, dict):
+        return None
+    try:
+        value = float(entry['value'])
+        measured_at = float(entry['measured_at'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not 0.0 <= time.time() - measured_at <= defaults.DEFAULT_TIMER_PROFILE_TTL:
+        return None
+    return value
+
+
+def store_timer_profile(kind: str, timer_name: str, value: float, samples: int | None = None) -> None:
+    """Persist a timer profile value for this machine.
+
+    :param kind: The kind of profile (``'precision'`` or ``'overhead'``).
+    :param timer_name: The name of the profiled timer.
+    :param value: The profile value.
+    :param samples: The number of samples the profile is based on, if configurable.
+    """
+    path = timer_profiles_path()
+    profiles = _read_profiles(path)
+    profiles[_profile_key(kind, timer_name, samples)] = {'value': value, 'measured_at': time.time()}
+    _write_profiles(path, profiles)
+
+
+def clear_timer_profiles() -> None:
+    """Discard the persisted timer profiles for this machine."""
+    path = timer_profiles_path()
+    profiles = _read_profiles(path)
+    prefix = f'{machine_fingerprint()}|'
+    remaining = {key: value for key, value in profiles.items() if not key.startswith(prefix)}
+    if len(remaining) != len(profiles):
+        _write_profiles(path, remaining)
@@ -1,10 +1,28 @@
 """Utility functions for simplebench."""
+from .allocation_sites import AllocationSite, allocation_sites
+from .cpu_affinity import (
+    CPUPinning,
+    available_cpus,
+    cpu_pinning,
+    current_cpu,
+    current_pinning,
+    current_priority,
+    parse_cpu_list,
+    pin_to_cpu,
+    set_cpu_affinity,
+    set_priority,
+    smt_sibling_groups,
+    smt_siblings,
+    spread_over_cores,
+)
 from .filenames import sanitize_filename
 from .flags_and_args import arg_to_flag, collect_arg_list, flag_to_arg
 from .kwargs_variations import kwargs_variations
 from .machine_info import (
     MachineInfo,
+    cpu_model,
     get_machine_info,
+    machine_fingerprint,
     platform_architecture,
     platform_id,
     platform_implementation,
@@ -14,9 +32,30 @@ from .machine_info import (
     platform_version,
     python_implementation_version,
 )
+from .native_memory import NativeMemory, reset_peak_rss, sample_native_memory
+from .resource_usage import RUsage, sample_rusage
 from .significant_figures import sigfigs
 
 __all__ = [
+    # allocation_sites.py
+    'AllocationSite',
+    'allocation_sites',
+
+    # cpu_affinity.py
+    'CPUPinning',
+    'available_cpus',
+    'cpu_pinning',
+    'current_cpu',
+    'current_pinning',
+    'current_priority',
+    'parse_cpu_list',
+    'pin_to_cpu',
+    'set_cpu_affinity',
+    'set_priority',
+    'smt_sibling_groups',
+    'smt_siblings',
+    'spread_over_cores',
+
     # filenames.py
     'sanitize_filename',
 
@@ -30,7 +69,9 @@ __all__ = [
 
     # machine_info.py
     'MachineInfo',
+    'cpu_model',
     'get_machine_info',
+    'machine_fingerprint',
     'python_implementation_version',
     'platform_processor',
     'platform_machine',
@@ -40,6 +81,15 @@ __all__ = [
     'platform_version',
     'platform_architecture',
 
+    # native_memory.py
+    'NativeMemory',
+    'reset_peak_rss',
+    'sample_native_memory',
+
+    # resource_usage.py
+    'RUsage',
+    'sample_rusage',
+
     # significant_figures.py
     'sigfigs',
 ]
@@ -0,0 +1,70 @@
+"""Utility functions for attributing memory allocations to the source lines that made them."""
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any, Iterable, NamedTuple
+
+_IGNORED_FILENAMES: tuple[str, ...] = (tracemalloc.__file__, '<frozen importlib._bootstrap>', '<unknown>')
+"""Files whose allocations are bookkeeping of the measurement or the import system, not of the action."""
+
+
+class AllocationSite(NamedTuple):
+    """The memory allocated at one call site between two ``tracemalloc`` snapshots.
+
+    :ivar frames: The traceback of the allocations as ``(filename, lineno)`` pairs, most recent
+        call first. Its depth is at most the number of frames ``tracemalloc`` was started with.
+    :vartype frames: tuple[tuple[str, int], ...]
+    :ivar size: The change in the number of bytes allocated from the site.
+    :vartype size: int
+    :ivar blocks: The change in the number of memory blocks allocated from the site.
+    :vartype blocks: int
+    """
+    frames: tuple[tuple[str, int], ...]
+    size: int
+    blocks: int
+
+    @property
+    def location(self) -> str:
+        """The ``filename:lineno`` of the line that made the allocations."""
+        if not self.frames:
+            return '<unknown>'
+        filename, lineno = self.frames[0]
+        return f'{filename}:{lineno}'
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the site as a JSON serializable dict.
+
+        :return: The site with its frames converted to ``{'filename': ..., 'lineno': ...}`` dicts.
+        """
+        return {'frames': [{'filename': filename, 'lineno': lineno} for filename, lineno in self.frames],
+                'size': self.size,
+                'blocks': self.blocks}
+
+
+def allocation_sites(before: tracemalloc.Snapshot,
+                     after: tracemalloc.Snapshot,
+                     limit: int,
+                     ignored: Iterable[str] = ()) -> tuple[AllocationSite, ...]:
+    """Return the sites that allocated the most memory between two snapshots.
+
+    The snapshots are grouped by traceback, so sites are told apart by as many frames as
+    ``tracemalloc`` recorded. Allocations made by ``tracemalloc`` itself, by the import system
+    and directly by the files in ``ignored`` are left out. Only memory still allocated when
+    ``after`` was taken is attributed; temporary allocations freed in between show up in the
+    peak memory, not here.
+
+    :param before: The snapshot taken before the measured call.
+    :param after: The snapshot taken after the measured call.
+    :param limit: The maximum number of sites returned.
+    :param ignored: Further filenames (or ``fnmatch`` patterns) whose allocations are ignored.
+    :return: The sites that grew, largest first (ties broken by the number of blocks).
+    """
+    filters = [tracemalloc.Filter(False, filename) for filename in (*_IGNORED_FILENAMES, *ignored)]
+    differences = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'traceback')
+    grown = [difference for difference in differences if difference.size_diff > 0]
+    grown.sort(key=lambda difference: (difference.size_diff, difference.count_diff), reverse=True)
+    return tuple(
+        AllocationSite(frames=tuple((frame.filename, frame.lineno) for frame in reversed(difference.traceback)),
+                       size=difference.size_diff,
+                       blocks=difference.count_diff)
+        for difference in grown[:limit])
@@ -0,0 +1,269 @@
+"""Utility functions for querying and setting the CPU affinity and priority of the current process."""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from functools import cache
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from simplebench.exceptions import SimpleBenchRuntimeError
+
+from .exceptions import _UtilsErrorTag
+
+_SYS_CPU_PATH: str = '/sys/devices/system/cpu'
+"""The sysfs directory describing the CPUs of the machine (Linux only)."""
+
+_PROC_STAT_PROCESSOR_FIELD: int = 39
+"""The (1-based) field of ``/proc/<pid>/stat`` holding the CPU the task last ran on."""
+
+_PROC_STAT_PATHS: tuple[str, ...] = ('/proc/thread-self/stat', '/proc/self/stat')
+"""The ``stat`` files of the calling thread (Linux 3.17 or later) and, as a fallback, of the main thread."""
+
+
+class CPUPinning(NamedTuple):
+    """The CPU pinning and scheduling priority a benchmark was run with.
+
+    :ivar cpus: The CPUs the process was allowed to run on (empty if unknown).
+    :vartype cpus: tuple[int, ...]
+    :ivar priority: The niceness of the process, or None if it is unknown.
+    :vartype priority: int | None
+    :ivar smt_siblings: The groups of ``cpus`` that are hardware threads (SMT siblings)
+        of the same physical core. CPUs without siblings in ``cpus`` are not listed.
+    :vartype smt_siblings: tuple[tuple[int, ...], ...]
+    """
+    cpus: tuple[int, ...] = ()
+    priority: int | None = None
+    smt_siblings: tuple[tuple[int, ...], ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pinning as a JSON serializable dict.
+
+        :return: The pinning with its tuples converted to lists.
+        """
+        return {'cpus': list(self.cpus),
+                'priority': self.priority,
+                'smt_siblings': [list(siblings) for siblings in self.smt_siblings]}
+
+
+def parse_cpu_list(spec: str) -> list[int]:
+    """Parse a CPU list in the Linux ``cpulist`` format (for example ``'0-3,8,10-11'``).
+
+    :param spec: The CPU list.
+    :return: The sorted, de-duplicated CPU numbers.
+    :raises ValueError: If ``spec`` is empty or not a valid CPU list.
+    """
+    cpus: set[int] = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            raise ValueError(f'invalid CPU list {spec!r}')
+        first, _, last = part.partition('-')
+        start, stop = int(first), int(last) if last else int(first)
+        if start < 0 or stop < start:
+            raise ValueError(f'invalid CPU range {part!r} in CPU list {spec!r}')
+        cpus.update(range(start, stop + 1))
+    return sorted(cpus)
+
+
+def available_cpus() -> list[int]:
+    """Return the sorted list of CPUs the current process is allowed to run on.
+
+    On platforms without :func:`os.sched_getaffinity` an empty list is returned.
+
+    :return: The CPU numbers available to the current process.
+    :rtype: list[int]
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return []
+    return sorted(os.sched_getaffinity(0))
+
+
+def pin_to_cpu(cpu: int | None) -> int | None:
+    """Pin the current process to a single CPU.
+
+    Pinning is skipped if ``cpu`` is None or the platform does not support
+    :func:`os.sched_setaffinity`. Failures to set the affinity (for example, because the CPU
+    is not in the process's allowed set) are not treated as errors.
+
+    :param cpu: The CPU number to pin to, or None to skip pinning.
+    :return: The CPU the process was pinned to, or None if it was not pinned.
+    :rtype: int | None
+    """
+    if cpu is None or not hasattr(os, 'sched_setaffinity'):
+        return None
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        return None
+    return cpu
+
+
+def set_cpu_affinity(cpus: Iterable[int]) -> list[int]:
+    """Restrict the current process to a set of CPUs.
+
+    As with :func:`pin_to_cpu`, failures to set the affinity are not treated as errors.
+
+    :param cpus: The CPU numbers to run on.
+    :return: The CPUs the process is allowed to run on afterwards (empty if unknown).
+    :rtype: list[int]
+    """
+    if hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, set(cpus))
+        except (OSError, ValueError):
+            pass
+    return available_cpus()
+
+
+def current_priority() -> int | None:
+    """Return the niceness of the current process.
+
+    :return: The niceness, or None on platforms without :func:`os.getpriority`.
+    :rtype: int | None
+    """
+    if not hasattr(os, 'getpriority'):
+        return None
+    try:
+        return os.getpriority(os.PRIO_PROCESS, 0)
+    except OSError:
+        return None
+
+
+def set_priority(niceness: int) -> int | None:
+    """Set the niceness of the current process.
+
+    Lower values mean a higher scheduling priority. Raising the priority (lowering the
+    niceness) usually requires elevated privileges. Failures are not treated as errors.
+
+    :param niceness: The niceness to set, typically between -20 and 19.
+    :return: The niceness of the process afterwards, or None if it is unknown.
+    :rtype: int | None
+    """
+    if hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, niceness)
+        except OSError:
+            pass
+    return current_priority()
+
+
+@cache
+def smt_siblings(cpu: int) -> tuple[int, ...]:
+    """Return the hardware threads sharing a physical core with a CPU, including the CPU itself.
+
+    The siblings are read from ``/sys/devices/system/cpu/cpu<N>/topology/thread_siblings_list``.
+    Where that is unavailable the CPU is assumed to have no siblings.
+
+    :param cpu: The CPU number.
+    :return: The sorted CPU numbers of the core's hardware threads.
+    :rtype: tuple[int, ...]
+    """
+    try:
+        siblings_path = f'{_SYS_CPU_PATH}/cpu{cpu}/topology/thread_siblings_list'
+        with open(siblings_path, 'r', encoding='utf-8') as siblings_file:
+            return tuple(parse_cpu_list(siblings_file.read().strip()))
+    except (OSError, ValueError):
+        return (cpu,)
+
+
+def smt_sibling_groups(cpus: Iterable[int]) -> tuple[tuple[int, ...], ...]:
+    """Return the groups of ``cpus`` that are SMT siblings of the same physical core.
+
+    :param cpus: The CPU numbers.
+    :return: The sorted groups of two or more CPUs sharing a core.
+    :rtype: tuple[tuple[int, ...], ...]
+    """
+    cpu_set = set(cpus)
+    groups = {tuple(sibling for sibling in smt_siblings(cpu) if sibling in cpu_set) for cpu in cpu_set}
+    return tuple(sorted(group for group in groups if len(group) > 1))
+
+
+def spread_over_cores(cpus: Iterable[int]) -> list[int]:
+    """Order CPUs so that one hardware thread of every physical core comes before any SMT sibling.
+
+    Assigning worker processes round-robin over the returned list gives each worker its
+    own physical core for as long as there are cores to go round.
+
+    :param cpus: The CPU numbers.
+    :return: The CPUs, first sibling of each core first, then the second siblings, and so on.
+    :rtype: list[int]
+    """
+    cpu_set = set(cpus)
+
+    def thread_rank(cpu: int) -> int:
+        siblings = [sibling for sibling in smt_siblings(cpu) if sibling in cpu_set]
+        return siblings.index(cpu) if cpu in siblings else 0
+
+    return sorted(cpu_set, key=lambda cpu: (thread_rank(cpu), cpu))
+
+
+def current_cpu() -> int | None:
+    """Return the CPU the calling thread last ran on, from ``/proc/thread-self/stat``.
+
+    ``/proc/self/stat`` describes the main thread of the process, which is not the calling
+    thread when a benchmark runs in a worker thread, so it is only read on kernels without
+    ``/proc/thread-self``.
+
+    :return: The CPU number, or None where ``/proc`` is unavailable.
+    :rtype: int | None
+    """
+    for stat_path in _PROC_STAT_PATHS:
+        try:
+            with open(stat_path, 'r', encoding='ascii') as stat_file:
+                stat = stat_file.read()
+            # The command name (field 2) is parenthesized and may contain spaces
+            fields = stat[stat.rindex(')') + 2:].split()
+            return int(fields[_PROC_STAT_PROCESSOR_FIELD - 3])
+        except (OSError, ValueError, IndexError):
+            continue
+    return None
+
+
+def current_pinning() -> CPUPinning:
+    """Return the CPU pinning and scheduling priority of the current process.
+
+    :return: The current pinning.
+    :rtype: CPUPinning
+    """
+    cpus = available_cpus()
+    return CPUPinning(cpus=tuple(cpus), priority=current_priority(), smt_siblings=smt_sibling_groups(cpus))
+
+
+@contextmanager
+def cpu_pinning(cpus: Iterable[int] | None = None, priority: int | None = None) -> Iterator[CPUPinning]:
+    """Temporarily pin the current process to a set of CPUs and set its niceness.
+
+    The previous affinity and niceness are restored on exit. If neither ``cpus`` nor
+    ``priority`` is given, nothing is changed.
+
+    Lowering the priority (raising the niceness) is allowed for any process, but raising it
+    back usually needs elevated privileges, so an unprivileged process cannot restore its
+    niceness after running with a lower priority. Rather than leave the rest of the process
+    running at the lower priority unnoticed, the restored niceness is checked on exit.
+    Running with a lower priority without privileges is best done in isolated child processes
+    (see :attr:`~simplebench.session.Session.isolated`), which exit afterwards.
+
+    :param cpus: The CPU numbers to run on, or None to leave the affinity unchanged.
+    :param priority: The niceness to run with, or None to leave it unchanged.
+    :return: A context manager yielding the effective pinning.
+    :raises SimpleBenchRuntimeError: If the previous niceness could not be restored on exit.
+    """
+    previous_cpus = available_cpus()
+    previous_priority = current_priority()
+    if cpus is not None:
+        set_cpu_affinity(cpus)
+    if priority is not None:
+        set_priority(priority)
+    try:
+        yield current_pinning()
+    finally:
+        if cpus is not None and previous_cpus:
+            set_cpu_affinity(previous_cpus)
+        if priority is not None and previous_priority is not None:
+            restored_priority = set_priority(previous_priority)
+            if restored_priority is not None and restored_priority != previous_priority:
+                raise SimpleBenchRuntimeError(
+                    f'Could not restore the niceness of the process to {previous_priority} after running '
+                    f'with niceness {priority}; it is still {restored_priority}. Raising the priority '
+                    'again needs elevated privileges: run the benchmark isolated instead.',
+                    tag=_UtilsErrorTag.CPU_PINNING_PRIORITY_NOT_RESTORED)
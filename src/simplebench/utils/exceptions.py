@@ -50,3 +50,7 @@ class _UtilsErrorTag(ErrorTag):
     """The include_comma_separated argument was not a bool"""
     COLLECT_ARG_LIST_INVALID_FLAG_ARG_VALUE = "COLLECT_ARG_LIST_INVALID_FLAG_ARG_VALUE"
     """The flag argument contained invalid characters for a command-line flag"""
+
+    # utils.cpu_pinning() tags
+    CPU_PINNING_PRIORITY_NOT_RESTORED = "CPU_PINNING_PRIORITY_NOT_RESTORED"
+    """The niceness of the process could not be restored after running with a lower priority"""
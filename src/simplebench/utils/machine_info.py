@@ -1,4 +1,6 @@
 """Utility functions to get machine information."""
+import hashlib
+import os
 import platform
 import sys
 from functools import cache
@@ -162,3 +164,42 @@ def platform_architecture() -> str:
     :rtype: str
     """
     return platform.architecture()[0]
+
+
+@cache
+def cpu_model() -> str:
+    """Return the CPU model name.
+
+    On Linux this is the ``model name`` from ``/proc/cpuinfo``. Elsewhere it falls back
+    to :func:`platform.processor` (or :func:`platform.machine` if that is empty). Unlike
+    :func:`get_machine_info` this does not query ``cpuinfo``, so it is fast.
+
+    :return: The CPU model name.
+    :rtype: str
+    """
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8') as cpuinfo_file:
+            for line in cpuinfo_file:
+                if line.lower().startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+@cache
+def machine_fingerprint() -> str:
+    """Return a short, stable fingerprint of the current machine and Python interpreter.
+
+    The fingerprint is a hash of the host name, processor and CPU model, CPU count, operating
+    system and kernel release, Python implementation, version and build, and architecture.
+    It changes when benchmarks are run on a different machine, kernel or interpreter, and is
+    used to key cached measurements that are only valid for the machine they were taken on.
+
+    :return: A 16 character hexadecimal fingerprint.
+    :rtype: str
+    """
+    parts = (platform.node(), platform.machine(), platform.processor(), cpu_model(), str(os.cpu_count()),
+             platform_id(), platform.release(), python_implementation_version(),
+             ' '.join(platform.python_build()), platform.python_compiler())
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:16]
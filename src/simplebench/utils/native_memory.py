@@ -0,0 +1,118 @@
+"""Utility functions for sampling the native (operating system level) memory of the current process.
+
+:mod:`tracemalloc` only sees memory allocated through Python's allocator hooks. Buffers
+allocated by C extensions, :mod:`mmap` regions and growth of the interpreter's own arenas
+are only visible in the memory the operating system reports for the process, which Linux
+exposes under ``/proc/self``.
+"""
+from __future__ import annotations
+
+import os
+from typing import NamedTuple
+
+_STATM: str = '/proc/self/statm'
+"""Page counts of the process's memory, the second being the resident set size."""
+_SMAPS_ROLLUP: str = '/proc/self/smaps_rollup'
+"""The memory of all the process's mappings summed up, in kilobytes."""
+_STATUS: str = '/proc/self/status'
+"""Status of the process, including its resident set size high-water mark (``VmHWM``)."""
+_CLEAR_REFS: str = '/proc/self/clear_refs'
+"""Writing ``5`` resets the resident set size high-water mark of the process."""
+
+_PAGE_SIZE: int = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+"""The size of a memory page in bytes."""
+
+_USS_FIELDS: tuple[bytes, ...] = (b'Private_Clean:', b'Private_Dirty:', b'Private_Hugetlb:')
+"""The ``smaps_rollup`` fields summed for the unique set size (memory no other process shares)."""
+
+
+class NativeMemory(NamedTuple):
+    """Native memory of the current process as reported by the operating system, in bytes.
+
+    As returned by :func:`sample_native_memory` the values are the current sizes.
+    :meth:`since` turns two samples into the changes for the region between them.
+
+    :ivar rss: The resident set size: memory of the process held in RAM, including
+        memory shared with other processes (``/proc/self/statm``).
+    :vartype rss: int
+    :ivar uss: The unique set size: resident memory private to the process, which is what
+        would be freed if it exited (``Private_*`` of ``/proc/self/smaps_rollup``).
+    :vartype uss: int
+    :ivar pss: The proportional set size: private memory plus an equal share of each page
+        shared with other processes (``Pss`` of ``/proc/self/smaps_rollup``).
+    :vartype pss: int
+    :ivar peak_rss: The resident set size high-water mark (``VmHWM`` of ``/proc/self/status``).
+        This is a high-water mark, not a size.
+    :vartype peak_rss: int
+    """
+    rss: int = 0
+    uss: int = 0
+    pss: int = 0
+    peak_rss: int = 0
+
+    def since(self, before: NativeMemory) -> NativeMemory:
+        """Return the changes between an earlier sample and this one.
+
+        The sizes are differenced. The peak resident set size is a high-water mark and is
+        kept as of this sample.
+
+        :param before: The earlier sample.
+        :return: The changes for the region between the two samples.
+        """
+        return NativeMemory(rss=self.rss - before.rss,
+                            uss=self.uss - before.uss,
+                            pss=self.pss - before.pss,
+                            peak_rss=self.peak_rss)
+
+
+def _read_kilobytes(path: str, fields: tuple[bytes, ...]) -> dict[bytes, int]:
+    """Read ``Field:   <value> kB`` lines from a ``/proc`` file.
+
+    :param path: The file to read.
+    :param fields: The field names, including the trailing colon.
+    :return: The values of the fields present in the file, in bytes.
+    """
+    with open(path, 'rb') as file:
+        lines = file.read().splitlines()
+    return {line.split(None, 1)[0]: int(line.split()[1]) * 1024
+            for line in lines if line.startswith(fields)}
+
+
+def sample_native_memory() -> NativeMemory | None:
+    """Sample the native memory of the current process.
+
+    Reading ``/proc/self/smaps_rollup`` makes the kernel walk the page tables of the
+    process, which takes tens of microseconds or more for large processes, so samples
+    should be taken outside timed regions.
+
+    :return: The current sizes, or None if the platform does not provide them
+        (``/proc/self/smaps_rollup`` needs Linux 4.14 or later).
+    """
+    try:
+        with open(_STATM, 'rb') as file:
+            resident_pages = int(file.read().split()[1])
+        rollup = _read_kilobytes(_SMAPS_ROLLUP, (b'Pss:', *_USS_FIELDS))
+        status = _read_kilobytes(_STATUS, (b'VmHWM:',))
+    except (OSError, ValueError, IndexError):
+        return None
+    return NativeMemory(rss=resident_pages * _PAGE_SIZE,
+                        uss=sum(rollup.get(field, 0) for field in _USS_FIELDS),
+                        pss=rollup.get(b'Pss:', 0),
+                        peak_rss=status.get(b'VmHWM:', 0))
+
+
+def reset_peak_rss() -> bool:
+    """Reset the resident set size high-water mark of the current process to its current size.
+
+    After a reset, :attr:`NativeMemory.peak_rss` is the peak since the reset instead of
+    since the process started. The high-water mark is shared with
+    :func:`resource.getrusage`, so its ``ru_maxrss`` is reset as well.
+
+    :return: True if the high-water mark was reset, False if the platform does not support it.
+    """
+    try:
+        with open(_CLEAR_REFS, 'w', encoding='ascii') as file:
+            file.write('5')
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,74 @@
+"""Utility functions for sampling the operating system resource counters of the current process."""
+from __future__ import annotations
+
+import sys
+from typing import NamedTuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class RUsage(NamedTuple):
+    """Operating system resource counters of the current process (see :func:`resource.getrusage`).
+
+    As returned by :func:`sample_rusage` the counters are cumulative for the life of the
+    process. :meth:`since` turns two samples into the counts for the region between them.
+
+    :ivar minor_faults: Page faults serviced without any I/O (``ru_minflt``).
+    :vartype minor_faults: int
+    :ivar major_faults: Page faults that required I/O (``ru_majflt``).
+    :vartype major_faults: int
+    :ivar voluntary_switches: Context switches because the process gave up the CPU,
+        usually to wait for a resource (``ru_nvcsw``).
+    :vartype voluntary_switches: int
+    :ivar involuntary_switches: Context switches because the process was preempted (``ru_nivcsw``).
+    :vartype involuntary_switches: int
+    :ivar block_io: Block input and output operations (``ru_inblock + ru_oublock``).
+    :vartype block_io: int
+    :ivar max_rss: The maximum resident set size of the process so far, in bytes (``ru_maxrss``).
+        This is a high-water mark, not a counter.
+    :vartype max_rss: int
+    """
+    minor_faults: int = 0
+    major_faults: int = 0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+    block_io: int = 0
+    max_rss: int = 0
+
+    def since(self, before: RUsage) -> RUsage:
+        """Return the counts between an earlier sample and this one.
+
+        The counters are differenced. The maximum resident set size is a high-water mark
+        and is kept as of this sample.
+
+        :param before: The earlier sample.
+        :return: The counts for the region between the two samples.
+        """
+        return RUsage(minor_faults=self.minor_faults - before.minor_faults,
+                      major_faults=self.major_faults - before.major_faults,
+                      voluntary_switches=self.voluntary_switches - before.voluntary_switches,
+                      involuntary_switches=self.involuntary_switches - before.involuntary_switches,
+                      block_io=self.block_io - before.block_io,
+                      max_rss=self.max_rss)
+
+
+def sample_rusage() -> RUsage | None:
+    """Sample the resource counters of the current process (all of its threads).
+
+    :return: The cumulative counters, or None if the platform does not provide
+        :func:`resource.getrusage`.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes except on macOS, where it is in bytes
+    max_rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return RUsage(minor_faults=usage.ru_minflt,
+                  major_faults=usage.ru_majflt,
+                  voluntary_switches=usage.ru_nvcsw,
+                  involuntary_switches=usage.ru_nivcsw,
+                  block_io=usage.ru_inblock + usage.ru_oublock,
+                  max_rss=max_rss)
@@ -0,0 +1,37 @@
+"""Shared pytest configuration for the simplebench tests."""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from simplebench import defaults
+
+_CACHE_DIR_KEY = pytest.StashKey[str]()
+"""The stash key of the temporary cache directory of the test run."""
+_PREVIOUS_CACHE_DIR_KEY = pytest.StashKey['str | None']()
+"""The stash key of the cache directory setting in effect before the test run."""
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep the persisted timer profiles of the test run out of the user's real cache directory.
+
+    This is done when pytest is configured rather than in a fixture because some test modules
+    run benchmarks while they are collected, to build their parametrized test cases, and the
+    fork server used for isolated runs keeps the environment it was started with.
+    """
+    config.stash[_PREVIOUS_CACHE_DIR_KEY] = os.environ.get(defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV)
+    config.stash[_CACHE_DIR_KEY] = tempfile.mkdtemp(prefix='simplebench-cache-')
+    os.environ[defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV] = config.stash[_CACHE_DIR_KEY]
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Restore the cache directory setting and remove the temporary cache directory."""
+    if _CACHE_DIR_KEY not in config.stash:
+        return
+    previous = config.stash[_PREVIOUS_CACHE_DIR_KEY]
+    if previous is None:
+        os.environ.pop(defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV, None)
+    else:
+        os.environ[defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV] = previous
+    shutil.rmtree(config.stash[_CACHE_DIR_KEY], ignore_errors=True)
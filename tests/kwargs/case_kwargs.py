@@ -1,7 +1,7 @@
 """simplebench.cases.Case KWArgs package for SimpleBench tests."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
 
 from simplebench.case import Case
 from simplebench.vcs import GitInfo
@@ -9,6 +9,7 @@ from simplebench.vcs import GitInfo
 from .kwargs import KWArgs, NoDefaultValue
 
 if TYPE_CHECKING:
+    from simplebench.enums import GCPolicy, MemoryStrategy, PrecisionStatistic, WarmupStrategy
     from simplebench.protocols import ActionRunner
     from simplebench.reporters.protocols import ReporterCallback
     from simplebench.reporters.reporter.options import ReporterOptions
@@ -36,6 +37,7 @@ class CaseKWArgs(KWArgs):
             action: ActionRunner | NoDefaultValue = NoDefaultValue(),
             iterations: int | NoDefaultValue = NoDefaultValue(),
             warmup_iterations: int | NoDefaultValue = NoDefaultValue(),
+            warmup_strategy: WarmupStrategy | NoDefaultValue = NoDefaultValue(),
             rounds: int | NoDefaultValue = NoDefaultValue(),
             timer: Callable[[], float | int] | NoDefaultValue = NoDefaultValue(),
             min_time: float | NoDefaultValue = NoDefaultValue(),
@@ -45,7 +47,23 @@ class CaseKWArgs(KWArgs):
             kwargs_variations: dict[str, list[Any]] | NoDefaultValue = NoDefaultValue(),
             runner: type[SimpleRunner] | NoDefaultValue = NoDefaultValue(),
             callback: ReporterCallback | NoDefaultValue = NoDefaultValue(),
-            options: Iterable[ReporterOptions] | NoDefaultValue = NoDefaultValue()
+            options: Iterable[ReporterOptions] | NoDefaultValue = NoDefaultValue(),
+            jobs: int | NoDefaultValue = NoDefaultValue(),
+            interleave: bool | NoDefaultValue = NoDefaultValue(),
+            memory_strategy: MemoryStrategy | NoDefaultValue = NoDefaultValue(),
+            memory_samples: int | NoDefaultValue = NoDefaultValue(),
+            latency_samples: int | NoDefaultValue = NoDefaultValue(),
+            latency_sample_rate: float | NoDefaultValue = NoDefaultValue(),
+            allocation_sites: int | NoDefaultValue = NoDefaultValue(),
+            allocation_frames: int | NoDefaultValue = NoDefaultValue(),
+            native_memory: bool | NoDefaultValue = NoDefaultValue(),
+            target_precision: float | NoDefaultValue = NoDefaultValue(),
+            precision_statistic: PrecisionStatistic | NoDefaultValue = NoDefaultValue(),
+            confidence_level: float | NoDefaultValue = NoDefaultValue(),
+            subtract_baseline: bool | NoDefaultValue = NoDefaultValue(),
+            gc_policy: GCPolicy | NoDefaultValue = NoDefaultValue(),
+            cpu_affinity: Sequence[int] | NoDefaultValue = NoDefaultValue(),
+            priority: int | NoDefaultValue = NoDefaultValue()
     ) -> None:
         """Constructs a CaseKWArgs instance. This class is used to hold keyword arguments for
         initializing a Case instance in tests.
@@ -69,6 +87,8 @@ class CaseKWArgs(KWArgs):
         :type iterations: int
         :param warmup_iterations: The number of warmup iterations to run before the benchmark. (default: 10)
         :type warmup_iterations: int
+        :param warmup_strategy: How the number of warmup iterations is decided. (default: WarmupStrategy.FIXED)
+        :type warmup_strategy: WarmupStrategy
         :param rounds: The number of test rounds that will be run by the action on each iteration. (default: 1)
         :type rounds: int
         :param timer: A callable that returns the current time. If None, the default timer is used.
@@ -96,5 +116,37 @@ class CaseKWArgs(KWArgs):
         :type callback: ReporterCallback | None
         :param options: An iterable of additional options for the benchmark case.
         :type options: Iterable[ReporterOptions]
+        :param jobs: The number of worker processes used to run the kwargs variations. (default: None)
+        :type jobs: int | None
+        :param interleave: Whether to run the kwargs variations interleaved. (default: False)
+        :type interleave: bool
+        :param memory_strategy: When the memory usage of the action is measured.
+        :type memory_strategy: MemoryStrategy
+        :param memory_samples: The N for every-Nth memory sampling or the number of memory samples after timing.
+        :type memory_samples: int
+        :param latency_samples: The number of individually timed calls for the per-call latencies. (default: None)
+        :type latency_samples: int | None
+        :param latency_sample_rate: The fraction of calls timed for the per-call latencies. (default: 1.0)
+        :type latency_sample_rate: float
+        :param allocation_sites: The number of allocation sites reported for each variation. (default: None)
+        :type allocation_sites: int | None
+        :param allocation_frames: The number of frames recorded for each allocation. (default: 1)
+        :type allocation_frames: int
+        :param native_memory: Whether to measure the native memory of the process. (default: False)
+        :type native_memory: bool
+        :param target_precision: The target relative precision of the per-round time. (default: None)
+        :type target_precision: float | None
+        :param precision_statistic: Whether precision is judged on the mean or the median.
+        :type precision_statistic: PrecisionStatistic
+        :param confidence_level: The confidence level of the precision confidence interval.
+        :type confidence_level: float
+        :param subtract_baseline: Whether to subtract the empty-action baseline from the timings.
+        :type subtract_baseline: bool
+        :param gc_policy: How the garbage collector is handled while the action is timed.
+        :type gc_policy: GCPolicy
+        :param cpu_affinity: The CPUs the case is run on. (default: None)
+        :type cpu_affinity: Sequence[int] | None
+        :param priority: The niceness the case is run with. (default: None)
+        :type priority: int | None
         """
         super().__init__(call=Case.__init__, kwargs=locals())
@@ -5,7 +5,16 @@ from typing import Any, Sequence
 
 from simplebench.iteration import Iteration
 from simplebench.results import Results
-from simplebench.stats import MemoryUsage, OperationsPerInterval, OperationTimings, PeakMemoryUsage
+from simplebench.stats import (
+    CPUTimings,
+    GCCollections,
+    LatencyHistogram,
+    MemoryUsage,
+    OperationsPerInterval,
+    OperationTimings,
+    PeakMemoryUsage,
+)
+from simplebench.utils import AllocationSite
 
 from .kwargs import KWArgs, NoDefaultValue
 
@@ -33,9 +42,15 @@ class ResultsKWArgs(KWArgs):
             memory_scale: float | NoDefaultValue = NoDefaultValue(),
             ops_per_second: OperationsPerInterval | NoDefaultValue = NoDefaultValue(),
             per_round_timings: OperationTimings | NoDefaultValue = NoDefaultValue(),
+            cpu_timings: CPUTimings | NoDefaultValue = NoDefaultValue(),
             memory: MemoryUsage | NoDefaultValue = NoDefaultValue(),
             peak_memory: PeakMemoryUsage | NoDefaultValue = NoDefaultValue(),
+            gc_collections: GCCollections | NoDefaultValue = NoDefaultValue(),
+            warmup_timings: OperationTimings | NoDefaultValue = NoDefaultValue(),
+            latency: LatencyHistogram | NoDefaultValue = NoDefaultValue(),
+            allocation_sites: Sequence[AllocationSite] | NoDefaultValue = NoDefaultValue(),
             extra_info: dict[str, Any] | NoDefaultValue = NoDefaultValue(),
+            memory_measured: bool | NoDefaultValue = NoDefaultValue(),
             ) -> None:
         """Initialize ResultsKWArgs with optional keyword arguments.
 
@@ -73,11 +88,23 @@ class ResultsKWArgs(KWArgs):
         :type ops_per_second: OperationsPerInterval
         :param per_round_timings: OperationTimings instance.
         :type per_round_timings: OperationTimings
+        :param cpu_timings: CPUTimings instance.
+        :type cpu_timings: CPUTimings
         :param memory: MemoryUsage instance.
         :type memory: MemoryUsage
         :param peak_memory: PeakMemoryUsage instance.
         :type peak_memory: PeakMemoryUsage
+        :param gc_collections: GCCollections instance.
+        :type gc_collections: GCCollections
+        :param warmup_timings: OperationTimings instance for the warmup iterations.
+        :type warmup_timings: OperationTimings
+        :param latency: LatencyHistogram instance of the per call latencies.
+        :type latency: LatencyHistogram
+        :param allocation_sites: Sequence of AllocationSite instances, largest first.
+        :type allocation_sites: Sequence[AllocationSite]
         :param extra_info: Additional information as a dictionary.
         :type extra_info: dict[str, Any]
+        :param memory_measured: Whether memory usage was measured.
+        :type memory_measured: bool
         """
         super().__init__(call=Results.__init__, kwargs=locals())
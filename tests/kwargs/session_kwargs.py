@@ -34,7 +34,13 @@ class SessionKWArgs(KWArgs):
             show_progress: bool | NoDefaultValue = NoDefaultValue(),
             output_path: Path | NoDefaultValue = NoDefaultValue(),
             console: Console | NoDefaultValue = NoDefaultValue(),
-            timer: Callable[[], float | int] | NoDefaultValue = NoDefaultValue()) -> None:
+            timer: Callable[[], float | int] | NoDefaultValue = NoDefaultValue(),
+            jobs: int | NoDefaultValue = NoDefaultValue(),
+            isolated: bool | NoDefaultValue = NoDefaultValue(),
+            interleave: bool | NoDefaultValue = NoDefaultValue(),
+            use_calibration_cache: bool | NoDefaultValue = NoDefaultValue(),
+            cpu_affinity: Sequence[int] | NoDefaultValue = NoDefaultValue(),
+            priority: int | NoDefaultValue = NoDefaultValue()) -> None:
         """Constructs a SessionKWArgs instance. This class is used to hold keyword arguments for
         initializing a Session instance in tests.
 
@@ -46,5 +52,11 @@ class SessionKWArgs(KWArgs):
         :param output_path: The output path for the session results.
         :param console: The console instance to use for the session.
         :param timer: The timer function to use for the session.
+        :param jobs: The number of worker processes used to run case variations.
+        :param isolated: Whether to run case variations in isolated fork server processes.
+        :param interleave: Whether to run the variations of all cases interleaved with each other.
+        :param use_calibration_cache: Whether to cache auto-calibrated rounds in the output path.
+        :param cpu_affinity: The CPUs to run cases on.
+        :param priority: The niceness to run cases with.
         """
         super().__init__(call=Session.__init__, kwargs=locals())
@@ -0,0 +1,106 @@
+"""Tests for the simplebench.reporters.csv.reporter.CSVReporter class."""
+import csv
+from functools import cache
+from io import StringIO
+from typing import Any
+
+import pytest
+
+from simplebench.case import Case
+from simplebench.enums import Section
+from simplebench.reporters.csv import CSVField, CSVOptions, CSVReporter
+from simplebench.results import Results
+from simplebench.runners import SimpleRunner
+from simplebench.stats import Stats
+
+
+def benchcase_with_size(_bench: SimpleRunner, **kwargs: Any) -> Results:
+    """A benchmark case function with a size parameter.
+
+    :param _bench: The benchmark runner.
+    :param kwargs: The keyword arguments.
+    :return: The benchmark results.
+    """
+    def action(size: int) -> None:
+        """Sum a range of the given size."""
+        _ = sum(range(size))
+    return _bench.run(n=kwargs['size'], action=action, kwargs=kwargs)
+
+
+@cache
+def reported_case() -> Case:
+    """Return a benchmarked case with two variations for rendering.
+
+    :return: The benchmarked case.
+    """
+    case = Case(group='example', title='reporter', description='Reporter case', action=benchcase_with_size,
+                iterations=20, warmup_iterations=1, min_time=0.01, max_time=0.1,
+                variation_cols={'size': 'Size'}, kwargs_variations={'size': [10, 1000]})
+    case.run()
+    return case
+
+
+def render_rows(fields: list[CSVField], variation_cols_last: bool = False) -> list[list[str]]:
+    """Render the TIMING section of the reported case and return its header and data rows.
+
+    :param fields: The fields to render.
+    :param variation_cols_last: Whether the variation columns are placed at the end of the rows.
+    :return: The header row followed by one row per result.
+    """
+    output = CSVReporter().render(case=reported_case(), section=Section.TIMING,
+                                  options=CSVOptions(fields=fields, variation_cols_last=variation_cols_last))
+    return [row for row in csv.reader(StringIO(output)) if not row[0].startswith('#')]
+
+
+@pytest.mark.parametrize('field, columns', [
+    pytest.param(field, 2 if field.name.endswith('_CI') else 1, id=field.name) for field in CSVField])
+def test_render_field_columns(field: CSVField, columns: int) -> None:
+    """Test that every field renders its header and one value per column after the variation column."""
+    header, *rows = render_rows([field])
+    assert len(header) == 1 + columns
+    assert header[0] == 'Size'
+    assert [row[0] for row in rows] == ['10', '1000']
+    assert all(len(row) == 1 + columns for row in rows)
+
+
+def test_render_outlier_fields() -> None:
+    """Test the outlier count and the outlier filtered mean and relative standard deviation."""
+    header, *rows = render_rows([CSVField.OUTLIERS, CSVField.FILTERED_MEAN, CSVField.FILTERED_RSD_PERCENT])
+    assert header[1] == 'outliers'
+    assert header[2].startswith('filtered mean (') and header[3] == 'filtered rsd (%)'
+    for result, row in zip(reported_case().results, rows):
+        stats = result.results_section(Section.TIMING)
+        assert isinstance(stats, Stats)
+        assert int(row[1]) == stats.outliers().total
+        assert float(row[2]) > 0.0 and float(row[3]) >= 0.0
+
+
+@pytest.mark.parametrize('field, label', [
+    (CSVField.MEAN_CI, 'mean'), (CSVField.MEDIAN_CI, 'median'), (CSVField.P5_CI, '5th'), (CSVField.P95_CI, '95th')])
+def test_render_confidence_interval_fields(field: CSVField, label: str) -> None:
+    """Test that a confidence interval field renders ordered lower and upper bounds."""
+    header, *rows = render_rows([field])
+    assert header[1].startswith(f'{label} ci low (') and header[2].startswith(f'{label} ci high (')
+    assert all(float(row[1]) <= float(row[2]) for row in rows)
+
+
+def test_render_variation_cols_last() -> None:
+    """Test that the field values are kept when the variation columns are placed last."""
+    first = render_rows([CSVField.N, CSVField.ROUNDS])
+    last = render_rows([CSVField.N, CSVField.ROUNDS], variation_cols_last=True)
+    assert [row[1:] + row[:1] for row in first] == last
+
+
+def test_render_latency_section() -> None:
+    """Test that the LATENCY section renders its histogram statistics and leaves the raw data fields empty."""
+    case = Case(group='example', title='latency', description='Latency case', action=benchcase_with_size,
+                iterations=5, warmup_iterations=1, min_time=0.01, max_time=0.1, latency_samples=1000,
+                variation_cols={'size': 'Size'}, kwargs_variations={'size': [10]})
+    case.run()
+    output = CSVReporter().render(case=case, section=Section.LATENCY,
+                                  options=CSVOptions(fields=[CSVField.MEDIAN, CSVField.MAX, CSVField.OUTLIERS,
+                                                             CSVField.MEAN_CI]))
+    header, row = [row for row in csv.reader(StringIO(output)) if not row[0].startswith('#')]
+    assert header[1].startswith('median (') and header[2].startswith('max (')
+    assert 0.0 < float(row[1]) <= float(row[2])
+    assert row[3:] == ['', '', '']
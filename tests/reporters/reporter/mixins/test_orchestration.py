@@ -6,7 +6,7 @@ from rich.table import Table
 from rich.text import Text
 
 from simplebench.case import Case
-from simplebench.enums import Section, Target
+from simplebench.enums import MemoryStrategy, Section, Target
 from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError
 from simplebench.reporters.choice.choice_conf import ChoiceConf
 from simplebench.reporters.choices.choices_conf import ChoicesConf
@@ -18,6 +18,7 @@ from ....factories import (
     FactoryReporterOptions,
     argument_parser_factory,
     case_factory,
+    case_kwargs_factory,
     choice_conf_kwargs_factory,
     default_reporter_callback,
     list_of_strings_flag_factory,
@@ -230,6 +231,36 @@ def _setup_render_by_section_good_path() -> tuple[FactoryReporterForOrchestratio
     )
 
 
+def _setup_render_by_section_memory_not_measured_path(
+) -> tuple[FactoryReporterForOrchestration, RenderBySectionMethodKWArgs]:
+    """Helper to arrange a render_by_section test scenario for a case that did not measure memory.
+
+    :return: A tuple containing the reporter and the kwargs.
+    :rtype: tuple[FactoryReporterForOrchestration, RenderBySectionMethodKWArgs]
+    """
+    reporter, kwargs = _setup_render_by_section_good_path()
+    case = Case(**case_kwargs_factory(), memory_strategy=MemoryStrategy.OFF)
+    case.run()
+    return reporter, kwargs.replace(case=case)
+
+
+def _setup_render_by_section_latency_not_recorded_path(
+) -> tuple[FactoryReporterForOrchestration, RenderBySectionMethodKWArgs]:
+    """Helper to arrange a render_by_section test scenario for a case that recorded no latency histogram.
+
+    :return: A tuple containing the reporter and the kwargs.
+    :rtype: tuple[FactoryReporterForOrchestration, RenderBySectionMethodKWArgs]
+    """
+    reporter, kwargs = _setup_good_path(
+        kwargs_class=RenderBySectionMethodKWArgs,
+        choice_name="test_choice_by_section_latency",
+        sections={Section.LATENCY, Section.OPS, Section.TIMING}
+    )
+    case = Case(**case_kwargs_factory())
+    case.run()
+    return reporter, kwargs.replace(case=case)  # type: ignore[return-value]
+
+
 def _setup_render_by_case_bad_target_path() -> tuple[FactoryReporterForOrchestration, RenderByCaseMethodKWArgs]:
     """Helper to arrange the 'bad target' test scenario for render_by_case.
 
@@ -438,6 +469,28 @@ def render_by_section_testspecs() -> list[TestSpec]:
             exception_tag=_ReporterErrorTag.VALIDATE_RENDER_BY_ARGS_INVALID_CALLBACK_ARG_TYPE)),
     ])
 
+    # --- Memory Not Measured Test ---
+    unmeasured_reporter, unmeasured_kwargs = _setup_render_by_section_memory_not_measured_path()
+    unmeasured_reporter.render_by_section(**unmeasured_kwargs)
+    testspecs.append(
+        idspec("BY_SECTION_013", TestGet(
+            name="Verify the memory section is skipped for a case that did not measure memory",
+            obj=unmeasured_reporter.render_spy,
+            attribute="count",
+            assertion=Assert.EQUAL,
+            expected=len(unmeasured_kwargs['choice'].sections) - 1)))
+
+    # --- Latency Not Recorded Test ---
+    no_latency_reporter, no_latency_kwargs = _setup_render_by_section_latency_not_recorded_path()
+    no_latency_reporter.render_by_section(**no_latency_kwargs)
+    testspecs.append(
+        idspec("BY_SECTION_014", TestGet(
+            name="Verify the latency section is skipped for a case that recorded no latency histogram",
+            obj=no_latency_reporter.render_spy,
+            attribute="count",
+            assertion=Assert.EQUAL,
+            expected=len(no_latency_kwargs['choice'].sections) - 1)))
+
     return testspecs
 
 
@@ -0,0 +1,119 @@
+"""Tests for the simplebench.reporters.rich_table.reporter.RichTableReporter class."""
+from functools import cache
+from typing import Any
+
+import pytest
+from rich.table import Table
+
+from simplebench.case import Case
+from simplebench.defaults import DEFAULT_CONFIDENCE_LEVEL
+from simplebench.enums import Section
+from simplebench.reporters.rich_table import RichTableField, RichTableOptions, RichTableReporter
+from simplebench.results import Results
+from simplebench.runners import SimpleRunner
+from simplebench.stats import Stats
+
+
+def benchcase_with_size(_bench: SimpleRunner, **kwargs: Any) -> Results:
+    """A benchmark case function with a size parameter.
+
+    :param _bench: The benchmark runner.
+    :param kwargs: The keyword arguments.
+    :return: The benchmark results.
+    """
+    def action(size: int) -> None:
+        """Sum a range of the given size."""
+        _ = sum(range(size))
+    return _bench.run(n=kwargs['size'], action=action, kwargs=kwargs)
+
+
+@cache
+def reported_case() -> Case:
+    """Return a benchmarked case with two variations for rendering.
+
+    :return: The benchmarked case.
+    """
+    case = Case(group='example', title='reporter', description='Reporter case', action=benchcase_with_size,
+                iterations=20, warmup_iterations=1, min_time=0.01, max_time=0.1,
+                variation_cols={'size': 'Size'}, kwargs_variations={'size': [10, 1000]})
+    case.run()
+    return case
+
+
+def render_columns(fields: list[RichTableField], variation_cols_last: bool = False) -> dict[str, list[str]]:
+    """Render the TIMING section of the reported case and return its cells by column header.
+
+    :param fields: The fields to render.
+    :param variation_cols_last: Whether the variation columns are placed at the end of the rows.
+    :return: The cells of each column, keyed by the column header, in column order.
+    """
+    table = RichTableReporter().render(case=reported_case(), section=Section.TIMING,
+                                       options=RichTableOptions(fields=fields, variation_cols_last=variation_cols_last))
+    assert isinstance(table, Table)
+    return {str(column.header): [str(cell) for cell in column.cells] for column in table.columns}
+
+
+@pytest.mark.parametrize('field', [pytest.param(field, id=field.name) for field in RichTableField])
+def test_render_field_column(field: RichTableField) -> None:
+    """Test that every field renders one column with a cell per result after the variation column."""
+    columns = render_columns([field])
+    assert len(columns) == 2
+    assert list(columns)[0] == 'Size'
+    assert all(len(cells) == len(reported_case().results) for cells in columns.values())
+
+
+@pytest.mark.parametrize('field, label', [
+    (RichTableField.MEAN_CI, 'mean'), (RichTableField.MEDIAN_CI, 'median'),
+    (RichTableField.P5_CI, '5th'), (RichTableField.P95_CI, '95th')])
+def test_render_confidence_interval_columns(field: RichTableField, label: str) -> None:
+    """Test that a confidence interval column shows its confidence level and ordered bounds."""
+    header, cells = list(render_columns([field]).items())[1]
+    assert header.startswith(f'{label} {DEFAULT_CONFIDENCE_LEVEL * 100:g}% CI ')
+    for cell in cells:
+        lower, upper = cell.split(' – ')
+        assert float(lower) <= float(upper)
+
+
+def test_render_confidence_interval_shares_statistic_unit() -> None:
+    """Test that a confidence interval column is scaled to the same unit as its statistic."""
+    headers = list(render_columns([RichTableField.MEDIAN, RichTableField.MEDIAN_CI]))
+    assert headers[1].removeprefix('median ') == headers[2].split(' CI ')[1]
+
+
+def test_render_outlier_columns() -> None:
+    """Test the outlier counts and the outlier filtered mean and relative standard deviation."""
+    columns = render_columns(
+        [RichTableField.OUTLIERS, RichTableField.FILTERED_MEAN, RichTableField.FILTERED_RSD_PERCENT])
+    headers = list(columns)
+    assert headers[1] == 'outliers\nmild/severe'
+    assert headers[2].startswith('filtered mean ') and headers[3] == 'filtered rsd%'
+    for index, result in enumerate(reported_case().results):
+        stats = result.results_section(Section.TIMING)
+        assert isinstance(stats, Stats)
+        outliers = stats.outliers()
+        assert columns[headers[1]][index] == f'{len(outliers.mild)}/{len(outliers.severe)}'
+        assert float(columns[headers[2]][index]) > 0.0
+        assert columns[headers[3]][index].endswith('%')
+
+
+def test_render_variation_cols_last() -> None:
+    """Test that the variation columns can be placed after the field columns."""
+    first = render_columns([RichTableField.N, RichTableField.ROUNDS])
+    last = render_columns([RichTableField.N, RichTableField.ROUNDS], variation_cols_last=True)
+    assert list(last) == ['N', 'Rounds', 'Size']
+    assert first == last
+
+
+def test_render_latency_section() -> None:
+    """Test that the LATENCY section renders its histogram statistics and dashes for the raw data fields."""
+    case = Case(group='example', title='latency', description='Latency case', action=benchcase_with_size,
+                iterations=5, warmup_iterations=1, min_time=0.01, max_time=0.1, latency_samples=1000,
+                variation_cols={'size': 'Size'}, kwargs_variations={'size': [10]})
+    case.run()
+    table = RichTableReporter().render(
+        case=case, section=Section.LATENCY,
+        options=RichTableOptions(fields=[RichTableField.MEDIAN, RichTableField.OUTLIERS, RichTableField.MEAN_CI]))
+    assert isinstance(table, Table)
+    median, outliers, mean_ci = ([str(cell) for cell in column.cells] for column in table.columns[1:])
+    assert float(median[0]) > 0.0
+    assert outliers == mean_ci == ['-']
@@ -1,24 +1,45 @@
 """Tests for the case.py module."""
 # pylint: disable=too-many-lines
 # from __future__ import annotations
+import gc
 import inspect
+import json
+import mmap
+import threading
+import time
 from argparse import ArgumentParser
 from functools import cache
+from pathlib import Path
 from typing import Any
 
 import pytest
 from rich.console import Console
 
 from simplebench.case import Case
-from simplebench.enums import Format, Section, Verbosity
+from simplebench.defaults import DEFAULT_WARMUP_WINDOW
+from simplebench.enums import (
+    ArrivalProcess,
+    BindingStrategy,
+    Format,
+    GCPolicy,
+    MemoryStrategy,
+    PrecisionStatistic,
+    Section,
+    Verbosity,
+    WarmupStrategy,
+)
 from simplebench.exceptions import SimpleBenchBenchmarkError, SimpleBenchTypeError, SimpleBenchValueError
 from simplebench.exceptions.case import _CaseErrorTag
+from simplebench.exceptions.runners import _RunnersErrorTag
 from simplebench.iteration import Iteration
+from simplebench.reporters.allocations import AllocationsOptions, AllocationsReporter
 from simplebench.reporters.reporter.options import ReporterOptions
 from simplebench.reporters.validators.exceptions import _ReportersValidatorsErrorTag
 from simplebench.results import Results
-from simplebench.runners import SimpleRunner
+from simplebench.runners import LoadRunner, SimpleRunner, saturation_knee
 from simplebench.session import Session
+from simplebench.stats import NATIVE_MEMORY_SECTION_UNITS, RUSAGE_SECTION_UNITS
+from simplebench.utils import available_cpus, current_priority, sample_native_memory, sample_rusage
 
 from .kwargs import CaseKWArgs
 from .testspec import Assert, TestAction, TestGet, TestSet, TestSpec, idspec, no_assigned_action
@@ -866,6 +887,213 @@ def validate_description(actual: str | None, expected: str | None) -> bool:
         kwargs=CaseKWArgs(rounds=0, action=benchcase),
         exception=SimpleBenchValueError,
         exception_tag=_CaseErrorTag.INVALID_ROUNDS_VALUE)),
+    idspec("INIT_068", TestAction(
+        name="jobs attribute is initialized to None when not provided",
+        action=Case,
+        kwargs=CaseKWArgs(action=benchcase),
+        validate_result=lambda obj: obj.jobs is None)),
+    idspec("INIT_069", TestAction(
+        name="jobs attribute is initialized when provided",
+        action=Case,
+        kwargs=CaseKWArgs(action=benchcase, jobs=2),
+        validate_result=lambda obj: obj.jobs == 2)),
+    idspec("INIT_070", TestAction(
+        name="Invalid jobs parameter (not an int)",
+        action=Case,
+        kwargs=CaseKWArgs(jobs='2', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_JOBS_TYPE)),
+    idspec("INIT_071", TestAction(
+        name="Invalid jobs parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(jobs=0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_JOBS_VALUE)),
+    idspec("INIT_072", TestAction(
+        name="Valid memory_strategy and memory_samples parameters",
+        action=Case,
+        kwargs=CaseKWArgs(memory_strategy=MemoryStrategy.EVERY_NTH, memory_samples=4, action=benchcase),
+        validate_result=lambda case: (case.memory_strategy == MemoryStrategy.EVERY_NTH
+                                      and case.memory_samples == 4))),
+    idspec("INIT_073", TestAction(
+        name="Invalid memory_strategy parameter (not a MemoryStrategy)",
+        action=Case,
+        kwargs=CaseKWArgs(memory_strategy='every-nth', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_MEMORY_STRATEGY_TYPE)),
+    idspec("INIT_074", TestAction(
+        name="Invalid memory_samples parameter (not an int)",
+        action=Case,
+        kwargs=CaseKWArgs(memory_samples=2.0, action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_MEMORY_SAMPLES_TYPE)),
+    idspec("INIT_075", TestAction(
+        name="Invalid memory_samples parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(memory_samples=0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_MEMORY_SAMPLES_VALUE)),
+    idspec("INIT_076", TestAction(
+        name="Valid target_precision, precision_statistic and confidence_level parameters",
+        action=Case,
+        kwargs=CaseKWArgs(target_precision=0.01, precision_statistic=PrecisionStatistic.MEDIAN,
+                          confidence_level=0.99, action=benchcase),
+        validate_result=lambda case: (case.target_precision == 0.01
+                                      and case.precision_statistic == PrecisionStatistic.MEDIAN
+                                      and case.confidence_level == 0.99))),
+    idspec("INIT_077", TestAction(
+        name="Invalid target_precision parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(target_precision=0.0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_TARGET_PRECISION_VALUE)),
+    idspec("INIT_078", TestAction(
+        name="Invalid precision_statistic parameter (not a PrecisionStatistic)",
+        action=Case,
+        kwargs=CaseKWArgs(precision_statistic='mean', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_PRECISION_STATISTIC_TYPE)),
+    idspec("INIT_079", TestAction(
+        name="Invalid confidence_level parameter (not a float)",
+        action=Case,
+        kwargs=CaseKWArgs(confidence_level=1, action=benchcase),
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_CONFIDENCE_LEVEL_TYPE)),
+    idspec("INIT_080", TestAction(
+        name="Invalid confidence_level parameter (out of range)",
+        action=Case,
+        kwargs=CaseKWArgs(confidence_level=1.0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_CONFIDENCE_LEVEL_VALUE)),
+    idspec("INIT_081", TestAction(
+        name="Valid subtract_baseline parameter",
+        action=Case,
+        kwargs=CaseKWArgs(subtract_baseline=True, action=benchcase),
+        validate_result=lambda case: case.subtract_baseline is True)),
+    idspec("INIT_082", TestAction(
+        name="Invalid subtract_baseline parameter (not a bool)",
+        action=Case,
+        kwargs=CaseKWArgs(subtract_baseline=1, action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_SUBTRACT_BASELINE_TYPE)),
+    idspec("INIT_083", TestAction(
+        name="Valid gc_policy parameter",
+        action=Case,
+        kwargs=CaseKWArgs(gc_policy=GCPolicy.DISABLE_DURING_TIMING, action=benchcase),
+        validate_result=lambda case: case.gc_policy is GCPolicy.DISABLE_DURING_TIMING)),
+    idspec("INIT_084", TestAction(
+        name="Invalid gc_policy parameter (not a GCPolicy)",
+        action=Case,
+        kwargs=CaseKWArgs(gc_policy='enabled', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_GC_POLICY_TYPE)),
+    idspec("INIT_085", TestAction(
+        name="Valid cpu_affinity parameter (sorted and de-duplicated)",
+        action=Case,
+        kwargs=CaseKWArgs(cpu_affinity=[3, 1, 3], action=benchcase),
+        validate_result=lambda case: case.cpu_affinity == (1, 3))),
+    idspec("INIT_086", TestAction(
+        name="Invalid cpu_affinity parameter (not a sequence of ints)",
+        action=Case,
+        kwargs=CaseKWArgs(cpu_affinity=['0'], action=benchcase),  # type: ignore[list-item]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_CPU_AFFINITY_TYPE)),
+    idspec("INIT_087", TestAction(
+        name="Invalid cpu_affinity parameter (empty)",
+        action=Case,
+        kwargs=CaseKWArgs(cpu_affinity=[], action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_CPU_AFFINITY_VALUE)),
+    idspec("INIT_088", TestAction(
+        name="Invalid cpu_affinity parameter (negative CPU)",
+        action=Case,
+        kwargs=CaseKWArgs(cpu_affinity=[0, -1], action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_CPU_AFFINITY_VALUE)),
+    idspec("INIT_089", TestAction(
+        name="Valid priority parameter",
+        action=Case,
+        kwargs=CaseKWArgs(priority=5, action=benchcase),
+        validate_result=lambda case: case.priority == 5 and case.pinning is None)),
+    idspec("INIT_090", TestAction(
+        name="Invalid priority parameter (not an int)",
+        action=Case,
+        kwargs=CaseKWArgs(priority=5.0, action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_PRIORITY_TYPE)),
+    idspec("INIT_091", TestAction(
+        name="Invalid priority parameter (out of range)",
+        action=Case,
+        kwargs=CaseKWArgs(priority=20, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_PRIORITY_VALUE)),
+    idspec("INIT_092", TestAction(
+        name="Valid warmup_strategy parameter",
+        action=Case,
+        kwargs=CaseKWArgs(warmup_strategy=WarmupStrategy.AUTO, action=benchcase),
+        validate_result=lambda case: case.warmup_strategy == WarmupStrategy.AUTO)),
+    idspec("INIT_093", TestAction(
+        name="Invalid warmup_strategy parameter (not a WarmupStrategy)",
+        action=Case,
+        kwargs=CaseKWArgs(warmup_strategy='auto', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_WARMUP_STRATEGY_TYPE)),
+    idspec("INIT_094", TestAction(
+        name="Valid interleave parameter",
+        action=Case,
+        kwargs=CaseKWArgs(interleave=True, action=benchcase),
+        validate_result=lambda case: case.interleave is True)),
+    idspec("INIT_095", TestAction(
+        name="Invalid interleave parameter (not a bool)",
+        action=Case,
+        kwargs=CaseKWArgs(interleave=1, action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_INTERLEAVE_TYPE)),
+    idspec("INIT_096", TestAction(
+        name="Valid latency_samples and latency_sample_rate parameters",
+        action=Case,
+        kwargs=CaseKWArgs(latency_samples=1000, latency_sample_rate=0.5, action=benchcase),
+        validate_result=lambda case: case.latency_samples == 1000 and case.latency_sample_rate == 0.5)),
+    idspec("INIT_097", TestAction(
+        name="Invalid latency_samples parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(latency_samples=0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_LATENCY_SAMPLES_VALUE)),
+    idspec("INIT_098", TestAction(
+        name="Invalid latency_sample_rate parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(latency_sample_rate=0.0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_LATENCY_SAMPLE_RATE_VALUE)),
+    idspec("INIT_099", TestAction(
+        name="Valid allocation_sites and allocation_frames parameters",
+        action=Case,
+        kwargs=CaseKWArgs(allocation_sites=5, allocation_frames=3, action=benchcase),
+        validate_result=lambda case: case.allocation_sites == 5 and case.allocation_frames == 3)),
+    idspec("INIT_100", TestAction(
+        name="Invalid allocation_sites parameter (zero value)",
+        action=Case,
+        kwargs=CaseKWArgs(allocation_sites=0, action=benchcase),
+        exception=SimpleBenchValueError,
+        exception_tag=_CaseErrorTag.INVALID_ALLOCATION_SITES_VALUE)),
+    idspec("INIT_101", TestAction(
+        name="Invalid allocation_frames parameter (str)",
+        action=Case,
+        kwargs=CaseKWArgs(allocation_frames='1', action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_ALLOCATION_FRAMES_TYPE)),
+    idspec("INIT_102", TestAction(
+        name="Valid native_memory parameter",
+        action=Case,
+        kwargs=CaseKWArgs(native_memory=True, action=benchcase),
+        validate_result=lambda case: case.native_memory is True)),
+    idspec("INIT_103", TestAction(
+        name="Invalid native_memory parameter (int)",
+        action=Case,
+        kwargs=CaseKWArgs(native_memory=1, action=benchcase),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_CaseErrorTag.INVALID_NATIVE_MEMORY_TYPE)),
 ])
 def test_case_init(testspec: TestAction) -> None:
     """Test the initialization of the Case class.
@@ -1111,6 +1339,43 @@ def test_getting_attributes(testspec: TestSpec) -> None:
             'case_kwargs': CaseKWArgs(group='example', title='benchcase', description='Benchmark case',
                                       min_time=0.01, max_time=0.1, action=broken_benchcase_action_that_raises),
         })),
+    idspec("RUN_010", TestAction(
+        name="Benchmark case with two variation axes and jobs=2 runs in parallel without exceptions",
+        action=no_assigned_action,
+        kwargs={},
+        extra={
+            'output_expected': False,
+            'case_kwargs': CaseKWArgs(
+                                group='example', title='benchcase', description='Benchmark case',
+                                min_time=0.01, max_time=0.1, jobs=2,
+                                action=benchcase_with_size_and_factor,
+                                kwargs_variations={'size': [10, 100], 'factor': [1, 2, 3]})
+        })),
+    idspec("RUN_011", TestAction(
+        name="Benchmark case run in parallel using the jobs setting of a displayless Session with progress",
+        action=no_assigned_action,
+        kwargs={'session': Session(console=displayless_console(), show_progress=True, jobs=3)},
+        extra={
+            'output_expected': False,
+            'case_kwargs': CaseKWArgs(
+                                group='example', title='benchcase', description='Benchmark case',
+                                min_time=0.01, max_time=0.1,
+                                action=benchcase_with_size,
+                                kwargs_variations={'size': [10, 100, 1000]})
+        })),
+    idspec("RUN_012", TestAction(
+        name="Benchmark case with broken action function raises exception when run in parallel",
+        action=no_assigned_action,
+        kwargs={},
+        exception=SimpleBenchBenchmarkError,
+        exception_tag=_CaseErrorTag.BENCHMARK_ACTION_RAISED_EXCEPTION,
+        extra={
+            'output_expected': False,
+            'case_kwargs': CaseKWArgs(group='example', title='benchcase', description='Benchmark case',
+                                      min_time=0.01, max_time=0.1, jobs=2,
+                                      kwargs_variations={'size': [1, 2]},
+                                      action=broken_benchcase_action_that_raises),
+        })),
 ])
 def test_run(capsys, testspec: TestAction) -> None:
     """Test the run method of the Case class.
@@ -1137,3 +1402,584 @@ def test_run(capsys, testspec: TestAction) -> None:
             assert output != "", "Expected output to stdout/stderr during session run"
         else:
             assert output == "", "Expected no output to stdout/stderr during displayless session run"
+
+
+def test_run_parallel_preserves_variation_order() -> None:
+    """Test that results from a parallel run are stored in kwargs variations grid order."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, jobs=4,
+        action=benchcase_with_size_and_factor,
+        variation_cols={'size': 'Size', 'factor': 'Factor'},
+        kwargs_variations={'size': [1000, 10, 100], 'factor': [3, 1, 2]})
+    benchmark_case.run()
+    assert [result.variation_marks for result in benchmark_case.results] == \
+        benchmark_case.expanded_kwargs_variations
+    assert [result.n for result in benchmark_case.results] == [
+        kwargs['size'] * kwargs['factor'] for kwargs in benchmark_case.expanded_kwargs_variations]
+
+
+@pytest.mark.parametrize('memory_strategy, expected_samples', [
+    (MemoryStrategy.EVERY_NTH, lambda iterations: (iterations + 2) // 3),
+    (MemoryStrategy.AFTER_TIMING, lambda iterations: 3),
+])
+def test_run_memory_strategy_samples(memory_strategy: MemoryStrategy, expected_samples: Any) -> None:
+    """Test that the memory sections are built from the samples taken by the memory strategy."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=5, warmup_iterations=1,
+        memory_strategy=memory_strategy, memory_samples=3, action=benchcase)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert result.memory_measured
+    assert result.memory is not None and result.peak_memory is not None
+    assert len(result.memory.data) == expected_samples(len(result.iterations))
+    assert len(result.peak_memory.data) == len(result.memory.data)
+
+
+def test_run_memory_strategy_off() -> None:
+    """Test that memory is reported as not measured rather than as zero with MemoryStrategy.OFF."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=5, warmup_iterations=1,
+        memory_strategy=MemoryStrategy.OFF, action=benchcase)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert not result.memory_measured
+    assert result.memory is None and result.peak_memory is None
+    assert result.as_dict()['memory'] is None and result.as_dict(full_data=True)['peak_memory'] is None
+
+
+@pytest.mark.parametrize('latency_sample_rate', [1.0, 0.25])
+def test_run_latency_samples(latency_sample_rate: float) -> None:
+    """Test that single calls are timed into the LATENCY section with their tail percentiles."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=5, warmup_iterations=1,
+        latency_samples=20000, latency_sample_rate=latency_sample_rate, action=benchcase)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert result.latency is not None
+    assert result.latency.total_count == 20000
+    assert result.extra_info['latency_sample_rate'] == latency_sample_rate
+    assert result.extra_info['timer_overhead_ns'] > 0.0
+    tails = result.extra_info['tail_latencies']
+    assert list(tails) == ['99', '99.9', '99.99']
+    assert tails['99'] <= tails['99.9'] <= tails['99.99'] <= result.latency.maximum
+    precision = result.extra_info['timer_precision_ns'] * 1e-9
+    assert result.extra_info['quantized_tail_latencies'] == [
+        label for label, value in tails.items() if value < 10 * precision]
+    latency = result.results_section(Section.LATENCY)
+    assert latency.percentiles[99] == pytest.approx(tails['99'])
+
+
+def test_run_allocation_sites() -> None:
+    """Test that the sites of the memory still held after a call are attributed to their lines."""
+    retained: list[bytearray] = []
+
+    def allocating_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case keeping a buffer alive after every call."""
+        def action() -> None:
+            """Allocate and keep a buffer."""
+            retained.append(bytearray(100_000))
+        return _bench.run(n=1, action=action, **kwargs)
+
+    benchmark_case = Case(
+        group='example', title='allocations', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=5, warmup_iterations=1,
+        allocation_sites=3, allocation_frames=2, action=allocating_case)
+    benchmark_case.run()
+    sites = benchmark_case.results[0].allocation_sites
+    assert sites is not None and 1 <= len(sites) <= 3
+    top = sites[0]
+    assert top.size >= 100_000 and top.blocks >= 1
+    assert top.frames[0][0] == __file__ and len(top.frames) <= 2
+    assert all(site.size <= top.size for site in sites)
+    assert benchmark_case.results[0].as_dict()['allocation_sites'][0] == top.as_dict()
+
+    reporter = AllocationsReporter()
+    table = reporter.render(case=benchmark_case, section=Section.ALLOCATIONS, options=AllocationsOptions(frames=2))
+    assert table.row_count == len(sites)
+    report = json.loads(reporter.render_json(
+        case=benchmark_case, section=Section.ALLOCATIONS, options=AllocationsOptions()))
+    assert report['variations'][0]['allocation_sites'][0] == top.as_dict()
+
+    benchmark_case = Case(group='example', title='benchcase', description='Benchmark case',
+                          min_time=0.01, max_time=0.1, iterations=5, warmup_iterations=1, action=benchcase)
+    benchmark_case.run()
+    assert benchmark_case.results[0].allocation_sites is None
+
+
+def test_run_target_precision_replaces_min_time() -> None:
+    """Test that a variation with a target precision stops once the precision is reached."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=60.0, max_time=120.0, iterations=5, warmup_iterations=1,
+        target_precision=0.5, action=benchcase)
+    benchmark_case.run()
+    extra_info = benchmark_case.results[0].extra_info
+    assert extra_info['target_precision'] == 0.5
+    assert extra_info['precision'] is not None and extra_info['precision'] <= 0.5
+    assert extra_info['precision_statistic'] == PrecisionStatistic.MEAN.value
+    assert benchmark_case.results[0].total_elapsed * 1e-9 < 60.0
+
+
+def test_run_input_factory_gives_each_round_a_fresh_input() -> None:
+    """Test that in batched mode every timed call of the action gets its own fresh input."""
+    unsorted_inputs: list[int] = []
+
+    def input_factory() -> list[int]:
+        unsorted_inputs.append(1)
+        return [3, 2, 1]
+
+    def sort_in_place(data: list[int]) -> None:
+        if data != [3, 2, 1]:
+            raise ValueError('input was reused')
+        data.sort()
+
+    def batched_benchcase(_bench: SimpleRunner, **kwargs) -> Results:
+        return _bench.run(n=3, action=sort_in_place, input_factory=input_factory, kwargs=kwargs)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, action=batched_benchcase)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert len(unsorted_inputs) >= result.rounds * len(result.iterations)
+    assert result.extra_info['binding_strategy'] == BindingStrategy.NO_ARGS.value
+
+
+def test_run_input_factory_cost_bounds_calibrated_rounds() -> None:
+    """Test that the untimed cost of generating batched inputs is kept within the time budget."""
+    def input_factory() -> list[int]:
+        return list(range(2000))
+
+    def batched_benchcase(_bench: SimpleRunner, **kwargs) -> Results:
+        return _bench.run(n=1, action=len, input_factory=input_factory, kwargs=kwargs)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.1, max_time=0.5, iterations=5, memory_strategy=MemoryStrategy.OFF,
+        action=batched_benchcase)
+    started = time.perf_counter()
+    benchmark_case.run()
+    assert time.perf_counter() - started < 5.0
+    result = benchmark_case.results[0]
+    assert len(result.iterations) >= 5
+
+
+def test_run_invalid_input_factory() -> None:
+    """Test that a non-callable input_factory is rejected."""
+    def batched_benchcase(_bench: SimpleRunner, **kwargs) -> Results:
+        return _bench.run(n=1, action=len, input_factory='not callable', kwargs=kwargs)  # type: ignore[arg-type]
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case', action=batched_benchcase)
+    with pytest.raises(SimpleBenchBenchmarkError) as excinfo:
+        benchmark_case.run()
+    assert isinstance(excinfo.value.__cause__, SimpleBenchTypeError)
+    assert excinfo.value.__cause__.tag_code == _RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_INPUT_FACTORY
+
+
+def test_run_threads() -> None:
+    """Test that thread scaling mode reports aggregate ops/s, per-thread latencies and the scaling efficiency."""
+    calling_threads: set[int] = set()
+
+    def record_thread() -> None:
+        calling_threads.add(threading.get_ident())
+
+    def threaded_benchcase(_bench: SimpleRunner, **kwargs) -> Results:
+        return _bench.run(n=1, action=record_thread, threads=3, kwargs=kwargs)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.5, iterations=3, warmup_iterations=1, rounds=10, action=threaded_benchcase)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert len(calling_threads) >= 3
+    assert all(iteration.rounds == 30 for iteration in result.iterations)
+    assert len(result.per_round_timings.data) == 3 * len(result.iterations)
+    extra_info = result.extra_info
+    assert extra_info['threads'] == 3
+    assert extra_info['single_thread_ops_per_second'] > 0.0
+    assert extra_info['scaling_efficiency'] > 0.0
+    assert 0.0 <= extra_info['thread_cpu_fraction']
+    assert isinstance(extra_info['gil_enabled'], bool)
+    assert not any(thread.name.startswith('simplebench-worker') for thread in threading.enumerate())
+
+
+@pytest.mark.parametrize('threads, input_factory, exception, tag', [
+    ('2', None, SimpleBenchTypeError, _RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_THREADS_TYPE),
+    (0, None, SimpleBenchValueError, _RunnersErrorTag.SIMPLERUNNER_RUN_INVALID_THREADS_VALUE),
+    (2, list, SimpleBenchValueError, _RunnersErrorTag.SIMPLERUNNER_RUN_THREADS_WITH_INPUT_FACTORY),
+])
+def test_run_invalid_threads(threads: Any, input_factory: Any, exception: type[Exception], tag: Any) -> None:
+    """Test that invalid thread counts, and threads combined with an input_factory, are rejected."""
+    def threaded_benchcase(_bench: SimpleRunner, **kwargs) -> Results:
+        return _bench.run(n=1, action=len, threads=threads, input_factory=input_factory, kwargs=kwargs)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case', action=threaded_benchcase)
+    with pytest.raises(SimpleBenchBenchmarkError) as excinfo:
+        benchmark_case.run()
+    cause = excinfo.value.__cause__
+    assert isinstance(cause, exception)
+    assert isinstance(cause, (SimpleBenchTypeError, SimpleBenchValueError))
+    assert cause.tag_code == tag
+
+
+def test_run_load() -> None:
+    """Test that an open-loop load sweep records per-call latencies and finds the saturation knee."""
+    def sleep_1ms() -> None:
+        time.sleep(0.001)
+
+    def load_benchcase(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        assert isinstance(_bench, LoadRunner)
+        return _bench.run(n=kwargs['rate'], action=sleep_1ms, rate=kwargs['rate'],
+                          arrival_process=ArrivalProcess.POISSON)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case', runner=LoadRunner,
+        min_time=0.2, max_time=0.5, iterations=10, warmup_iterations=2, action=load_benchcase,
+        kwargs_variations={'rate': [50, 5000]}, variation_cols={'rate': 'Rate'})
+    benchmark_case.run()
+    slow, fast = sorted(benchmark_case.results, key=lambda result: result.extra_info['rate'])
+    assert slow.extra_info['arrival_process'] == 'poisson'
+    assert slow.extra_info['calls'] == sum(iteration.rounds for iteration in slow.iterations)
+    assert slow.latency is not None
+    assert slow.latency.total_count == slow.extra_info['calls'] + slow.extra_info['omitted_calls']
+    assert not slow.extra_info['saturated']
+    assert fast.extra_info['saturated']
+    assert fast.extra_info['achieved_rate'] < fast.extra_info['offered_rate']
+    # Queued calls count the time spent waiting for the schedule to catch up
+    latency = fast.results_section(Section.LATENCY)
+    assert latency.maximum > 10 * fast.extra_info['service_time_median']
+    assert latency.percentiles[99] <= latency.maximum
+    assert saturation_knee(benchmark_case.results) is slow
+    assert saturation_knee([fast]) is None
+
+
+@pytest.mark.parametrize('rate, arrival_process, threads, exception, tag', [
+    ('10', ArrivalProcess.CONSTANT, 1, SimpleBenchTypeError, _RunnersErrorTag.LOADRUNNER_RUN_INVALID_RATE_TYPE),
+    (0, ArrivalProcess.CONSTANT, 1, SimpleBenchValueError, _RunnersErrorTag.LOADRUNNER_RUN_INVALID_RATE_VALUE),
+    (10, 'poisson', 1, SimpleBenchTypeError, _RunnersErrorTag.LOADRUNNER_RUN_INVALID_ARRIVAL_PROCESS),
+    (10, ArrivalProcess.CONSTANT, 2, SimpleBenchValueError, _RunnersErrorTag.LOADRUNNER_RUN_UNSUPPORTED_OPTION),
+])
+def test_run_load_invalid(
+        rate: Any, arrival_process: Any, threads: Any, exception: type[Exception], tag: Any) -> None:
+    """Test that invalid rates and arrival processes, and unsupported options, are rejected by LoadRunner."""
+    def load_benchcase(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        assert isinstance(_bench, LoadRunner)
+        return _bench.run(n=1, action=len, rate=rate, arrival_process=arrival_process, threads=threads)
+
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case', runner=LoadRunner,
+        action=load_benchcase)
+    with pytest.raises(SimpleBenchBenchmarkError) as excinfo:
+        benchmark_case.run()
+    cause = excinfo.value.__cause__
+    assert isinstance(cause, exception)
+    assert isinstance(cause, (SimpleBenchTypeError, SimpleBenchValueError))
+    assert cause.tag_code == tag
+
+
+def test_run_subtract_baseline() -> None:
+    """Test that the empty-action baseline is recorded and optionally subtracted from TIMING and OPS."""
+    for subtract_baseline in (False, True):
+        benchmark_case = Case(
+            group='example', title='benchcase', description='Benchmark case',
+            min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1,
+            subtract_baseline=subtract_baseline, action=benchcase)
+        benchmark_case.run()
+        result = benchmark_case.results[0]
+        extra_info = result.extra_info
+        baseline = extra_info['baseline_per_round']
+        assert baseline > 0.0
+        assert extra_info['baseline_subtracted'] is subtract_baseline
+        uncorrected = [iteration.per_round_elapsed for iteration in result.iterations]
+        expected = [max(timing - baseline, 0.0) for timing in uncorrected] if subtract_baseline else uncorrected
+        assert list(result.per_round_timings.data) == pytest.approx(expected)
+        assert list(result.ops_per_second.data) == pytest.approx(
+            [1.0 / timing if timing > 0.0 else 0.0 for timing in expected])
+
+
+def test_run_gc_policy() -> None:
+    """Test that garbage collections are recorded per iteration and suppressed by DISABLE_DURING_TIMING."""
+    def cyclic_garbage_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case whose action creates cyclic garbage."""
+        def action() -> None:
+            """Create reference cycles that only the garbage collector can free."""
+            for _ in range(1000):
+                cycle: list[Any] = []
+                cycle.append(cycle)
+        return _bench.run(n=1000, action=action, **kwargs)
+
+    collections: dict[GCPolicy, list[int]] = {}
+    for gc_policy in (GCPolicy.ENABLED, GCPolicy.DISABLE_DURING_TIMING):
+        benchmark_case = Case(
+            group='example', title='cyclic garbage', description='Benchmark case',
+            min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1,
+            gc_policy=gc_policy, action=cyclic_garbage_case)
+        benchmark_case.run()
+        result = benchmark_case.results[0]
+        assert result.extra_info['gc_policy'] == gc_policy.value
+        assert 0.0 <= result.extra_info['gc_time_fraction'] <= 1.0
+        assert list(result.results_section(Section.GC).data) == [
+            iteration.gc_collections for iteration in result.iterations]
+        collections[gc_policy] = [iteration.gc_collections for iteration in result.iterations]
+    assert gc.isenabled()
+    assert sum(collections[GCPolicy.ENABLED]) > 0
+    assert sum(collections[GCPolicy.DISABLE_DURING_TIMING]) == 0
+
+
+def test_run_warmup_strategy() -> None:
+    """Test that the warmup curve is kept and that automatic warmup stops at a steady state."""
+    def steady_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case with a constant workload."""
+        return _bench.run(n=100, action=lambda: sum(range(100)), **kwargs)
+
+    for warmup_strategy in (WarmupStrategy.FIXED, WarmupStrategy.AUTO):
+        benchmark_case = Case(
+            group='example', title='steady', description='Benchmark case',
+            min_time=0.01, max_time=1.0, iterations=3, rounds=10, warmup_iterations=4,
+            warmup_strategy=warmup_strategy, action=steady_case)
+        benchmark_case.run()
+        result = benchmark_case.results[0]
+        extra_info = result.extra_info
+        assert extra_info['warmup_strategy'] == warmup_strategy.value
+        assert result.warmup_timings is not None
+        assert len(result.warmup_timings.data) == extra_info['warmup_iterations']
+        assert result.results_section(Section.WARMUP) is result.warmup_timings
+        if warmup_strategy == WarmupStrategy.FIXED:
+            assert extra_info['warmup_iterations'] == 4
+            assert extra_info['steady_state'] is None
+            assert extra_info['first_call_elapsed'] is None
+        else:
+            assert 0.0 < extra_info['first_call_elapsed'] < 1.0
+            assert isinstance(extra_info['steady_state'], bool)
+            if extra_info['steady_state']:
+                assert extra_info['warmup_iterations'] >= 2 * DEFAULT_WARMUP_WINDOW
+
+
+def test_run_cpu_time() -> None:
+    """Test that CPU time is measured alongside wall-clock time and exposes off-CPU time."""
+    def sleeping_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case whose action spends its time off the CPU."""
+        def action() -> None:
+            """Sleep without using the CPU."""
+            time.sleep(0.002)
+        return _bench.run(n=1, action=action, **kwargs)
+
+    benchmark_case = Case(
+        group='example', title='sleeping', description='Benchmark case',
+        min_time=0.01, max_time=0.5, iterations=3, warmup_iterations=0, rounds=5,
+        action=sleeping_case)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert list(result.results_section(Section.CPU_TIME).data) == [
+        iteration.per_round_cpu_elapsed for iteration in result.iterations]
+    assert all(iteration.cpu_elapsed < iteration.elapsed * iteration.scale for iteration in result.iterations)
+    assert 0.0 <= result.cpu_utilization < 0.5
+    assert result.as_dict()['cpu_utilization'] == result.cpu_utilization
+
+
+def test_run_cpu_time_batched() -> None:
+    """Test that the CPU time of a batched benchmark leaves out the untimed input generation."""
+    def batched_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A batched benchmark case whose inputs cost far more to make than to use."""
+        def input_factory() -> list[str]:
+            """Build an input many times more expensive to make than to scan."""
+            return [str(value) for value in range(2000)]
+        return _bench.run(n=1, action=max, input_factory=input_factory, kwargs=kwargs)
+
+    benchmark_case = Case(
+        group='example', title='batched', description='Benchmark case',
+        min_time=0.01, max_time=0.5, iterations=3, warmup_iterations=0, rounds=100,
+        action=batched_case)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert 0.0 < result.cpu_utilization < 2.0
+
+
+@pytest.mark.skipif(sample_rusage() is None, reason='resource.getrusage is not available')
+def test_run_rusage() -> None:
+    """Test that OS resource counters are recorded per iteration and reported as sections."""
+    def page_faulting_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case whose action maps and touches fresh memory."""
+        def action() -> None:
+            """Map a fresh anonymous region and touch every page of it."""
+            with mmap.mmap(-1, 1 << 22) as region:
+                for offset in range(0, 1 << 22, mmap.PAGESIZE):
+                    region[offset] = 1
+        return _bench.run(n=1, action=action, **kwargs)
+
+    benchmark_case = Case(
+        group='example', title='page faults', description='Benchmark case',
+        min_time=0.01, max_time=0.5, iterations=3, warmup_iterations=1, rounds=5,
+        action=page_faulting_case)
+    benchmark_case.run()
+    result = benchmark_case.results[0]
+    assert set(result.rusage) == set(RUSAGE_SECTION_UNITS)
+    assert list(result.results_section(Section.MINOR_PAGE_FAULTS).data) == [
+        iteration.rusage.minor_faults for iteration in result.iterations]
+    assert result.results_section(Section.MINOR_PAGE_FAULTS).minimum > 0
+    assert result.results_section(Section.MAX_RSS).minimum > 0
+    assert set(result.as_dict()['rusage']) == {section.value for section in RUSAGE_SECTION_UNITS}
+
+
+@pytest.mark.skipif(sample_native_memory() is None, reason='/proc/self/smaps_rollup is not available')
+def test_run_native_memory() -> None:
+    """Test that native memory invisible to tracemalloc is recorded per iteration and reported as sections."""
+    regions: list[mmap.mmap] = []
+
+    def mapping_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case whose action maps, touches and keeps fresh memory."""
+        def action() -> None:
+            """Map a fresh anonymous region, touch every page of it and keep it mapped."""
+            region = mmap.mmap(-1, 1 << 22)
+            for offset in range(0, 1 << 22, mmap.PAGESIZE):
+                region[offset] = 1
+            regions.append(region)
+        return _bench.run(n=1, action=action, **kwargs)
+
+    try:
+        benchmark_case = Case(
+            group='example', title='native memory', description='Benchmark case',
+            min_time=0.01, max_time=0.5, iterations=3, warmup_iterations=1, rounds=1,
+            memory_strategy=MemoryStrategy.OFF, native_memory=True, action=mapping_case)
+        benchmark_case.run()
+    finally:
+        for region in regions:
+            region.close()
+    result = benchmark_case.results[0]
+    assert set(result.native_memory) == set(NATIVE_MEMORY_SECTION_UNITS)
+    assert list(result.results_section(Section.RSS).data) == [
+        iteration.native_memory.rss for iteration in result.iterations]
+    for section in (Section.RSS, Section.USS, Section.PSS):
+        assert result.results_section(section).minimum >= 1 << 22
+    assert result.results_section(Section.PEAK_RSS).minimum > 0
+    assert set(result.as_dict()['native_memory']) == {section.value for section in NATIVE_MEMORY_SECTION_UNITS}
+
+    benchmark_case = Case(group='example', title='benchcase', description='Benchmark case',
+                          min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, action=benchcase)
+    benchmark_case.run()
+    assert all(stats.maximum == 0 for stats in benchmark_case.results[0].native_memory.values())
+
+
+@pytest.mark.skipif(not available_cpus(), reason='os.sched_setaffinity is not available')
+def test_run_cpu_pinning() -> None:
+    """Test that a case runs pinned to its CPUs, records the pinning, and restores the affinity."""
+    cpus_before = available_cpus()
+    niceness_before = current_priority()
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1,
+        action=benchcase)
+    session = Session(console=displayless_console(), cpu_affinity=cpus_before[:1], priority=niceness_before)
+    benchmark_case.run(session=session)
+    result = benchmark_case.results[0]
+    assert result.extra_info['cpu_affinity'] == cpus_before[:1]
+    assert result.extra_info['priority'] == niceness_before
+    assert result.extra_info['cpu_migrations'] == 0
+    assert benchmark_case.pinning is not None
+    assert benchmark_case.pinning.cpus == tuple(cpus_before[:1])
+    assert available_cpus() == cpus_before
+
+
+def test_run_reuses_calibration_cache(tmp_path: Path) -> None:
+    """Test that calibrated rounds are cached in the output path, reused, and recalibrated on drift."""
+    def run_case(benchmark_id: str | None = None, use_calibration_cache: bool = True) -> int:
+        benchmark_case = Case(
+            group='example', title='benchcase', description='Benchmark case', benchmark_id=benchmark_id,
+            min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, action=benchcase)
+        benchmark_case.run(session=Session(console=displayless_console(), output_path=tmp_path,
+                                           use_calibration_cache=use_calibration_cache))
+        return benchmark_case.results[0].rounds
+
+    cache_path = tmp_path / '_calibration_cache.json'
+    run_case(use_calibration_cache=False)
+    run_case(benchmark_id='transient-1')
+    assert not cache_path.exists()
+
+    rounds = run_case()
+    entries = json.loads(cache_path.read_text(encoding='utf-8'))
+    assert [entry['rounds'] for entry in entries.values()] == [rounds]
+    assert run_case() == rounds
+
+    key = next(iter(entries))
+    stale_key = key.replace('benchcase', 'removed_benchcase', 1)
+    entries[key] = {'rounds': rounds + 7, 'per_call_ns': 1e12, 'stored_at': time.time()}
+    entries[stale_key] = {'rounds': 10, 'per_call_ns': 1.0, 'stored_at': 0.0}
+    cache_path.write_text(json.dumps(entries), encoding='utf-8')
+    assert run_case() != rounds + 7
+    entries = json.loads(cache_path.read_text(encoding='utf-8'))
+    assert list(entries) == [key]
+    assert entries[key]['per_call_ns'] < 1e12
+
+
+def test_run_interleaved_preserves_variation_order() -> None:
+    """Test that interleaved variations each get their own Results, stored in grid order."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, interleave=True,
+        action=benchcase_with_size_and_factor,
+        variation_cols={'size': 'Size', 'factor': 'Factor'},
+        kwargs_variations={'size': [100, 10], 'factor': [2, 1]})
+    benchmark_case.run(session=Session(console=displayless_console()))
+    assert [result.variation_marks for result in benchmark_case.results] == \
+        benchmark_case.expanded_kwargs_variations
+    assert all(result.extra_info['interleaved'] for result in benchmark_case.results)
+
+    other_case = Case(
+        group='example', title='other', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, action=benchcase)
+    Case.run_interleaved([benchmark_case, other_case], session=Session(console=displayless_console()))
+    assert len(benchmark_case.results) == 8
+    assert len(other_case.results) == 1
+    assert other_case.results[0].extra_info['interleaved'] is True
+
+
+def test_run_interleaved_error() -> None:
+    """Test that a failing interleaved variation cancels the others and its error is raised."""
+    def failing_case(_bench: SimpleRunner, **kwargs: Any) -> Results:
+        """A benchmark case that fails for one of its variations."""
+        size: int = kwargs['size']
+        if size == 2:
+            raise RuntimeError('failed variation')
+        return _bench.run(n=size, action=lambda: sum(range(size)))
+
+    benchmark_case = Case(
+        group='example', title='failing', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, interleave=True,
+        action=failing_case, kwargs_variations={'size': [1, 2, 3]})
+    with pytest.raises(SimpleBenchBenchmarkError) as excinfo:
+        benchmark_case.run(session=Session(console=displayless_console()))
+    assert excinfo.value.tag_code == _CaseErrorTag.BENCHMARK_ACTION_RAISED_EXCEPTION
+    assert 'failed variation' in str(excinfo.value)
+    assert not benchmark_case.results
+
+
+def test_run_isolated_preserves_variation_order() -> None:
+    """Test that results from an isolated run are stored in kwargs variations grid order."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, jobs=2,
+        action=benchcase_with_size_and_factor,
+        variation_cols={'size': 'Size', 'factor': 'Factor'},
+        kwargs_variations={'size': [100, 10], 'factor': [2, 1]})
+    benchmark_case.run(session=Session(console=displayless_console(), isolated=True))
+    assert [result.variation_marks for result in benchmark_case.results] == \
+        benchmark_case.expanded_kwargs_variations
+    assert [result.n for result in benchmark_case.results] == [
+        kwargs['size'] * kwargs['factor'] for kwargs in benchmark_case.expanded_kwargs_variations]
+
+
+def test_run_isolated_uses_session_calibration_cache(tmp_path: Path) -> None:
+    """Test that isolated child processes run with the calibration cache of the parent session."""
+    benchmark_case = Case(
+        group='example', title='benchcase', description='Benchmark case',
+        min_time=0.01, max_time=0.1, iterations=3, warmup_iterations=1, action=benchcase)
+    benchmark_case.run(session=Session(console=displayless_console(), isolated=True,
+                                       output_path=tmp_path, use_calibration_cache=True))
+    entries = json.loads((tmp_path / '_calibration_cache.json').read_text(encoding='utf-8'))
+    assert [entry['rounds'] for entry in entries.values()] == [benchmark_case.results[0].rounds]
@@ -12,6 +12,7 @@ from simplebench.defaults import (
 )
 from simplebench.enums import Verbosity
 from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError, _CaseErrorTag, _DecoratorsErrorTag
+from simplebench.runners import AsyncRunner
 from simplebench.session import Session
 
 
@@ -636,6 +637,39 @@ def test_decorator_use_field_for_n_valid() -> None:
     assert actual_n_values == expected_n_values, "The n values in results do not match the expected sizes."
 
 
+def test_decorator_async_function_uses_async_runner() -> None:
+    """Test that the ``@benchmark`` decorator benchmarks coroutine functions with the AsyncRunner."""
+    clear_registered_cases()
+
+    @benchmark('test',
+               title='Async function',
+               min_time=0.1,
+               max_time=1.0,
+               kwargs_variations={'size': [10, 100]},
+               use_field_for_n='size')
+    async def async_function(size: int) -> int:
+        """A test coroutine function.
+
+        :param size: The size parameter.
+        :return: The sum of the range.
+        """
+        return sum(range(size))
+
+    cases = get_registered_cases()
+    assert len(cases) == 1, "Expected exactly one registered case."
+    assert cases[0].runner is AsyncRunner, "Expected the AsyncRunner to be selected for a coroutine function."
+
+    session = Session(cases=cases, verbosity=Verbosity.QUIET)
+    session.parse_args([])  # No command-line args
+    session.run()
+
+    test_case = cases[0]
+    assert len(test_case.results) == 2, "Expected two results for the two size variations."
+    assert [result.n for result in test_case.results] == [10, 100]
+    assert all(result.rounds >= 1 and result.iterations for result in test_case.results)
+    clear_registered_cases()
+
+
 def test_decorator_with_no_parameters() -> None:
     """Test that the ``@benchmark`` decorator works correctly with no optional parameters."""
     clear_registered_cases()
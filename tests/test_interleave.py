@@ -0,0 +1,81 @@
+"""Tests for the simplebench.interleave module."""
+import threading
+
+import pytest
+
+from simplebench.exceptions import SimpleBenchRuntimeError, SimpleBenchTypeError, SimpleBenchValueError
+from simplebench.exceptions.interleave import _InterleaveErrorTag
+from simplebench.interleave import InterleavedScheduler
+
+
+def run_participants(scheduler: InterleavedScheduler, turns_each: int) -> list[int]:
+    """Run one thread per participant, each taking ``turns_each`` turns, and return the order of the turns.
+
+    :param scheduler: The scheduler to take turns with.
+    :param turns_each: The number of turns each participant takes before finishing.
+    :return: The participant numbers in the order they held the turn.
+    """
+    turns: list[int] = []
+
+    def participant(number: int) -> None:
+        scheduler.wait_turn(number)
+        for turn in range(turns_each):
+            turns.append(number)
+            if turn < turns_each - 1:
+                scheduler.yield_turn(number)
+        scheduler.finish(number)
+
+    threads = [threading.Thread(target=participant, args=(number,)) for number in range(scheduler.participants)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10.0)
+    return turns
+
+
+def test_scheduler_rounds() -> None:
+    """Test that every participant gets exactly one turn per round, in a shuffled order."""
+    scheduler = InterleavedScheduler(4, seed=1)
+    assert scheduler.participants == 4
+    turns = run_participants(scheduler, 25)
+    assert len(turns) == 100
+    rounds = [tuple(turns[start:start + 4]) for start in range(0, 100, 4)]
+    assert all(sorted(order) == [0, 1, 2, 3] for order in rounds)
+    assert len(set(rounds)) > 1
+    assert scheduler.turn is None
+
+    assert run_participants(InterleavedScheduler(4, seed=1), 25) == turns
+    assert run_participants(InterleavedScheduler(1), 3) == [0, 0, 0]
+
+
+def test_scheduler_finish_and_cancel() -> None:
+    """Test that finishing passes the turn on and that cancelling makes waiting participants raise."""
+    scheduler = InterleavedScheduler(2, seed=0)
+    first = scheduler.turn
+    assert first is not None
+    scheduler.finish(first)
+    scheduler.finish(first)
+    assert scheduler.turn == 1 - first
+    scheduler.yield_turn(1 - first)  # the last participant keeps the turn
+    with pytest.raises(SimpleBenchRuntimeError) as excinfo:
+        scheduler.wait_turn(first)
+    assert excinfo.value.tag_code == _InterleaveErrorTag.CANCELLED
+
+    scheduler = InterleavedScheduler(2, seed=0)
+    scheduler.cancel()
+    with pytest.raises(SimpleBenchRuntimeError) as excinfo:
+        scheduler.wait_turn(0)
+    assert excinfo.value.tag_code == _InterleaveErrorTag.CANCELLED
+
+
+def test_scheduler_errors() -> None:
+    """Test that invalid arguments raise tagged errors."""
+    with pytest.raises(SimpleBenchTypeError) as type_excinfo:
+        InterleavedScheduler('2')  # type: ignore[arg-type]
+    assert type_excinfo.value.tag_code == _InterleaveErrorTag.INVALID_PARTICIPANTS_ARG_TYPE
+    with pytest.raises(SimpleBenchValueError) as value_excinfo:
+        InterleavedScheduler(0)
+    assert value_excinfo.value.tag_code == _InterleaveErrorTag.INVALID_PARTICIPANTS_ARG_VALUE
+    with pytest.raises(SimpleBenchRuntimeError) as runtime_excinfo:
+        InterleavedScheduler(2).wait_turn(2)
+    assert runtime_excinfo.value.tag_code == _InterleaveErrorTag.INVALID_PARTICIPANT
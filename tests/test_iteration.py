@@ -5,6 +5,7 @@ from simplebench.defaults import DEFAULT_INTERVAL_SCALE, DEFAULT_INTERVAL_UNIT
 from simplebench.enums import Section
 from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError, _IterationErrorTag
 from simplebench.iteration import Iteration
+from simplebench.utils import NativeMemory, RUsage
 
 from .testspec import TestAction, idspec
 
@@ -170,7 +171,27 @@ def test_iteration_init(testspec: TestAction) -> None:
         action=Iteration().iteration_section,
         args=['bad_section'],
         exception=SimpleBenchTypeError,
-        exception_tag=_IterationErrorTag.ITERATION_SECTION_INVALID_SECTION_ARG_TYPE))
+        exception_tag=_IterationErrorTag.ITERATION_SECTION_INVALID_SECTION_ARG_TYPE)),
+    idspec("ITERATION_022", TestAction(
+        name="Iteration Section - Section.CPU_TIME",
+        action=Iteration(elapsed=4.0, scale=1.0, rounds=2, cpu_elapsed=3.0).iteration_section,
+        args=[Section.CPU_TIME],
+        validate_result=lambda result: (result == 1.5))),
+    idspec("ITERATION_023", TestAction(
+        name="Iteration Section - Section.MAJOR_PAGE_FAULTS",
+        action=Iteration(rusage=RUsage(major_faults=7)).iteration_section,
+        args=[Section.MAJOR_PAGE_FAULTS],
+        validate_result=lambda result: (result == 7))),
+    idspec("ITERATION_024", TestAction(
+        name="Iteration Section - Section.USS",
+        action=Iteration(native_memory=NativeMemory(rss=4096, uss=-8192, pss=2048)).iteration_section,
+        args=[Section.USS],
+        validate_result=lambda result: (result == -8192))),
+    idspec("ITERATION_025", TestAction(
+        name="Iteration Section - Section.PEAK_RSS",
+        action=Iteration(native_memory=NativeMemory(peak_rss=1 << 20)).iteration_section,
+        args=[Section.PEAK_RSS],
+        validate_result=lambda result: (result == 1 << 20))),
 ])
 def test_iteration_section(testspec: TestAction) -> None:
     """Test the iteration_section method of the Iteration class.
@@ -181,6 +202,12 @@ def test_iteration_section(testspec: TestAction) -> None:
     testspec.run()
 
 
+def test_cpu_utilization() -> None:
+    """Test the CPU/wall-clock utilization ratio of the Iteration class."""
+    assert Iteration(elapsed=4.0, scale=1.0, cpu_elapsed=1.0).cpu_utilization == 0.25
+    assert Iteration(elapsed=0.0, cpu_elapsed=1.0).cpu_utilization == 0.0
+
+
 def test_repr() -> None:
     """Test the ``__repr__`` method of the Iteration class."""
     it = Iteration(n=10, elapsed=5.0, unit='ms', scale=1e-3, memory=512, peak_memory=1024)
@@ -0,0 +1,198 @@
+"""Tests for the simplebench/iteration_table.py module."""
+import numpy as np
+import pytest
+
+from simplebench.enums import Section
+from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError, _IterationTableErrorTag
+from simplebench.iteration import Iteration
+from simplebench.iteration_table import IterationTable
+from simplebench.results import Results
+from simplebench.stats import OperationsPerInterval, OperationTimings, ResourceUsage
+from simplebench.utils import NativeMemory, RUsage
+
+from .testspec import TestAction, idspec
+
+
+def sample_iterations() -> list[Iteration]:
+    """Return a list of iterations with distinct values in every field."""
+    return [
+        Iteration(n=2, rounds=4, elapsed=400.0 * (index + 1), memory=100 + index, peak_memory=200 + index,
+                  gc_collections=index, gc_elapsed=1e-7 * index, cpu_elapsed=1e-6 * (index + 1),
+                  rusage=RUsage(minor_faults=index, max_rss=1024 * index),
+                  native_memory=NativeMemory(rss=4096 * index, uss=-4096 * index, pss=2048 * index,
+                                             peak_rss=8192 * index))
+        for index in range(5)]
+
+
+@pytest.mark.parametrize("testspec", [
+    idspec("ITERATION_TABLE_001", TestAction(
+        name="Default construction is an empty ns table",
+        action=IterationTable,
+        validate_result=lambda result: (len(result) == 0 and result.unit == 'ns' and
+                                        not result.read_only))),
+    idspec("ITERATION_TABLE_002", TestAction(
+        name="Bad unit arg type (int)",
+        action=IterationTable,
+        kwargs={'unit': 1},
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.UNIT_ARG_TYPE)),
+    idspec("ITERATION_TABLE_003", TestAction(
+        name="Bad unit arg value (blank)",
+        action=IterationTable,
+        kwargs={'unit': ' '},
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.UNIT_ARG_VALUE)),
+    idspec("ITERATION_TABLE_004", TestAction(
+        name="Bad capacity arg type (float)",
+        action=IterationTable,
+        kwargs={'capacity': 1.5},
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.CAPACITY_ARG_TYPE)),
+    idspec("ITERATION_TABLE_005", TestAction(
+        name="Bad capacity arg value (0)",
+        action=IterationTable,
+        kwargs={'capacity': 0},
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.CAPACITY_ARG_VALUE)),
+    idspec("ITERATION_TABLE_006", TestAction(
+        name="from_iterations with a non-Sequence",
+        action=IterationTable.from_iterations,
+        args=[{}],
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.FROM_ITERATIONS_INVALID_ARG_TYPE)),
+    idspec("ITERATION_TABLE_007", TestAction(
+        name="from_iterations with a non-Iteration element",
+        action=IterationTable.from_iterations,
+        args=[[Iteration(), 1.0]],
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.FROM_ITERATIONS_INVALID_ARG_IN_SEQUENCE)),
+    idspec("ITERATION_TABLE_008", TestAction(
+        name="from_iterations with mixed units",
+        action=IterationTable.from_iterations,
+        args=[[Iteration(unit='ns'), Iteration(unit='ms', scale=1e-3)]],
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.FROM_ITERATIONS_MIXED_UNITS)),
+    idspec("ITERATION_TABLE_009", TestAction(
+        name="append a non-Iteration",
+        action=lambda: IterationTable().append(1.0),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.APPEND_INVALID_ITERATION_ARG_TYPE)),
+    idspec("ITERATION_TABLE_010", TestAction(
+        name="append an iteration with another unit",
+        action=lambda: IterationTable(unit='ms').append(Iteration()),
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.APPEND_MISMATCHED_UNIT)),
+    idspec("ITERATION_TABLE_011", TestAction(
+        name="append to a frozen table",
+        action=lambda: IterationTable().frozen().append_values(n=1, rounds=1, elapsed=1.0),
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.APPEND_TO_FROZEN_TABLE)),
+    idspec("ITERATION_TABLE_012", TestAction(
+        name="Unknown column name",
+        action=lambda: IterationTable().column('bogus'),
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.COLUMN_INVALID_NAME_ARG_VALUE)),
+    idspec("ITERATION_TABLE_013", TestAction(
+        name="section with a non-Section",
+        action=lambda: IterationTable().section('ops'),  # type: ignore[arg-type]
+        exception=SimpleBenchTypeError,
+        exception_tag=_IterationTableErrorTag.SECTION_INVALID_SECTION_ARG_TYPE)),
+    idspec("ITERATION_TABLE_014", TestAction(
+        name="section without per-iteration values",
+        action=lambda: IterationTable().section(Section.LATENCY),
+        exception=SimpleBenchValueError,
+        exception_tag=_IterationTableErrorTag.SECTION_UNSUPPORTED_SECTION_ARG_VALUE)),
+])
+def test_iteration_table_init(testspec: TestAction) -> None:
+    """Test IterationTable construction and argument validation.
+
+    :param testspec: The test specification to run.
+    :type testspec: TestAction
+    """
+    testspec.run()
+
+
+def test_round_trip() -> None:
+    """Iterations stored in a table come back out unchanged."""
+    iterations = sample_iterations()
+    table = IterationTable.from_iterations(iterations)
+    assert len(table) == len(iterations)
+    assert list(table) == iterations
+    assert table[-1] == iterations[-1]
+    with pytest.raises(IndexError):
+        table[len(iterations)]  # pylint: disable=pointless-statement
+
+
+def test_append_values_grows_and_matches_append() -> None:
+    """The trusted append_values path stores the same rows as append, past the initial capacity."""
+    iterations = sample_iterations()
+    fast = IterationTable(capacity=1)
+    checked = IterationTable(capacity=1)
+    for iteration in iterations:
+        fast.append_values(n=iteration.n, rounds=iteration.rounds, elapsed=iteration.elapsed,
+                           memory=iteration.memory, peak_memory=iteration.peak_memory,
+                           gc_collections=iteration.gc_collections, gc_elapsed=iteration.gc_elapsed,
+                           cpu_elapsed=iteration.cpu_elapsed, rusage=iteration.rusage,
+                           native_memory=iteration.native_memory)
+        checked.append(iteration)
+    assert fast == checked
+    assert fast == IterationTable.from_iterations(iterations)
+    assert fast != IterationTable()
+
+
+@pytest.mark.parametrize('section', [
+    Section.OPS, Section.TIMING, Section.MEMORY, Section.PEAK_MEMORY, Section.GC, Section.CPU_TIME,
+    Section.MINOR_PAGE_FAULTS, Section.MAX_RSS, Section.RSS, Section.USS, Section.PSS, Section.PEAK_RSS])
+def test_section_matches_iterations(section: Section) -> None:
+    """Table sections hold the values Iteration.iteration_section returns."""
+    iterations = sample_iterations() + [Iteration(elapsed=0.0)]
+    table = IterationTable.from_iterations(iterations)
+    assert table.section(section).tolist() == [iteration.iteration_section(section) for iteration in iterations]
+
+
+def test_views_are_read_only() -> None:
+    """Column and section views cannot be written through, and frozen tables share no data."""
+    table = IterationTable.from_iterations(sample_iterations())
+    memory = table.section(Section.MEMORY)
+    assert np.shares_memory(memory, table.column('memory'))
+    with pytest.raises(ValueError):
+        memory[0] = 0
+
+    frozen = table.frozen()
+    assert frozen.read_only and frozen.frozen() is frozen
+    assert not np.shares_memory(frozen.column('memory'), table.column('memory'))
+    table.append(Iteration())
+    assert len(frozen) == len(table) - 1
+
+
+def test_results_use_table() -> None:
+    """Results built from a table or from the same iterations report the same statistics."""
+    iterations = sample_iterations()
+    common = {'group': 'g', 'title': 't', 'description': 'd', 'n': 2, 'rounds': 4, 'total_elapsed': 1.0}
+    from_list = Results(iterations=iterations, **common)
+    from_table = Results(iterations=IterationTable.from_iterations(iterations), **common)
+    assert from_table.iteration_table.read_only
+    assert from_table.iterations == from_list.iterations == tuple(iterations)
+    assert from_table.ops_per_second == from_list.ops_per_second
+    assert from_table.per_round_timings == from_list.per_round_timings
+    assert from_table.cpu_timings == from_list.cpu_timings
+    assert from_table.memory == from_list.memory
+    assert from_table.peak_memory == from_list.peak_memory
+    assert from_table.gc_collections == from_list.gc_collections
+    assert from_table.rusage == from_list.rusage
+    assert from_table.native_memory == from_list.native_memory
+    assert from_table.cpu_utilization == from_list.cpu_utilization
+
+
+def test_stats_from_table() -> None:
+    """Stats accept a table in place of a list of iterations, alone or after explicit data."""
+    iterations = sample_iterations()
+    table = IterationTable.from_iterations(iterations)
+    assert (OperationTimings(rounds=4, iterations=table).data ==
+            OperationTimings(rounds=4, iterations=iterations).data)
+    assert (OperationsPerInterval(rounds=4, data=[1.0], iterations=table).data ==
+            OperationsPerInterval(rounds=4, data=[1.0], iterations=iterations).data)
+    assert (ResourceUsage(section=Section.MAX_RSS, rounds=4, iterations=table).data ==
+            ResourceUsage(section=Section.MAX_RSS, rounds=4, iterations=iterations).data)
+    with pytest.raises(SimpleBenchValueError):
+        OperationTimings(rounds=4, iterations=IterationTable())
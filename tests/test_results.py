@@ -549,6 +549,36 @@ def base_iterations() -> list[Iteration]:
         ),
         exception=SimpleBenchValueError,
         exception_tag=_ResultsErrorTag.ROUNDS_INVALID_ARG_VALUE)),
+    idspec("RESULTS_047", TestAction(
+        name="iterations with mixed units",
+        action=Results,
+        kwargs=ResultsKWArgs(
+            group='default_group', title='default_title', description='default_description',
+            n=1, rounds=1, total_elapsed=1.0,
+            iterations=[Iteration(unit='ns'), Iteration(unit='ms', scale=1e-3)]
+        ),
+        exception=SimpleBenchValueError,
+        exception_tag=_ResultsErrorTag.ITERATIONS_MIXED_UNITS)),
+    idspec("RESULTS_048", TestAction(
+        name="allocation_sites with a non-AllocationSite element",
+        action=Results,
+        kwargs=ResultsKWArgs(
+            group='default_group', title='default_title', description='default_description',
+            n=1, rounds=1, total_elapsed=1.0, iterations=base_iterations(),
+            allocation_sites=[('file.py', 1)]  # type: ignore[list-item]
+        ),
+        exception=SimpleBenchTypeError,
+        exception_tag=_ResultsErrorTag.ALLOCATION_SITES_INVALID_ARG_TYPE)),
+    idspec("RESULTS_049", TestAction(
+        name="Wrong type for memory_measured argument (str instead of bool)",
+        action=Results,
+        kwargs=ResultsKWArgs(
+            group='default_group', title='default_title', description='default_description',
+            n=1, rounds=1, total_elapsed=1.0, iterations=base_iterations(),
+            memory_measured='yes'  # type: ignore[arg-type]
+        ),
+        exception=SimpleBenchTypeError,
+        exception_tag=_ResultsErrorTag.MEMORY_MEASURED_INVALID_ARG_TYPE)),
 ])
 def test_results_init(testspec: TestAction) -> None:
     """Test Results initialization.
@@ -773,6 +803,17 @@ def test_results_sections(section: Section) -> None:
         f"results_section({section}) should be type Stats not {type(section_value)}")
 
 
+def test_results_as_dict_bootstrap() -> None:
+    """Test that only the full data of the timing and ops sections carry bootstrap confidence intervals."""
+    results = base_results()
+    summary = results.as_dict()
+    assert 'bootstrap' not in summary['per_round_timings'] and 'bootstrap' not in summary['ops_per_second']
+    full = results.as_dict(full_data=True)
+    for key, stats in (('per_round_timings', results.per_round_timings), ('ops_per_second', results.ops_per_second)):
+        assert full[key]['bootstrap'] == stats.bootstrap_intervals().as_dict(stats.scale)
+    assert 'bootstrap' not in full['cpu_timings'] and 'bootstrap' not in full['gc_collections']
+
+
 def test_results_sections_invalid() -> None:
     """Test Results sections property with unsupported or invalid sections."""
     results = base_results()
@@ -787,3 +828,11 @@ def test_results_sections_invalid() -> None:
     assert excinfo1.value.tag_code == _ResultsErrorTag.RESULTS_SECTION_INVALID_SECTION_ARG_TYPE, (
         f"Expected SimpleBenchTypeError for invalid section type {type(Nonsense.NONSENSE)}"
     )
+
+    results = Results(group='default_group', title='default_title', description='default_description',
+                      n=1, rounds=1, total_elapsed=1.0, iterations=base_iterations(), memory_measured=False)
+    with pytest.raises(SimpleBenchValueError) as excinfo2:
+        results.results_section(Section.PEAK_MEMORY)
+    assert excinfo2.value.tag_code == _ResultsErrorTag.RESULTS_SECTION_NOT_MEASURED, (
+        f"Expected SimpleBenchValueError for the unmeasured section {Section.PEAK_MEMORY}"
+    )
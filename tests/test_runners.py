@@ -0,0 +1,71 @@
+"""Tests for the simplebench/runners.py module."""
+import pytest
+
+from simplebench.enums import BindingStrategy
+from simplebench.runners import bind_arguments
+
+from .testspec import TestAction, TestSpec, idspec
+
+
+def _size_factor(size: int, factor: int = 1) -> int:
+    return size * factor
+
+
+def _keyword_only(*, size: int) -> int:
+    return size
+
+
+def _var_keyword(**kwargs: int) -> int:
+    return len(kwargs)
+
+
+def _batched_size(data: list[int], size: int) -> int:
+    return len(data) + size
+
+
+@pytest.mark.parametrize("testspec", [
+    idspec("BIND_001", TestAction(
+        name="No kwargs binds no arguments",
+        action=bind_arguments,
+        args=[_size_factor, {}],
+        expected=(BindingStrategy.NO_ARGS, {}))),
+    idspec("BIND_002", TestAction(
+        name="Kwargs matching all positional parameters bind positionally in signature order",
+        action=bind_arguments,
+        args=[_size_factor, {'factor': 2, 'size': 3}],
+        expected=(BindingStrategy.POSITIONAL, (3, 2)))),
+    idspec("BIND_003", TestAction(
+        name="Kwargs matching leading positional parameters bind positionally if the rest have defaults",
+        action=bind_arguments,
+        args=[_size_factor, {'size': 3}],
+        expected=(BindingStrategy.POSITIONAL, (3,)))),
+    idspec("BIND_004", TestAction(
+        name="Kwargs skipping a leading positional parameter bind as keywords",
+        action=bind_arguments,
+        args=[_size_factor, {'factor': 2}],
+        expected=(BindingStrategy.KEYWORDS, {'factor': 2}))),
+    idspec("BIND_005", TestAction(
+        name="Keyword-only parameters bind as keywords",
+        action=bind_arguments,
+        args=[_keyword_only, {'size': 3}],
+        expected=(BindingStrategy.KEYWORDS, {'size': 3}))),
+    idspec("BIND_006", TestAction(
+        name="A **kwargs catch-all binds as keywords",
+        action=bind_arguments,
+        args=[_var_keyword, {'size': 3}],
+        expected=(BindingStrategy.KEYWORDS, {'size': 3}))),
+    idspec("BIND_007", TestAction(
+        name="Batched actions bind the parameters after the batched input positionally",
+        action=bind_arguments,
+        args=[_batched_size, {'size': 3}],
+        kwargs={'batched': True},
+        expected=(BindingStrategy.POSITIONAL, (3,)))),
+    idspec("BIND_008", TestAction(
+        name="Actions without an inspectable signature bind as keywords",
+        action=bind_arguments,
+        args=[dict, {'size': 3}],
+        expected=(BindingStrategy.KEYWORDS, {'size': 3}))),
+])
+def test_bind_arguments(testspec: TestSpec) -> None:
+    """Test bind_arguments() chooses the cheapest binding for the action's signature."""
+    testspec.run()
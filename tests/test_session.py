@@ -12,7 +12,12 @@ from rich.console import Console
 from rich.progress import Progress
 
 from simplebench import Case, Results, Session, Verbosity
-from simplebench.exceptions import SimpleBenchArgumentError, SimpleBenchTypeError, _SessionErrorTag
+from simplebench.exceptions import (
+    SimpleBenchArgumentError,
+    SimpleBenchTypeError,
+    SimpleBenchValueError,
+    _SessionErrorTag,
+)
 from simplebench.reporters.choice import ChoiceConf
 from simplebench.reporters.choices import ChoicesConf
 from simplebench.reporters.csv import CSVConfig
@@ -145,6 +150,108 @@ def benchcase(_bench: SimpleRunner, **kwargs) -> Results:
         exception=SimpleBenchTypeError,
         exception_tag=_SessionErrorTag.PROPERTY_INVALID_CONSOLE_ARG
     )),
+    idspec("INIT_012", TestAction(
+        name="Valid 'jobs' parameter",
+        action=Session,
+        kwargs=SessionKWArgs(jobs=4),
+        validate_result=lambda session: session.jobs == 4,
+    )),
+    idspec("INIT_013", TestAction(
+        name="Invalid type for 'jobs' parameter (string instead of int)",
+        action=Session,
+        kwargs=SessionKWArgs(jobs="4"),  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        exception=SimpleBenchTypeError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_JOBS_ARG
+    )),
+    idspec("INIT_014", TestAction(
+        name="Invalid value for 'jobs' parameter (zero)",
+        action=Session,
+        kwargs=SessionKWArgs(jobs=0),
+        exception=SimpleBenchValueError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_JOBS_VALUE
+    )),
+    idspec("INIT_015", TestAction(
+        name="Valid 'isolated' parameter",
+        action=Session,
+        kwargs=SessionKWArgs(isolated=True),
+        validate_result=lambda session: session.isolated is True,
+    )),
+    idspec("INIT_016", TestAction(
+        name="Invalid type for 'isolated' parameter (int instead of bool)",
+        action=Session,
+        kwargs=SessionKWArgs(isolated=1),  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        exception=SimpleBenchTypeError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_ISOLATED_ARG
+    )),
+    idspec("INIT_017", TestAction(
+        name="Valid 'use_calibration_cache' parameter with output_path",
+        action=Session,
+        kwargs=SessionKWArgs(use_calibration_cache=True, output_path=Path('bench_out')),
+        validate_result=lambda session: (
+            session.use_calibration_cache is True
+            and session.calibration_cache is not None
+            and session.calibration_cache.path == Path('bench_out') / '_calibration_cache.json'),
+    )),
+    idspec("INIT_018", TestAction(
+        name="Disabled 'use_calibration_cache' parameter has no calibration cache",
+        action=Session,
+        kwargs=SessionKWArgs(use_calibration_cache=False, output_path=Path('bench_out')),
+        validate_result=lambda session: session.calibration_cache is None,
+    )),
+    idspec("INIT_019", TestAction(
+        name="Invalid type for 'use_calibration_cache' parameter (int instead of bool)",
+        action=Session,
+        kwargs=SessionKWArgs(use_calibration_cache=1),  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        exception=SimpleBenchTypeError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_USE_CALIBRATION_CACHE_ARG
+    )),
+    idspec("INIT_020", TestAction(
+        name="Valid 'cpu_affinity' and 'priority' parameters",
+        action=Session,
+        kwargs=SessionKWArgs(cpu_affinity=[2, 0], priority=-5),
+        validate_result=lambda session: session.cpu_affinity == (0, 2) and session.priority == -5,
+    )),
+    idspec("INIT_021", TestAction(
+        name="Invalid type for 'cpu_affinity' parameter (str instead of sequence of ints)",
+        action=Session,
+        kwargs=SessionKWArgs(cpu_affinity="0-3"),  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        exception=SimpleBenchTypeError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_CPU_AFFINITY_ARG
+    )),
+    idspec("INIT_022", TestAction(
+        name="Invalid value for 'cpu_affinity' parameter (negative CPU)",
+        action=Session,
+        kwargs=SessionKWArgs(cpu_affinity=[-1]),
+        exception=SimpleBenchValueError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_CPU_AFFINITY_VALUE
+    )),
+    idspec("INIT_023", TestAction(
+        name="Invalid value for 'priority' parameter (out of range)",
+        action=Session,
+        kwargs=SessionKWArgs(priority=-21),
+        exception=SimpleBenchValueError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_PRIORITY_VALUE
+    )),
+    idspec("INIT_024", TestAction(
+        name="Valid 'interleave' parameter",
+        action=Session,
+        kwargs=SessionKWArgs(interleave=True),
+        validate_result=lambda session: session.interleave is True,
+    )),
+    idspec("INIT_025", TestAction(
+        name="Invalid type for 'interleave' parameter (int instead of bool)",
+        action=Session,
+        kwargs=SessionKWArgs(interleave=1),  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+        exception=SimpleBenchTypeError,
+        exception_tag=_SessionErrorTag.PROPERTY_INVALID_INTERLEAVE_ARG
+    )),
+    idspec("INIT_026", TestAction(
+        name="Calibration cache is opt-in: no calibration cache by default, even with output_path",
+        action=Session,
+        kwargs=SessionKWArgs(output_path=Path('bench_out')),
+        validate_result=lambda session: (
+            session.use_calibration_cache is False and session.calibration_cache is None),
+    )),
 ])
 def test_session_init(testspec: TestSpec) -> None:
     """Tests the initialization of the Session class with various combinations of parameters.
@@ -1,23 +1,46 @@
 """Tests for the simplebench/stats.py module."""
 # Conflicts with pytest fixtures
 # pylint: disable=redefined-outer-name
+import math
 import statistics
 from enum import Enum
 from typing import Any, Sequence
 
+import numpy as np
 import pytest
 
-from simplebench.enums import Section
+from simplebench.enums import OutlierMethod, PrecisionStatistic, Section
 from simplebench.exceptions import SimpleBenchKeyError, SimpleBenchTypeError, SimpleBenchValueError
+from simplebench.exceptions.base import ErrorTag
 from simplebench.iteration import Iteration
-from simplebench.stats import MemoryUsage, OperationsPerInterval, OperationTimings, PeakMemoryUsage, Stats, StatsSummary
+from simplebench.stats import (
+    LatencyHistogram,
+    MemoryUsage,
+    OperationsPerInterval,
+    OperationTimings,
+    PeakMemoryUsage,
+    PrecisionTracker,
+    Stats,
+    StatsSummary,
+    bootstrap_intervals,
+    ci_half_width,
+    classify_outliers,
+    median_absolute_deviation,
+    relative_ci_half_width,
+    steady_state_start,
+    t_quantile,
+    trimmed_mean,
+)
 from simplebench.stats.exceptions import (
+    _BootstrapErrorTag,
+    _LatencyHistogramErrorTag,
     _MemoryUsageErrorTag,
     _OperationsPerIntervalErrorTag,
     _OperationTimingsErrorTag,
     _PeakMemoryUsageErrorTag,
     _StatsErrorTag,
     _StatsSummaryErrorTag,
+    _WarmupErrorTag,
 )
 
 from .testspec import NO_EXPECTED_VALUE, Assert, TestAction, TestGet, TestSet, TestSpec, idspec
@@ -1106,3 +1129,282 @@ def test_stats_summaryfrom_stats_error_cases(testspec: TestSpec) -> None:
     :type testspec: TestSpec
     """
     testspec.run()
+
+
+@pytest.mark.parametrize('probability, degrees_of_freedom, expected', [
+    (0.975, 1, 12.7062),
+    (0.975, 2, 4.3027),
+    (0.975, 5, 2.5706),
+    (0.975, 10, 2.2281),
+    (0.975, 3, 3.1824),
+    (0.995, 3, 5.8409),
+    (0.9995, 3, 12.9240),
+    (0.025, 4, -2.7764),
+    (0.975, 29, 2.0452),
+    (0.995, 30, 2.7500),
+    (0.9995, 30, 3.6460),
+])
+def test_t_quantile(probability: float, degrees_of_freedom: int, expected: float) -> None:
+    """Test the Student's t quantile against tabulated values."""
+    assert t_quantile(probability, degrees_of_freedom) == pytest.approx(expected, rel=5e-5)
+
+
+def test_ci_half_width() -> None:
+    """Test the confidence interval half-widths of the mean and median."""
+    data = [float(value) for value in range(1, 21)]
+    expected_mean_half_width = t_quantile(0.975, 19) * statistics.stdev(data) / math.sqrt(len(data))
+    assert ci_half_width(data) == pytest.approx(expected_mean_half_width)
+    assert relative_ci_half_width(data) == pytest.approx(expected_mean_half_width / statistics.fmean(data))
+    # order statistics x(5) and x(16) bracket the median of 20 points at 95% confidence
+    assert ci_half_width(data, statistic=PrecisionStatistic.MEDIAN) == pytest.approx((16.0 - 5.0) / 2.0)
+    assert ci_half_width([1.0]) == math.inf
+    assert relative_ci_half_width([2.0, 2.0, 2.0]) == 0.0
+    assert relative_ci_half_width([-1.0, 1.0]) == math.inf
+    with pytest.raises(SimpleBenchValueError):
+        ci_half_width([])
+    with pytest.raises(SimpleBenchValueError):
+        ci_half_width(data, confidence_level=1.0)
+    with pytest.raises(SimpleBenchTypeError):
+        ci_half_width(data, statistic='mean')  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize('statistic', [PrecisionStatistic.MEAN, PrecisionStatistic.MEDIAN])
+def test_precision_tracker(statistic: PrecisionStatistic) -> None:
+    """Test that the running precision matches relative_ci_half_width over the sample so far."""
+    data = [100.0 + (value * 7919 % 31) for value in range(200)]
+    tracker = PrecisionTracker(statistic=statistic, growth=0.0)
+    assert tracker.precision == math.inf
+    for count, value in enumerate(data, start=1):
+        precision = tracker.add(value)
+        expected = relative_ci_half_width(data[:count], statistic=statistic) if count > 1 else math.inf
+        assert precision == pytest.approx(expected, rel=1e-9)
+    assert len(tracker) == len(data)
+
+
+def test_precision_tracker_median_growth() -> None:
+    """Test that the median precision is only re-evaluated after the sample has grown enough."""
+    tracker = PrecisionTracker(statistic=PrecisionStatistic.MEDIAN, growth=0.5)
+    data = [float(value % 13) + 1.0 for value in range(40)]
+    evaluations = []
+    for count, value in enumerate(data, start=1):
+        tracker.add(value)
+        if count > 1 and tracker.precision == pytest.approx(
+                relative_ci_half_width(data[:count], statistic=PrecisionStatistic.MEDIAN)):
+            evaluations.append(count)
+    assert evaluations[:5] == [2, 3, 5, 8, 12]
+    assert PrecisionTracker(statistic=PrecisionStatistic.MEAN).add(1.0) == math.inf
+    assert PrecisionTracker().add(0.0) == math.inf
+    with pytest.raises(SimpleBenchValueError):
+        PrecisionTracker(growth=-1.0)
+    with pytest.raises(SimpleBenchTypeError):
+        PrecisionTracker(statistic='median')  # type: ignore[arg-type]
+
+
+def test_outliers() -> None:
+    """Test mild and severe outlier classification and the robust estimators."""
+    data = [10, 11, 10, 12, 11, 10, 16.5, 11, 10, 200]
+    stats = Stats(unit='s', scale=1.0, data=data)
+    # quartiles 10 and 11.75: mild fences 7.375 - 14.375, severe fences 4.75 - 17.0
+    tukey = stats.outliers()
+    assert tukey.mild == (6,)
+    assert tukey.severe == (9,)
+    assert tukey.total == 2
+    assert tukey.count((6,)) == 1  # the tuple method is not shadowed
+    filtered = data[:6] + data[7:9]
+    assert stats.filtered_data() == tuple(filtered)
+    assert stats.filtered_mean == pytest.approx(statistics.mean(filtered))
+    assert stats.filtered_relative_standard_deviation < stats.relative_standard_deviation
+    # median 11, MAD 1: mild beyond 3.5 * 1.4826, severe beyond 7 * 1.4826
+    mad = stats.outliers(OutlierMethod.MAD)
+    assert mad.mild == (6,)
+    assert mad.severe == (9,)
+    assert mad.indices == (6, 9)
+    assert stats.median_absolute_deviation == median_absolute_deviation(data) == 1.0
+    assert stats.trimmed_mean() == pytest.approx(statistics.mean(sorted(data)[1:9]))
+    assert trimmed_mean(data, 0.0) == pytest.approx(statistics.mean(data))
+    assert stats.as_dict['outliers'] == {'method': 'tukey', 'mild': (6,), 'severe': (9,)}
+
+
+def test_outliers_edge_cases() -> None:
+    """Test outlier classification with too few or identical data points and invalid arguments."""
+    assert classify_outliers([1.0, 1.0, 100.0]).total == 0
+    assert classify_outliers([5, 5, 5, 5, 5], OutlierMethod.MAD).total == 0
+    # more than half the points identical: the mean absolute deviation is used instead of the MAD
+    assert classify_outliers([0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 30], OutlierMethod.MAD).severe == (11,)
+    with pytest.raises(SimpleBenchValueError):
+        classify_outliers([])
+    with pytest.raises(SimpleBenchTypeError):
+        classify_outliers([1.0, 2.0], method='tukey')  # type: ignore[arg-type]
+    with pytest.raises(SimpleBenchValueError):
+        trimmed_mean([1.0, 2.0], 0.5)
+
+
+def test_bootstrap_intervals() -> None:
+    """Test the bootstrap confidence intervals of the mean, median and percentiles."""
+    data = [float(value) for value in range(1, 101)]
+    intervals = bootstrap_intervals(data, percentiles=[10, 90], resamples=1000, seed=42)
+    assert intervals.resamples == 1000
+    assert intervals.seed == 42
+    assert intervals.confidence_level == 0.95
+    for interval, estimate in ((intervals.mean, 50.5), (intervals.median, 50.5),
+                               (intervals.percentile(10), 10.9), (intervals.percentile(90), 90.1)):
+        assert interval.lower < estimate < interval.upper
+    # the standard error of the mean is about 2.9, so the 95% interval is about ±5.7
+    assert intervals.mean.half_width == pytest.approx(5.7, rel=0.2)
+    assert bootstrap_intervals(data, percentiles=[10, 90], resamples=1000, seed=42) == intervals
+    wider = bootstrap_intervals(data, resamples=1000, confidence_level=0.99, seed=42)
+    assert wider.mean.half_width > intervals.mean.half_width
+    with pytest.raises(KeyError):
+        intervals.percentile(50)
+
+    single = bootstrap_intervals([3.0], percentiles=[])
+    assert single.mean == single.median == (3.0, 3.0)
+    assert single.percentiles == ()
+
+    stats = Stats(unit='ns', scale=1e-9, data=data)
+    assert stats.bootstrap_intervals() is stats.bootstrap_intervals()
+    assert 'bootstrap' not in stats.as_dict
+    bootstrap = stats.bootstrap_intervals().as_dict(stats.scale)
+    assert set(bootstrap['percentiles']) == {'5', '95'}
+    mean_lower, mean_upper = bootstrap['mean']
+    assert mean_lower == pytest.approx(stats.bootstrap_intervals().mean.lower / 1e-9)
+    assert mean_lower < stats.as_dict['mean'] < mean_upper  # type: ignore[operator]
+
+
+@pytest.mark.parametrize('kwargs, exception, tag', [
+    ({'data': []}, SimpleBenchValueError, _BootstrapErrorTag.INVALID_DATA_ARG_VALUE),
+    ({'data': 'abc'}, SimpleBenchTypeError, _BootstrapErrorTag.INVALID_DATA_ARG_TYPE),
+    ({'percentiles': [101]}, SimpleBenchValueError, _BootstrapErrorTag.INVALID_PERCENTILES_ARG_VALUE),
+    ({'percentiles': 5}, SimpleBenchTypeError, _BootstrapErrorTag.INVALID_PERCENTILES_ARG_TYPE),
+    ({'resamples': 0}, SimpleBenchValueError, _BootstrapErrorTag.INVALID_RESAMPLES_ARG_VALUE),
+    ({'confidence_level': 1.0}, SimpleBenchValueError, _BootstrapErrorTag.INVALID_CONFIDENCE_LEVEL_ARG_VALUE),
+    ({'seed': -1}, SimpleBenchValueError, _BootstrapErrorTag.INVALID_SEED_ARG_VALUE),
+    ({'seed': 1.5}, SimpleBenchTypeError, _BootstrapErrorTag.INVALID_SEED_ARG_TYPE),
+])
+def test_bootstrap_intervals_errors(kwargs: dict, exception: type[Exception], tag: ErrorTag) -> None:
+    """Test that invalid bootstrap_intervals arguments raise tagged errors."""
+    arguments: dict[str, Any] = {'data': [1.0, 2.0, 3.0]} | kwargs
+    with pytest.raises(exception) as excinfo:
+        bootstrap_intervals(**arguments)
+    assert excinfo.value.tag_code == tag  # type: ignore[attr-defined]
+
+
+def test_steady_state_start() -> None:
+    """Test the detection of the end of the warmup in a series of iteration times."""
+    level = [100.0, 101.0, 99.0, 100.5, 99.5] * 4
+    assert steady_state_start(level) == 0
+    decaying = [100.0 + 1000.0 * 0.5 ** index for index in range(12)] + level
+    start = steady_state_start(decaying)
+    assert start is not None and 6 <= start <= 12
+    assert steady_state_start(decaying, window=3) is not None
+    assert steady_state_start([1.0, 2.0]) is None
+    assert steady_state_start([float(value) for value in range(1, 41)]) is None
+    # a large tolerance accepts a gently rising series as steady
+    assert steady_state_start([float(value) for value in range(100, 140)], tolerance=0.1) == 0
+
+
+@pytest.mark.parametrize('kwargs, exception, tag', [
+    ({'data': 'abc'}, SimpleBenchTypeError, _WarmupErrorTag.INVALID_DATA_ARG_TYPE),
+    ({'window': 0}, SimpleBenchValueError, _WarmupErrorTag.INVALID_WINDOW_ARG_VALUE),
+    ({'window': 2.0}, SimpleBenchTypeError, _WarmupErrorTag.INVALID_WINDOW_ARG_TYPE),
+    ({'tolerance': -0.1}, SimpleBenchValueError, _WarmupErrorTag.INVALID_TOLERANCE_ARG_VALUE),
+    ({'tolerance': '0.1'}, SimpleBenchTypeError, _WarmupErrorTag.INVALID_TOLERANCE_ARG_TYPE),
+])
+def test_steady_state_start_errors(kwargs: dict, exception: type[Exception], tag: ErrorTag) -> None:
+    """Test that invalid steady_state_start arguments raise tagged errors."""
+    arguments: dict[str, Any] = {'data': [1.0, 2.0, 3.0]} | kwargs
+    with pytest.raises(exception) as excinfo:
+        steady_state_start(**arguments)
+    assert excinfo.value.tag_code == tag  # type: ignore[attr-defined]
+
+
+def test_latency_histogram() -> None:
+    """Test recording values in a latency histogram and computing statistics from its counts."""
+    rng = np.random.default_rng(42)
+    values = rng.lognormal(mean=10.0, sigma=1.0, size=100_000).round()
+    histogram = LatencyHistogram()
+    size = histogram.counts.size
+    histogram.record_values(values)
+    assert histogram.total_count == len(values)
+    assert histogram.counts.size == size  # the footprint does not grow with the number of values
+    with pytest.raises(ValueError):
+        histogram.counts[0] = 1  # the counts view is read only
+    for percentile in (50.0, 90.0, 99.0, 99.9):
+        assert histogram.value_at_percentile(percentile) == pytest.approx(
+            np.percentile(values, percentile), rel=2e-3)
+    assert histogram.mean == pytest.approx(values.mean() * 1e-9, rel=1e-3)
+    assert histogram.standard_deviation == pytest.approx(values.std(ddof=1) * 1e-9, rel=1e-3)
+    assert histogram.minimum == pytest.approx(values.min() * 1e-9, rel=1e-3)
+    assert histogram.maximum == pytest.approx(values.max() * 1e-9, rel=1e-3)
+    assert len(histogram.percentiles) == 101
+
+    summary = StatsSummary.from_histogram(histogram)
+    assert summary.median == histogram.median
+    assert summary.percentiles[99] == histogram.value_at_percentile(99) * 1e-9
+    with pytest.raises(SimpleBenchTypeError) as excinfo:
+        StatsSummary.from_histogram(values)  # type: ignore[arg-type]
+    assert excinfo.value.tag_code == _StatsSummaryErrorTag.FROM_HISTOGRAM_INVALID_HISTOGRAM_ARG_TYPE
+
+    empty = LatencyHistogram()
+    assert empty.mean == empty.median == empty.maximum == 0.0
+    assert empty.value_at_percentile(99) == 0
+
+
+def test_latency_histogram_merge_and_export() -> None:
+    """Test merging latency histograms and exporting them in the HdrHistogram formats."""
+    first = LatencyHistogram(significant_figures=2)
+    second = LatencyHistogram(significant_figures=2)
+    first.record_values([1000, 2000, 3000])
+    second.record(1_000_000, count=5)
+    first.add(second)
+    assert first.total_count == 8
+    assert first.value_at_percentile(100) == pytest.approx(1_000_000, rel=1e-2)
+    with pytest.raises(SimpleBenchValueError) as excinfo:
+        first.add(LatencyHistogram(significant_figures=3))
+    assert excinfo.value.tag_code == _LatencyHistogramErrorTag.ADD_INCOMPATIBLE_HISTOGRAM
+
+    corrected = LatencyHistogram()
+    corrected.record_corrected(1000, expected_interval=100)
+    assert corrected.total_count == 10
+    assert corrected.value_at_percentile(0) == 100
+
+    encoded = first.encode()
+    assert encoded.startswith('HISTFAAA')
+    assert LatencyHistogram.decode(encoded) == first
+    assert LatencyHistogram.from_dict(first.as_dict) == first
+    with pytest.raises(SimpleBenchValueError) as excinfo:
+        LatencyHistogram.decode('not a histogram')
+    assert excinfo.value.tag_code == _LatencyHistogramErrorTag.DECODE_INVALID_ENCODING
+
+    log = first.to_hdr_log(start_time=0.0, interval_length=1.5, tag='load').splitlines()
+    assert log[0] == '#[Histogram log format version 1.3]'
+    assert log[1].startswith('#[StartTime: 0.000 (seconds since epoch), Thu Jan 01 00:00:00 UTC 1970')
+    assert log[3] == f'Tag=load,0.000,1.500,{first.maximum / 1e-9 / 1e6:.3f},{encoded}'
+
+
+@pytest.mark.parametrize('kwargs, exception, tag', [
+    ({'lowest_trackable_value': 0}, SimpleBenchValueError, _LatencyHistogramErrorTag.INVALID_LOWEST_ARG_VALUE),
+    ({'lowest_trackable_value': 1.0}, SimpleBenchTypeError, _LatencyHistogramErrorTag.INVALID_LOWEST_ARG_TYPE),
+    ({'highest_trackable_value': 1}, SimpleBenchValueError, _LatencyHistogramErrorTag.INVALID_HIGHEST_ARG_VALUE),
+    ({'significant_figures': 6}, SimpleBenchValueError,
+     _LatencyHistogramErrorTag.INVALID_SIGNIFICANT_FIGURES_ARG_VALUE),
+    ({'unit': ''}, SimpleBenchValueError, _LatencyHistogramErrorTag.INVALID_UNIT_ARG_VALUE),
+    ({'scale': -1.0}, SimpleBenchValueError, _LatencyHistogramErrorTag.INVALID_SCALE_ARG_VALUE),
+])
+def test_latency_histogram_errors(kwargs: dict, exception: type[Exception], tag: ErrorTag) -> None:
+    """Test that invalid LatencyHistogram arguments raise tagged errors."""
+    with pytest.raises(exception) as excinfo:
+        LatencyHistogram(**kwargs)
+    assert excinfo.value.tag_code == tag  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize('value, exception, tag', [
+    (-1, SimpleBenchValueError, _LatencyHistogramErrorTag.VALUE_OUT_OF_RANGE),
+    (10 ** 13, SimpleBenchValueError, _LatencyHistogramErrorTag.VALUE_OUT_OF_RANGE),
+    ('10', SimpleBenchTypeError, _LatencyHistogramErrorTag.INVALID_VALUE_ARG_TYPE),
+])
+def test_latency_histogram_record_errors(value: Any, exception: type[Exception], tag: ErrorTag) -> None:
+    """Test that values that cannot be recorded raise tagged errors."""
+    with pytest.raises(exception) as excinfo:
+        LatencyHistogram().record(value)
+    assert excinfo.value.tag_code == tag  # type: ignore[attr-defined]
@@ -1,10 +1,13 @@
 """Test the simplebench.timers module"""
+import json
 import time
+from pathlib import Path
 
 import pytest
 
+from simplebench import defaults
 from simplebench.exceptions import SimpleBenchRuntimeError, SimpleBenchTypeError
-from simplebench.timers import is_valid_timer, timer_overhead_ns, timer_precision_ns
+from simplebench.timers import is_valid_timer, reprofile_timers, timer_overhead_ns, timer_precision_ns
 from simplebench.timers.exceptions import _TimersErrorTag
 from simplebench.timers.info import fake_timer
 
@@ -119,3 +122,30 @@ def test_timer_precision_ns(testspec: TestSpec):
 def test_timer_overhead_ns(testspec: TestSpec):
     """Test timer_overhead_ns() function."""
     testspec.run()
+
+
+def test_timer_profiles_are_persisted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that timer profiles are persisted, reused across processes and discarded by reprofile_timers()."""
+    monkeypatch.setenv(defaults.DEFAULT_TIMER_PROFILE_CACHE_ENV, str(tmp_path))
+    reprofile_timers()
+    precision = timer_precision_ns(time.perf_counter_ns)
+    profiles_path = tmp_path / 'timer_profiles.json'
+    profiles = json.loads(profiles_path.read_text(encoding='utf-8'))
+    [key] = [key for key in profiles if '|time.perf_counter_ns|precision|' in key]
+    assert profiles[key]['value'] == precision
+
+    # A new process (simulated by clearing the in-process cache) reuses the persisted profile
+    profiles[key]['value'] = 12345.0
+    profiles_path.write_text(json.dumps(profiles), encoding='utf-8')
+    timer_precision_ns.cache_clear()
+    assert timer_precision_ns(time.perf_counter_ns) == 12345.0
+
+    # Expired profiles are measured again
+    profiles[key]['measured_at'] -= defaults.DEFAULT_TIMER_PROFILE_TTL + 1.0
+    profiles_path.write_text(json.dumps(profiles), encoding='utf-8')
+    timer_precision_ns.cache_clear()
+    assert timer_precision_ns(time.perf_counter_ns) != 12345.0
+
+    # reprofile_timers() discards the persisted profiles
+    reprofile_timers()
+    assert not json.loads(profiles_path.read_text(encoding='utf-8'))
@@ -3,7 +3,7 @@ import pytest
 
 import simplebench.defaults as defaults
 from simplebench import utils
-from simplebench.exceptions import SimpleBenchTypeError, SimpleBenchValueError
+from simplebench.exceptions import SimpleBenchRuntimeError, SimpleBenchTypeError, SimpleBenchValueError
 from simplebench.utils.exceptions import _UtilsErrorTag
 
 from .factories import argument_parser_factory, list_of_strings_flag_factory, namespace_factory
@@ -245,3 +245,91 @@ def test_collect_arg_list(testspec: TestAction) -> None:
     :type testspec: TestAction
     """
     testspec.run()
+
+
+@pytest.mark.parametrize("testspec", [
+    idspec("PARSE_CPU_LIST_001", TestAction(
+        name="Single CPU",
+        args=['3'],
+        action=utils.parse_cpu_list,
+        expected=[3])),
+    idspec("PARSE_CPU_LIST_002", TestAction(
+        name="Ranges and single CPUs, unsorted and overlapping",
+        args=['8,0-3,2-4'],
+        action=utils.parse_cpu_list,
+        expected=[0, 1, 2, 3, 4, 8])),
+    idspec("PARSE_CPU_LIST_003", TestAction(
+        name="Empty entry",
+        args=['0,,2'],
+        action=utils.parse_cpu_list,
+        exception=ValueError)),
+    idspec("PARSE_CPU_LIST_004", TestAction(
+        name="Descending range",
+        args=['3-1'],
+        action=utils.parse_cpu_list,
+        exception=ValueError)),
+    idspec("PARSE_CPU_LIST_005", TestAction(
+        name="Not a number",
+        args=['cpu0'],
+        action=utils.parse_cpu_list,
+        exception=ValueError)),
+])
+def test_parse_cpu_list(testspec: TestAction) -> None:
+    """Test utils.parse_cpu_list() function.
+
+    :param testspec: The test specification.
+    :type testspec: TestAction
+    """
+    testspec.run()
+
+
+def test_smt_siblings(tmp_path, monkeypatch) -> None:
+    """Test that SMT siblings are read from sysfs and used to spread CPUs over physical cores."""
+    for cpu, siblings in {0: '0,2', 1: '1,3', 2: '0,2', 3: '1,3'}.items():
+        topology = tmp_path / f'cpu{cpu}' / 'topology'
+        topology.mkdir(parents=True)
+        (topology / 'thread_siblings_list').write_text(f'{siblings}\n', encoding='utf-8')
+    monkeypatch.setattr('simplebench.utils.cpu_affinity._SYS_CPU_PATH', str(tmp_path))
+    utils.smt_siblings.cache_clear()
+    try:
+        assert utils.smt_siblings(2) == (0, 2)
+        assert utils.smt_siblings(9) == (9,)
+        assert utils.smt_sibling_groups([0, 1, 2]) == ((0, 2),)
+        assert utils.spread_over_cores([3, 2, 1, 0]) == [0, 1, 2, 3]
+        assert utils.spread_over_cores([0, 2, 3]) == [0, 3, 2]
+    finally:
+        utils.smt_siblings.cache_clear()
+
+
+def test_current_cpu_reads_calling_thread(tmp_path, monkeypatch) -> None:
+    """Test that the CPU is read for the calling thread, falling back to the process's main thread."""
+    stat_fields = ' '.join(['0'] * 35)
+    thread_stat = tmp_path / 'thread-self-stat'
+    process_stat = tmp_path / 'self-stat'
+    thread_stat.write_text(f'1 (python (worker)) S {stat_fields} 7 0\n', encoding='ascii')
+    process_stat.write_text(f'1 (python) S {stat_fields} 3 0\n', encoding='ascii')
+    monkeypatch.setattr('simplebench.utils.cpu_affinity._PROC_STAT_PATHS', (str(thread_stat), str(process_stat)))
+    assert utils.current_cpu() == 7
+    thread_stat.unlink()
+    assert utils.current_cpu() == 3
+    process_stat.unlink()
+    assert utils.current_cpu() is None
+
+
+def test_cpu_pinning_priority_not_restored(monkeypatch) -> None:
+    """Test that a niceness which cannot be restored after running with a lower priority is reported."""
+    niceness = {'value': 0}
+
+    def setpriority(which: int, who: int, value: int) -> None:  # pylint: disable=unused-argument
+        if value < niceness['value']:
+            raise PermissionError('raising the priority needs elevated privileges')
+        niceness['value'] = value
+
+    monkeypatch.setattr('os.getpriority', lambda which, who: niceness['value'], raising=False)
+    monkeypatch.setattr('os.setpriority', setpriority, raising=False)
+    with utils.cpu_pinning(priority=0) as pinning:
+        assert pinning.priority == 0
+    with pytest.raises(SimpleBenchRuntimeError) as excinfo:
+        with utils.cpu_pinning(priority=5) as pinning:
+            assert pinning.priority == 5
+    assert excinfo.value.tag_code == _UtilsErrorTag.CPU_PINNING_PRIORITY_NOT_RESTORED